@@ -0,0 +1,111 @@
+"""Unknown World - TurnInput/TurnOutput 모델 핫패스 벤치마크.
+
+요청마다 실행되는 모델 검증/생성/복사/직렬화 비용을 측정합니다 (순수 CPU, 네트워크 없음).
+빠른 경로를 바꿀 때 전후 수치를 비교하는 용도이며, 테스트 스위트에는 포함되지 않습니다.
+
+측정 항목:
+    - TurnInput: json.loads + model_validate vs model_validate_json (/api/turn 본문 파싱)
+    - TurnOutput: model_validate_json (Gemini 응답 검증), model_dump_json + final 라인
+    - 생성: 검증 생성자 vs model_construct (신뢰 객체), 빈 WorldDelta, 안전 폴백, Mock 출력
+    - 복사: render 단계의 2단계 model_copy 체인 (agent_console.badges 갱신)
+
+실행:
+    cd backend
+    PYTHONPATH=src uv run python benchmarks/bench_turn_models.py [--number N] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import timeit
+from collections.abc import Callable
+
+os.environ.setdefault("UW_MODE", "mock")
+
+from unknown_world.api.turn_stream_events import final_event_line  # noqa: E402
+from unknown_world.models.turn import (  # noqa: E402
+    AgentConsole,
+    AgentPhase,
+    ClientInfo,
+    EconomySnapshot,
+    Language,
+    TurnInput,
+    TurnOutput,
+    ValidationBadge,
+    WorldDelta,
+)
+from unknown_world.orchestrator.fallback import create_safe_fallback  # noqa: E402
+from unknown_world.orchestrator.mock import MockOrchestrator  # noqa: E402
+
+
+def _build_cases() -> dict[str, Callable[[], object]]:
+    turn_input = TurnInput(
+        language=Language.KO,
+        text="낡은 문을 조심스럽게 연다",
+        client=ClientInfo(viewport_w=1920, viewport_h=1080),
+        economy_snapshot=EconomySnapshot(signal=100, memory_shard=5),
+    )
+    input_body = turn_input.model_dump_json().encode("utf-8")
+
+    mock = MockOrchestrator(seed=42)
+    output = mock.generate_turn_output(turn_input)
+    output_json = output.model_dump_json()
+    output_fields = {name: getattr(output, name) for name in TurnOutput.model_fields}
+    console_fields = {
+        "current_phase": AgentPhase.COMMIT,
+        "badges": [ValidationBadge.SCHEMA_OK, ValidationBadge.ECONOMY_OK],
+        "repair_count": 0,
+    }
+
+    def copy_chain() -> TurnOutput:
+        console = output.agent_console.model_copy(update={"badges": [ValidationBadge.SAFETY_OK]})
+        return output.model_copy(update={"agent_console": console})
+
+    return {
+        "turn_input.json_loads+model_validate": lambda: TurnInput.model_validate(
+            json.loads(input_body)
+        ),
+        "turn_input.model_validate_json": lambda: TurnInput.model_validate_json(input_body),
+        "turn_output.model_validate_json": lambda: TurnOutput.model_validate_json(output_json),
+        "turn_output.final_event_line": lambda: final_event_line(output),
+        "turn_output.__init__": lambda: TurnOutput(**output_fields),
+        "turn_output.model_construct": lambda: TurnOutput.model_construct(**output_fields),
+        "agent_console.__init__": lambda: AgentConsole(**console_fields),
+        "agent_console.model_construct": lambda: AgentConsole.model_construct(**console_fields),
+        "world_delta.empty": WorldDelta,
+        "fallback.create_safe_fallback": lambda: create_safe_fallback(Language.KO),
+        "mock.generate_turn_output": lambda: mock.generate_turn_output(turn_input),
+        "turn_output.model_copy_chain": copy_chain,
+    }
+
+
+def run(number: int, repeat: int) -> dict[str, float]:
+    """각 항목의 호출당 최소 시간(µs)을 측정합니다."""
+    results: dict[str, float] = {}
+    for name, func in _build_cases().items():
+        best = min(timeit.repeat(func, number=number, repeat=repeat))
+        results[name] = round(best / number * 1_000_000, 2)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TurnInput/TurnOutput 모델 핫패스 벤치마크")
+    parser.add_argument("--number", type=int, default=2000, help="반복당 호출 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run(args.number, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    width = max(len(name) for name in results)
+    for name, micros in results.items():
+        print(f"{name:<{width}}  {micros:>9.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
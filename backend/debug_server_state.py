@@ -20,16 +20,13 @@ print()
 from pydantic import ValidationError
 
 from unknown_world.models.turn import Language, TurnInput, TurnOutput
-from unknown_world.orchestrator.generate_turn_output import (
-    TurnOutputGenerator,
-    _strip_additional_properties,
-)
+from unknown_world.orchestrator.generate_turn_output import TurnOutputGenerator
+from unknown_world.schemas import get_turn_schema_artifacts
 
 
 async def main():
-    # 1. JSON Schema 검사 - $defs/$ref 확인
-    raw_schema = TurnOutput.model_json_schema()
-    stripped = _strip_additional_properties(raw_schema)
+    # 1. JSON Schema 검사 - $defs/$ref 확인 (서버가 요청에 넣는 생성 아티팩트)
+    stripped = get_turn_schema_artifacts().gemini_schema()
 
     has_refs = "$defs" in stripped
     print(f"Schema has $defs: {has_refs}")
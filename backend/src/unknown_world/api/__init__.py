@@ -7,6 +7,7 @@ from unknown_world.api.ending_report import router as ending_report_router
 from unknown_world.api.image import router as image_router
 from unknown_world.api.item_icon import router as item_icon_router
 from unknown_world.api.scanner import router as scanner_router
+from unknown_world.api.session import router as session_router
 from unknown_world.api.turn import router as turn_router
 
 __all__ = [
@@ -14,5 +15,6 @@ __all__ = [
     "image_router",
     "item_icon_router",
     "scanner_router",
+    "session_router",
     "turn_router",
 ]
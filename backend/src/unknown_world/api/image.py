@@ -8,6 +8,7 @@
     - RULE-008: 텍스트 우선 + Lazy 이미지 원칙
     - RULE-010: 이미지 모델 ID 고정 (gemini-3-pro-image-preview)
     - RULE-007: 프롬프트 원문/비밀정보 노출 금지
+    - 생성 완료 후 (opt-in) Scene affordance 백그라운드 선계산 (정밀분석 지연 제거)
 
 페어링 질문 결정:
     - Q1: Option A (로컬 파일로 저장 후 image_url로 서빙)
@@ -20,12 +21,19 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel, ConfigDict, Field
 
-from unknown_world.models.turn import Language
+from unknown_world.api.image_http_cache import (
+    build_cached_file_response,
+    negotiate_image_variant,
+    stat_regular_file,
+)
+from unknown_world.models.turn import ClientInfo, Language
+from unknown_world.services.affordance_precompute import get_affordance_precomputer
 from unknown_world.services.image_generation import (
     ImageGenerationRequest,
     ImageGenerationStatus,
@@ -34,9 +42,21 @@ from unknown_world.services.image_generation import (
     create_fallback_response,
     get_image_generator,
 )
+from unknown_world.services.image_jobs import ImageJobRegistry, get_image_job_registry
+from unknown_world.services.image_variants import (
+    AVIF_EXTENSION,
+    create_image_variants,
+    schedule_image_variants,
+)
+from unknown_world.storage.offload import get_offload_executor
 from unknown_world.storage.paths import (
     DEFAULT_IMAGE_EXTENSION,
+    IMAGE_VARIANT_FULL,
+    IMAGE_VARIANT_ORDER,
+    VARIANT_IMAGE_EXTENSION,
     build_image_url,
+    build_image_variant_url,
+    build_variant_filename,
     get_generated_images_dir,
 )
 from unknown_world.storage.validation import (
@@ -70,6 +90,11 @@ async def get_generator():
     return get_image_generator()
 
 
+async def get_job_registry() -> ImageJobRegistry:
+    """이미지 생성 작업 레지스트리 의존성."""
+    return get_image_job_registry()
+
+
 # =============================================================================
 # 요청/응답 스키마 (API 계층용)
 # =============================================================================
@@ -91,6 +116,7 @@ class GenerateImageRequest(BaseModel):
         skip_on_failure: 실패 시 건너뛰기 (텍스트-only 진행)
         model_label: 모델 티어링 라벨 (U-066: FAST/QUALITY)
         turn_id: 턴 ID (late-binding 가드용, U-066)
+        client: 클라이언트 정보 (지정 시 뷰포트에 맞는 WebP 변형 URL 반환)
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -114,6 +140,10 @@ class GenerateImageRequest(BaseModel):
     skip_on_failure: bool = Field(default=True, description="실패 시 건너뛰기 (텍스트-only 진행)")
     model_label: str = Field(default="QUALITY", description="모델 티어링 라벨 (FAST/QUALITY)")
     turn_id: int | None = Field(default=None, description="턴 ID (late-binding 가드용)")
+    client: ClientInfo | None = Field(
+        default=None,
+        description="클라이언트 정보 (뷰포트 기반 이미지 변형 선택용)",
+    )
 
 
 class GenerateImageResponse(BaseModel):
@@ -158,6 +188,34 @@ class ImageStatusResponse(BaseModel):
     image_url: str | None = Field(default=None, description="이미지 URL")
 
 
+class CancelImageRequest(BaseModel):
+    """이미지 생성 취소 요청.
+
+    Attributes:
+        session_id: 취소할 작업의 세션 ID
+        turn_id: 지정 시 이 턴 이하의 작업만 취소 (더 새로운 작업은 보존)
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    session_id: str = Field(min_length=1, description="세션 ID")
+    turn_id: int | None = Field(default=None, description="취소 기준 턴 ID")
+
+
+class CancelImageResponse(BaseModel):
+    """이미지 생성 취소 응답.
+
+    Attributes:
+        session_id: 세션 ID
+        cancelled: 진행 중인 작업을 취소했는지 여부
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    session_id: str = Field(description="세션 ID")
+    cancelled: bool = Field(description="취소 여부")
+
+
 # =============================================================================
 # 엔드포인트 정의
 # =============================================================================
@@ -172,6 +230,7 @@ class ImageStatusResponse(BaseModel):
 async def generate_image(
     request: GenerateImageRequest,
     generator: ImageGeneratorType = Depends(get_generator),
+    registry: ImageJobRegistry = Depends(get_job_registry),
 ) -> GenerateImageResponse:
     """이미지를 생성합니다.
 
@@ -179,10 +238,13 @@ async def generate_image(
     프론트엔드에서 별도로 호출합니다.
 
     텍스트 턴의 TTFB를 블로킹하지 않습니다 (RULE-008).
+    session_id가 있으면 같은 세션의 이전 턴 작업은 취소되고,
+    이 요청이 더 새로운 요청에 의해 대체되면 status=cancelled로 응답합니다.
 
     Args:
         request: 이미지 생성 요청
         generator: 이미지 생성기 (의존성 주입)
+        registry: 이미지 생성 작업 레지스트리 (의존성 주입)
 
     Returns:
         GenerateImageResponse: 생성 결과
@@ -216,25 +278,49 @@ async def generate_image(
 
     # 이미지 생성 실행
     try:
-        result = await generator.generate(
-            ImageGenerationRequest(
-                prompt=request.prompt,
-                aspect_ratio=request.aspect_ratio,
-                image_size=normalized_image_size,
-                reference_image_ids=request.reference_image_ids,
-                reference_image_url=request.reference_image_url,
-                session_id=request.session_id,
-                model_label=request.model_label,
-            )
+        gen_request = ImageGenerationRequest(
+            prompt=request.prompt,
+            aspect_ratio=request.aspect_ratio,
+            image_size=normalized_image_size,
+            reference_image_ids=request.reference_image_ids,
+            reference_image_url=request.reference_image_url,
+            session_id=request.session_id,
+            model_label=request.model_label,
+        )
+        result = await registry.run(
+            lambda: generator.generate(gen_request),
+            session_id=request.session_id,
+            turn_id=request.turn_id,
         )
 
         success = result.status == ImageGenerationStatus.COMPLETED
+        image_url = result.image_url
+
+        # 서빙용 WebP/AVIF 크기 변형 생성 (실패 시 원본 PNG URL 유지)
+        if success and result.image_id:
+            # 정밀분석용 affordance 선계산 (opt-in, 낮은 우선순위 백그라운드)
+            precomputer = get_affordance_precomputer()
+            if precomputer is not None:
+                precomputer.schedule(result.image_id, request.language)
+
+            if request.client is not None:
+                # 뷰포트별 변형 URL을 돌려주려면 인코딩 완료를 기다려야 함
+                variants = await create_image_variants(result.image_id)
+                if variants is not None:
+                    image_url = build_image_variant_url(
+                        result.image_id,
+                        client=request.client,
+                        available=variants.available,
+                    )
+            else:
+                # PNG URL 응답 + Accept 협상용 변형은 백그라운드 인코딩
+                schedule_image_variants(result.image_id)
 
         return GenerateImageResponse(
             success=success,
             status=result.status,
             image_id=result.image_id,
-            image_url=result.image_url,
+            image_url=image_url,
             message=result.message,
             generation_time_ms=result.generation_time_ms,
             model_label=request.model_label,
@@ -262,6 +348,32 @@ async def generate_image(
             ) from e
 
 
+@router.post(
+    "/cancel",
+    response_model=CancelImageResponse,
+    summary="이미지 생성 취소",
+    description="세션의 진행 중인 이미지 생성 작업을 취소합니다.",
+)
+async def cancel_image(
+    request: CancelImageRequest,
+    registry: ImageJobRegistry = Depends(get_job_registry),
+) -> CancelImageResponse:
+    """세션의 진행 중인 이미지 생성을 취소합니다.
+
+    취소된 작업의 /generate 요청은 status=cancelled로 응답하며,
+    진행 중이던 Gemini 호출과 동시 실행 슬롯은 즉시 반환됩니다.
+
+    Args:
+        request: 취소 요청
+        registry: 이미지 생성 작업 레지스트리
+
+    Returns:
+        CancelImageResponse: 취소 결과
+    """
+    cancelled = registry.cancel(request.session_id, turn_id=request.turn_id)
+    return CancelImageResponse(session_id=request.session_id, cancelled=cancelled)
+
+
 @router.get(
     "/status/{image_id}",
     response_model=ImageStatusResponse,
@@ -300,29 +412,83 @@ async def get_image_status(
 )
 async def get_image_file(
     image_id: str,
-) -> FileResponse:
+    request: Request,
+    variant: str | None = Query(default=None, description="크기 변형 (thumb/medium/full)"),
+    format: str | None = Query(default=None, description="변형 포맷 (webp/avif)"),
+) -> Response:
     """이미지 파일을 반환합니다.
 
     MVP에서는 로컬 파일을 직접 서빙합니다.
     MMP에서 GCS URL 리다이렉트로 변경 예정.
+    variant/format을 지정하면 해당 변형을 반환하고, 변형이 없으면 원본 PNG로 폴백합니다.
+    둘 다 없으면 Accept 헤더로 사전 인코딩(AVIF/WebP) 변형을 협상합니다.
+
+    이미지 ID는 불변이므로 immutable Cache-Control과 내용 해시 ETag를 부여하고,
+    If-None-Match 일치 시 304, Range 요청 시 206으로 응답합니다.
 
     Args:
         image_id: 이미지 ID
+        request: HTTP 요청 (조건부/Range/Accept 헤더)
+        variant: 크기 변형 이름
+        format: 변형 포맷 (기본: webp)
 
     Returns:
-        FileResponse: 이미지 파일
+        Response: 이미지 파일 또는 304 응답
     """
+    if variant is not None and variant not in IMAGE_VARIANT_ORDER:
+        raise HTTPException(status_code=400, detail="지원하지 않는 이미지 변형입니다.")
+    if format is not None and format not in (VARIANT_IMAGE_EXTENSION, AVIF_EXTENSION):
+        raise HTTPException(status_code=400, detail="지원하지 않는 이미지 포맷입니다.")
+
     # RU-006-Q5: 중앙화된 경로 함수 사용
     output_dir = get_generated_images_dir()
+    executor = get_offload_executor()
+
+    if variant is not None or format is not None:
+        extension = format or VARIANT_IMAGE_EXTENSION
+        variant_filename = build_variant_filename(
+            image_id, variant or IMAGE_VARIANT_FULL, extension=extension
+        )
+        variant_path = output_dir / variant_filename
+        variant_stat = await executor.run_io(stat_regular_file, variant_path)
+        if variant_stat is not None:
+            return await build_cached_file_response(
+                variant_path,
+                request.headers,
+                stat_result=variant_stat,
+                media_type=f"image/{extension}",
+                immutable=True,
+                filename=variant_filename,
+            )
+
     filename = f"{image_id}.{DEFAULT_IMAGE_EXTENSION}"
     file_path = output_dir / filename
+    stat_result = await executor.run_io(stat_regular_file, file_path)
 
-    if not file_path.exists():
+    if stat_result is None:
         raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
 
-    return FileResponse(
-        path=str(file_path),
+    if variant is None and format is None:
+        negotiated = await negotiate_image_variant(file_path, request.headers.get("accept"))
+        if negotiated is not None:
+            negotiated_path, media_type, negotiated_stat = negotiated
+            return await build_cached_file_response(
+                negotiated_path,
+                request.headers,
+                stat_result=negotiated_stat,
+                media_type=media_type,
+                immutable=True,
+                vary_accept=True,
+                filename=negotiated_path.name,
+            )
+
+    return await build_cached_file_response(
+        file_path,
+        request.headers,
+        stat_result=stat_result,
         media_type="image/png",
+        immutable=True,
+        vary_accept=variant is None and format is None,
         filename=filename,
     )
 
@@ -334,11 +500,13 @@ async def get_image_file(
 )
 async def image_health(
     generator: ImageGeneratorType = Depends(get_generator),
-) -> dict[str, str | bool]:
+    registry: ImageJobRegistry = Depends(get_job_registry),
+) -> dict[str, Any]:
     """이미지 서비스 헬스체크.
 
     Args:
         generator: 이미지 생성기
+        registry: 이미지 생성 작업 레지스트리
 
     Returns:
         헬스 상태 정보
@@ -352,4 +520,6 @@ async def image_health(
         "available": is_available,
         "mode": mode,
         "model": "gemini-3-pro-image-preview",
+        **registry.get_stats(),
+        "offload": get_offload_executor().get_stats(),
     }
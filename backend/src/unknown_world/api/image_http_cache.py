@@ -0,0 +1,263 @@
+"""Unknown World - 이미지 HTTP 캐싱 헬퍼.
+
+생성 이미지(/api/image/file, /static/images/generated/)는 ID가 불변이므로
+브라우저/CDN/nginx 캐시가 반복 로딩을 흡수할 수 있도록 캐시 헤더를 부여합니다.
+
+제공 기능:
+    - 강한 ETag: 파일 내용 해시(SHA-256) 기반, (경로, mtime, 크기) 키로 메모리 캐싱
+    - Cache-Control: 생성 이미지는 immutable, 그 외 정적 파일은 ETag 재검증(no-cache)
+      (아이콘 캐시 하위 경로는 LRU 제거 후 같은 URL로 재생성되므로 재검증 대상)
+    - 조건부 GET: If-None-Match 일치 시 304 (본문 없음)
+    - 사전 인코딩 변형 협상: Accept 헤더에 따라 AVIF/WebP 변형 선택 (Vary: Accept)
+    - Range 요청: Starlette FileResponse의 바이트 범위 지원 (If-Range는 강한 ETag 기준)
+
+설계 원칙:
+    - 해시 계산은 I/O 오프로드 풀에서 실행 (이벤트 루프 블로킹 금지)
+    - RULE-007: 파일 내용/경로는 로그에 포함하지 않음
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+from collections import OrderedDict
+from pathlib import Path
+
+import anyio.to_thread
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+
+from unknown_world.services.item_icon_generator import ICON_CACHE_SUBDIR
+from unknown_world.storage.offload import get_offload_executor
+from unknown_world.storage.paths import (
+    DEFAULT_IMAGE_EXTENSION,
+    IMAGE_VARIANT_FULL,
+    IMAGES_GENERATED_SUBDIR,
+    VARIANT_IMAGE_EXTENSION,
+    build_variant_filename,
+)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+"""불변 리소스(생성 이미지) 캐시 정책."""
+
+REVALIDATE_CACHE_CONTROL = "no-cache"
+"""변경 가능 리소스 캐시 정책 (ETag로 매번 재검증)."""
+
+_ICON_CACHE_PREFIX = f"{IMAGES_GENERATED_SUBDIR}/{ICON_CACHE_SUBDIR}/"
+"""아이콘 캐시 경로 ({cache_key}.png가 제거/재생성되므로 immutable 제외)."""
+
+MAX_ETAG_CACHE_ENTRIES = 4096
+"""ETag 메모리 캐시 최대 엔트리 수."""
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_NEGOTIABLE_FORMATS: tuple[tuple[str, str], ...] = (
+    ("avif", "image/avif"),
+    (VARIANT_IMAGE_EXTENSION, "image/webp"),
+)
+"""선호 순서의 사전 인코딩 포맷 (확장자, MIME)."""
+
+
+# =============================================================================
+# 콘텐츠 해시 ETag
+# =============================================================================
+
+
+def _hash_file(path: Path) -> str:
+    """파일 내용의 SHA-256 해시를 계산합니다 (블로킹 - run_io 대상)."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentEtagCache:
+    """파일 내용 해시 기반 강한 ETag 캐시 (LRU).
+
+    (경로, mtime_ns, 크기)가 같으면 재해시하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = MAX_ETAG_CACHE_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+
+    async def get_etag(self, path: Path, stat_result: os.stat_result) -> str:
+        """파일의 강한 ETag를 반환합니다 (따옴표 포함)."""
+        key = (str(path), stat_result.st_mtime_ns, stat_result.st_size)
+        etag = self._entries.get(key)
+        if etag is not None:
+            self._entries.move_to_end(key)
+            return etag
+
+        digest = await get_offload_executor().run_io(_hash_file, path)
+        etag = f'"{digest[:32]}"'
+        self._entries[key] = etag
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return etag
+
+    def clear(self) -> None:
+        """캐시를 비웁니다 (테스트용)."""
+        self._entries.clear()
+
+
+_etag_cache = ContentEtagCache()
+
+
+def get_etag_cache() -> ContentEtagCache:
+    """ETag 캐시 싱글톤을 반환합니다."""
+    return _etag_cache
+
+
+# =============================================================================
+# 조건부 응답 / 변형 협상
+# =============================================================================
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 판정합니다 (weak 비교)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def stat_regular_file(path: Path) -> os.stat_result | None:
+    """일반 파일이면 stat 결과를 반환합니다 (블로킹 - run_io 대상)."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+
+async def negotiate_image_variant(
+    png_path: Path, accept: str | None
+) -> tuple[Path, str, os.stat_result] | None:
+    """Accept 헤더에 맞는 사전 인코딩(AVIF/WebP) 변형을 찾습니다.
+
+    Args:
+        png_path: 원본 PNG 경로 ({image_id}.png)
+        accept: 요청 Accept 헤더
+
+    Returns:
+        (변형 경로, MIME, stat) 또는 None (협상 불가/변형 없음)
+    """
+    if not accept:
+        return None
+
+    image_id = png_path.stem
+    executor = get_offload_executor()
+    for extension, media_type in _NEGOTIABLE_FORMATS:
+        if media_type not in accept:
+            continue
+        candidate = png_path.with_name(
+            build_variant_filename(image_id, IMAGE_VARIANT_FULL, extension=extension)
+        )
+        stat_result = await executor.run_io(stat_regular_file, candidate)
+        if stat_result is not None:
+            return candidate, media_type, stat_result
+    return None
+
+
+async def build_cached_file_response(
+    path: Path,
+    request_headers: Headers,
+    *,
+    stat_result: os.stat_result,
+    media_type: str | None = None,
+    immutable: bool = False,
+    vary_accept: bool = False,
+    filename: str | None = None,
+) -> Response:
+    """캐시 헤더/조건부 GET/Range를 지원하는 파일 응답을 생성합니다.
+
+    Args:
+        path: 파일 경로
+        request_headers: 요청 헤더
+        stat_result: 파일 stat 결과
+        media_type: MIME 타입 (None이면 확장자로 추론)
+        immutable: 불변 리소스 여부 (Cache-Control 결정)
+        vary_accept: Accept 협상 결과인지 여부 (Vary: Accept 추가)
+        filename: Content-Disposition 파일명
+
+    Returns:
+        FileResponse (200/206) 또는 304 응답
+    """
+    etag = await get_etag_cache().get_etag(path, stat_result)
+    headers = {
+        "etag": etag,
+        "cache-control": IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL,
+    }
+    if vary_accept:
+        headers["vary"] = "Accept"
+
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match and _etag_matches(etag, if_none_match):
+        return NotModifiedResponse(Headers(headers=headers))
+
+    return FileResponse(
+        path,
+        headers=headers,
+        media_type=media_type,
+        filename=filename,
+        stat_result=stat_result,
+    )
+
+
+# =============================================================================
+# /static 마운트
+# =============================================================================
+
+
+class CachedStaticFiles(StaticFiles):
+    """캐시 헤더/강한 ETag/변형 협상을 적용한 StaticFiles.
+
+    생성 이미지 하위 경로는 immutable로 서빙하며, 원본 PNG 요청은
+    Accept 헤더에 따라 사전 인코딩 변형으로 대체합니다.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            # 디렉토리/404 처리는 기본 동작 유지
+            return await super().get_response(path, scope)
+
+        request_headers = Headers(scope=scope)
+        file_path = Path(full_path)
+        relative = path.replace(os.sep, "/")
+        generated = relative.startswith(f"{IMAGES_GENERATED_SUBDIR}/")
+        immutable = generated and not relative.startswith(_ICON_CACHE_PREFIX)
+        vary_accept = False
+        media_type: str | None = None
+
+        if (
+            generated
+            and relative.count("/") == IMAGES_GENERATED_SUBDIR.count("/") + 1
+            and file_path.suffix == f".{DEFAULT_IMAGE_EXTENSION}"
+        ):
+            vary_accept = True
+            negotiated = await negotiate_image_variant(file_path, request_headers.get("accept"))
+            if negotiated is not None:
+                file_path, media_type, stat_result = negotiated
+
+        return await build_cached_file_response(
+            file_path,
+            request_headers,
+            stat_result=stat_result,
+            media_type=media_type,
+            immutable=immutable,
+            vary_accept=vary_accept,
+        )
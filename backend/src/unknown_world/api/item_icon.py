@@ -2,6 +2,11 @@
 
 아이템 설명을 기반으로 동적 아이콘을 생성하는 API 엔드포인트입니다.
 
+인벤토리 전체를 한 번에 다루는 배치 엔드포인트:
+    - POST /api/item/icons: 아이템 목록의 상태 조회/생성 시작을 1회 요청으로 처리
+    - POST /api/item/icons/stream: 위와 같이 시작한 뒤 완료되는 아이콘 URL을 순서대로 push
+      (기본 NDJSON, Accept: text/event-stream이면 SSE)
+
 설계 원칙:
     - RULE-004: 실패 시 안전한 폴백 제공
     - RULE-006: ko/en 언어 정책 준수
@@ -16,14 +21,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import Annotated
+import os
+from collections.abc import AsyncGenerator
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
+from unknown_world.services.icon_work_queue import IconPriority
 from unknown_world.services.item_icon_generator import (
     IconGenerationRequest,
+    IconGenerationResponse,
+    IconGenerationStatus,
+    ItemIconGenerator,
     get_item_icon_generator,
 )
 
@@ -39,6 +53,23 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/item", tags=["item"])
 
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+MAX_BATCH_ICON_ITEMS = 64
+"""배치 요청 1회당 최대 아이템 수."""
+
+DEFAULT_ICON_STREAM_TIMEOUT_SECONDS = 180.0
+"""push 스트림 최대 유지 시간 (기본, 초)."""
+
+
+def _get_icon_stream_timeout() -> float:
+    """환경변수(UW_ICON_STREAM_TIMEOUT_S)에서 push 스트림 최대 유지 시간을 읽습니다."""
+    return float(
+        os.environ.get("UW_ICON_STREAM_TIMEOUT_S", str(DEFAULT_ICON_STREAM_TIMEOUT_SECONDS))
+    )
+
 
 # =============================================================================
 # API 모델
@@ -53,6 +84,8 @@ class GenerateIconRequest(BaseModel):
         description: 아이템 설명 (아이콘 생성용)
         language: 현재 세션 언어
         wait: 생성 완료까지 대기할지 여부
+        priority: 백그라운드 생성 우선순위
+        session_id: 세션 식별자 (세션 간 공정성)
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -64,6 +97,11 @@ class GenerateIconRequest(BaseModel):
         default=False,
         description="생성 완료까지 대기 (false: placeholder 즉시 반환)",
     )
+    priority: IconPriority = Field(
+        default=IconPriority.NORMAL,
+        description="백그라운드 생성 우선순위 (visible/normal/prefetch)",
+    )
+    session_id: str | None = Field(default=None, description="세션 식별자 (공정성)")
 
 
 class IconResponse(BaseModel):
@@ -100,6 +138,140 @@ class IconStatusResponse(BaseModel):
     status: str = Field(description="생성 상태")
 
 
+class BatchIconItem(BaseModel):
+    """배치 요청의 아이템 한 개.
+
+    Attributes:
+        item_id: 아이템 고유 ID
+        description: 아이템 설명 (아이콘 생성용)
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    item_id: str = Field(description="아이템 고유 ID")
+    description: str = Field(description="아이템 설명 (아이콘 생성용)")
+
+
+class BatchIconRequest(BaseModel):
+    """인벤토리 아이콘 배치 요청 (API).
+
+    Attributes:
+        items: 아이템 목록
+        language: 현재 세션 언어
+        generate: 캐시에 없는 아이콘의 백그라운드 생성을 시작할지 여부
+        priority: 백그라운드 생성 우선순위 (인벤토리 렌더링이므로 기본 visible)
+        session_id: 세션 식별자 (세션 간 공정성)
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    items: list[BatchIconItem] = Field(max_length=MAX_BATCH_ICON_ITEMS, description="아이템 목록")
+    language: str = Field(default="en-US", description="현재 세션 언어 (ko-KR/en-US)")
+    generate: bool = Field(
+        default=True,
+        description="캐시에 없는 아이콘의 백그라운드 생성 시작 (false: 상태만 조회)",
+    )
+    priority: IconPriority = Field(
+        default=IconPriority.VISIBLE,
+        description="백그라운드 생성 우선순위 (visible/normal/prefetch)",
+    )
+    session_id: str | None = Field(default=None, description="세션 식별자 (공정성)")
+
+
+class BatchIconResponse(BaseModel):
+    """인벤토리 아이콘 배치 응답 (API).
+
+    Attributes:
+        icons: 요청 순서와 같은 아이콘 응답 목록
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    icons: list[IconResponse] = Field(description="아이콘 응답 목록 (요청 순서)")
+
+
+def _to_icon_response(result: IconGenerationResponse) -> IconResponse:
+    return IconResponse(
+        status=result.status.value,
+        icon_url=result.icon_url,
+        item_id=result.item_id,
+        is_placeholder=result.is_placeholder,
+        message=result.message,
+    )
+
+
+async def resolve_icon_batch(
+    generator: ItemIconGenerator, request: BatchIconRequest
+) -> list[IconResponse]:
+    """아이템별 캐시 확인/생성 시작/상태 조회를 수행합니다 (요청 순서 유지)."""
+    responses: list[IconResponse] = []
+    for item in request.items:
+        gen_request = IconGenerationRequest(
+            item_id=item.item_id,
+            item_description=item.description,
+            language=request.language,
+            priority=request.priority,
+            session_id=request.session_id,
+        )
+        if request.generate:
+            result = _to_icon_response(await generator.generate_icon(gen_request))
+            if result.status == IconGenerationStatus.PENDING:
+                # 이미 진행 중/완료/실패한 항목은 실제 상태로 보정
+                status = await generator.get_icon_status(item.item_id)
+                result.status = status.value
+        else:
+            result = _to_icon_response(await generator.peek_icon(gen_request))
+        responses.append(result)
+    return responses
+
+
+def _format_stream_event(event: dict[str, Any], *, sse: bool) -> str:
+    """스트림 이벤트를 NDJSON 라인 또는 SSE 메시지로 직렬화합니다."""
+    data = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+    if sse:
+        return f"event: {event['type']}\ndata: {data}\n\n"
+    return f"{data}\n"
+
+
+async def stream_icon_events(
+    generator: ItemIconGenerator, initial: list[IconResponse], *, sse: bool
+) -> AsyncGenerator[str]:
+    """초기 상태를 즉시 송출한 뒤, 생성 중인 아이콘을 완료 순서대로 송출합니다."""
+    waiting: dict[asyncio.Task[IconGenerationResponse | None], str] = {
+        asyncio.create_task(generator.wait_for_icon(icon.item_id)): icon.item_id
+        for icon in initial
+        if icon.is_placeholder and icon.status != IconGenerationStatus.FAILED
+    }
+
+    try:
+        for icon in initial:
+            yield _format_stream_event({"type": "icon", **icon.model_dump()}, sse=sse)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _get_icon_stream_timeout()
+        while waiting:
+            done, _ = await asyncio.wait(
+                waiting,
+                timeout=max(0.0, deadline - loop.time()),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                break
+            for task in done:
+                item_id = waiting.pop(task)
+                result = task.result()
+                if result is None:
+                    continue
+                icon = _to_icon_response(result.model_copy(update={"item_id": item_id}))
+                yield _format_stream_event({"type": "icon", **icon.model_dump()}, sse=sse)
+
+        yield _format_stream_event({"type": "done", "pending": sorted(waiting.values())}, sse=sse)
+    finally:
+        # 클라이언트 연결 종료/타임아웃 시 대기자만 정리 (생성 태스크는 계속 진행)
+        for task in waiting:
+            task.cancel()
+
+
 # =============================================================================
 # API 엔드포인트
 # =============================================================================
@@ -131,6 +303,8 @@ async def generate_item_icon(request: GenerateIconRequest) -> IconResponse:
         item_id=request.item_id,
         item_description=request.description,
         language=request.language,
+        priority=request.priority,
+        session_id=request.session_id,
     )
 
     result = await generator.generate_icon(
@@ -171,6 +345,8 @@ async def get_or_generate_icon(
     item_id: Annotated[str, Query(description="아이템 고유 ID")],
     description: Annotated[str, Query(description="아이템 설명")],
     language: Annotated[str, Query(description="세션 언어")] = "en-US",
+    priority: Annotated[IconPriority, Query(description="생성 우선순위")] = IconPriority.NORMAL,
+    session_id: Annotated[str | None, Query(description="세션 식별자 (공정성)")] = None,
 ) -> IconResponse:
     """아이콘을 조회하거나 생성합니다 (GET 방식).
 
@@ -180,6 +356,8 @@ async def get_or_generate_icon(
         item_id: 아이템 ID
         description: 아이템 설명
         language: 세션 언어
+        priority: 백그라운드 생성 우선순위
+        session_id: 세션 식별자
 
     Returns:
         IconResponse: 아이콘 URL 및 상태
@@ -189,6 +367,8 @@ async def get_or_generate_icon(
         item_id=item_id,
         item_description=description,
         language=language,
+        priority=priority,
+        session_id=session_id,
     )
 
     result = await generator.generate_icon(
@@ -203,3 +383,71 @@ async def get_or_generate_icon(
         is_placeholder=result.is_placeholder,
         message=result.message,
     )
+
+
+@router.post("/icons", response_model=BatchIconResponse)
+async def batch_item_icons(request: BatchIconRequest) -> BatchIconResponse:
+    """인벤토리 전체 아이콘의 상태를 한 번에 조회하고, 없는 아이콘은 생성을 시작합니다.
+
+    아이템별 상태 폴링(/icon/{item_id}/status)을 대체합니다.
+
+    Args:
+        request: 배치 요청
+
+    Returns:
+        BatchIconResponse: 요청 순서의 아이콘 응답 목록
+    """
+    logger.info(
+        "[ItemIconAPI] Batch icon request",
+        extra={"count": len(request.items), "generate": request.generate},
+    )
+
+    generator = get_item_icon_generator()
+    return BatchIconResponse(icons=await resolve_icon_batch(generator, request))
+
+
+@router.post(
+    "/icons/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "아이콘 이벤트 스트림 (icon... → done)",
+            "content": {
+                "application/x-ndjson": {
+                    "example": '{"type":"icon","status":"completed","item_id":"i1",...}\n'
+                },
+                "text/event-stream": {"example": 'event: done\ndata: {"type":"done"}\n\n'},
+            },
+        }
+    },
+)
+async def stream_item_icons(request: Request, body: BatchIconRequest) -> StreamingResponse:
+    """배치 요청을 처리한 뒤, 아이콘이 완료될 때마다 URL을 push합니다.
+
+    첫 이벤트로 아이템별 현재 상태를 보내고, 생성 중인 아이콘은 완료 순서대로
+    icon 이벤트를 추가 송출한 뒤 done 이벤트로 종료합니다.
+    Accept 헤더에 text/event-stream이 있으면 SSE, 아니면 NDJSON으로 응답합니다.
+
+    Args:
+        request: FastAPI Request 객체 (Accept 협상용)
+        body: 배치 요청
+
+    Returns:
+        StreamingResponse: NDJSON 또는 SSE 스트림
+    """
+    sse = "text/event-stream" in request.headers.get("accept", "")
+    logger.info(
+        "[ItemIconAPI] Icon stream opened",
+        extra={"count": len(body.items), "sse": sse},
+    )
+
+    generator = get_item_icon_generator()
+    initial = await resolve_icon_batch(generator, body)
+    return StreamingResponse(
+        stream_icon_events(generator, initial, sse=sse),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
+        },
+    )
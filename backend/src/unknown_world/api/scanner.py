@@ -7,6 +7,10 @@
     - RULE-004: 실패 시 안전한 폴백 (텍스트-only 캡션)
     - RULE-007: 프롬프트 원문/업로드 파일 내용 로깅 금지
     - RULE-009: bbox는 0~1000 정규화 + [ymin, xmin, ymax, xmax]
+    - 아이콘 선생성: item_candidates 아이콘을 prefetch 우선순위로 미리 큐잉
+      (사용자가 후보를 인벤토리에 추가할 때는 대개 캐시되어 있음)
+    - 스트리밍 업로드: 본문을 청크 단위로 파싱하여 크기/형식 위반을 수신 도중 거부
+      (storage/upload_stream, 요청당 메모리 상한)
 
 페어링 질문 결정:
     - Q1: Option A (multipart 업로드로 처리)
@@ -20,9 +24,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Annotated
+from typing import Any
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel, ConfigDict, Field
 
 from unknown_world.models.scanner import (
@@ -36,9 +40,21 @@ from unknown_world.services.image_understanding import (
     ImageUnderstandingService,
     get_image_understanding_service,
 )
+from unknown_world.services.item_icon_generator import (
+    ItemIconGenerator,
+    get_item_icon_generator,
+    is_icon_prefetch_enabled,
+)
+from unknown_world.storage.upload_stream import (
+    UploadRejectedError,
+    UploadRejection,
+    read_image_upload,
+)
 from unknown_world.storage.validation import (
     ALLOWED_IMAGE_MIME_TYPES,
     MAX_IMAGE_FILE_SIZE_BYTES,
+    image_too_large_message,
+    unsupported_image_format_message,
     validate_image_upload,
 )
 
@@ -68,6 +84,11 @@ async def get_scanner_service() -> ImageUnderstandingService:
     return get_image_understanding_service()
 
 
+async def get_icon_prefetcher() -> ItemIconGenerator | None:
+    """아이콘 선생성기 의존성 (비활성화 시 None)."""
+    return get_item_icon_generator() if is_icon_prefetch_enabled() else None
+
+
 # =============================================================================
 # 응답 스키마 (API 계층용)
 # =============================================================================
@@ -135,6 +156,75 @@ class ScannerHealthResponse(BaseModel):
     max_file_size_mb: int = Field(description="최대 파일 크기 (MB)")
 
 
+# =============================================================================
+# 업로드 파싱 헬퍼
+# =============================================================================
+
+_SCAN_REQUEST_BODY: dict[str, Any] = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "required": ["file"],
+                "properties": {
+                    "file": {
+                        "type": "string",
+                        "format": "binary",
+                        "description": "분석할 이미지 파일",
+                    },
+                    "language": {
+                        "type": "string",
+                        "default": "en-US",
+                        "description": "응답 언어 (ko-KR 또는 en-US)",
+                    },
+                    "preserve_original": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "원본 이미지 저장 여부 (디버깅/재분석용, RU-006-S1)",
+                    },
+                    "session_id": {
+                        "type": "string",
+                        "description": "세션 ID (이미지 그룹화용)",
+                    },
+                },
+            }
+        }
+    },
+}
+"""OpenAPI 요청 본문 스키마 (본문을 직접 스트리밍 파싱하므로 수동 선언)."""
+
+
+def _parse_language(value: str | None) -> Language:
+    """폼 언어 값을 파싱합니다 (잘못된 값은 ko-KR)."""
+    try:
+        return Language(value or "en-US")
+    except ValueError:
+        return Language.KO
+
+
+def _language_from_headers(request: Request) -> Language:
+    """폼을 끝까지 읽기 전에 거부된 경우의 에러 메시지 언어 (Accept-Language 기준)."""
+    accept = request.headers.get("accept-language", "")
+    return Language.KO if accept.lower().startswith("ko") else Language.EN
+
+
+def _parse_form_bool(value: str | None) -> bool:
+    """폼 불리언 값을 파싱합니다 (FastAPI Form(bool)과 같은 참 값)."""
+    return (value or "").strip().lower() in ("1", "true", "on", "yes")
+
+
+def _rejection_message(error: UploadRejectedError, language: Language) -> str:
+    """업로드 거부 사유를 사용자 메시지로 변환합니다."""
+    if error.reason == UploadRejection.UNSUPPORTED_TYPE:
+        return unsupported_image_format_message(error.content_type or "unknown", language)
+    if error.reason == UploadRejection.TOO_LARGE:
+        return image_too_large_message(error.size_bytes, language)
+    if error.reason == UploadRejection.MISSING_FILE:
+        return "이미지 파일이 없습니다" if language == Language.KO else "No image file provided"
+    return "파일을 읽을 수 없습니다" if language == Language.KO else "Could not read the file"
+
+
 # =============================================================================
 # 엔드포인트 정의
 # =============================================================================
@@ -145,50 +235,43 @@ class ScannerHealthResponse(BaseModel):
     response_model=ScannerResponse,
     summary="이미지 스캔",
     description="이미지를 업로드하여 오브젝트와 아이템 후보를 추출합니다.",
+    openapi_extra={"requestBody": _SCAN_REQUEST_BODY},
 )
 async def scan_image(
-    file: Annotated[UploadFile, File(description="분석할 이미지 파일")],
-    language: Annotated[
-        str,
-        Form(description="응답 언어 (ko-KR 또는 en-US)"),
-    ] = "en-US",
-    preserve_original: Annotated[
-        bool,
-        Form(description="원본 이미지 저장 여부 (디버깅/재분석용, RU-006-S1)"),
-    ] = False,
-    session_id: Annotated[
-        str | None,
-        Form(description="세션 ID (이미지 그룹화용)"),
-    ] = None,
+    request: Request,
     service: ImageUnderstandingService = Depends(get_scanner_service),
+    icon_prefetcher: ItemIconGenerator | None = Depends(get_icon_prefetcher),
 ) -> ScannerResponse:
     """이미지를 스캔하여 오브젝트와 아이템 후보를 추출합니다.
 
     이 엔드포인트는 Scanner 슬롯 UI에서 이미지를 드롭/업로드할 때 호출됩니다.
     추출된 아이템 후보는 인벤토리에 추가하거나 세계에 배치할 수 있습니다.
 
-    Args:
-        file: 분석할 이미지 파일 (multipart/form-data)
-        language: 응답 언어 (ko-KR 또는 en-US)
+    multipart/form-data 필드:
+        file: 분석할 이미지 파일
+        language: 응답 언어 (ko-KR 또는 en-US, 기본: en-US)
         preserve_original: 원본 이미지 저장 여부 (RU-006-S1)
         session_id: 세션 ID (이미지 그룹화용)
+
+    Args:
+        request: HTTP 요청 (본문을 스트리밍으로 파싱)
         service: Scanner 서비스 (의존성 주입)
+        icon_prefetcher: 아이콘 선생성기 (의존성 주입, 비활성화 시 None)
 
     Returns:
-        ScannerResponse: 스캔 결과
-
-    Raises:
-        HTTPException: 파일 형식이 잘못되었거나 크기 초과 시
+        ScannerResponse: 스캔 결과 (업로드 거부 시 success=False)
     """
-    # 언어 파싱
-    try:
-        lang = Language(language)
-    except ValueError:
-        lang = Language.KO
-
-    # 파일 읽기
+    # 파일 읽기 (스트리밍: 크기/형식 위반 시 나머지 본문을 읽지 않고 중단)
     try:
-        content = await file.read()
+        upload = await read_image_upload(request.headers, request.stream())
+    except UploadRejectedError as e:
+        lang = _language_from_headers(request)
+        return ScannerResponse(
+            success=False,
+            status=ScanStatus.FAILED,
+            message=_rejection_message(e, lang),
+            language=lang,
+        )
     except Exception as e:
         logger.error(
             "[ScannerAPI] File read failed",
@@ -198,11 +281,16 @@ async def scan_image(
             success=False,
             status=ScanStatus.FAILED,
             message="파일을 읽을 수 없습니다",
-            language=lang,
+            language=_language_from_headers(request),
         )
 
+    lang = _parse_language(upload.fields.get("language"))
+    preserve_original = _parse_form_bool(upload.fields.get("preserve_original"))
+    session_id = upload.fields.get("session_id") or None
+    content = upload.content
+    content_type = upload.content_type
+
     # 중앙화된 파일 검증 (RULE-004, RU-006-Q1)
-    content_type = file.content_type or "application/octet-stream"
     validation_error = validate_image_upload(
         content=content,
         content_type=content_type,
@@ -225,7 +313,7 @@ async def scan_image(
     logger.info(
         "[ScannerAPI] Scan request",
         extra={
-            "filename": file.filename,
+            "filename": upload.filename,
             "content_type": content_type,
             "size_kb": len(content) // 1024,
             "language": lang.value,
@@ -245,6 +333,17 @@ async def scan_image(
         # 성공 여부 결정
         success = result.status in (ScanStatus.COMPLETED, ScanStatus.PARTIAL)
 
+        # 후보 아이콘 선생성 (클라이언트와 같은 설명 규칙: description, 없으면 label)
+        if success and icon_prefetcher is not None and result.item_candidates:
+            icon_prefetcher.prefetch_icons(
+                (
+                    (candidate.id, candidate.description or candidate.label)
+                    for candidate in result.item_candidates
+                ),
+                language=lang.value,
+                session_id=session_id,
+            )
+
         return ScannerResponse(
             success=success,
             status=result.status,
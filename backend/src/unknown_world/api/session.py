@@ -0,0 +1,751 @@
+"""Unknown World - 세션 전송 계층 (WebSocket + SSE 폴백).
+
+POST /api/turn은 턴마다 새 HTTP 요청(헤더 파싱/CORS preflight/연결 수립)을 치르므로,
+하나의 영속 연결에서 턴/이미지/아이콘 이벤트를 다중화하는 세션 전송을 제공합니다.
+
+전송:
+    - WebSocket: /api/session/ws (양방향, 권장)
+    - SSE 폴백: POST /api/session (세션 생성)
+      → GET /api/session/{session_id}/events (서버 → 클라이언트)
+      → POST /api/session/{session_id}/messages (클라이언트 → 서버, 202)
+
+클라이언트 메시지 (WebSocket 텍스트 프레임 / messages 본문):
+    - {"type": "turn", "request_id": "...", "data": TurnInput, "seed": 선택,
+       "idempotency_key": 선택 (재연결 후 재시도 시 저장된 결과 재생/진행 중 턴 합류)}
+    - {"type": "image", "request_id": "...", "data": GenerateImageRequest}
+    - {"type": "icons", "request_id": "...", "data": BatchIconRequest}
+    - {"type": "cancel", "request_id": "..."}
+    - {"type": "ping"}
+
+서버 메시지 (봉투):
+    {"channel": "turn|image|icon|session", "request_id": "...", "event": {...}}
+    - turn 채널의 event는 /api/turn NDJSON 이벤트와 동일 (stage/badges/.../final)
+    - icon 채널의 event는 /api/icons/stream 이벤트와 동일 (icon... → done)
+    - image 채널의 event는 {"type": "image", ...GenerateImageResponse}
+
+설계 원칙:
+    - /api/turn과 같은 파이프라인/이벤트 매핑 재사용 (_stream_turn_events, _convert_pipeline_event)
+    - 세션 상태(session_id, 진행 중 요청, 마지막 활동 시각)는 서버 측에 유지
+      → 이미지/아이콘 요청의 session_id를 자동으로 채워 세션 단위 대체/공정성 보장
+    - RULE-004: 입력 검증 실패/처리 예외 시에도 error 이벤트로 응답 (연결 유지)
+    - RULE-008: 이벤트는 생성 즉시 push (outbox는 크기 제한, 가득 차면 요청 생산자 대기)
+    - session 채널 응답(pong/cancelled/error)은 outbox가 가득 차면 버림
+      (메시지 POST가 소비자 없는 outbox에서 멈추지 않도록)
+    - 연결이 끊기면 진행 중인 요청을 취소 (세션 자체는 유휴 TTL 동안 재연결 가능)
+    - 전송 없이 유예 시간이 지나면 진행 중인 요청을 중단하고 새 요청을 거부
+      (SSE 폴백은 이벤트 스트림을 열기 전에 메시지를 보낼 수 있으므로 유예 시간을 둠)
+
+환경변수:
+    - UW_SESSION_OUTBOX_SIZE: 세션 outbox 최대 메시지 수 (기본: 256)
+    - UW_SESSION_IDLE_TTL_S: 연결 없는 세션 보존 시간 (기본: 300초)
+    - UW_SESSION_ATTACH_GRACE_S: 전송 없이 요청을 유지하는 시간 (기본: 15초)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+import uuid
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from typing import Any, cast
+
+from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from unknown_world.api.image import GenerateImageRequest, generate_image
+from unknown_world.api.item_icon import BatchIconRequest, resolve_icon_batch, stream_icon_events
+from unknown_world.api.turn import open_turn_stream, parse_turn_body, stream_input_error
+from unknown_world.api.turn_replay import IdempotencyKeyConflictError, is_valid_idempotency_key
+from unknown_world.services.image_generation import get_image_generator
+from unknown_world.services.image_jobs import get_image_job_registry
+from unknown_world.services.item_icon_generator import get_item_icon_generator
+
+# =============================================================================
+# 라우터 정의
+# =============================================================================
+
+router = APIRouter(prefix="/api", tags=["Session"])
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_SESSION_OUTBOX_SIZE = 256
+"""기본 세션 outbox 최대 메시지 수."""
+
+DEFAULT_SESSION_IDLE_TTL_SECONDS = 300.0
+"""기본 유휴 세션 보존 시간 (초)."""
+
+DEFAULT_SESSION_ATTACH_GRACE_SECONDS = 15.0
+"""기본 전송 없는 요청 유지 시간 (초, TurnReplayStore 재연결 대기 시간과 동일)."""
+
+_SEND_POLL_SECONDS = 0.5
+"""outbox가 가득 찼을 때 전송 상태를 다시 확인하는 주기 (초)."""
+
+
+class SessionChannel:
+    """세션 메시지 채널."""
+
+    TURN = "turn"
+    IMAGE = "image"
+    ICON = "icon"
+    SESSION = "session"
+
+
+def get_session_outbox_size() -> int:
+    """환경변수에서 세션 outbox 최대 메시지 수를 읽습니다."""
+    return max(1, int(os.environ.get("UW_SESSION_OUTBOX_SIZE", str(DEFAULT_SESSION_OUTBOX_SIZE))))
+
+
+def get_session_idle_ttl_seconds() -> float:
+    """환경변수에서 유휴 세션 보존 시간을 읽습니다."""
+    return float(os.environ.get("UW_SESSION_IDLE_TTL_S", str(DEFAULT_SESSION_IDLE_TTL_SECONDS)))
+
+
+def get_session_attach_grace_seconds() -> float:
+    """환경변수에서 전송 없는 요청 유지 시간을 읽습니다."""
+    return float(
+        os.environ.get("UW_SESSION_ATTACH_GRACE_S", str(DEFAULT_SESSION_ATTACH_GRACE_SECONDS))
+    )
+
+
+class SessionTransportLostError(Exception):
+    """전송 없이 유예 시간이 지나 요청 이벤트를 받을 소비자가 없을 때 발생합니다."""
+
+
+# =============================================================================
+# 봉투 직렬화
+# =============================================================================
+
+_ENVELOPE_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def session_envelope(channel: str, request_id: str | None, line: bytes) -> str:
+    """NDJSON 이벤트 라인을 세션 봉투로 감쌉니다 (이벤트 JSON은 재직렬화 없이 삽입).
+
+    Args:
+        channel: 메시지 채널 (SessionChannel)
+        request_id: 클라이언트 요청 ID (세션 이벤트는 None)
+        line: NDJSON 이벤트 라인 (개행 포함 가능)
+
+    Returns:
+        str: 봉투 JSON (개행 없음)
+    """
+    head = _ENVELOPE_ENCODER.encode({"channel": channel, "request_id": request_id})
+    event = line.rstrip(b"\n").decode("utf-8")
+    return f'{head[:-1]},"event":{event}}}'
+
+
+def _event_line(event: dict[str, Any]) -> bytes:
+    return _ENVELOPE_ENCODER.encode(event).encode("utf-8")
+
+
+# =============================================================================
+# 세션
+# =============================================================================
+
+
+class TurnSession:
+    """서버 측 세션 상태 (outbox + 진행 중인 요청)."""
+
+    def __init__(
+        self,
+        session_id: str | None = None,
+        *,
+        outbox_size: int | None = None,
+        attach_grace_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """TurnSession을 초기화합니다.
+
+        Args:
+            session_id: 세션 ID (기본: 새 UUID)
+            outbox_size: outbox 최대 메시지 수 (기본: 환경변수 UW_SESSION_OUTBOX_SIZE)
+            attach_grace_seconds: 전송 없는 요청 유지 시간
+                (기본: 환경변수 UW_SESSION_ATTACH_GRACE_S)
+            clock: 단조 시계 (테스트 주입용)
+        """
+        self.session_id = session_id or uuid.uuid4().hex
+        self._clock = clock
+        self._outbox: asyncio.Queue[tuple[str, str]] = asyncio.Queue(
+            outbox_size or get_session_outbox_size()
+        )
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._attached = False
+        self._closed = False
+        self._grace = (
+            attach_grace_seconds
+            if attach_grace_seconds is not None
+            else get_session_attach_grace_seconds()
+        )
+        self.created_at = clock()
+        self.last_activity = self.created_at
+        self._unattached_since = self.created_at
+        self.turn_count = 0
+        self.message_count = 0
+        self.dropped_replies = 0
+
+    # -------------------------------------------------------------------------
+    # 상태
+    # -------------------------------------------------------------------------
+
+    @property
+    def attached(self) -> bool:
+        """전송(WebSocket/SSE)이 연결되어 있는지 여부."""
+        return self._attached
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def active_requests(self) -> list[str]:
+        """진행 중인 요청 ID 목록."""
+        return list(self._tasks)
+
+    @property
+    def transport_expired(self) -> bool:
+        """전송 없이 유예 시간 이상 지났는지 여부 (진행 중인 요청 중단, 새 요청 거부)."""
+        return not self._attached and self._clock() - self._unattached_since >= self._grace
+
+    def is_idle_expired(self, ttl_seconds: float) -> bool:
+        """연결 없이 ttl_seconds 이상 지났는지 여부."""
+        return not self._attached and self._clock() - self.last_activity >= ttl_seconds
+
+    def attach(self) -> None:
+        """전송 연결을 표시합니다 (세션당 한 번에 하나의 전송만 허용).
+
+        Raises:
+            RuntimeError: 이미 다른 전송이 연결되어 있을 때
+        """
+        if self._attached:
+            raise RuntimeError("Session already has an attached transport")
+        self._attached = True
+        self.last_activity = self._clock()
+
+    async def detach(self) -> None:
+        """전송 연결을 해제하고 진행 중인 요청을 취소합니다."""
+        self._attached = False
+        self.last_activity = self._clock()
+        self._unattached_since = self.last_activity
+        await self.cancel_all()
+
+    async def close(self) -> None:
+        """세션을 종료합니다 (진행 중인 요청 취소)."""
+        self.expire()
+        await self.cancel_all()
+
+    def expire(self) -> None:
+        """세션을 종료 상태로 표시하고 진행 중인 요청에 취소를 요청합니다 (대기 없음)."""
+        self._closed = True
+        for task in self._tasks.values():
+            task.cancel()
+
+    # -------------------------------------------------------------------------
+    # outbox
+    # -------------------------------------------------------------------------
+
+    async def send(self, channel: str, request_id: str | None, line: bytes) -> None:
+        """요청 이벤트 라인을 봉투로 감싸 outbox에 추가합니다 (가득 차면 대기).
+
+        Raises:
+            SessionTransportLostError: 세션이 종료되었거나 전송 없이 유예 시간이 지났을 때
+        """
+        item = (channel, session_envelope(channel, request_id, line))
+        while True:
+            if self._closed or self.transport_expired:
+                raise SessionTransportLostError(self.session_id)
+            try:
+                await asyncio.wait_for(self._outbox.put(item), _SEND_POLL_SECONDS)
+            except TimeoutError:
+                continue
+            return
+
+    async def send_event(self, channel: str, request_id: str | None, event: dict[str, Any]) -> None:
+        """dict 이벤트를 outbox에 추가합니다."""
+        await self.send(channel, request_id, _event_line(event))
+
+    def reply(self, request_id: str | None, event: dict[str, Any]) -> None:
+        """session 채널 응답(pong/cancelled/error)을 outbox에 추가합니다 (가득 차면 버림).
+
+        handle_message는 메시지 POST 요청 안에서 실행되므로, 소비자가 없는 outbox에서
+        대기하면 요청이 멈춥니다. 응답은 버리고 dropped_replies로 집계합니다.
+        """
+        envelope = session_envelope(SessionChannel.SESSION, request_id, _event_line(event))
+        try:
+            self._outbox.put_nowait((SessionChannel.SESSION, envelope))
+        except asyncio.QueueFull:
+            self.dropped_replies += 1
+            logger.warning(
+                "[Session] Outbox full, session reply dropped",
+                extra={"event_type": event.get("type"), "dropped": self.dropped_replies},
+            )
+
+    async def next_message(self) -> tuple[str, str]:
+        """outbox에서 다음 (채널, 봉투)를 꺼냅니다 (없으면 대기)."""
+        return await self._outbox.get()
+
+    # -------------------------------------------------------------------------
+    # 메시지 처리
+    # -------------------------------------------------------------------------
+
+    async def handle_message(self, message: Any) -> None:
+        """클라이언트 메시지 하나를 처리합니다 (요청은 백그라운드 태스크로 실행).
+
+        잘못된 메시지는 연결을 끊지 않고 session 채널 error 이벤트로 응답합니다.
+        """
+        self.last_activity = self._clock()
+        self.message_count += 1
+
+        if not isinstance(message, dict):
+            self._send_error(None, "Message must be a JSON object", "INVALID_MESSAGE")
+            return
+        message = cast(dict[str, Any], message)
+
+        message_type = message.get("type")
+        request_id = message.get("request_id")
+        if request_id is not None and not isinstance(request_id, str):
+            self._send_error(None, "request_id must be a string", "INVALID_MESSAGE")
+            return
+
+        if message_type == "ping":
+            self.reply(request_id, {"type": "pong"})
+            return
+
+        if message_type == "cancel":
+            cancelled = await self.cancel(request_id) if request_id else False
+            self.reply(request_id, {"type": "cancelled", "cancelled": cancelled})
+            return
+
+        handlers = {
+            "turn": self._run_turn,
+            "image": self._run_image,
+            "icons": self._run_icons,
+        }
+        handler = handlers.get(message_type) if isinstance(message_type, str) else None
+        if handler is None:
+            self._send_error(request_id, f"Unknown message type: {message_type}", "INVALID_MESSAGE")
+            return
+        if not request_id:
+            self._send_error(None, "request_id is required", "INVALID_MESSAGE")
+            return
+        if request_id in self._tasks:
+            self._send_error(request_id, "Duplicate request_id", "DUPLICATE_REQUEST")
+            return
+        if self.transport_expired:
+            self._send_error(request_id, "No transport attached to session", "NO_TRANSPORT")
+            return
+
+        self._start(request_id, handler(request_id, message))
+
+    def _start(self, request_id: str, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(self._run_request(request_id, coro))
+        self._tasks[request_id] = task
+
+        def _done(_: asyncio.Task[None]) -> None:
+            if self._tasks.get(request_id) is task:
+                del self._tasks[request_id]
+
+        task.add_done_callback(_done)
+
+    async def _run_request(self, request_id: str, coro: Coroutine[Any, Any, None]) -> None:
+        """요청 태스크 본체 (전송 없이 유예 시간이 지나면 조용히 중단)."""
+        try:
+            await coro
+        except SessionTransportLostError:
+            logger.info(
+                "[Session] Request stopped: no transport attached",
+                extra={"request_id": request_id},
+            )
+
+    async def cancel(self, request_id: str) -> bool:
+        """진행 중인 요청을 취소합니다.
+
+        Returns:
+            bool: 취소한 요청이 있었는지 여부
+        """
+        task = self._tasks.pop(request_id, None)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        return True
+
+    async def cancel_all(self) -> None:
+        """진행 중인 모든 요청을 취소합니다."""
+        for request_id in list(self._tasks):
+            await self.cancel(request_id)
+
+    def _send_error(self, request_id: str | None, message: str, code: str) -> None:
+        self.reply(request_id, {"type": "error", "message": message, "code": code})
+
+    async def _is_disconnected(self) -> bool:
+        # 전송 연결 해제 시에는 detach()가 직접 취소하므로, 여기서는 세션 종료와
+        # 전송 없는 유예 시간 초과만 확인 (SSE 폴백은 이벤트 스트림을 열기 전에 메시지를 보낼 수 있음)
+        return self._closed or self.transport_expired
+
+    async def _run_turn(self, request_id: str, message: dict[str, Any]) -> None:
+        """턴 요청: /api/turn과 같은 NDJSON 이벤트를 turn 채널로 송출합니다.
+
+        idempotency_key가 있으면 /api/turn의 Idempotency-Key와 같은 재생 저장소를 사용합니다
+        (재연결 후 재시도 시 저장된 결과 재생 또는 진행 중인 턴에 합류).
+        """
+        parse_result = parse_turn_body(message.get("data"))
+        stream: AsyncGenerator[bytes]
+        if isinstance(parse_result, dict):
+            stream = stream_input_error(parse_result)
+        else:
+            seed = message.get("seed")
+            idempotency_key = message.get("idempotency_key")
+            if idempotency_key is not None and (
+                not isinstance(idempotency_key, str)
+                or not is_valid_idempotency_key(idempotency_key)
+            ):
+                self._send_error(request_id, "Invalid idempotency_key", "INVALID_MESSAGE")
+                return
+            try:
+                _, stream = open_turn_stream(
+                    parse_result,
+                    seed if isinstance(seed, int) else None,
+                    idempotency_key=idempotency_key,
+                    is_disconnected=self._is_disconnected,
+                )
+            except IdempotencyKeyConflictError:
+                self._send_error(
+                    request_id,
+                    "idempotency_key reused with a different turn input",
+                    "IDEMPOTENCY_KEY_CONFLICT",
+                )
+                return
+            self.turn_count += 1
+
+        async with contextlib.aclosing(stream):
+            async for line in stream:
+                await self.send(SessionChannel.TURN, request_id, line)
+
+    async def _run_image(self, request_id: str, message: dict[str, Any]) -> None:
+        """이미지 요청: 생성이 끝나면 결과(상태/URL)를 image 채널로 push합니다."""
+        try:
+            request = GenerateImageRequest.model_validate(message.get("data"))
+        except ValidationError:
+            self._send_error(request_id, "Invalid image request", "VALIDATION_ERROR")
+            return
+        if request.session_id is None:
+            request = request.model_copy(update={"session_id": self.session_id})
+
+        try:
+            response = await generate_image(
+                request,
+                generator=get_image_generator(),
+                registry=get_image_job_registry(),
+            )
+        except HTTPException as e:
+            self._send_error(request_id, str(e.detail), "IMAGE_ERROR")
+            return
+        await self.send_event(
+            SessionChannel.IMAGE,
+            request_id,
+            {"type": "image", **response.model_dump(mode="json")},
+        )
+
+    async def _run_icons(self, request_id: str, message: dict[str, Any]) -> None:
+        """아이콘 배치 요청: /api/icons/stream과 같은 이벤트를 icon 채널로 송출합니다."""
+        try:
+            request = BatchIconRequest.model_validate(message.get("data"))
+        except ValidationError:
+            self._send_error(request_id, "Invalid icon request", "VALIDATION_ERROR")
+            return
+        if request.session_id is None:
+            request = request.model_copy(update={"session_id": self.session_id})
+
+        generator = get_item_icon_generator()
+        initial = await resolve_icon_batch(generator, request)
+        async for line in stream_icon_events(generator, initial, sse=False):
+            await self.send(SessionChannel.ICON, request_id, line.encode("utf-8"))
+
+
+# =============================================================================
+# 세션 레지스트리
+# =============================================================================
+
+
+class SessionRegistry:
+    """세션 ID → TurnSession 레지스트리 (유휴 세션은 조회/생성 시 정리)."""
+
+    def __init__(self, *, idle_ttl_seconds: float | None = None) -> None:
+        self._sessions: dict[str, TurnSession] = {}
+        self._idle_ttl = (
+            idle_ttl_seconds if idle_ttl_seconds is not None else get_session_idle_ttl_seconds()
+        )
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self) -> TurnSession:
+        """새 세션을 생성합니다."""
+        self._evict_idle()
+        session = TurnSession()
+        self._sessions[session.session_id] = session
+        logger.info("[Session] Session created", extra={"active_sessions": len(self._sessions)})
+        return session
+
+    def get(self, session_id: str) -> TurnSession | None:
+        """세션을 조회합니다 (만료/종료된 세션은 None)."""
+        self._evict_idle()
+        return self._sessions.get(session_id)
+
+    def get_or_create(self, session_id: str | None) -> TurnSession:
+        """기존 세션을 재개하거나 새 세션을 생성합니다."""
+        if session_id:
+            session = self.get(session_id)
+            if session is not None:
+                return session
+        return self.create()
+
+    async def remove(self, session_id: str) -> bool:
+        """세션을 종료하고 제거합니다."""
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        await session.close()
+        return True
+
+    def _evict_idle(self) -> None:
+        expired = [sid for sid, s in self._sessions.items() if s.is_idle_expired(self._idle_ttl)]
+        for session_id in expired:
+            self._sessions.pop(session_id).expire()
+        if expired:
+            logger.info("[Session] Idle sessions evicted", extra={"evicted": len(expired)})
+
+    def get_stats(self) -> dict[str, int]:
+        """세션 지표를 반환합니다."""
+        sessions = list(self._sessions.values())
+        return {
+            "sessions": len(sessions),
+            "attached": sum(1 for s in sessions if s.attached),
+            "active_requests": sum(len(s.active_requests) for s in sessions),
+        }
+
+
+_registry_instance: SessionRegistry | None = None
+
+
+def get_session_registry() -> SessionRegistry:
+    """SessionRegistry 싱글톤 인스턴스를 반환합니다."""
+    global _registry_instance
+
+    if _registry_instance is None:
+        _registry_instance = SessionRegistry()
+    return _registry_instance
+
+
+def reset_session_registry() -> None:
+    """세션 레지스트리를 초기화합니다 (테스트용)."""
+    global _registry_instance
+    _registry_instance = None
+
+
+def _ready_event(session: TurnSession) -> bytes:
+    return _event_line({"type": "ready", "session_id": session.session_id})
+
+
+# =============================================================================
+# WebSocket 전송
+# =============================================================================
+
+
+@router.websocket("/session/ws")
+async def session_websocket(websocket: WebSocket) -> None:
+    """세션 WebSocket 전송.
+
+    연결 직후 session 채널 ready 이벤트(session_id 포함)를 보내고,
+    이후 텍스트 프레임(JSON 메시지)을 받아 턴/이미지/아이콘 요청을 다중화합니다.
+    쿼리 파라미터 session_id로 기존 세션을 재개할 수 있습니다.
+    """
+    registry = get_session_registry()
+    session = registry.get_or_create(websocket.query_params.get("session_id"))
+    try:
+        session.attach()
+    except RuntimeError:
+        await websocket.close(code=4409, reason="Session already attached")
+        return
+
+    await websocket.accept()
+    await websocket.send_text(session_envelope(SessionChannel.SESSION, None, _ready_event(session)))
+
+    async def writer() -> None:
+        while True:
+            _, envelope = await session.next_message()
+            await websocket.send_text(envelope)
+
+    writer_task = asyncio.create_task(writer())
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                message = json.loads(raw)
+            except ValueError:
+                message = None
+            await session.handle_message(message)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(
+            "[Session] WebSocket transport failed",
+            extra={"error_type": type(e).__name__},
+        )
+    finally:
+        writer_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await writer_task
+        await session.detach()
+        logger.info(
+            "[Session] WebSocket detached",
+            extra={"turns": session.turn_count, "messages": session.message_count},
+        )
+
+
+# =============================================================================
+# SSE 폴백
+# =============================================================================
+
+
+def _require_session(session_id: str) -> TurnSession:
+    session = get_session_registry().get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return session
+
+
+async def _stream_session_sse(
+    session: TurnSession,
+    is_disconnected: Callable[[], Any] | None = None,
+    *,
+    poll_seconds: float = 0.5,
+) -> AsyncGenerator[str]:
+    """세션 outbox를 SSE 메시지로 송출합니다 (event: 채널명).
+
+    Args:
+        session: 연결된 세션 (호출 전에 attach됨, 종료 시 detach)
+        is_disconnected: 클라이언트 연결 끊김 확인 함수
+        poll_seconds: 메시지가 없을 때 연결 끊김 확인 주기
+
+    Yields:
+        str: SSE 메시지
+    """
+    try:
+        yield (
+            f"event: {SessionChannel.SESSION}\n"
+            f"data: {session_envelope(SessionChannel.SESSION, None, _ready_event(session))}\n\n"
+        )
+        while not session.closed:
+            try:
+                channel, envelope = await asyncio.wait_for(session.next_message(), poll_seconds)
+            except TimeoutError:
+                if is_disconnected is not None and await is_disconnected():
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: {channel}\ndata: {envelope}\n\n"
+    finally:
+        await session.detach()
+
+
+@router.post(
+    "/session",
+    status_code=201,
+    summary="세션 생성 (SSE 폴백)",
+    description="SSE 폴백용 세션을 생성합니다. WebSocket은 /api/session/ws를 사용합니다.",
+)
+async def create_session() -> dict[str, str]:
+    """세션을 생성하고 session_id를 반환합니다."""
+    session = get_session_registry().create()
+    return {"session_id": session.session_id}
+
+
+@router.get(
+    "/session/{session_id}/events",
+    response_class=StreamingResponse,
+    summary="세션 이벤트 스트림 (SSE)",
+    responses={
+        200: {
+            "description": "세션 이벤트 스트림",
+            "content": {
+                "text/event-stream": {
+                    "example": 'event: turn\ndata: {"channel":"turn","request_id":"r1",'
+                    '"event":{"type":"stage","name":"parse","status":"start"}}\n\n'
+                }
+            },
+        },
+        404: {"description": "세션 없음"},
+        409: {"description": "이미 다른 전송이 연결됨"},
+    },
+)
+async def session_events(request: Request, session_id: str) -> StreamingResponse:
+    """세션 outbox를 SSE로 송출합니다 (세션당 한 번에 하나의 스트림)."""
+    session = _require_session(session_id)
+    try:
+        session.attach()
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail="Session already attached") from e
+
+    return StreamingResponse(
+        _stream_session_sse(session, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
+        },
+    )
+
+
+@router.post(
+    "/session/{session_id}/messages",
+    status_code=202,
+    summary="세션 메시지 전송 (SSE 폴백)",
+    description="WebSocket 텍스트 프레임과 같은 형식의 메시지를 전송합니다.",
+    responses={
+        404: {"description": "세션 없음"},
+        409: {"description": "유예 시간 안에 이벤트 스트림이 연결되지 않음"},
+    },
+)
+async def post_session_message(request: Request, session_id: str) -> dict[str, Any]:
+    """클라이언트 메시지를 세션에 전달합니다 (결과는 이벤트 스트림으로 송출)."""
+    session = _require_session(session_id)
+    if session.transport_expired:
+        raise HTTPException(status_code=409, detail="No event stream attached to session")
+    try:
+        message = await request.json()
+    except ValueError:
+        message = None
+    await session.handle_message(message)
+    return {"accepted": True, "active_requests": session.active_requests}
+
+
+@router.delete(
+    "/session/{session_id}",
+    summary="세션 종료",
+)
+async def delete_session(session_id: str) -> dict[str, bool]:
+    """세션을 종료하고 진행 중인 요청을 취소합니다."""
+    removed = await get_session_registry().remove(session_id)
+    if not removed:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return {"closed": True}
+
+
+@router.get(
+    "/session/health",
+    summary="세션 전송 헬스체크",
+)
+async def session_health() -> dict[str, Any]:
+    """세션 레지스트리 지표를 반환합니다."""
+    return {"status": "ok", **get_session_registry().get_stats()}
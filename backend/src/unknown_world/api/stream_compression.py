@@ -0,0 +1,275 @@
+"""Unknown World - NDJSON 스트림 압축 (gzip/brotli, 이벤트 단위 flush).
+
+/api/turn NDJSON 스트림을 Accept-Encoding 협상에 따라 압축합니다.
+일반 GZip 미들웨어는 버퍼가 찰 때까지 출력을 모으므로 stage/narrative_delta 이벤트가 늦게
+도착하지만, 이 모듈은 이벤트(청크)마다 sync flush하여 지연 없이 압축된 조각을 전달합니다.
+큰 final 이벤트(카드/오브젝트/월드 델타, UTF-8 한국어 텍스트)에서 전송량 이득이 큽니다.
+
+인코딩 선택:
+    - br: brotli 패키지가 설치되어 있고 클라이언트가 허용할 때 (선택 의존성)
+    - gzip: 클라이언트가 허용할 때
+    - identity: 그 외 (또는 UW_STREAM_COMPRESSION=0)
+
+설계 원칙:
+    - RULE-008: 단계 이벤트 가시성 유지 (이벤트마다 flush → TTFB/타자 효과 보존)
+    - RULE-007: 스트림 내용은 로깅하지 않음 (바이트 수/압축률만 기록)
+
+환경변수:
+    - UW_STREAM_COMPRESSION: 스트림 압축 활성화 (기본: "1")
+    - UW_STREAM_COMPRESSION_LEVEL: gzip 레벨/brotli 품질 (기본: 5)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import zlib
+from collections.abc import AsyncGenerator, AsyncIterator
+from enum import StrEnum
+from typing import Any, Protocol
+
+try:
+    import brotli  # pyright: ignore[reportMissingImports]
+except ImportError:  # 선택 의존성: 미설치 시 gzip만 사용
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_STREAM_COMPRESSION_LEVEL = 5
+"""기본 압축 레벨 (스트리밍: 속도/압축률 균형)."""
+
+
+class StreamEncoding(StrEnum):
+    """스트림 Content-Encoding."""
+
+    BROTLI = "br"
+    GZIP = "gzip"
+    IDENTITY = "identity"
+
+
+def is_stream_compression_enabled() -> bool:
+    """환경변수에서 스트림 압축 활성화 여부를 읽습니다."""
+    return os.environ.get("UW_STREAM_COMPRESSION", "1").lower() not in ("0", "false", "no")
+
+
+def get_stream_compression_level() -> int:
+    """환경변수에서 압축 레벨을 읽습니다 (1~9, 잘못된 값이면 기본값)."""
+    try:
+        level = int(
+            os.environ.get("UW_STREAM_COMPRESSION_LEVEL", str(DEFAULT_STREAM_COMPRESSION_LEVEL))
+        )
+    except ValueError:
+        return DEFAULT_STREAM_COMPRESSION_LEVEL
+    return min(9, max(1, level))
+
+
+def is_brotli_available() -> bool:
+    """brotli 패키지 설치 여부."""
+    return brotli is not None
+
+
+# =============================================================================
+# 협상
+# =============================================================================
+
+
+def _parse_accept_encoding(header: str) -> dict[str, float]:
+    """Accept-Encoding 헤더를 {코딩: q값}으로 파싱합니다."""
+    accepted: dict[str, float] = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_stream_encoding(accept_encoding: str | None) -> StreamEncoding:
+    """Accept-Encoding 헤더로 스트림 인코딩을 결정합니다.
+
+    q=0인 코딩은 제외하고, 허용된 코딩 중 br → gzip 순으로 선호합니다 ("*" 포함).
+
+    Args:
+        accept_encoding: 요청 Accept-Encoding 헤더 값
+
+    Returns:
+        StreamEncoding: 선택된 인코딩 (비활성화/미허용 시 IDENTITY)
+    """
+    if not accept_encoding or not is_stream_compression_enabled():
+        return StreamEncoding.IDENTITY
+
+    accepted = _parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    candidates = [StreamEncoding.GZIP]
+    if is_brotli_available():
+        candidates.insert(0, StreamEncoding.BROTLI)
+
+    best = StreamEncoding.IDENTITY
+    best_q = 0.0
+    for encoding in candidates:
+        q = accepted.get(encoding.value, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+# =============================================================================
+# 압축기
+# =============================================================================
+
+
+class _StreamCompressor(Protocol):
+    def compress_flush(self, data: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    """gzip 컨테이너 + Z_SYNC_FLUSH (청크마다 바이트 경계에서 출력)."""
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress_flush(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    """brotli 스트리밍 압축 + 청크마다 flush."""
+
+    def __init__(self, level: int) -> None:
+        assert brotli is not None
+        self._compressor: Any = brotli.Compressor(quality=level)  # pyright: ignore[reportUnknownMemberType]
+
+    def compress_flush(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _create_compressor(encoding: StreamEncoding, level: int) -> _StreamCompressor:
+    if encoding == StreamEncoding.BROTLI:
+        return _BrotliCompressor(level)
+    return _GzipCompressor(level)
+
+
+# =============================================================================
+# 압축 지표
+# =============================================================================
+
+
+class StreamCompressionStats:
+    """인코딩별 스트림 수/원본·압축 바이트 누적 지표."""
+
+    def __init__(self) -> None:
+        self._streams: dict[str, int] = {}
+        self._raw_bytes: dict[str, int] = {}
+        self._compressed_bytes: dict[str, int] = {}
+
+    def record(self, encoding: StreamEncoding, raw_bytes: int, compressed_bytes: int) -> None:
+        """완료된 스트림 하나를 기록합니다."""
+        key = encoding.value
+        self._streams[key] = self._streams.get(key, 0) + 1
+        self._raw_bytes[key] = self._raw_bytes.get(key, 0) + raw_bytes
+        self._compressed_bytes[key] = self._compressed_bytes.get(key, 0) + compressed_bytes
+
+    def get_stats(self) -> dict[str, dict[str, float | int]]:
+        """인코딩별 지표를 반환합니다 (ratio: 압축 바이트 / 원본 바이트)."""
+        stats: dict[str, dict[str, float | int]] = {}
+        for key, streams in self._streams.items():
+            raw = self._raw_bytes[key]
+            compressed = self._compressed_bytes[key]
+            stats[key] = {
+                "streams": streams,
+                "raw_bytes": raw,
+                "compressed_bytes": compressed,
+                "ratio": round(compressed / raw, 3) if raw else 0.0,
+            }
+        return stats
+
+
+_stats_instance: StreamCompressionStats | None = None
+
+
+def get_stream_compression_stats() -> StreamCompressionStats:
+    """StreamCompressionStats 싱글톤 인스턴스를 반환합니다."""
+    global _stats_instance
+
+    if _stats_instance is None:
+        _stats_instance = StreamCompressionStats()
+    return _stats_instance
+
+
+def reset_stream_compression_stats() -> None:
+    """압축 지표를 초기화합니다 (테스트용)."""
+    global _stats_instance
+    _stats_instance = None
+
+
+# =============================================================================
+# 스트림 래퍼
+# =============================================================================
+
+
+async def compress_stream(
+    source: AsyncIterator[bytes],
+    encoding: StreamEncoding,
+    *,
+    level: int | None = None,
+) -> AsyncGenerator[bytes]:
+    """NDJSON bytes 스트림을 이벤트(청크) 단위 flush로 압축합니다.
+
+    Args:
+        source: NDJSON 라인 스트림
+        encoding: 협상된 인코딩 (IDENTITY면 그대로 전달)
+        level: 압축 레벨 (기본: 환경변수 UW_STREAM_COMPRESSION_LEVEL)
+
+    Yields:
+        bytes: 압축된 조각 (각 조각은 그 시점까지의 이벤트를 완전히 복원 가능)
+    """
+    if encoding == StreamEncoding.IDENTITY:
+        async for chunk in source:
+            yield chunk
+        return
+
+    compressor = _create_compressor(encoding, level or get_stream_compression_level())
+    raw_bytes = 0
+    compressed_bytes = 0
+    try:
+        async for chunk in source:
+            raw_bytes += len(chunk)
+            data = compressor.compress_flush(chunk)
+            compressed_bytes += len(data)
+            yield data
+
+        tail = compressor.finish()
+        compressed_bytes += len(tail)
+        yield tail
+    finally:
+        # 클라이언트 Abort(취소)로 중단된 스트림도 전송한 만큼 기록
+        get_stream_compression_stats().record(encoding, raw_bytes, compressed_bytes)
+        logger.debug(
+            "[StreamCompression] Stream finished",
+            extra={
+                "encoding": encoding.value,
+                "raw_bytes": raw_bytes,
+                "compressed_bytes": compressed_bytes,
+            },
+        )
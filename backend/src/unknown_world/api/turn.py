@@ -8,6 +8,8 @@ POST 요청을 받아 NDJSON(라인 단위 JSON) 스트리밍으로 턴 결과
     - RULE-005: 재화 인바리언트 (잔액 음수 금지)
     - RULE-007: 프롬프트/내부 추론 노출 금지
     - RULE-008: 단계/배지 가시화, TTFB 2초 목표
+    - Accept-Encoding 협상 시 gzip/br 압축 (이벤트 단위 flush, stream_compression 참조)
+    - Idempotency-Key 헤더가 있으면 재시도 시 저장된 결과 재생/진행 중 턴 합류 (turn_replay 참조)
 
 스트림 이벤트 타입:
     - stage: 단계 진행 상태 (Parse→Validate→Plan→Resolve→Render→Verify→Commit)
@@ -33,22 +35,42 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import json
+import logging
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
 from typing import Any, cast
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
+from unknown_world.api.stream_compression import (
+    StreamEncoding,
+    compress_stream,
+    get_stream_compression_stats,
+    is_brotli_available,
+    is_stream_compression_enabled,
+    negotiate_stream_encoding,
+)
+from unknown_world.api.turn_event_queue import (
+    TurnEventQueue,
+    get_turn_disconnect_poll_seconds,
+    get_turn_stream_metrics,
+)
+from unknown_world.api.turn_replay import (
+    IdempotencyKeyConflictError,
+    TurnReplayMode,
+    get_turn_replay_store,
+    is_valid_idempotency_key,
+    turn_fingerprint,
+)
 from unknown_world.api.turn_stream_events import (
-    BadgesEvent,
-    NarrativeDeltaEvent,
-    RepairEvent,
-    StageEvent,
     StageStatus,
-    StreamEventType,
-    serialize_event,
+    badges_event_line,
+    narrative_delta_event_line,
+    repair_event_line,
+    stage_event_line,
 )
 from unknown_world.api.turn_streaming_helpers import (
     emit_error_with_fallback,
@@ -67,6 +89,7 @@ from unknown_world.orchestrator.stages.types import (
     PipelineEvent,
     PipelineEventType,
 )
+from unknown_world.schemas.artifacts import get_turn_schema_artifacts
 
 # =============================================================================
 # 라우터 정의
@@ -74,70 +97,50 @@ from unknown_world.orchestrator.stages.types import (
 
 router = APIRouter(prefix="/api", tags=["Turn"])
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Pipeline Event → Stream Event 변환
 # =============================================================================
 
+_STAGE_STATUS_BY_EVENT: dict[PipelineEventType, str] = {
+    PipelineEventType.STAGE_START: StageStatus.START,
+    PipelineEventType.STAGE_COMPLETE: StageStatus.COMPLETE,
+    PipelineEventType.STAGE_FAIL: StageStatus.FAIL,
+}
+
 
-def _convert_pipeline_event(event: PipelineEvent) -> dict[str, Any] | None:
-    """파이프라인 이벤트를 스트림 이벤트로 변환합니다.
+def _convert_pipeline_event(event: PipelineEvent) -> bytes | None:
+    """파이프라인 이벤트를 NDJSON 스트림 라인으로 변환합니다.
+
+    stage 이벤트는 미리 렌더링된 bytes를 재사용하고, 나머지는 이벤트 모델 생성 없이
+    빠른 직렬화 경로를 사용합니다 (turn_stream_events 참조).
 
     Args:
         event: 파이프라인 도메인 이벤트
 
     Returns:
-        스트림 이벤트 dict (serialize_event에 전달) 또는 None
+        NDJSON 라인 (bytes) 또는 None
     """
-    if event.event_type == PipelineEventType.STAGE_START:
+    event_type = event.event_type
+    if event_type in _STAGE_STATUS_BY_EVENT:
         if event.phase is None:
             return None
-        return StageEvent(
-            type=StreamEventType.STAGE,
-            name=event.phase.value,
-            status=StageStatus.START,
-        ).model_dump()
+        return stage_event_line(event.phase.value, _STAGE_STATUS_BY_EVENT[event_type])
 
-    if event.event_type == PipelineEventType.STAGE_COMPLETE:
-        if event.phase is None:
+    if event_type == PipelineEventType.BADGES:
+        if event.badges is None:
             return None
-        return StageEvent(
-            type=StreamEventType.STAGE,
-            name=event.phase.value,
-            status=StageStatus.COMPLETE,
-        ).model_dump()
+        return badges_event_line([b.value for b in event.badges])
 
-    if event.event_type == PipelineEventType.STAGE_FAIL:
-        if event.phase is None:
-            return None
-        return StageEvent(
-            type=StreamEventType.STAGE,
-            name=event.phase.value,
-            status=StageStatus.FAIL,
-        ).model_dump()
+    if event_type == PipelineEventType.REPAIR:
+        return repair_event_line(event.repair_attempt, event.repair_message)
 
-    if event.event_type == PipelineEventType.BADGES:
-        if event.badges is None:
-            return None
-        return BadgesEvent(
-            type=StreamEventType.BADGES,
-            badges=[b.value for b in event.badges],
-        ).model_dump()
-
-    if event.event_type == PipelineEventType.REPAIR:
-        return RepairEvent(
-            type=StreamEventType.REPAIR,
-            attempt=event.repair_attempt,
-            message=event.repair_message,
-        ).model_dump()
-
-    if event.event_type == PipelineEventType.NARRATIVE_DELTA:
+    if event_type == PipelineEventType.NARRATIVE_DELTA:
         if event.text is None:
             return None
-        return NarrativeDeltaEvent(
-            type=StreamEventType.NARRATIVE_DELTA,
-            text=event.text,
-        ).model_dump()
+        return narrative_delta_event_line(event.text)
 
     return None
 
@@ -148,24 +151,31 @@ def _convert_pipeline_event(event: PipelineEvent) -> dict[str, Any] | None:
 
 
 async def _stream_turn_events(
-    turn_input: TurnInput, seed: int | None = None
-) -> AsyncGenerator[str]:
+    turn_input: TurnInput,
+    seed: int | None = None,
+    *,
+    is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+) -> AsyncGenerator[bytes]:
     """턴 처리 이벤트를 NDJSON 스트림으로 생성합니다.
 
     Pipeline을 실행하고, 도메인 이벤트를 스트림 이벤트로 변환하여 전송합니다.
+    이벤트는 크기 제한 큐(TurnEventQueue)를 거치며, 연결 끊김이 감지되면
+    파이프라인 태스크(진행 중인 모델 호출 포함)를 즉시 취소합니다.
 
     Args:
         turn_input: 사용자 턴 입력
         seed: Mock 모드 시드 (재현성 보장)
+        is_disconnected: 클라이언트 연결 끊김 확인 함수 (예: request.is_disconnected)
 
     Yields:
-        str: NDJSON 라인
+        bytes: NDJSON 라인 (UTF-8)
     """
     # 이벤트 큐 (emit 콜백에서 이벤트를 쌓고, 메인 루프에서 소비)
-    event_queue: asyncio.Queue[PipelineEvent | None] = asyncio.Queue()
+    event_queue = TurnEventQueue()
+    poll_seconds = get_turn_disconnect_poll_seconds()
 
     async def emit(event: PipelineEvent) -> None:
-        """파이프라인 이벤트를 큐에 추가합니다."""
+        """파이프라인 이벤트를 큐에 추가합니다 (가득 차면 병합 또는 대기)."""
         await event_queue.put(event)
 
     # Pipeline 컨텍스트 생성
@@ -190,21 +200,41 @@ async def _stream_turn_events(
             ctx.is_fallback = True
         finally:
             # 종료 신호 (CancelledError 포함 모든 경우에 전송)
-            await event_queue.put(None)
+            await event_queue.close()
 
     pipeline_task = asyncio.create_task(run_pipeline_task())
 
     # 이벤트 소비 루프
     try:
+        loop = asyncio.get_running_loop()
+        next_disconnect_check = loop.time() + poll_seconds
         while True:
-            event = await event_queue.get()
+            try:
+                event = await event_queue.get(timeout=poll_seconds)
+                idle = False
+            except TimeoutError:
+                event, idle = None, True
+
+            # 연결 끊김 능동 감지: 이벤트가 없거나 확인 주기가 지났을 때
+            if is_disconnected is not None and (idle or loop.time() >= next_disconnect_check):
+                next_disconnect_check = loop.time() + poll_seconds
+                if await is_disconnected():
+                    get_turn_stream_metrics().record_disconnect()
+                    logger.info(
+                        "[TurnStream] Client disconnected, cancelling pipeline",
+                        extra={"pending_events": len(event_queue)},
+                    )
+                    return  # finally에서 파이프라인 태스크 취소 (모델 호출 중단)
+
+            if idle:
+                continue
             if event is None:
                 # Pipeline 종료
                 break
 
-            stream_event = _convert_pipeline_event(event)
-            if stream_event is not None:
-                yield serialize_event(stream_event)
+            line = _convert_pipeline_event(event)
+            if line is not None:
+                yield line
 
         # U-130: rate limit 상태이면 error(RATE_LIMITED)만 송출, final 없음
         if ctx.is_rate_limited:
@@ -238,6 +268,70 @@ async def _stream_turn_events(
                 await pipeline_task
 
 
+def open_turn_stream(
+    turn_input: TurnInput,
+    seed: int | None = None,
+    *,
+    idempotency_key: str | None = None,
+    is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+) -> tuple[TurnReplayMode | None, AsyncGenerator[bytes]]:
+    """턴 NDJSON 스트림을 엽니다 (멱등 키가 있으면 재생 저장소 경유).
+
+    키가 있으면 파이프라인은 요청 연결과 분리되어 실행되므로 is_disconnected는 사용하지 않고,
+    구독자가 모두 떠난 뒤 재연결 유예 시간이 지나면 취소됩니다.
+
+    Args:
+        turn_input: 사용자 턴 입력
+        seed: Mock 모드 시드
+        idempotency_key: 멱등 키 (None이면 일반 스트림)
+        is_disconnected: 클라이언트 연결 끊김 확인 함수 (키가 없을 때만 사용)
+
+    Returns:
+        (처리 방식 또는 None, NDJSON 라인 스트림)
+
+    Raises:
+        IdempotencyKeyConflictError: 같은 키가 다른 입력으로 사용되었을 때
+    """
+    if idempotency_key is None:
+        return None, _stream_turn_events(turn_input, seed=seed, is_disconnected=is_disconnected)
+
+    return get_turn_replay_store().open(
+        idempotency_key,
+        turn_fingerprint(turn_input, seed),
+        lambda is_abandoned: _stream_turn_events(
+            turn_input, seed=seed, is_disconnected=is_abandoned
+        ),
+    )
+
+
+def _ndjson_response(
+    request: Request,
+    stream: AsyncIterator[bytes],
+    *,
+    headers: dict[str, str],
+) -> StreamingResponse:
+    """NDJSON 스트림 응답을 생성합니다 (Accept-Encoding 협상 시 이벤트 단위 flush 압축).
+
+    Args:
+        request: 요청 (Accept-Encoding 협상용)
+        stream: NDJSON 라인 스트림
+        headers: 응답 헤더
+
+    Returns:
+        StreamingResponse: NDJSON 스트림 (압축 시 Content-Encoding 포함)
+    """
+    encoding = negotiate_stream_encoding(request.headers.get("accept-encoding"))
+    response_headers = {**headers, "Vary": "Accept-Encoding"}
+    if encoding != StreamEncoding.IDENTITY:
+        response_headers["Content-Encoding"] = encoding.value
+
+    return StreamingResponse(
+        compress_stream(stream, encoding),
+        media_type="application/x-ndjson",
+        headers=response_headers,
+    )
+
+
 # =============================================================================
 # 입력 검증
 # =============================================================================
@@ -246,17 +340,54 @@ async def _stream_turn_events(
 async def _validate_and_parse_input(request: Request) -> TurnInput | dict[str, Any]:
     """요청 본문을 TurnInput으로 검증 및 파싱합니다.
 
+    정상 경로는 본문 bytes를 model_validate_json으로 한 번에 파싱+검증합니다
+    (json.loads로 dict를 만든 뒤 다시 검증하는 이중 변환 생략).
+    검증 실패 시에만 본문을 dict로 디코딩하여 language/economy를 추출합니다.
+
+    Returns:
+        TurnInput 또는 에러 정보 dict (language, economy_snapshot 포함)
+    """
+    try:
+        raw_body = await request.body()
+    except Exception:
+        return _body_parse_error()
+
+    try:
+        return TurnInput.model_validate_json(raw_body)
+    except ValidationError:
+        pass
+
+    try:
+        body = json.loads(raw_body)
+    except ValueError:
+        return _body_parse_error()
+    return parse_turn_body(body)
+
+
+def _body_parse_error() -> dict[str, Any]:
+    """본문을 JSON으로 읽을 수 없을 때의 에러 정보."""
+    return {
+        "error": True,
+        "message": "Failed to parse request body",
+        "details": None,
+        "language": "en-US",
+        "economy_snapshot": None,
+    }
+
+
+def parse_turn_body(body: Any) -> TurnInput | dict[str, Any]:
+    """디코딩된 본문을 TurnInput으로 검증합니다 (HTTP/세션 전송 공용).
+
     Returns:
         TurnInput 또는 에러 정보 dict (language, economy_snapshot 포함)
     """
-    body: dict[str, Any] | None = None
     try:
-        body = await request.json()
         return TurnInput.model_validate(body)
     except ValidationError as e:
         # RU-002-S1: 입력 검증 실패 시에도 language/economy 추출 시도
-        raw_language = body.get("language") if isinstance(body, dict) else None
-        raw_economy = body.get("economy_snapshot") if isinstance(body, dict) else None
+        fields = cast(dict[str, Any], body) if isinstance(body, dict) else {}
+        raw_language = fields.get("language")
+        raw_economy = fields.get("economy_snapshot")
         return {
             "error": True,
             "message": "Invalid input",
@@ -264,14 +395,42 @@ async def _validate_and_parse_input(request: Request) -> TurnInput | dict[str, A
             "language": raw_language if raw_language in ("ko-KR", "en-US") else "en-US",
             "economy_snapshot": raw_economy,
         }
-    except Exception:
-        return {
-            "error": True,
-            "message": "Failed to parse request body",
-            "details": None,
-            "language": "en-US",
-            "economy_snapshot": None,
-        }
+
+
+async def stream_input_error(parse_result: dict[str, Any]) -> AsyncGenerator[bytes]:
+    """입력 검증 실패 시 error + final(폴백) 순서로 송출합니다 (RU-002-S1).
+
+    Args:
+        parse_result: parse_turn_body의 에러 정보 dict
+
+    Yields:
+        bytes: NDJSON 라인 (UTF-8)
+    """
+    error_language = parse_result.get("language", "en-US")
+    error_economy = parse_result.get("economy_snapshot")
+
+    # economy_snapshot이 유효한지 확인
+    economy_snapshot: CurrencyAmount | None = None
+    if isinstance(error_economy, dict):
+        try:
+            # 명시적 타입 캐스팅으로 Pyright 경고 해소
+            eco_dict = cast(dict[str, Any], error_economy)
+            economy_snapshot = CurrencyAmount(
+                signal=int(eco_dict.get("signal", 100)),
+                memory_shard=int(eco_dict.get("memory_shard", 5)),
+            )
+        except (ValueError, TypeError):
+            economy_snapshot = None
+
+    # RU-005-Q3: 헬퍼를 사용하여 error + final(폴백) 송출
+    async for line in emit_error_with_fallback(
+        Language.KO if error_language == "ko-KR" else Language.EN,
+        error_message=parse_result.get("message", "Invalid input"),
+        error_code="VALIDATION_ERROR",
+        economy_snapshot=economy_snapshot,
+        repair_count=0,
+    ):
+        yield line
 
 
 # =============================================================================
@@ -293,6 +452,9 @@ async def _validate_and_parse_input(request: Request) -> TurnInput | dict[str, A
 - `final`: 최종 TurnOutput
 - `error`: 에러 발생 시
 
+**멱등 재시도**: `Idempotency-Key` 헤더를 보내면 같은 키의 재시도는 완료된 턴의 이벤트를
+즉시 재생하거나 진행 중인 턴에 합류합니다 (응답 헤더 `Idempotency-Replay`: new/attached/replayed).
+
 **예시 요청**:
 ```json
 {
@@ -312,7 +474,8 @@ async def _validate_and_parse_input(request: Request) -> TurnInput | dict[str, A
                 }
             },
         },
-        400: {"description": "잘못된 요청"},
+        400: {"description": "잘못된 요청 (Idempotency-Key 형식 오류)"},
+        409: {"description": "같은 Idempotency-Key가 다른 턴 입력으로 재사용됨"},
     },
 )
 async def turn_stream(request: Request) -> StreamingResponse:
@@ -332,36 +495,9 @@ async def turn_stream(request: Request) -> StreamingResponse:
 
     if isinstance(parse_result, dict) and parse_result.get("error"):
         # RU-002-S1: 입력 검증 실패 시에도 error + final(폴백) 순서로 송출
-        error_language = parse_result.get("language", "en-US")
-        error_economy = parse_result.get("economy_snapshot")
-
-        # economy_snapshot이 유효한지 확인
-        economy_snapshot: CurrencyAmount | None = None
-        if isinstance(error_economy, dict):
-            try:
-                # 명시적 타입 캐스팅으로 Pyright 경고 해소
-                eco_dict = cast(dict[str, Any], error_economy)
-                economy_snapshot = CurrencyAmount(
-                    signal=int(eco_dict.get("signal", 100)),
-                    memory_shard=int(eco_dict.get("memory_shard", 5)),
-                )
-            except (ValueError, TypeError):
-                economy_snapshot = None
-
-        async def error_stream() -> AsyncGenerator[str]:
-            # RU-005-Q3: 헬퍼를 사용하여 error + final(폴백) 송출
-            async for line in emit_error_with_fallback(
-                Language.KO if error_language == "ko-KR" else Language.EN,
-                error_message=parse_result.get("message", "Invalid input"),
-                error_code="VALIDATION_ERROR",
-                economy_snapshot=economy_snapshot,
-                repair_count=0,
-            ):
-                yield line
-
-        return StreamingResponse(
-            error_stream(),
-            media_type="application/x-ndjson",
+        return _ndjson_response(
+            request,
+            stream_input_error(parse_result),
             headers={
                 "Cache-Control": "no-cache",
                 "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
@@ -374,13 +510,61 @@ async def turn_stream(request: Request) -> StreamingResponse:
     seed_param = request.query_params.get("seed")
     seed = int(seed_param) if seed_param else None
 
+    # 멱등 키 (재시도 시 저장된 결과 재생/진행 중 턴 합류)
+    idempotency_key = request.headers.get("idempotency-key")
+    if idempotency_key is not None and not is_valid_idempotency_key(idempotency_key):
+        raise HTTPException(status_code=400, detail="Invalid Idempotency-Key")
+
+    try:
+        replay_mode, stream = open_turn_stream(
+            turn_input,
+            seed,
+            idempotency_key=idempotency_key,
+            is_disconnected=request.is_disconnected,
+        )
+    except IdempotencyKeyConflictError as e:
+        raise HTTPException(
+            status_code=409, detail="Idempotency-Key reused with a different turn input"
+        ) from e
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
+        "X-Request-Time": str(int(time.time() * 1000)),
+    }
+    if replay_mode is not None:
+        headers["Idempotency-Replay"] = replay_mode.value
+
     # NDJSON 스트리밍 응답
-    return StreamingResponse(
-        _stream_turn_events(turn_input, seed=seed),
-        media_type="application/x-ndjson",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
-            "X-Request-Time": str(int(time.time() * 1000)),
+    return _ndjson_response(request, stream, headers=headers)
+
+
+@router.get(
+    "/turn/health",
+    summary="턴 스트림 헬스체크",
+    description=(
+        "턴 스트림 압축률, 이벤트 큐 지표(지연/병합/연결 끊김), 멱등 재생 지표, "
+        "TurnOutput 스키마 버전을 반환합니다."
+    ),
+)
+async def turn_health() -> dict[str, Any]:
+    """턴 스트림 헬스체크 (압축/이벤트 큐 지표 포함).
+
+    Returns:
+        헬스 상태 정보
+    """
+    schema_artifacts = get_turn_schema_artifacts()
+    return {
+        "status": "ok",
+        "compression": {
+            "enabled": is_stream_compression_enabled(),
+            "brotli_available": is_brotli_available(),
+            "encodings": get_stream_compression_stats().get_stats(),
         },
-    )
+        "stream": get_turn_stream_metrics().get_stats(),
+        "replay": get_turn_replay_store().get_stats(),
+        "schema": {
+            "version": schema_artifacts.version,
+            "source": schema_artifacts.source,
+        },
+    }
@@ -0,0 +1,230 @@
+"""Unknown World - 턴 스트림 이벤트 큐 (백프레셔/병합/지연 지표).
+
+파이프라인 emit 콜백과 NDJSON 소비 루프 사이의 큐입니다. 무제한 asyncio.Queue는
+느린 클라이언트에서 이벤트가 메모리에 쌓이므로, 크기 제한과 명시적인 오버플로 정책을 둡니다.
+
+오버플로 정책 (큐가 가득 찬 상태에서 put):
+    1. stage 이벤트 병합: 같은 단계(phase)의 더 새로운 stage 이벤트가 뒤에 있는
+       가장 오래된 stage start 이벤트를 버림
+       (클라이언트는 단계별 최신 상태만 있으면 됨 — start→complete가 complete로 합쳐짐,
+       complete/fail은 버리지 않으므로 어떤 단계도 진행 중 상태로 남지 않음)
+    2. 병합할 stage 이벤트가 없으면 생산자(파이프라인)가 공간이 생길 때까지 대기 (백프레셔)
+    3. badges/repair/narrative_delta 이벤트와 종료 신호는 버리지 않음
+       (final은 파이프라인 종료 후 직접 송출되므로 큐를 거치지 않음)
+
+설계 원칙:
+    - RULE-008: 단계 가시성 유지 (병합 후에도 마지막 단계 상태는 항상 전달)
+    - RULE-004: 종료 신호(close)는 큐 상태와 무관하게 즉시 전달
+
+환경변수:
+    - UW_TURN_EVENT_QUEUE_SIZE: 큐 최대 이벤트 수 (기본: 64)
+    - UW_TURN_DISCONNECT_POLL_S: 연결 끊김 확인 주기 (기본: 0.5초)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+
+from unknown_world.orchestrator.stages.types import PipelineEvent, PipelineEventType
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_TURN_EVENT_QUEUE_SIZE = 64
+"""기본 큐 최대 이벤트 수."""
+
+DEFAULT_TURN_DISCONNECT_POLL_SECONDS = 0.5
+"""기본 연결 끊김 확인 주기 (초)."""
+
+_STAGE_EVENT_TYPES = frozenset(
+    {
+        PipelineEventType.STAGE_START,
+        PipelineEventType.STAGE_COMPLETE,
+        PipelineEventType.STAGE_FAIL,
+    }
+)
+
+
+def get_turn_event_queue_size() -> int:
+    """환경변수에서 큐 최대 이벤트 수를 읽습니다."""
+    return max(
+        2, int(os.environ.get("UW_TURN_EVENT_QUEUE_SIZE", str(DEFAULT_TURN_EVENT_QUEUE_SIZE)))
+    )
+
+
+def get_turn_disconnect_poll_seconds() -> float:
+    """환경변수에서 연결 끊김 확인 주기를 읽습니다."""
+    return float(
+        os.environ.get("UW_TURN_DISCONNECT_POLL_S", str(DEFAULT_TURN_DISCONNECT_POLL_SECONDS))
+    )
+
+
+# =============================================================================
+# 스트림 지표
+# =============================================================================
+
+
+class TurnStreamMetrics:
+    """턴 스트림 큐 지표 (이벤트 지연/병합/백프레셔/연결 끊김)."""
+
+    def __init__(self) -> None:
+        self._events = 0
+        self._total_lag = 0.0
+        self._max_lag = 0.0
+        self._coalesced = 0
+        self._producer_waits = 0
+        self._max_depth = 0
+        self._disconnects = 0
+
+    def record_dequeue(self, lag_seconds: float, depth: int) -> None:
+        """큐에서 꺼낸 이벤트의 대기 시간과 꺼내기 직전 큐 깊이를 기록합니다."""
+        self._events += 1
+        self._total_lag += lag_seconds
+        self._max_lag = max(self._max_lag, lag_seconds)
+        self._max_depth = max(self._max_depth, depth)
+
+    def record_coalesced(self) -> None:
+        self._coalesced += 1
+
+    def record_producer_wait(self) -> None:
+        self._producer_waits += 1
+
+    def record_disconnect(self) -> None:
+        self._disconnects += 1
+
+    def get_stats(self) -> dict[str, float | int]:
+        """지표를 반환합니다 (지연은 ms)."""
+        return {
+            "events": self._events,
+            "avg_lag_ms": round(self._total_lag / self._events * 1000, 2) if self._events else 0.0,
+            "max_lag_ms": round(self._max_lag * 1000, 2),
+            "max_queue_depth": self._max_depth,
+            "coalesced_events": self._coalesced,
+            "producer_waits": self._producer_waits,
+            "disconnects": self._disconnects,
+        }
+
+
+_metrics_instance: TurnStreamMetrics | None = None
+
+
+def get_turn_stream_metrics() -> TurnStreamMetrics:
+    """TurnStreamMetrics 싱글톤 인스턴스를 반환합니다."""
+    global _metrics_instance
+
+    if _metrics_instance is None:
+        _metrics_instance = TurnStreamMetrics()
+    return _metrics_instance
+
+
+def reset_turn_stream_metrics() -> None:
+    """턴 스트림 지표를 초기화합니다 (테스트용)."""
+    global _metrics_instance
+    _metrics_instance = None
+
+
+# =============================================================================
+# 이벤트 큐
+# =============================================================================
+
+
+class TurnEventQueue:
+    """크기 제한 + stage 병합 오버플로 정책을 가진 단일 생산자/단일 소비자 큐."""
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        *,
+        metrics: TurnStreamMetrics | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """TurnEventQueue를 초기화합니다.
+
+        Args:
+            maxsize: 최대 이벤트 수 (기본: 환경변수 UW_TURN_EVENT_QUEUE_SIZE)
+            metrics: 지표 기록 대상 (기본: 전역 TurnStreamMetrics)
+            clock: 단조 시계 (테스트 주입용)
+        """
+        self._maxsize = maxsize or get_turn_event_queue_size()
+        self._metrics = metrics or get_turn_stream_metrics()
+        self._clock = clock
+        self._items: deque[tuple[PipelineEvent, float]] = deque()
+        self._closed = False
+        self._cond = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def put(self, event: PipelineEvent) -> None:
+        """이벤트를 추가합니다 (가득 차면 stage 병합, 불가능하면 공간이 생길 때까지 대기)."""
+        async with self._cond:
+            waited = False
+            while len(self._items) >= self._maxsize and not self._closed:
+                if self._coalesce_stage(event):
+                    break
+                if not waited:
+                    waited = True
+                    self._metrics.record_producer_wait()
+                await self._cond.wait()
+
+            if self._closed:
+                return  # 큐가 닫힘 (파이프라인 종료 후 도착한 이벤트는 폐기)
+            self._items.append((event, self._clock()))
+            self._cond.notify_all()
+
+    def _coalesce_stage(self, incoming: PipelineEvent) -> bool:
+        """같은 단계의 더 새로운 stage 이벤트에 의해 대체되는 가장 오래된 start 이벤트를 제거합니다.
+
+        Returns:
+            bool: 제거했는지 여부
+        """
+        events = [event for event, _ in self._items]
+        events.append(incoming)
+        for i, event in enumerate(events[:-1]):
+            if event.event_type != PipelineEventType.STAGE_START:
+                continue
+            if any(
+                later.event_type in _STAGE_EVENT_TYPES and later.phase == event.phase
+                for later in events[i + 1 :]
+            ):
+                del self._items[i]
+                self._metrics.record_coalesced()
+                return True
+        return False
+
+    async def get(self, timeout: float | None = None) -> PipelineEvent | None:
+        """이벤트를 꺼냅니다.
+
+        Args:
+            timeout: 최대 대기 시간 (None이면 무제한)
+
+        Returns:
+            이벤트 또는 None (close() 이후 큐가 비었을 때)
+
+        Raises:
+            TimeoutError: timeout 내에 이벤트가 없을 때
+        """
+        async with self._cond:
+            if not self._items and not self._closed:
+                await asyncio.wait_for(
+                    self._cond.wait_for(lambda: bool(self._items) or self._closed), timeout
+                )
+            if not self._items:
+                return None
+
+            depth = len(self._items)
+            event, enqueued_at = self._items.popleft()
+            self._metrics.record_dequeue(self._clock() - enqueued_at, depth)
+            self._cond.notify_all()
+            return event
+
+    async def close(self) -> None:
+        """종료 신호를 보냅니다 (남은 이벤트는 소비 가능, 대기 중인 생산자는 해제)."""
+        async with self._cond:
+            self._closed = True
+            self._cond.notify_all()
@@ -0,0 +1,324 @@
+"""Unknown World - 멱등 턴 제출 (결과 재생/진행 중 턴 재연결).
+
+NDJSON 스트림이 턴 도중 끊기면 클라이언트는 같은 턴을 다시 제출하고, 서버는 모델 호출부터
+다시 생성합니다. 턴에 멱등 키(Idempotency-Key)가 있으면 이 모듈이 이벤트 로그를 보관하여:
+
+    - 완료된 턴 재시도: 저장된 이벤트(stage/badges/narrative_delta/final)를 즉시 재생
+    - 진행 중인 턴 재시도: 실행 중인 파이프라인에 합류 (지금까지의 이벤트 재생 후 이어서 수신)
+    - 같은 키 + 다른 입력: IdempotencyKeyConflictError (API 계층이 409로 변환)
+
+키가 있는 턴의 파이프라인은 요청 연결과 분리된 태스크에서 실행되며, 구독자가 모두 떠난 뒤
+유예 시간(UW_TURN_REPLAY_ATTACH_GRACE_S) 안에 재연결이 없으면 취소됩니다 (모델 호출 중단).
+final 없이 끝난 턴(취소/rate limit)은 보관하지 않으므로 재시도 시 새로 생성됩니다.
+
+설계 원칙:
+    - RULE-008: 재생/합류 시에도 /api/turn과 같은 이벤트 순서 유지
+    - RULE-007: 키/입력 원문은 로깅하지 않음 (입력은 지문 해시로만 비교)
+
+환경변수:
+    - UW_TURN_REPLAY_TTL_S: 완료된 턴 보관 시간 (기본: 300초)
+    - UW_TURN_REPLAY_MAX_ENTRIES: 보관 최대 턴 수 (기본: 256)
+    - UW_TURN_REPLAY_ATTACH_GRACE_S: 구독자 없는 진행 중 턴의 재연결 대기 시간 (기본: 15초)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import os
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from enum import StrEnum
+
+from unknown_world.models.turn import TurnInput
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_TURN_REPLAY_TTL_SECONDS = 300.0
+"""기본 완료 턴 보관 시간 (초)."""
+
+DEFAULT_TURN_REPLAY_MAX_ENTRIES = 256
+"""기본 보관 최대 턴 수."""
+
+DEFAULT_TURN_REPLAY_ATTACH_GRACE_SECONDS = 15.0
+"""기본 재연결 대기 시간 (초)."""
+
+MAX_IDEMPOTENCY_KEY_LENGTH = 200
+"""멱등 키 최대 길이."""
+
+_FINAL_LINE_PREFIX = b'{"type":"final"'
+
+
+def get_turn_replay_ttl_seconds() -> float:
+    """환경변수에서 완료 턴 보관 시간을 읽습니다."""
+    return float(os.environ.get("UW_TURN_REPLAY_TTL_S", str(DEFAULT_TURN_REPLAY_TTL_SECONDS)))
+
+
+def get_turn_replay_max_entries() -> int:
+    """환경변수에서 보관 최대 턴 수를 읽습니다."""
+    return max(
+        1,
+        int(os.environ.get("UW_TURN_REPLAY_MAX_ENTRIES", str(DEFAULT_TURN_REPLAY_MAX_ENTRIES))),
+    )
+
+
+def get_turn_replay_attach_grace_seconds() -> float:
+    """환경변수에서 재연결 대기 시간을 읽습니다."""
+    return float(
+        os.environ.get(
+            "UW_TURN_REPLAY_ATTACH_GRACE_S", str(DEFAULT_TURN_REPLAY_ATTACH_GRACE_SECONDS)
+        )
+    )
+
+
+class TurnReplayMode(StrEnum):
+    """멱등 키 요청 처리 방식 (Idempotency-Replay 응답 헤더 값)."""
+
+    NEW = "new"
+    ATTACHED = "attached"
+    REPLAYED = "replayed"
+
+
+class IdempotencyKeyConflictError(Exception):
+    """같은 멱등 키가 다른 턴 입력으로 재사용되었음을 나타내는 예외."""
+
+
+def turn_fingerprint(turn_input: TurnInput, seed: int | None = None) -> str:
+    """턴 입력 지문 (같은 키의 재시도가 같은 입력인지 비교용).
+
+    Args:
+        turn_input: 턴 입력
+        seed: Mock 모드 시드
+
+    Returns:
+        str: SHA-256 hex
+    """
+    digest = hashlib.sha256(turn_input.model_dump_json().encode("utf-8"))
+    digest.update(f"|seed={seed}".encode())
+    return digest.hexdigest()
+
+
+def is_valid_idempotency_key(key: str) -> bool:
+    """멱등 키 형식 검증 (비어 있지 않고 길이 제한 이내, 출력 가능한 ASCII)."""
+    return 0 < len(key) <= MAX_IDEMPOTENCY_KEY_LENGTH and key.isascii() and key.isprintable()
+
+
+# =============================================================================
+# 턴 실행 기록
+# =============================================================================
+
+TurnStreamFactory = Callable[[Callable[[], Awaitable[bool]]], AsyncGenerator[bytes]]
+"""is_abandoned 콜백을 받아 NDJSON 스트림을 만드는 함수 (_stream_turn_events 래퍼)."""
+
+
+class _TurnRun:
+    """키 하나의 턴 실행 기록 (이벤트 로그 + 구독자 수)."""
+
+    def __init__(self, fingerprint: str, now: float) -> None:
+        self.fingerprint = fingerprint
+        self.lines: list[bytes] = []
+        self.done = False
+        self.completed = False
+        self.subscribers = 0
+        self.last_detached = now
+        self.finished_at: float | None = None
+        self.task: asyncio.Task[None] | None = None
+        self._changed = asyncio.Event()
+
+    def publish(self, line: bytes | None = None) -> None:
+        """이벤트 추가(또는 종료)를 대기 중인 구독자에게 알립니다."""
+        if line is not None:
+            self.lines.append(line)
+            if line.startswith(_FINAL_LINE_PREFIX):
+                self.completed = True
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait_changed(self) -> None:
+        await self._changed.wait()
+
+
+# =============================================================================
+# 재생 저장소
+# =============================================================================
+
+
+class TurnReplayStore:
+    """멱등 키 → 턴 실행 기록 저장소 (TTL + 최대 개수 제한)."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        attach_grace_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """TurnReplayStore를 초기화합니다.
+
+        Args:
+            ttl_seconds: 완료 턴 보관 시간 (기본: 환경변수 UW_TURN_REPLAY_TTL_S)
+            max_entries: 보관 최대 턴 수 (기본: 환경변수 UW_TURN_REPLAY_MAX_ENTRIES)
+            attach_grace_seconds: 재연결 대기 시간 (기본: 환경변수 UW_TURN_REPLAY_ATTACH_GRACE_S)
+            clock: 단조 시계 (테스트 주입용)
+        """
+        self._ttl = ttl_seconds if ttl_seconds is not None else get_turn_replay_ttl_seconds()
+        self._max_entries = max_entries or get_turn_replay_max_entries()
+        self._grace = (
+            attach_grace_seconds
+            if attach_grace_seconds is not None
+            else get_turn_replay_attach_grace_seconds()
+        )
+        self._clock = clock
+        self._runs: dict[str, _TurnRun] = {}
+        self._counts = {mode.value: 0 for mode in TurnReplayMode}
+        self._conflicts = 0
+        self._abandoned = 0
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def open(
+        self, key: str, fingerprint: str, factory: TurnStreamFactory
+    ) -> tuple[TurnReplayMode, AsyncGenerator[bytes]]:
+        """멱등 키로 턴 스트림을 엽니다 (새 실행/진행 중 합류/완료 결과 재생).
+
+        Args:
+            key: 멱등 키
+            fingerprint: 턴 입력 지문 (turn_fingerprint)
+            factory: 새 실행 시 NDJSON 스트림을 만드는 함수
+
+        Returns:
+            (처리 방식, NDJSON 라인 스트림)
+
+        Raises:
+            IdempotencyKeyConflictError: 같은 키가 다른 입력으로 사용되었을 때
+        """
+        self._evict()
+        run = self._runs.get(key)
+        if run is not None and run.fingerprint != fingerprint:
+            self._conflicts += 1
+            raise IdempotencyKeyConflictError(key)
+
+        if run is None:
+            run = _TurnRun(fingerprint, self._clock())
+            self._runs[key] = run
+            run.task = asyncio.create_task(self._produce(key, run, factory))
+            mode = TurnReplayMode.NEW
+        elif run.done:
+            mode = TurnReplayMode.REPLAYED
+        else:
+            mode = TurnReplayMode.ATTACHED
+
+        self._counts[mode.value] += 1
+        if mode != TurnReplayMode.NEW:
+            logger.info(
+                "[TurnReplay] Retry served from stored turn",
+                extra={"mode": mode.value, "events": len(run.lines)},
+            )
+        return mode, self._subscribe(run)
+
+    async def _produce(self, key: str, run: _TurnRun, factory: TurnStreamFactory) -> None:
+        """턴 스트림을 끝까지 소비하며 이벤트 로그에 기록합니다 (요청 연결과 분리)."""
+
+        async def is_abandoned() -> bool:
+            abandoned = run.subscribers == 0 and self._clock() - run.last_detached >= self._grace
+            if abandoned:
+                self._abandoned += 1
+            return abandoned
+
+        source = factory(is_abandoned)
+        try:
+            async for line in source:
+                run.publish(line)
+        except Exception as e:
+            logger.error(
+                "[TurnReplay] Stored turn stream failed",
+                extra={"error_type": type(e).__name__},
+            )
+        finally:
+            with contextlib.suppress(Exception):
+                await source.aclose()
+            run.done = True
+            run.finished_at = self._clock()
+            run.publish()
+            # final 없이 끝난 턴(취소/rate limit)은 재시도 시 새로 생성
+            if not run.completed and self._runs.get(key) is run:
+                del self._runs[key]
+
+    async def _subscribe(self, run: _TurnRun) -> AsyncGenerator[bytes]:
+        """기록된 이벤트를 처음부터 재생한 뒤, 실행 중이면 새 이벤트를 이어서 송출합니다."""
+        run.subscribers += 1
+        index = 0
+        try:
+            while True:
+                while index < len(run.lines):
+                    yield run.lines[index]
+                    index += 1
+                if run.done:
+                    return
+                await run.wait_changed()
+        finally:
+            run.subscribers -= 1
+            run.last_detached = self._clock()
+
+    def _evict(self) -> None:
+        """만료된 완료 턴을 제거하고, 최대 개수를 넘으면 오래된 완료 턴부터 제거합니다."""
+        now = self._clock()
+        finished = [(key, run) for key, run in self._runs.items() if run.finished_at is not None]
+        for key, run in finished:
+            if now - (run.finished_at or now) >= self._ttl:
+                del self._runs[key]
+
+        overflow = len(self._runs) - self._max_entries + 1
+        if overflow > 0:
+            oldest = sorted(
+                ((run.finished_at, key) for key, run in self._runs.items() if run.done),
+                key=lambda item: item[0] or 0.0,
+            )
+            for _, key in oldest[:overflow]:
+                del self._runs[key]
+
+    async def shutdown(self) -> None:
+        """진행 중인 턴 실행 태스크를 모두 취소합니다."""
+        tasks = [run.task for run in self._runs.values() if run.task and not run.task.done()]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._runs.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """재생 지표를 반환합니다."""
+        return {
+            "entries": len(self._runs),
+            "in_flight": sum(1 for run in self._runs.values() if not run.done),
+            **self._counts,
+            "conflicts": self._conflicts,
+            "abandoned": self._abandoned,
+        }
+
+
+_store_instance: TurnReplayStore | None = None
+
+
+def get_turn_replay_store() -> TurnReplayStore:
+    """TurnReplayStore 싱글톤 인스턴스를 반환합니다."""
+    global _store_instance
+
+    if _store_instance is None:
+        _store_instance = TurnReplayStore()
+    return _store_instance
+
+
+def reset_turn_replay_store() -> None:
+    """재생 저장소를 초기화합니다 (테스트용)."""
+    global _store_instance
+    _store_instance = None
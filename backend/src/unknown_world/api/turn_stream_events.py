@@ -8,6 +8,13 @@ NDJSON 스트리밍에서 사용되는 이벤트 타입, 모델, 유틸리티를
     - RULE-003: 구조화 출력(JSON Schema) 우선 + Pydantic 검증
     - RULE-008: 단계/배지 가시화
 
+직렬화 경로:
+    - Pydantic 이벤트 모델은 계약(스키마) 문서 역할을 유지
+    - 전송 시에는 모델 생성/model_dump 없이 동일한 키 순서의 dict를 재사용 인코더로 직렬화
+    - 턴마다 동일한 stage start/complete/fail 라인은 모듈 로드 시 bytes로 미리 렌더링
+    - final 이벤트는 TurnOutput을 model_dump_json으로 한 번만 직렬화해 미리 인코딩된 envelope에 삽입
+    - 모든 라인은 compact JSON(공백 없는 구분자)이며 StreamingResponse에 bytes(UTF-8)로 전달
+
 참조:
     - vibe/unit-plans/U-007[Mvp].md
     - vibe/refactors/RU-002-Q4.md
@@ -16,10 +23,15 @@ NDJSON 스트리밍에서 사용되는 이벤트 타입, 모델, 유틸리티를
 from __future__ import annotations
 
 import json
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, Final
 
 from pydantic import BaseModel, Field
 
+from unknown_world.models.turn import AgentPhase
+
+if TYPE_CHECKING:
+    from unknown_world.models.turn import TurnOutput
+
 # =============================================================================
 # 스트림 이벤트 타입 상수
 # =============================================================================
@@ -140,6 +152,12 @@ class ErrorEvent(BaseModel):
 # =============================================================================
 
 
+_EVENT_ENCODER: Final[json.JSONEncoder] = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":")
+)
+"""재사용 JSON 인코더 (compact 구분자: Pydantic model_dump_json 출력과 동일한 형식)."""
+
+
 def serialize_event(event: dict[str, Any]) -> str:
     """이벤트를 NDJSON 라인으로 직렬화합니다.
 
@@ -149,7 +167,88 @@ def serialize_event(event: dict[str, Any]) -> str:
     Returns:
         str: NDJSON 형식 문자열 (줄바꿈 포함)
     """
-    return json.dumps(event, ensure_ascii=False) + "\n"
+    return _EVENT_ENCODER.encode(event) + "\n"
+
+
+def serialize_event_bytes(event: dict[str, Any]) -> bytes:
+    """이벤트를 NDJSON 라인 bytes(UTF-8)로 직렬화합니다.
+
+    json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"의 UTF-8 인코딩과
+    바이트 단위로 같습니다.
+    """
+    return (_EVENT_ENCODER.encode(event) + "\n").encode()
+
+
+# =============================================================================
+# 사전 렌더링 / 빠른 경로 라인 생성
+# =============================================================================
+
+
+_STAGE_LINES: Final[dict[tuple[str, str], bytes]] = {
+    (phase.value, status): serialize_event_bytes(
+        {"type": StreamEventType.STAGE, "name": phase.value, "status": status}
+    )
+    for phase in AgentPhase
+    for status in (StageStatus.START, StageStatus.COMPLETE, StageStatus.FAIL)
+}
+"""AgentPhase × 상태별로 미리 렌더링한 stage 이벤트 라인 (StageEvent.model_dump()와 동일)."""
+
+
+def stage_event_line(name: str, status: str) -> bytes:
+    """stage 이벤트 라인을 반환합니다 (알려진 단계/상태는 캐시된 bytes).
+
+    Args:
+        name: 단계 이름 (AgentPhase 값)
+        status: 단계 상태 (StageStatus)
+    """
+    line = _STAGE_LINES.get((name, status))
+    if line is None:
+        line = serialize_event_bytes(
+            {"type": StreamEventType.STAGE, "name": name, "status": status}
+        )
+    return line
+
+
+def badges_event_line(badges: list[str]) -> bytes:
+    """badges 이벤트 라인을 생성합니다 (BadgesEvent와 동일한 키 순서)."""
+    return serialize_event_bytes({"type": StreamEventType.BADGES, "badges": badges})
+
+
+def repair_event_line(attempt: int, message: str | None = None) -> bytes:
+    """repair 이벤트 라인을 생성합니다 (RepairEvent와 동일한 키 순서)."""
+    return serialize_event_bytes(
+        {"type": StreamEventType.REPAIR, "attempt": attempt, "message": message}
+    )
+
+
+def narrative_delta_event_line(text: str) -> bytes:
+    """narrative_delta 이벤트 라인을 생성합니다 (NarrativeDeltaEvent와 동일한 키 순서)."""
+    return serialize_event_bytes({"type": StreamEventType.NARRATIVE_DELTA, "text": text})
+
+
+def error_event_line(message: str, code: str | None = None) -> bytes:
+    """error 이벤트 라인을 생성합니다 (ErrorEvent와 동일한 키 순서)."""
+    return serialize_event_bytes({"type": StreamEventType.ERROR, "message": message, "code": code})
+
+
+_FINAL_ENVELOPE_HEAD: Final[bytes] = b'{"type":"final","data":'
+"""final 이벤트 envelope 앞부분 (FinalEvent 키 순서: type → data)."""
+
+_FINAL_ENVELOPE_TAIL: Final[bytes] = b"}\n"
+"""final 이벤트 envelope 뒷부분 (NDJSON 줄바꿈 포함)."""
+
+
+def final_event_line(output: TurnOutput) -> bytes:
+    """final 이벤트 라인을 생성합니다.
+
+    TurnOutput을 model_dump_json으로 한 번만 직렬화하여 envelope 사이에 삽입합니다.
+    결과는 {"type": "final", "data": output.model_dump(mode="json")}를
+    serialize_event_bytes()로 직렬화한 것과 바이트 단위로 같습니다.
+
+    Args:
+        output: 최종 TurnOutput
+    """
+    return b"".join((_FINAL_ENVELOPE_HEAD, output.model_dump_json().encode(), _FINAL_ENVELOPE_TAIL))
 
 
 # =============================================================================
@@ -166,4 +265,11 @@ __all__ = [
     "FinalEvent",
     "ErrorEvent",
     "serialize_event",
+    "serialize_event_bytes",
+    "stage_event_line",
+    "badges_event_line",
+    "repair_event_line",
+    "narrative_delta_event_line",
+    "error_event_line",
+    "final_event_line",
 ]
@@ -18,11 +18,9 @@ import asyncio
 from collections.abc import AsyncGenerator
 
 from unknown_world.api.turn_stream_events import (
-    ErrorEvent,
-    FinalEvent,
-    NarrativeDeltaEvent,
-    StreamEventType,
-    serialize_event,
+    error_event_line,
+    final_event_line,
+    narrative_delta_event_line,
 )
 from unknown_world.models.turn import (
     CurrencyAmount,
@@ -69,7 +67,7 @@ async def stream_narrative_delta(
     *,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     delay_sec: float = DEFAULT_TYPING_DELAY_SEC,
-) -> AsyncGenerator[str]:
+) -> AsyncGenerator[bytes]:
     """내러티브 텍스트를 타자 효과로 스트리밍합니다.
 
     Args:
@@ -78,7 +76,7 @@ async def stream_narrative_delta(
         delay_sec: 청크 간 딜레이 (초, 기본 0.02)
 
     Yields:
-        str: NDJSON 라인 (narrative_delta 이벤트)
+        bytes: NDJSON 라인 (narrative_delta 이벤트)
 
     Example:
         >>> async for line in stream_narrative_delta("안녕하세요"):
@@ -86,12 +84,7 @@ async def stream_narrative_delta(
     """
     for i in range(0, len(narrative), chunk_size):
         chunk = narrative[i : i + chunk_size]
-        yield serialize_event(
-            NarrativeDeltaEvent(
-                type=StreamEventType.NARRATIVE_DELTA,
-                text=chunk,
-            ).model_dump()
-        )
+        yield narrative_delta_event_line(chunk)
         await asyncio.sleep(delay_sec)
 
 
@@ -108,7 +101,7 @@ async def emit_error_with_fallback(
     economy_snapshot: CurrencyAmount | None = None,
     repair_count: int = 0,
     is_blocked: bool = False,
-) -> AsyncGenerator[str]:
+) -> AsyncGenerator[bytes]:
     """에러 이벤트와 안전한 폴백 final을 순서대로 송출합니다.
 
     RULE-004: 에러 경로에서도 반드시 final 1회 종료 인바리언트를 유지합니다.
@@ -122,7 +115,7 @@ async def emit_error_with_fallback(
         is_blocked: 안전 정책에 의해 차단되었는지
 
     Yields:
-        str: NDJSON 라인 (error 이벤트 → final 이벤트)
+        bytes: NDJSON 라인 (error 이벤트 → final 이벤트)
 
     Example:
         >>> async for line in emit_error_with_fallback(Language.KO):
@@ -133,13 +126,7 @@ async def emit_error_with_fallback(
     message = error_message or messages.get("internal_error", "Error occurred")
 
     # 에러 이벤트 송출
-    yield serialize_event(
-        ErrorEvent(
-            type=StreamEventType.ERROR,
-            message=message,
-            code=error_code,
-        ).model_dump()
-    )
+    yield error_event_line(message, error_code)
 
     # 안전한 폴백 생성 및 송출
     fallback = create_safe_fallback(
@@ -148,17 +135,10 @@ async def emit_error_with_fallback(
         repair_count=repair_count,
         is_blocked=is_blocked,
     )
-    # U-069: TurnOutput을 먼저 직렬화하여 모든 필드 포함
-    fallback_dict = fallback.model_dump(mode="json")
-    yield serialize_event(
-        FinalEvent(
-            type=StreamEventType.FINAL,
-            data=fallback_dict,
-        ).model_dump(mode="json")
-    )
+    yield final_event_line(fallback)
 
 
-async def emit_rate_limited_error(language: Language) -> AsyncGenerator[str]:
+async def emit_rate_limited_error(language: Language) -> AsyncGenerator[bytes]:
     """RATE_LIMITED 에러 이벤트를 송출합니다 (final 없이).
 
     U-130: 429 Rate Limit으로 모든 재시도가 소진된 경우 사용합니다.
@@ -168,43 +148,28 @@ async def emit_rate_limited_error(language: Language) -> AsyncGenerator[str]:
         language: 응답 언어
 
     Yields:
-        str: NDJSON 라인 (error 이벤트만, final 없음)
+        bytes: NDJSON 라인 (error 이벤트만, final 없음)
     """
     messages = ERROR_MESSAGES[language]
     message = messages.get("rate_limited", "API request limit exceeded.")
 
-    yield serialize_event(
-        ErrorEvent(
-            type=StreamEventType.ERROR,
-            message=message,
-            code="RATE_LIMITED",
-        ).model_dump()
-    )
+    yield error_event_line(message, "RATE_LIMITED")
 
 
-async def emit_final(output: TurnOutput) -> AsyncGenerator[str]:
+async def emit_final(output: TurnOutput) -> AsyncGenerator[bytes]:
     """최종 TurnOutput을 final 이벤트로 송출합니다.
 
     Args:
         output: 최종 TurnOutput
 
     Yields:
-        str: NDJSON 라인 (final 이벤트)
+        bytes: NDJSON 라인 (final 이벤트)
 
     Note:
-        U-069 버그 수정: TurnOutput을 먼저 model_dump()로 직렬화하여
-        agent_console.model_label 등 모든 필드가 포함되도록 합니다.
-        FinalEvent.data가 Any 타입이라 중첩 Pydantic 모델이
-        자동 직렬화되지 않는 문제를 해결합니다.
+        U-069: TurnOutput 자체를 model_dump_json으로 직렬화하므로
+        agent_console.model_label 등 모든 필드가 포함됩니다 (FinalEvent.data는 Any 타입).
     """
-    # U-069: TurnOutput을 먼저 직렬화하여 모든 필드 포함
-    output_dict = output.model_dump(mode="json")
-    yield serialize_event(
-        FinalEvent(
-            type=StreamEventType.FINAL,
-            data=output_dict,
-        ).model_dump(mode="json")
-    )
+    yield final_event_line(output)
 
 
 # =============================================================================
@@ -217,7 +182,7 @@ async def stream_output_with_narrative(
     *,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     delay_sec: float = DEFAULT_TYPING_DELAY_SEC,
-) -> AsyncGenerator[str]:
+) -> AsyncGenerator[bytes]:
     """내러티브 델타 스트리밍 후 final 이벤트를 송출합니다.
 
     Args:
@@ -226,7 +191,7 @@ async def stream_output_with_narrative(
         delay_sec: 청크 간 딜레이 (초)
 
     Yields:
-        str: NDJSON 라인 (narrative_delta 이벤트들 → final 이벤트)
+        bytes: NDJSON 라인 (narrative_delta 이벤트들 → final 이벤트)
     """
     # 내러티브 델타 스트리밍
     async for line in stream_narrative_delta(
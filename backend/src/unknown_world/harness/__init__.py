@@ -2,6 +2,7 @@
 
 세션 리플레이를 위한 시나리오 저장/재생 도구입니다.
 데모 검증 및 Hard Gate 회귀 테스트에 사용됩니다.
+대량 시나리오는 suite_runner로 병렬/샤딩 실행합니다 (python -m unknown_world.harness).
 
 참조:
     - vibe/unit-plans/U-025[Mvp].md (리플레이 섹션)
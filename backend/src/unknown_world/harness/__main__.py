@@ -0,0 +1,81 @@
+"""리플레이 스위트 실행 CLI.
+
+실행:
+    cd backend
+    uv run python -m unknown_world.harness scenarios/ --json out/replay.json --junit out/replay.xml
+
+    # 동시 실행 수 / 로컬 멀티프로세스
+    uv run python -m unknown_world.harness scenarios/ --concurrency 32 --processes 4
+
+    # CI 매트릭스 샤딩 (잡마다 다른 --shard-index)
+    uv run python -m unknown_world.harness scenarios/ --shard-index 2 --shard-count 8
+
+종료 코드: 모든 시나리오 통과 시 0, 실패가 있으면 1
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from unknown_world.harness.reports import write_json_report, write_junit_report
+from unknown_world.harness.suite_runner import (
+    discover_scenarios,
+    run_suite_files,
+    run_suite_processes,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Unknown World 리플레이 스위트 실행")
+    parser.add_argument("paths", nargs="+", help="시나리오 JSON 파일 또는 디렉토리")
+    parser.add_argument("--concurrency", type=int, default=None, help="동시 실행 시나리오 수")
+    parser.add_argument("--processes", type=int, default=1, help="워커 프로세스 수")
+    parser.add_argument("--shard-index", type=int, default=0, help="실행할 샤드 번호 (0부터)")
+    parser.add_argument("--shard-count", type=int, default=1, help="전체 샤드 수")
+    parser.add_argument(
+        "--stage-delays", action="store_true", help="단계별 모의 처리 지연 적용 (기본: 비활성화)"
+    )
+    parser.add_argument("--json", dest="json_path", help="JSON 리포트 경로")
+    parser.add_argument("--junit", dest="junit_path", help="JUnit XML 리포트 경로")
+    parser.add_argument("--verbose", action="store_true", help="스텝별 로그 출력")
+    args = parser.parse_args()
+
+    if args.processes > 1 and args.shard_count > 1:
+        parser.error("--processes and --shard-count cannot be combined")
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    paths = discover_scenarios(args.paths)
+
+    if args.processes > 1:
+        suite = run_suite_processes(
+            paths,
+            processes=args.processes,
+            concurrency=args.concurrency,
+            stage_delays=args.stage_delays,
+        )
+    else:
+        suite = asyncio.run(
+            run_suite_files(
+                paths,
+                concurrency=args.concurrency,
+                stage_delays=args.stage_delays,
+                shard_index=args.shard_index,
+                shard_count=args.shard_count,
+            )
+        )
+
+    if args.json_path:
+        write_json_report(suite, args.json_path)
+    if args.junit_path:
+        write_junit_report(suite, args.junit_path)
+
+    for result in suite.results:
+        if not result.all_passed:
+            print(f"FAIL {result.summary}")
+    print(suite.summary)
+    return 0 if suite.all_passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
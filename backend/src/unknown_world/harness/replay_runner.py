@@ -4,9 +4,10 @@
 각 턴의 Hard Gate(Schema/Economy/Safety/Consistency) 결과를 수집합니다.
 
 설계 원칙:
-    - 시나리오의 각 스텝을 순차적으로 실행
+    - 시나리오의 각 스텝을 순차적으로 실행 (시나리오 간 병렬화는 suite_runner)
     - 서버 내부에서 pipeline을 직접 호출 (HTTP 오버헤드 제거)
-    - 각 턴마다 4대 Hard Gate 검증 결과를 수집
+    - 단계별 모의 처리 지연(*_DELAY_MS)은 기본 비활성화 (UI 연출용)
+    - 각 턴마다 4대 Hard Gate 검증 결과와 실행 시간을 수집
     - 실패 시 diff/context 포함
 
 참조:
@@ -17,6 +18,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -41,6 +43,12 @@ class ReplayResult(BaseModel):
     failed_steps: int
     step_results: list[StepResult] = []
     summary: str = ""
+    duration_ms: float = 0.0
+
+    @property
+    def all_passed(self) -> bool:
+        """모든 스텝이 Hard Gate를 통과했는지 여부."""
+        return self.failed_steps == 0
 
 
 def load_scenario(path: str | Path) -> Scenario:
@@ -74,7 +82,7 @@ def save_scenario(scenario: Scenario, path: str | Path) -> None:
     logger.info("[ReplayRunner] Scenario saved to %s", path)
 
 
-async def run_replay(scenario: Scenario) -> ReplayResult:
+async def run_replay(scenario: Scenario, *, stage_delays: bool = False) -> ReplayResult:
     """시나리오를 리플레이합니다.
 
     각 스텝을 순차적으로 실행하고 Hard Gate 결과를 수집합니다.
@@ -82,6 +90,7 @@ async def run_replay(scenario: Scenario) -> ReplayResult:
 
     Args:
         scenario: 실행할 시나리오
+        stage_delays: 단계별 모의 처리 지연 적용 여부 (기본: 비활성화)
 
     Returns:
         ReplayResult: 리플레이 전체 결과
@@ -93,6 +102,7 @@ async def run_replay(scenario: Scenario) -> ReplayResult:
         scenario.seed,
     )
 
+    started = time.perf_counter()
     step_results: list[StepResult] = []
     # 경제 상태 추적 (누적)
     current_balance = CurrencyAmount(signal=100, memory_shard=5)
@@ -112,6 +122,7 @@ async def run_replay(scenario: Scenario) -> ReplayResult:
             language=scenario.language,
             seed=scenario.seed + idx,
             economy_snapshot=current_balance,
+            stage_delays=stage_delays,
         )
 
         step_results.append(result)
@@ -137,6 +148,7 @@ async def run_replay(scenario: Scenario) -> ReplayResult:
         failed_steps=failed,
         step_results=step_results,
         summary=summary,
+        duration_ms=_elapsed_ms(started),
     )
 
 
@@ -147,11 +159,13 @@ async def _execute_step(
     language: Language,
     seed: int,
     economy_snapshot: CurrencyAmount,
+    stage_delays: bool = False,
 ) -> StepResult:
     """단일 스텝을 실행하고 Hard Gate를 검증합니다.
 
     MVP에서는 Mock pipeline을 사용하여 검증합니다.
     """
+    started = time.perf_counter()
     gates: list[GateResult] = []
     narrative_preview = ""
     error_msg: str | None = None
@@ -186,6 +200,7 @@ async def _execute_step(
             turn_input=turn_input,
             seed=seed,
             is_mock=True,
+            stage_delays=stage_delays,
         )
 
         # 더미 emit 함수 (리플레이 결과 수집용)
@@ -254,9 +269,15 @@ async def _execute_step(
         all_passed=all_passed,
         narrative_preview=narrative_preview,
         error=error_msg,
+        duration_ms=_elapsed_ms(started),
     )
 
 
+def _elapsed_ms(started: float) -> float:
+    """perf_counter 기준 경과 시간(ms)."""
+    return round((time.perf_counter() - started) * 1000.0, 3)
+
+
 def _all_gates_fail(detail: str) -> list[GateResult]:
     """모든 게이트를 실패로 생성합니다."""
     return [
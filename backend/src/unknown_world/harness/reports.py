@@ -0,0 +1,113 @@
+"""Unknown World - 리플레이 스위트 리포트 (JSON/JUnit XML).
+
+SuiteResult를 CI가 읽을 수 있는 형식으로 기록합니다.
+
+    - JSON: SuiteResult 전체 (집계 + 시나리오/스텝별 게이트 결과 + 실행 시간)
+    - JUnit XML: 시나리오 = testsuite, 스텝 = testcase
+      (게이트 실패 → <failure>, 스텝 실행 예외 → <error>,
+       실행/로드 실패 시나리오 → <error> testcase 하나)
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from unknown_world.harness.replay_runner import ReplayResult
+from unknown_world.harness.scenario import GateStatus, StepResult
+from unknown_world.harness.suite_runner import SuiteResult
+
+_TESTCASE_NAME_LENGTH = 60
+
+
+def _seconds(duration_ms: float) -> str:
+    return f"{duration_ms / 1000.0:.3f}"
+
+
+def _step_case(scenario: ReplayResult, step: StepResult) -> ET.Element:
+    case = ET.Element(
+        "testcase",
+        {
+            "classname": f"replay.{scenario.scenario_name}",
+            "name": f"step {step.step_index + 1}: {step.text[:_TESTCASE_NAME_LENGTH]}",
+            "time": _seconds(step.duration_ms),
+        },
+    )
+    if step.all_passed:
+        return case
+
+    failed_gates = [gate for gate in step.gates if gate.status == GateStatus.FAIL]
+    if step.error is not None:
+        node = ET.SubElement(case, "error", {"type": "StepError", "message": step.error})
+    else:
+        message = ", ".join(gate.name for gate in failed_gates)
+        node = ET.SubElement(case, "failure", {"type": "HardGateFailure", "message": message})
+    node.text = "\n".join(
+        f"{gate.name}: {gate.detail}" if gate.detail else gate.name for gate in failed_gates
+    )
+    return case
+
+
+def _scenario_counts(scenario: ReplayResult) -> tuple[int, int, int]:
+    """시나리오의 (tests, failures, errors) 수.
+
+    스텝 결과 없이 실패한 시나리오(실행/로드 실패)는 ScenarioError 케이스 하나로 집계합니다.
+    """
+    if not scenario.step_results:
+        return (0, 0, 0) if scenario.all_passed else (1, 0, 1)
+    errors = sum(1 for step in scenario.step_results if step.error is not None)
+    failures = sum(
+        1 for step in scenario.step_results if not step.all_passed and step.error is None
+    )
+    return len(scenario.step_results), failures, errors
+
+
+def to_junit_xml(suite: SuiteResult) -> str:
+    """SuiteResult를 JUnit XML 문자열로 변환합니다."""
+    counts = [_scenario_counts(scenario) for scenario in suite.results]
+    root = ET.Element(
+        "testsuites",
+        {
+            "name": "replay",
+            "tests": str(sum(tests for tests, _, _ in counts)),
+            "failures": str(sum(failures for _, failures, _ in counts)),
+            "errors": str(sum(errors for _, _, errors in counts)),
+            "time": _seconds(suite.duration_ms),
+        },
+    )
+    for scenario, (tests, failures, errors) in zip(suite.results, counts, strict=True):
+        testsuite = ET.SubElement(
+            root,
+            "testsuite",
+            {
+                "name": scenario.scenario_name,
+                "tests": str(tests),
+                "failures": str(failures),
+                "errors": str(errors),
+                "time": _seconds(scenario.duration_ms),
+            },
+        )
+        testsuite.extend(_step_case(scenario, step) for step in scenario.step_results)
+        if not scenario.step_results and not scenario.all_passed:
+            # 시나리오 자체가 실행되지 못한 경우 (스텝 결과 없음)
+            case = ET.SubElement(
+                testsuite, "testcase", {"classname": "replay", "name": scenario.scenario_name}
+            )
+            ET.SubElement(case, "error", {"type": "ScenarioError", "message": scenario.summary})
+
+    ET.indent(root)
+    return ET.tostring(root, encoding="unicode", xml_declaration=True) + "\n"
+
+
+def write_json_report(suite: SuiteResult, path: str | Path) -> None:
+    """SuiteResult를 JSON 파일로 기록합니다."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(suite.model_dump_json(indent=2), encoding="utf-8")
+
+
+def write_junit_report(suite: SuiteResult, path: str | Path) -> None:
+    """SuiteResult를 JUnit XML 파일로 기록합니다."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(to_junit_xml(suite), encoding="utf-8")
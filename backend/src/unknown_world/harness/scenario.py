@@ -90,3 +90,4 @@ class StepResult(BaseModel):
     all_passed: bool
     narrative_preview: str = ""  # 첫 100자
     error: str | None = None
+    duration_ms: float = 0.0
@@ -0,0 +1,380 @@
+"""Unknown World - 시나리오 스위트 병렬 실행기.
+
+여러 시나리오를 동시에 리플레이하고 pass/fail 및 실행 시간을 집계합니다.
+야간 회귀(수백 개 시나리오)를 수 초 안에 끝내기 위한 실행기입니다.
+
+설계 원칙:
+    - 시나리오 내부 스텝은 순차, 시나리오 간에는 동시 실행 (worker 수 제한)
+    - 단계별 모의 처리 지연(*_DELAY_MS)은 기본 비활성화
+    - 샤딩: 시나리오 목록을 shard_index::shard_count로 나눠 CI 매트릭스/프로세스별 실행
+      (파일 스위트는 샤딩 후 해당 샤드의 파일만 로드, 로드 실패는 시나리오 실패로 기록)
+    - 결과 순서는 입력 순서를 유지 (리포트 diff 안정성)
+
+환경변수:
+    - UW_HARNESS_CONCURRENCY: 동시 실행 시나리오 수 (기본: 16)
+
+참조:
+    - vibe/unit-plans/U-025[Mvp].md
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from unknown_world.harness.replay_runner import ReplayResult, load_scenario, run_replay
+from unknown_world.harness.scenario import Scenario
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_HARNESS_CONCURRENCY = 16
+"""기본 동시 실행 시나리오 수."""
+
+
+def get_harness_concurrency() -> int:
+    """환경변수에서 동시 실행 시나리오 수를 읽습니다."""
+    return max(1, int(os.environ.get("UW_HARNESS_CONCURRENCY", str(DEFAULT_HARNESS_CONCURRENCY))))
+
+
+# =============================================================================
+# 결과 모델
+# =============================================================================
+
+
+class TimingSummary(BaseModel):
+    """스텝 실행 시간 분포 (ms)."""
+
+    count: int = 0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class SuiteResult(BaseModel):
+    """시나리오 스위트 실행 결과.
+
+    Attributes:
+        shard_index: 실행한 샤드 번호 (None이면 전체 또는 병합 결과)
+        shard_count: 전체 샤드 수
+        concurrency: 동시 실행 시나리오 수
+        duration_ms: 스위트 전체 경과 시간 (wall clock)
+        step_timing: 스텝 실행 시간 분포
+        results: 시나리오별 리플레이 결과 (입력 순서)
+    """
+
+    shard_index: int | None = None
+    shard_count: int = 1
+    concurrency: int = 1
+    total_scenarios: int = 0
+    passed_scenarios: int = 0
+    failed_scenarios: int = 0
+    total_steps: int = 0
+    passed_steps: int = 0
+    failed_steps: int = 0
+    duration_ms: float = 0.0
+    step_timing: TimingSummary = Field(default_factory=TimingSummary)
+    results: list[ReplayResult] = []
+
+    @property
+    def all_passed(self) -> bool:
+        """모든 시나리오가 통과했는지 여부."""
+        return self.failed_scenarios == 0
+
+    @property
+    def summary(self) -> str:
+        """한 줄 요약."""
+        text = (
+            f"{self.passed_scenarios}/{self.total_scenarios} scenarios passed, "
+            f"{self.passed_steps}/{self.total_steps} steps passed "
+            f"in {self.duration_ms / 1000.0:.2f}s"
+        )
+        if self.shard_index is not None:
+            text = f"[shard {self.shard_index}/{self.shard_count}] {text}"
+        return text
+
+
+def _percentile(sorted_values: Sequence[float], ratio: float) -> float:
+    """nearest-rank 백분위수."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(ratio * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _summarize_timing(results: Sequence[ReplayResult]) -> TimingSummary:
+    durations = sorted(step.duration_ms for result in results for step in result.step_results)
+    if not durations:
+        return TimingSummary()
+    return TimingSummary(
+        count=len(durations),
+        mean_ms=round(sum(durations) / len(durations), 3),
+        p50_ms=_percentile(durations, 0.50),
+        p95_ms=_percentile(durations, 0.95),
+        max_ms=durations[-1],
+    )
+
+
+def _build_suite_result(
+    results: list[ReplayResult],
+    *,
+    shard_index: int | None,
+    shard_count: int,
+    concurrency: int,
+    duration_ms: float,
+) -> SuiteResult:
+    passed_scenarios = sum(1 for r in results if r.all_passed)
+    return SuiteResult(
+        shard_index=shard_index,
+        shard_count=shard_count,
+        concurrency=concurrency,
+        total_scenarios=len(results),
+        passed_scenarios=passed_scenarios,
+        failed_scenarios=len(results) - passed_scenarios,
+        total_steps=sum(r.total_steps for r in results),
+        passed_steps=sum(r.passed_steps for r in results),
+        failed_steps=sum(r.failed_steps for r in results),
+        duration_ms=round(duration_ms, 3),
+        step_timing=_summarize_timing(results),
+        results=results,
+    )
+
+
+# =============================================================================
+# 샤딩/탐색
+# =============================================================================
+
+
+def shard_items[T](items: Sequence[T], shard_index: int, shard_count: int) -> list[T]:
+    """목록을 라운드로빈으로 나눠 shard_index 번째 몫을 반환합니다.
+
+    Raises:
+        ValueError: shard_count < 1 또는 shard_index가 범위를 벗어났을 때
+    """
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise ValueError(f"Invalid shard {shard_index}/{shard_count}")
+    return list(items[shard_index::shard_count])
+
+
+def discover_scenarios(paths: Sequence[str | Path]) -> list[Path]:
+    """시나리오 JSON 파일 목록을 찾습니다 (디렉토리는 재귀 탐색, 정렬된 순서).
+
+    정렬된 순서는 프로세스/CI 잡 간 샤딩 결과를 일치시키기 위해 필요합니다.
+    """
+    found: list[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            found.extend(sorted(path.rglob("*.json")))
+        else:
+            found.append(path)
+    return found
+
+
+# =============================================================================
+# 실행
+# =============================================================================
+
+
+def _crashed_result(scenario_name: str, total_steps: int, summary: str) -> ReplayResult:
+    """실행/로드에 실패한 시나리오 결과 (스텝 결과 없이 실패로 집계)."""
+    return ReplayResult(
+        scenario_name=scenario_name,
+        total_steps=total_steps,
+        passed_steps=0,
+        failed_steps=max(1, total_steps),
+        summary=summary,
+    )
+
+
+async def _replay_guarded(scenario: Scenario, stage_delays: bool) -> ReplayResult:
+    """시나리오를 리플레이합니다 (예외는 실패 결과로 변환해 스위트를 계속 진행)."""
+    try:
+        return await run_replay(scenario, stage_delays=stage_delays)
+    except Exception as exc:
+        logger.warning("[SuiteRunner] Scenario %s crashed: %s", scenario.name, type(exc).__name__)
+        return _crashed_result(
+            scenario.name, len(scenario.steps), f"Replay '{scenario.name}' crashed: {exc}"
+        )
+
+
+async def _load_and_replay(path: str | Path, stage_delays: bool) -> ReplayResult:
+    """시나리오 파일을 로드해 리플레이합니다 (로드 실패는 해당 시나리오의 실패 결과)."""
+    try:
+        scenario = load_scenario(path)
+    except (OSError, ValueError) as exc:
+        logger.warning("[SuiteRunner] Scenario %s failed to load: %s", path, type(exc).__name__)
+        return _crashed_result(str(path), 0, f"Scenario '{path}' failed to load: {exc}")
+    return await _replay_guarded(scenario, stage_delays)
+
+
+async def _run_selected[T](
+    items: Sequence[T],
+    replay: Callable[[T], Awaitable[ReplayResult]],
+    *,
+    concurrency: int | None,
+    shard_index: int,
+    shard_count: int,
+) -> SuiteResult:
+    """샤드에 속한 항목을 동시 실행 수 제한 하에 리플레이하고 집계합니다."""
+    limit = concurrency or get_harness_concurrency()
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run_one(item: T) -> ReplayResult:
+        async with semaphore:
+            return await replay(item)
+
+    logger.info(
+        "[SuiteRunner] Starting suite: scenarios=%d, shard=%d/%d, concurrency=%d",
+        len(items),
+        shard_index,
+        shard_count,
+        limit,
+    )
+    started = time.perf_counter()
+    results = list(await asyncio.gather(*(run_one(item) for item in items)))
+    suite = _build_suite_result(
+        results,
+        shard_index=shard_index if shard_count > 1 else None,
+        shard_count=shard_count,
+        concurrency=limit,
+        duration_ms=(time.perf_counter() - started) * 1000.0,
+    )
+    logger.info("[SuiteRunner] %s", suite.summary)
+    return suite
+
+
+async def run_suite(
+    scenarios: Sequence[Scenario],
+    *,
+    concurrency: int | None = None,
+    stage_delays: bool = False,
+    shard_index: int = 0,
+    shard_count: int = 1,
+) -> SuiteResult:
+    """시나리오 스위트를 동시에 리플레이합니다.
+
+    Args:
+        scenarios: 실행할 시나리오 목록 (샤딩 전 전체 목록)
+        concurrency: 동시 실행 시나리오 수 (기본: 환경변수 UW_HARNESS_CONCURRENCY)
+        stage_delays: 단계별 모의 처리 지연 적용 여부 (기본: 비활성화)
+        shard_index: 실행할 샤드 번호 (0부터)
+        shard_count: 전체 샤드 수
+
+    Returns:
+        SuiteResult: 집계된 실행 결과
+    """
+    return await _run_selected(
+        shard_items(scenarios, shard_index, shard_count),
+        lambda scenario: _replay_guarded(scenario, stage_delays),
+        concurrency=concurrency,
+        shard_index=shard_index,
+        shard_count=shard_count,
+    )
+
+
+async def run_suite_files(
+    paths: Sequence[str | Path],
+    *,
+    concurrency: int | None = None,
+    stage_delays: bool = False,
+    shard_index: int = 0,
+    shard_count: int = 1,
+) -> SuiteResult:
+    """시나리오 파일 스위트를 동시에 리플레이합니다.
+
+    파일 목록을 먼저 샤딩한 뒤 해당 샤드의 파일만 로드합니다. 로드에 실패한 파일은
+    스위트를 중단하지 않고 해당 시나리오의 실패(스텝 결과 없음)로 기록됩니다.
+
+    Args:
+        paths: 시나리오 JSON 파일 목록 (discover_scenarios 결과, 샤딩 전 전체 목록)
+        concurrency: 동시 실행 시나리오 수 (기본: 환경변수 UW_HARNESS_CONCURRENCY)
+        stage_delays: 단계별 모의 처리 지연 적용 여부 (기본: 비활성화)
+        shard_index: 실행할 샤드 번호 (0부터)
+        shard_count: 전체 샤드 수
+
+    Returns:
+        SuiteResult: 집계된 실행 결과
+    """
+    return await _run_selected(
+        shard_items(paths, shard_index, shard_count),
+        lambda path: _load_and_replay(path, stage_delays),
+        concurrency=concurrency,
+        shard_index=shard_index,
+        shard_count=shard_count,
+    )
+
+
+def merge_suite_results(shards: Sequence[SuiteResult]) -> SuiteResult:
+    """샤드별 결과를 하나로 병합합니다 (경과 시간은 가장 느린 샤드 기준)."""
+    return _build_suite_result(
+        [result for shard in shards for result in shard.results],
+        shard_index=None,
+        shard_count=len(shards),
+        concurrency=sum(shard.concurrency for shard in shards),
+        duration_ms=max((shard.duration_ms for shard in shards), default=0.0),
+    )
+
+
+def _run_shard_in_process(
+    paths: list[str],
+    shard_index: int,
+    shard_count: int,
+    concurrency: int | None,
+    stage_delays: bool,
+) -> str:
+    """워커 프로세스 진입점 (결과는 JSON 문자열로 반환)."""
+    suite = asyncio.run(
+        run_suite_files(
+            paths,
+            concurrency=concurrency,
+            stage_delays=stage_delays,
+            shard_index=shard_index,
+            shard_count=shard_count,
+        )
+    )
+    return suite.model_dump_json()
+
+
+def run_suite_processes(
+    paths: Sequence[str | Path],
+    *,
+    processes: int,
+    concurrency: int | None = None,
+    stage_delays: bool = False,
+) -> SuiteResult:
+    """시나리오 파일을 프로세스 수만큼 샤딩해 병렬 실행하고 결과를 병합합니다.
+
+    Args:
+        paths: 시나리오 JSON 파일 목록 (discover_scenarios 결과)
+        processes: 워커 프로세스 수 (= 샤드 수)
+        concurrency: 프로세스당 동시 실행 시나리오 수
+        stage_delays: 단계별 모의 처리 지연 적용 여부
+
+    Returns:
+        SuiteResult: 병합된 실행 결과
+    """
+    path_strs = [str(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [
+            pool.submit(
+                _run_shard_in_process, path_strs, index, processes, concurrency, stage_delays
+            )
+            for index in range(processes)
+        ]
+        shards = [SuiteResult.model_validate_json(future.result()) for future in futures]
+    merged = merge_suite_results(shards)
+    logger.info("[SuiteRunner] %s (processes=%d)", merged.summary, processes)
+    return merged
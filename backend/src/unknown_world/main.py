@@ -59,7 +59,6 @@ from typing import Literal
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
 from unknown_world import __version__
@@ -68,10 +67,20 @@ from unknown_world.api import (
     image_router,
     item_icon_router,
     scanner_router,
+    session_router,
     turn_router,
 )
+from unknown_world.api.image_http_cache import CachedStaticFiles
+from unknown_world.api.turn_replay import get_turn_replay_store
+from unknown_world.schemas.artifacts import get_turn_schema_artifacts
+from unknown_world.services.affordance_precompute import shutdown_affordance_precomputer
+from unknown_world.services.item_icon_generator import (
+    flush_item_icon_cache,
+    get_item_icon_generator,
+)
+from unknown_world.storage.offload import get_offload_executor, reset_offload_executor
 from unknown_world.storage.paths import BASE_DATA_DIR, STATIC_URL_PREFIX
-from unknown_world.storage.seed import seed_scene_images
+from unknown_world.storage.seed import seed_scene_images_async
 
 # =============================================================================
 # 로거 설정
@@ -128,7 +137,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 
     # U-124: 사전 생성 씬 이미지를 백엔드 output 디렉터리에 시드
     # 프론트엔드 WebP → 백엔드 PNG 변환 (Gemini 참조 이미지 파이프라인용)
-    seed_scene_images()
+    # Pillow 변환은 CPU 오프로드 풀에서 실행 (이벤트 루프 블로킹 방지)
+    await seed_scene_images_async()
+
+    # 아이콘 캐시 manifest 로드 (요청 경로에서 디렉토리 스캔/파일 조회 제거)
+    await get_offload_executor().run_io(get_item_icon_generator)
+
+    # 빌드 시 생성된 TurnOutput 스키마 로드 (첫 턴의 스키마 생성 비용 제거)
+    get_turn_schema_artifacts()
 
     logger.info("[Startup] Unknown World backend started")
 
@@ -139,6 +155,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # =========================================================================
     logger.info("[Shutdown] Unknown World backend shutting down")
 
+    # 진행 중인 affordance 선계산 취소
+    await shutdown_affordance_precomputer()
+
+    # 멱등 키로 분리 실행 중인 턴 취소
+    await get_turn_replay_store().shutdown()
+
+    # 아이콘 캐시 LRU 순서 저장 (조회 시에는 메모리에만 반영됨)
+    flush_item_icon_cache()
+
+    # 이미지 코덱/파일 I/O 워커 풀 종료
+    reset_offload_executor()
+
 
 # =============================================================================
 # FastAPI 앱 인스턴스
@@ -160,7 +188,8 @@ app = FastAPI(
 # 전체 .data 디렉토리를 /static으로 서빙하여 카테고리별 경로 지원
 # 예: /static/images/generated/img_xxx.png
 BASE_DATA_DIR.mkdir(parents=True, exist_ok=True)
-app.mount(STATIC_URL_PREFIX, StaticFiles(directory=str(BASE_DATA_DIR)), name="static")
+# 생성 이미지는 immutable 캐시 + 내용 해시 ETag + Accept 기반 WebP/AVIF 협상
+app.mount(STATIC_URL_PREFIX, CachedStaticFiles(directory=str(BASE_DATA_DIR)), name="static")
 
 # =============================================================================
 # CORS 설정
@@ -199,6 +228,9 @@ app.add_middleware(
 # U-007: /api/turn HTTP Streaming 엔드포인트
 app.include_router(turn_router)
 
+# /api/session WebSocket/SSE 세션 전송 (턴/이미지/아이콘 이벤트 다중화)
+app.include_router(session_router)
+
 # U-019: /api/image 이미지 생성 엔드포인트
 app.include_router(image_router)
 
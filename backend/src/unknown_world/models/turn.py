@@ -23,12 +23,26 @@ Gemini Structured Outputs에 투입 가능한 JSON Schema(부분집합)를 생
 """
 
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from unknown_world.config.models import ModelLabel  # U-136: SSOT 통합
 
+# =============================================================================
+# 필드 헬퍼
+# =============================================================================
+
+
+def _empty_list_schema(schema: dict[str, Any]) -> None:
+    """빈 리스트 기본값 필드의 JSON Schema에 "default": []를 유지합니다.
+
+    default=[]는 인스턴스를 생성할 때마다 기본값을 deepcopy하므로 default_factory(lambda: [])를
+    사용하고, Gemini/프론트엔드용 스키마는 기존과 같게 유지합니다.
+    """
+    schema["default"] = []
+
+
 # =============================================================================
 # 공통 Enum 타입
 # =============================================================================
@@ -337,7 +351,8 @@ class ActionDeck(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     cards: list[ActionCard] = Field(
-        default=[],
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
         min_length=0,
         max_length=5,
         description="액션 카드 목록 (3~5장 권장)",
@@ -362,7 +377,10 @@ class UIOutput(BaseModel):
 
     action_deck: ActionDeck = Field(default_factory=ActionDeck, description="액션 카드 덱")
     objects: list[SceneObject] = Field(
-        default=[], max_length=5, description="클릭 가능한 장면 오브젝트 목록 (최대 5개)"
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
+        max_length=5,
+        description="클릭 가능한 장면 오브젝트 목록 (최대 5개)",
     )
 
 
@@ -482,22 +500,40 @@ class WorldDelta(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     rules_changed: list[WorldRule] = Field(
-        default=[], max_length=3, description="변경된 규칙 목록 (최대 3개)"
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
+        max_length=3,
+        description="변경된 규칙 목록 (최대 3개)",
     )
     inventory_added: list[InventoryItemData] = Field(
-        default=[], max_length=5, description="추가된 인벤토리 아이템 (최대 5개)"
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
+        max_length=5,
+        description="추가된 인벤토리 아이템 (최대 5개)",
     )
     inventory_removed: list[str] = Field(
-        default=[], max_length=5, description="제거된 인벤토리 아이템 (최대 5개)"
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
+        max_length=5,
+        description="제거된 인벤토리 아이템 (최대 5개)",
     )
     quests_updated: list[Quest] = Field(
-        default=[], max_length=3, description="업데이트된 퀘스트/목표 목록 (최대 3개)"
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
+        max_length=3,
+        description="업데이트된 퀘스트/목표 목록 (최대 3개)",
     )
     relationships_changed: list[str] = Field(
-        default=[], max_length=3, description="변경된 관계 (최대 3개)"
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
+        max_length=3,
+        description="변경된 관계 (최대 3개)",
     )
     memory_pins: list[MemoryPin] = Field(
-        default=[], max_length=2, description="중요 설정 고정 후보 (최대 2개)"
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
+        max_length=2,
+        description="중요 설정 고정 후보 (최대 2개)",
     )
 
 
@@ -533,7 +569,10 @@ class ImageJob(BaseModel):
     aspect_ratio: str = Field(default="16:9", description="가로세로 비율")
     image_size: str = Field(default="1024x1024", description="이미지 크기")
     reference_image_ids: list[str] = Field(
-        default=[], max_length=2, description="참조 이미지 ID 목록 (최대 2개)"
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
+        max_length=2,
+        description="참조 이미지 ID 목록 (최대 2개)",
     )
     reference_image_url: str | None = Field(
         default=None,
@@ -654,7 +693,10 @@ class AgentConsole(BaseModel):
 
     current_phase: AgentPhase = Field(default=AgentPhase.COMMIT, description="현재 실행 단계")
     badges: list[ValidationBadge] = Field(
-        default=[], max_length=4, description="검증 배지 목록 (최대 4개)"
+        default_factory=lambda: [],
+        json_schema_extra=_empty_list_schema,
+        max_length=4,
+        description="검증 배지 목록 (최대 4개)",
     )
     repair_count: Annotated[int, Field(ge=0, description="자동 복구 시도 횟수")] = 0
     model_label: ModelLabel = Field(
@@ -42,6 +42,10 @@ from unknown_world.orchestrator.stages.types import (
 from unknown_world.orchestrator.stages.validate import validate_stage
 from unknown_world.orchestrator.stages.verify import verify_stage
 from unknown_world.services.image_generation import get_image_generator
+from unknown_world.services.item_icon_generator import (
+    get_item_icon_generator,
+    is_icon_prefetch_enabled,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +92,7 @@ def create_pipeline_context(
     is_mock: bool | None = None,
     image_generator: ImageGeneratorType | None = None,
     session_id: str | None = None,
+    stage_delays: bool = True,
 ) -> PipelineContext:
     """파이프라인 컨텍스트를 생성합니다.
 
@@ -101,6 +106,7 @@ def create_pipeline_context(
             None이면 render_stage에서 이미지 생성을 건너뜁니다 (기존 동작 보존).
             테스트 시 MockImageGenerator를 주입하여 모킹 가능합니다.
         session_id: 세션 ID (U-127, None이면 "default" 사용)
+        stage_delays: 단계별 모의 처리 지연 적용 여부 (리플레이 하네스는 False)
 
     Returns:
         초기화된 파이프라인 컨텍스트
@@ -131,6 +137,11 @@ def create_pipeline_context(
         # Real 모드에서만 히스토리 활성화
         conversation_history = get_conversation_history(session_id or "default")
 
+    # 아이콘 선생성 (Real 모드 + UW_ICON_PREFETCH 활성화 시)
+    icon_prefetcher = (
+        get_item_icon_generator() if is_icon_prefetch_enabled(is_mock=is_mock) else None
+    )
+
     return PipelineContext(
         turn_input=turn_input,
         economy_snapshot=economy_snapshot,
@@ -138,6 +149,9 @@ def create_pipeline_context(
         seed=seed,
         image_generator=image_generator,
         conversation_history=conversation_history,
+        session_id=session_id,
+        icon_prefetcher=icon_prefetcher,
+        stage_delays=stage_delays,
     )
 
 
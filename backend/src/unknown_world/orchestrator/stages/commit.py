@@ -6,6 +6,8 @@
 설계 원칙:
     - RULE-008: 단계 이벤트 일관성
     - 동작 보존: 기존 시뮬레이션 지연 유지
+    - 아이콘 선생성: 검증된 출력의 inventory_added 아이콘을 prefetch 우선순위로 큐잉하여
+      클라이언트가 /api/item/icon을 요청할 때는 대개 캐시되어 있도록 함
 
 참조:
     - vibe/refactors/RU-005-Q4.md
@@ -14,6 +16,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 
 from unknown_world.models.turn import AgentPhase
 from unknown_world.orchestrator.stages.types import (
@@ -23,10 +26,38 @@ from unknown_world.orchestrator.stages.types import (
     PipelineEventType,
 )
 
+logger = logging.getLogger(__name__)
+
 # 모의 처리 지연 시간 (ms)
 COMMIT_DELAY_MS = 20
 
 
+def _prefetch_inventory_icons(ctx: PipelineContext) -> None:
+    """검증된 출력의 inventory_added 아이콘 생성을 prefetch 우선순위로 시작합니다.
+
+    설명은 클라이언트와 같은 규칙(description, 없으면 label)을 사용해 캐시 키를 맞춥니다.
+    실패해도 턴 결과에는 영향을 주지 않습니다 (RULE-004).
+    """
+    if ctx.icon_prefetcher is None or ctx.output is None or ctx.is_fallback:
+        return
+
+    added = ctx.output.world.inventory_added
+    if not added:
+        return
+
+    try:
+        ctx.icon_prefetcher.prefetch_icons(
+            ((item.id, item.description or item.label) for item in added if not item.icon_url),
+            language=ctx.turn_input.language.value,
+            session_id=ctx.session_id,
+        )
+    except Exception as e:
+        logger.warning(
+            "[Commit] Icon prefetch scheduling failed",
+            extra={"error_type": type(e).__name__},
+        )
+
+
 async def commit_stage(ctx: PipelineContext, *, emit: EmitFn) -> PipelineContext:
     """Commit 단계를 실행합니다.
 
@@ -49,8 +80,11 @@ async def commit_stage(ctx: PipelineContext, *, emit: EmitFn) -> PipelineContext
         )
     )
 
+    _prefetch_inventory_icons(ctx)
+
     # 모의 처리 지연 (기존 동작 보존)
-    await asyncio.sleep(COMMIT_DELAY_MS / 1000.0)
+    if ctx.stage_delays:
+        await asyncio.sleep(COMMIT_DELAY_MS / 1000.0)
 
     # Stage 완료 이벤트
     await emit(
@@ -52,7 +52,8 @@ async def plan_stage(ctx: PipelineContext, *, emit: EmitFn) -> PipelineContext:
     )
 
     # 모의 처리 지연 (기존 동작 보존)
-    await asyncio.sleep(PLAN_DELAY_MS / 1000.0)
+    if ctx.stage_delays:
+        await asyncio.sleep(PLAN_DELAY_MS / 1000.0)
 
     # Stage 완료 이벤트
     await emit(
@@ -490,7 +490,8 @@ async def render_stage(ctx: PipelineContext, *, emit: EmitFn) -> PipelineContext
         logger.debug("[Render] Image generation service not injected, pass-through")
 
     # 모의 처리 지연 (기존 동작 보존)
-    await asyncio.sleep(RENDER_DELAY_MS / 1000.0)
+    if ctx.stage_delays:
+        await asyncio.sleep(RENDER_DELAY_MS / 1000.0)
 
     # Stage 완료 이벤트
     await emit(
@@ -201,6 +201,7 @@ async def _execute_vision_analysis(
     language = ctx.turn_input.language
 
     try:
+        from unknown_world.services.affordance_precompute import get_affordance_precomputer
         from unknown_world.services.agentic_vision import (
             affordances_to_scene_objects,
             get_agentic_vision_service,
@@ -208,9 +209,15 @@ async def _execute_vision_analysis(
 
         vision_service = get_agentic_vision_service()
 
+        # 이미지 생성 직후 선계산된 결과가 있으면 비전 호출 생략
+        precomputer = get_affordance_precomputer()
+        precomputed = (
+            await precomputer.get(image_url, language) if precomputer is not None else None
+        )
+
         # 핫스팟 1개 미만 시 최대 2회 리트라이
         MAX_VISION_RETRIES = 2
-        result = await vision_service.analyze_scene(image_url, language)
+        result = precomputed or await vision_service.analyze_scene(image_url, language)
 
         for retry in range(MAX_VISION_RETRIES):
             if result.success and result.affordances:
@@ -365,7 +372,8 @@ async def resolve_stage(ctx: PipelineContext, *, emit: EmitFn) -> PipelineContex
             )
     else:
         # 기존 동작: pass-through + 모의 지연
-        await asyncio.sleep(RESOLVE_DELAY_MS / 1000.0)
+        if ctx.stage_delays:
+            await asyncio.sleep(RESOLVE_DELAY_MS / 1000.0)
 
         # U-090: 비정밀분석 턴에서 GM이 생성한 핫스팟 조용히 제거
         # GM이 프롬프트 지시를 무시하고 objects[]에 핫스팟을 추가할 수 있으므로
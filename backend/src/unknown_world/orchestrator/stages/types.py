@@ -8,6 +8,7 @@ Pipeline에서 사용하는 컨텍스트와 emit 콜백 인터페이스를 정
     - RULE-007/008: 프롬프트/내부 추론 노출 금지, 단계/배지만 표시
     - U-051: 이미지 생성 서비스 의존성 주입 (순환 의존 방지를 위해 TYPE_CHECKING 활용)
     - U-127: 멀티턴 대화 히스토리 전달 경로
+    - 아이콘 선생성: commit 단계에서 inventory_added 아이콘을 prefetch 우선순위로 큐잉
 
 참조:
     - vibe/refactors/RU-005-Q4.md
@@ -35,6 +36,7 @@ from unknown_world.models.turn import (
 if TYPE_CHECKING:
     from unknown_world.orchestrator.conversation_history import ConversationHistory
     from unknown_world.services.image_generation import ImageGeneratorType
+    from unknown_world.services.item_icon_generator import ItemIconGenerator
 
 # =============================================================================
 # Emit 콜백 타입 (오케스트레이터 → API 레이어)
@@ -117,6 +119,11 @@ class PipelineContext:
         conversation_history: 멀티턴 대화 히스토리 (U-127, 선택적 주입)
         thought_signature: 현재 턴의 Thought Signature (U-127, validate 후 설정)
         is_rate_limited: API rate limit(429)으로 모든 재시도 소진 여부 (U-130)
+        session_id: 세션 식별자 (아이콘 선생성 공정성 버킷)
+        icon_prefetcher: 아이콘 생성기 (선택적 주입)
+            None이면 commit 단계의 아이콘 선생성을 건너뜁니다 (Mock 모드 기본).
+        stage_delays: 단계별 모의 처리 지연(*_DELAY_MS) 적용 여부
+            UI 단계 연출용이며, 리플레이 하네스는 비활성화합니다.
     """
 
     turn_input: TurnInput
@@ -135,6 +142,9 @@ class PipelineContext:
     cost_multiplier: float = 1.0
     conversation_history: ConversationHistory | None = None
     thought_signature: str | None = None
+    session_id: str | None = None
+    icon_prefetcher: ItemIconGenerator | None = None
+    stage_delays: bool = True
 
 
 # =============================================================================
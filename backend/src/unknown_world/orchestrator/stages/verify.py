@@ -57,7 +57,8 @@ async def verify_stage(ctx: PipelineContext, *, emit: EmitFn) -> PipelineContext
     )
 
     # 모의 처리 지연 (기존 동작 보존)
-    await asyncio.sleep(VERIFY_DELAY_MS / 1000.0)
+    if ctx.stage_delays:
+        await asyncio.sleep(VERIFY_DELAY_MS / 1000.0)
 
     # U-090: 비정밀분석 턴 핫스팟 이중 안전장치
     # resolve stage에서 이미 필터링하지만, 놓친 경우를 대비
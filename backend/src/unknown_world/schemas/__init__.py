@@ -0,0 +1,27 @@
+"""Unknown World - 빌드 시 생성되는 JSON Schema 아티팩트.
+
+Pydantic 모델에서 Gemini 호환 스키마/스키마 버전/프론트엔드 공유 스키마를 생성하고,
+런타임에는 생성물을 불변 객체로 로드합니다 (python -m unknown_world.schemas).
+"""
+
+from unknown_world.schemas.artifacts import (
+    TurnSchemaArtifacts,
+    build_gemini_schema,
+    find_stale_artifacts,
+    get_turn_schema_artifacts,
+    reset_turn_schema_artifacts,
+    schema_digest,
+    strip_additional_properties,
+    write_artifacts,
+)
+
+__all__ = [
+    "TurnSchemaArtifacts",
+    "build_gemini_schema",
+    "find_stale_artifacts",
+    "get_turn_schema_artifacts",
+    "reset_turn_schema_artifacts",
+    "schema_digest",
+    "strip_additional_properties",
+    "write_artifacts",
+]
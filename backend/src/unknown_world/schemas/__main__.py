@@ -0,0 +1,32 @@
+"""JSON Schema 아티팩트 생성 CLI.
+
+실행:
+    cd backend
+    uv run python -m unknown_world.schemas           # 아티팩트 재생성
+    uv run python -m unknown_world.schemas --check   # 모델과 불일치 시 종료 코드 1 (CI용)
+"""
+
+import argparse
+import sys
+
+from unknown_world.schemas.artifacts import find_stale_artifacts, write_artifacts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="TurnInput/TurnOutput JSON Schema 아티팩트 생성")
+    parser.add_argument("--check", action="store_true", help="생성하지 않고 모델과의 불일치만 검사")
+    args = parser.parse_args()
+
+    if args.check:
+        stale = find_stale_artifacts()
+        for path in stale:
+            print(f"stale: {path}", file=sys.stderr)
+        return 1 if stale else 0
+
+    for path in write_artifacts():
+        print(f"updated: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""Unknown World - TurnInput/TurnOutput JSON Schema 아티팩트 (빌드 시 생성, 시작 시 로드).
+
+Pydantic 모델(models/turn.py)을 단일 소스로 하여 다음을 빌드 시점에 생성합니다:
+
+    - Gemini 호환 TurnOutput 스키마 (additionalProperties 제거, U-080)
+      → backend/src/unknown_world/schemas/generated/turn_output.gemini.schema.json
+    - 스키마 버전/해시 manifest
+      → backend/src/unknown_world/schemas/generated/manifest.json
+    - 프론트엔드 공유 스키마 (TurnInput/TurnOutput, 엄격 모드 그대로)
+      → shared/schemas/turn/turn_input.schema.json, turn_output.schema.json
+
+런타임은 생성된 Gemini 스키마를 시작 시 한 번 읽어 불변 객체(TurnSchemaArtifacts)로 보관하므로
+첫 턴에서 model_json_schema() + 재귀 정리 비용이 들지 않습니다. 스키마 버전(내용 해시)은
+프롬프트/컨텍스트 캐시 키로 사용할 수 있습니다.
+
+생성/검사:
+    cd backend
+    uv run python -m unknown_world.schemas           # 아티팩트 재생성
+    uv run python -m unknown_world.schemas --check   # 모델과 불일치 시 종료 코드 1
+
+설계 원칙:
+    - RULE-003: 구조화 출력 스키마는 Pydantic 모델이 SSOT (수동 사본 금지)
+
+환경변수:
+    - UW_SCHEMA_ARTIFACTS: 생성된 아티팩트 사용 여부 (기본: "1", "0"이면 시작 시 모델에서 빌드)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from unknown_world.models.turn import TurnInput, TurnOutput
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 경로/상수
+# =============================================================================
+
+GENERATED_DIR = Path(__file__).resolve().parent / "generated"
+"""백엔드 런타임 아티팩트 디렉토리 (패키지에 포함)."""
+
+GEMINI_SCHEMA_PATH = GENERATED_DIR / "turn_output.gemini.schema.json"
+MANIFEST_PATH = GENERATED_DIR / "manifest.json"
+
+# backend/src/unknown_world/schemas/artifacts.py → 레포 루트 (4단계 상위)
+SHARED_SCHEMA_DIR = (
+    Path(__file__).resolve().parent.parent.parent.parent.parent / "shared" / "schemas" / "turn"
+)
+"""프론트엔드 공유 스키마 디렉토리 (레포 루트 shared/, 빌드 시에만 사용)."""
+
+SCHEMA_VERSION_LENGTH = 16
+"""스키마 버전 문자열 길이 (SHA-256 hex 앞부분)."""
+
+_SHARED_SCHEMA_IDS = {
+    "turn_input": "https://unknown-world.dev/schemas/turn/turn_input.schema.json",
+    "turn_output": "https://unknown-world.dev/schemas/turn/turn_output.schema.json",
+}
+
+
+def is_schema_artifacts_enabled() -> bool:
+    """환경변수에서 생성된 아티팩트 사용 여부를 읽습니다."""
+    return os.environ.get("UW_SCHEMA_ARTIFACTS", "1").lower() not in ("0", "false", "no")
+
+
+# =============================================================================
+# 스키마 빌드
+# =============================================================================
+
+
+def strip_additional_properties(schema: dict[str, Any]) -> dict[str, Any]:
+    """JSON Schema에서 additionalProperties 필드를 재귀적으로 제거합니다.
+
+    Gemini API는 Pydantic이 생성하는 `additionalProperties` 필드를 인식하지 못하여
+    `400 INVALID_ARGUMENT: Unknown name "additional_properties"` 에러가 발생합니다 (U-080).
+
+    Args:
+        schema: Pydantic model_json_schema()로 생성된 JSON Schema
+
+    Returns:
+        additionalProperties가 제거된 JSON Schema (입력은 수정하지 않음)
+    """
+    cleaned: dict[str, Any] = {}
+    for key, value in schema.items():
+        if key == "additionalProperties":
+            continue
+        if isinstance(value, dict):
+            cleaned[key] = strip_additional_properties(cast(dict[str, Any], value))
+        elif isinstance(value, list):
+            cleaned[key] = [
+                strip_additional_properties(cast(dict[str, Any], item))
+                if isinstance(item, dict)
+                else item
+                for item in cast(list[Any], value)
+            ]
+        else:
+            cleaned[key] = value
+    return cleaned
+
+
+def schema_digest(schema: dict[str, Any]) -> str:
+    """스키마 내용 해시 (키 순서/공백과 무관한 정규화 JSON의 SHA-256 hex)."""
+    canonical = json.dumps(schema, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def build_gemini_schema() -> dict[str, Any]:
+    """모델에서 Gemini 호환 TurnOutput 스키마를 빌드합니다."""
+    return strip_additional_properties(TurnOutput.model_json_schema())
+
+
+def build_manifest(gemini_schema: dict[str, Any]) -> dict[str, str]:
+    """스키마 해시와 계약 버전(세 스키마 해시의 결합 해시 앞 16자)을 계산합니다."""
+    digests = {
+        "gemini_schema_sha256": schema_digest(gemini_schema),
+        "turn_input_sha256": schema_digest(TurnInput.model_json_schema()),
+        "turn_output_sha256": schema_digest(TurnOutput.model_json_schema()),
+    }
+    combined = hashlib.sha256("|".join(digests.values()).encode("ascii")).hexdigest()
+    return {"version": combined[:SCHEMA_VERSION_LENGTH], **digests}
+
+
+def _shared_schema(name: str, schema: dict[str, Any], version: str) -> dict[str, Any]:
+    return {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "$id": _SHARED_SCHEMA_IDS[name],
+        "$comment": "자동 생성 파일 - 직접 수정 금지 (python -m unknown_world.schemas)",
+        "x-schema-version": version,
+        **schema,
+    }
+
+
+def build_artifact_files() -> dict[Path, str]:
+    """모든 아티팩트 파일 내용을 빌드합니다.
+
+    Returns:
+        {파일 경로: 파일 내용}
+    """
+    gemini_schema = build_gemini_schema()
+    manifest = build_manifest(gemini_schema)
+    version = manifest["version"]
+
+    return {
+        GEMINI_SCHEMA_PATH: _dump(gemini_schema),
+        MANIFEST_PATH: _dump(manifest),
+        SHARED_SCHEMA_DIR / "turn_input.schema.json": _dump(
+            _shared_schema("turn_input", TurnInput.model_json_schema(), version)
+        ),
+        SHARED_SCHEMA_DIR / "turn_output.schema.json": _dump(
+            _shared_schema("turn_output", TurnOutput.model_json_schema(), version)
+        ),
+    }
+
+
+def _dump(data: dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+
+
+def write_artifacts() -> list[Path]:
+    """아티팩트 파일을 생성/갱신합니다.
+
+    Returns:
+        내용이 바뀐 파일 경로 목록
+    """
+    changed: list[Path] = []
+    for path, content in build_artifact_files().items():
+        if path.exists() and path.read_text(encoding="utf-8") == content:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        changed.append(path)
+    return changed
+
+
+def find_stale_artifacts() -> list[Path]:
+    """모델과 내용이 다른(또는 없는) 아티팩트 파일 목록을 반환합니다."""
+    return [
+        path
+        for path, content in build_artifact_files().items()
+        if not path.exists() or path.read_text(encoding="utf-8") != content
+    ]
+
+
+# =============================================================================
+# 런타임 로드
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class TurnSchemaArtifacts:
+    """시작 시 로드되는 불변 스키마 아티팩트.
+
+    Attributes:
+        version: 스키마 계약 버전 (TurnInput/TurnOutput/Gemini 스키마 해시 기반, 캐시 키용)
+        gemini_schema_json: Gemini 호환 TurnOutput 스키마 JSON 텍스트
+        source: 로드 출처 ("generated" 또는 "models")
+    """
+
+    version: str
+    gemini_schema_json: str
+    source: str
+
+    def gemini_schema(self) -> dict[str, Any]:
+        """요청에 넣을 Gemini 스키마 dict를 반환합니다.
+
+        google-genai SDK는 response_schema dict를 제자리에서 변환하므로,
+        공유 객체 대신 요청마다 새 dict를 디코딩해 넘깁니다.
+        """
+        return json.loads(self.gemini_schema_json)
+
+
+def load_turn_schema_artifacts() -> TurnSchemaArtifacts:
+    """생성된 아티팩트를 읽습니다 (비활성화/파일 없음 시 모델에서 빌드).
+
+    Returns:
+        TurnSchemaArtifacts: 불변 스키마 아티팩트
+    """
+    if is_schema_artifacts_enabled():
+        try:
+            manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+            return TurnSchemaArtifacts(
+                version=manifest["version"],
+                gemini_schema_json=GEMINI_SCHEMA_PATH.read_text(encoding="utf-8"),
+                source="generated",
+            )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(
+                "[SchemaArtifacts] Generated artifacts unavailable, building from models",
+                extra={"error_type": type(e).__name__},
+            )
+
+    gemini_schema = build_gemini_schema()
+    return TurnSchemaArtifacts(
+        version=build_manifest(gemini_schema)["version"],
+        gemini_schema_json=json.dumps(gemini_schema, ensure_ascii=False),
+        source="models",
+    )
+
+
+_artifacts_instance: TurnSchemaArtifacts | None = None
+
+
+def get_turn_schema_artifacts() -> TurnSchemaArtifacts:
+    """TurnSchemaArtifacts 싱글톤 인스턴스를 반환합니다 (최초 호출 시 로드)."""
+    global _artifacts_instance
+
+    if _artifacts_instance is None:
+        _artifacts_instance = load_turn_schema_artifacts()
+        logger.info(
+            "[SchemaArtifacts] Turn schema loaded",
+            extra={
+                "schema_version": _artifacts_instance.version,
+                "source": _artifacts_instance.source,
+            },
+        )
+    return _artifacts_instance
+
+
+def reset_turn_schema_artifacts() -> None:
+    """스키마 아티팩트 싱글톤을 초기화합니다 (테스트용)."""
+    global _artifacts_instance
+    _artifacts_instance = None
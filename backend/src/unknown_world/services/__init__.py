@@ -29,11 +29,22 @@ from unknown_world.services.image_generation import (
     get_image_generator,
     reset_image_generator,
 )
+from unknown_world.services.image_jobs import (
+    ImageJobRegistry,
+    get_image_job_registry,
+    reset_image_job_registry,
+)
 from unknown_world.services.image_understanding import (
     ImageUnderstandingService,
     get_image_understanding_service,
     reset_image_understanding_service,
 )
+from unknown_world.services.image_variants import (
+    ImageVariantSet,
+    create_image_variants,
+    encode_image_variants,
+    schedule_image_variants,
+)
 
 __all__ = [
     # GenAI 클라이언트
@@ -55,6 +66,14 @@ __all__ = [
     "create_fallback_response",
     "get_image_generator",
     "reset_image_generator",
+    # 이미지 생성 작업 취소/대체
+    "ImageJobRegistry",
+    "get_image_job_registry",
+    "reset_image_job_registry",
+    "ImageVariantSet",
+    "create_image_variants",
+    "encode_image_variants",
+    "schedule_image_variants",
     # 이미지 이해/Scanner (U-021)
     "ImageUnderstandingService",
     "get_image_understanding_service",
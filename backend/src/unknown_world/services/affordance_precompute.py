@@ -0,0 +1,288 @@
+"""Unknown World - Scene affordance 백그라운드 선계산.
+
+"정밀분석" 트리거 시 resolve_stage는 AgenticVisionService.analyze_scene을 동기적으로 기다린 뒤에야
+내러티브를 전달할 수 있습니다. 이 모듈은 /api/image/generate가 Scene 이미지를 만든 직후
+낮은 우선순위 백그라운드 작업으로 affordance를 미리 추출해 이미지 ID별로 보관하고,
+이후 정밀분석 요청은 보관된 결과(또는 진행 중인 선계산)로 응답합니다.
+
+구성:
+    - 낮은 우선순위: 동시 실행 선계산 수 제한 (UW_AFFORDANCE_PRECOMPUTE_CONCURRENCY)
+    - 결과 저장소: (image_id, 언어) 키, TTL + 최대 엔트리 수 (LRU)
+    - 진행 중 선계산 재사용: 트리거가 선계산 도중 도착하면 새 호출 대신 완료를 기다림 (타임아웃)
+
+설계 원칙:
+    - Opt-in (UW_AFFORDANCE_PRECOMPUTE, 기본 비활성화): 정밀분석을 하지 않는 턴에도 비전 비용 발생
+    - RULE-004: 선계산 실패/빈 결과는 저장하지 않음 (트리거 시 기존 경로로 분석)
+    - RULE-007: 이미지 내용/프롬프트는 로깅하지 않음
+
+환경변수:
+    - UW_AFFORDANCE_PRECOMPUTE: 선계산 활성화 (기본: "0")
+    - UW_AFFORDANCE_PRECOMPUTE_CONCURRENCY: 동시 실행 선계산 수 (기본: 1)
+    - UW_AFFORDANCE_PRECOMPUTE_WAIT_S: 트리거가 진행 중 선계산을 기다리는 최대 시간 (기본: 15초)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+from unknown_world.models.turn import Language
+from unknown_world.storage.paths import (
+    DEFAULT_IMAGE_EXTENSION,
+    STATIC_IMAGES_URL_PREFIX,
+    build_image_url,
+)
+
+if TYPE_CHECKING:
+    from unknown_world.services.agentic_vision import AgenticVisionService, VisionAnalysisResult
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_PRECOMPUTE_CONCURRENCY = 1
+"""기본 동시 실행 선계산 수 (인터랙티브 비전 호출보다 낮은 우선순위)."""
+
+DEFAULT_PRECOMPUTE_WAIT_SECONDS = 15.0
+"""트리거가 진행 중 선계산을 기다리는 기본 최대 시간 (초)."""
+
+DEFAULT_PRECOMPUTE_TTL_SECONDS = 1800.0
+"""선계산 결과 유효 시간 (초)."""
+
+DEFAULT_PRECOMPUTE_MAX_ENTRIES = 128
+"""선계산 결과 최대 보관 수."""
+
+
+def is_affordance_precompute_enabled() -> bool:
+    """환경변수에서 선계산 활성화 여부를 읽습니다 (opt-in)."""
+    return os.environ.get("UW_AFFORDANCE_PRECOMPUTE", "0").lower() not in ("0", "false", "no")
+
+
+def get_precompute_concurrency() -> int:
+    """환경변수에서 동시 실행 선계산 수를 읽습니다."""
+    return max(
+        1,
+        int(
+            os.environ.get(
+                "UW_AFFORDANCE_PRECOMPUTE_CONCURRENCY", str(DEFAULT_PRECOMPUTE_CONCURRENCY)
+            )
+        ),
+    )
+
+
+def get_precompute_wait_seconds() -> float:
+    """환경변수에서 진행 중 선계산 대기 시간을 읽습니다."""
+    return float(
+        os.environ.get("UW_AFFORDANCE_PRECOMPUTE_WAIT_S", str(DEFAULT_PRECOMPUTE_WAIT_SECONDS))
+    )
+
+
+def image_id_from_url(image_url: str) -> str | None:
+    """생성 Scene 이미지 URL에서 이미지 ID를 추출합니다.
+
+    변형 URL(예: img_abc.medium.webp)도 원본 이미지 ID로 매핑합니다.
+
+    Args:
+        image_url: Scene 이미지 URL (예: /static/images/generated/img_abc.png)
+
+    Returns:
+        이미지 ID 또는 None (생성 이미지 URL이 아닌 경우)
+    """
+    path = image_url.split("?", 1)[0]
+    if not path.startswith(f"{STATIC_IMAGES_URL_PREFIX}/generated/"):
+        return None
+    image_id = PurePosixPath(path).name.split(".", 1)[0]
+    return image_id or None
+
+
+# =============================================================================
+# 선계산기
+# =============================================================================
+
+
+class AffordancePrecomputer:
+    """Scene 이미지 affordance 선계산 + 결과 보관소."""
+
+    def __init__(
+        self,
+        vision_service_factory: Callable[[], AgenticVisionService],
+        *,
+        concurrency: int | None = None,
+        wait_seconds: float | None = None,
+        ttl_seconds: float = DEFAULT_PRECOMPUTE_TTL_SECONDS,
+        max_entries: int = DEFAULT_PRECOMPUTE_MAX_ENTRIES,
+    ) -> None:
+        """AffordancePrecomputer를 초기화합니다.
+
+        Args:
+            vision_service_factory: AgenticVisionService 제공자 (예: get_agentic_vision_service)
+            concurrency: 동시 실행 선계산 수 (기본: 환경변수)
+            wait_seconds: 진행 중 선계산 대기 시간 (기본: 환경변수)
+            ttl_seconds: 결과 유효 시간
+            max_entries: 결과 최대 보관 수
+        """
+        self._vision_service_factory = vision_service_factory
+        self._semaphore = asyncio.Semaphore(concurrency or get_precompute_concurrency())
+        self._wait_seconds = (
+            wait_seconds if wait_seconds is not None else get_precompute_wait_seconds()
+        )
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._results: OrderedDict[tuple[str, Language], tuple[float, VisionAnalysisResult]] = (
+            OrderedDict()
+        )
+        self._tasks: dict[tuple[str, Language], asyncio.Task[None]] = {}
+        self._served = 0
+        self._misses = 0
+
+    def schedule(self, image_id: str, language: Language) -> bool:
+        """이미지의 affordance 선계산을 백그라운드로 시작합니다.
+
+        Returns:
+            bool: 새 작업을 시작했는지 여부 (이미 보관/진행 중이면 False)
+        """
+        key = (image_id, language)
+        if key in self._tasks or self._peek(key) is not None:
+            return False
+
+        task = asyncio.create_task(self._run(key), name="affordance_precompute")
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return True
+
+    async def _run(self, key: tuple[str, Language]) -> None:
+        image_id, language = key
+        async with self._semaphore:
+            image_url = build_image_url(
+                f"{image_id}.{DEFAULT_IMAGE_EXTENSION}", category="generated"
+            )
+            try:
+                result = await self._vision_service_factory().analyze_scene(image_url, language)
+            except Exception as e:
+                logger.warning(
+                    "[AffordancePrecompute] Precompute failed",
+                    extra={"image_id": image_id, "error_type": type(e).__name__},
+                )
+                return
+
+        if not (result.success and result.affordances):
+            logger.info(
+                "[AffordancePrecompute] Empty precompute result discarded",
+                extra={"image_id": image_id, "message": result.message},
+            )
+            return
+
+        self._results[key] = (time.monotonic() + self._ttl, result)
+        self._results.move_to_end(key)
+        while len(self._results) > self._max_entries:
+            self._results.popitem(last=False)
+        logger.info(
+            "[AffordancePrecompute] Affordances precomputed",
+            extra={
+                "image_id": image_id,
+                "affordance_count": len(result.affordances),
+                "analysis_time_ms": result.analysis_time_ms,
+            },
+        )
+
+    def _peek(self, key: tuple[str, Language]) -> VisionAnalysisResult | None:
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._results[key]
+            return None
+        return entry[1]
+
+    async def get(self, image_url: str, language: Language) -> VisionAnalysisResult | None:
+        """선계산 결과를 반환합니다 (진행 중이면 wait_seconds까지 완료를 기다림).
+
+        Args:
+            image_url: Scene 이미지 URL
+            language: 세션 언어
+
+        Returns:
+            선계산된 결과의 복사본 또는 None (트리거 시 기존 경로로 분석)
+        """
+        image_id = image_id_from_url(image_url)
+        if image_id is None:
+            return None
+
+        key = (image_id, language)
+        task = self._tasks.get(key)
+        if task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout=self._wait_seconds)
+            except TimeoutError:
+                logger.info(
+                    "[AffordancePrecompute] Precompute still running, analyzing directly",
+                    extra={"image_id": image_id},
+                )
+
+        result = self._peek(key)
+        if result is None:
+            self._misses += 1
+            return None
+
+        self._served += 1
+        return copy.deepcopy(result)
+
+    async def shutdown(self) -> None:
+        """진행 중인 선계산을 취소합니다."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, int]:
+        """선계산 지표를 반환합니다."""
+        return {
+            "stored": len(self._results),
+            "running": len(self._tasks),
+            "served": self._served,
+            "misses": self._misses,
+        }
+
+
+# =============================================================================
+# 싱글톤 인스턴스
+# =============================================================================
+
+_precomputer_instance: AffordancePrecomputer | None = None
+
+
+def get_affordance_precomputer() -> AffordancePrecomputer | None:
+    """AffordancePrecomputer 인스턴스를 반환합니다 (비활성화 시 None)."""
+    global _precomputer_instance
+
+    if not is_affordance_precompute_enabled():
+        return None
+    if _precomputer_instance is None:
+        from unknown_world.services.agentic_vision import get_agentic_vision_service
+
+        _precomputer_instance = AffordancePrecomputer(get_agentic_vision_service)
+    return _precomputer_instance
+
+
+async def shutdown_affordance_precomputer() -> None:
+    """진행 중인 선계산을 취소하고 인스턴스를 초기화합니다."""
+    global _precomputer_instance
+
+    if _precomputer_instance is not None:
+        await _precomputer_instance.shutdown()
+    _precomputer_instance = None
+
+
+def reset_affordance_precomputer() -> None:
+    """AffordancePrecomputer 캐시를 초기화합니다."""
+    global _precomputer_instance
+    _precomputer_instance = None
@@ -11,6 +11,7 @@ gemini-3-flash-preview + code_execution 도구를 활용하여 이미지 내
     - RULE-007/008: 프롬프트 원문/비밀정보 노출 금지
     - RULE-009: bbox 0~1000 정규화, [ymin, xmin, ymax, xmax]
     - U-076 Q2: 비전 분석 비용 1.5x
+    - 변하지 않은 Scene 이미지 재분석은 perceptual hash 결과 캐시로 응답 (vision_cache)
 
 참조:
     - vibe/unit-plans/U-076[Mvp].md
@@ -31,6 +32,12 @@ from typing import TYPE_CHECKING, Any, cast
 from unknown_world.config.models import ModelLabel, get_model_id
 from unknown_world.models.turn import Box2D, Language, SceneObject
 from unknown_world.services.genai_client import ENV_UW_MODE, GenAIMode
+from unknown_world.services.vision_cache import (
+    compute_perceptual_hash_async,
+    get_scene_analysis_cache,
+)
+from unknown_world.storage.offload import get_offload_executor
+from unknown_world.storage.paths import IMAGES_GENERATED_SUBDIR, get_source_image_filename
 from unknown_world.storage.validation import BBOX_MAX, BBOX_MIN
 
 if TYPE_CHECKING:
@@ -480,8 +487,8 @@ class AgenticVisionService:
             result.analysis_time_ms = int((time.time() - start_time) * 1000)
             return result
 
-        # 이미지 읽기
-        image_bytes = self._load_image(image_url)
+        # 이미지 읽기 (파일 I/O는 오프로드 풀에서 실행)
+        image_bytes = await get_offload_executor().run_io(self._load_image, image_url)
         if image_bytes is None:
             logger.warning(
                 "[AgenticVision] Image loading failed, returning empty result",
@@ -494,10 +501,27 @@ class AgenticVisionService:
                 message="image_load_failed",
             )
 
+        # 결과 캐시 조회 (턴마다 같은 Scene 이미지를 재분석하는 경우)
+        cache = get_scene_analysis_cache()
+        image_hash = await compute_perceptual_hash_async(image_bytes) if cache is not None else None
+        if cache is not None and image_hash is not None:
+            cached = cache.get(image_hash, language.value)
+            if cached is not None:
+                cached.analysis_time_ms = int((time.time() - start_time) * 1000)
+                return cached
+
         # 실제 비전 모델 호출
         try:
             result = await self._call_vision_model(image_bytes, language)
             result.analysis_time_ms = int((time.time() - start_time) * 1000)
+            # 빈 결과는 저장하지 않음 (resolve_stage 리트라이가 다시 호출할 수 있어야 함)
+            if (
+                cache is not None
+                and image_hash is not None
+                and result.success
+                and result.affordances
+            ):
+                cache.put(image_hash, result, language.value)
 
             logger.info(
                 "[AgenticVision] Analysis complete",
@@ -540,6 +564,10 @@ class AgenticVisionService:
                 # /static/ prefix 제거 → .data/ 내부 상대경로
                 # 예: /static/images/generated/img_xxx.png → images/generated/img_xxx.png
                 relative_path = image_url[len("/static/") :]
+                if relative_path.startswith(f"{IMAGES_GENERATED_SUBDIR}/"):
+                    # 변형(webp/avif) URL이어도 원본 PNG를 분석
+                    filename = get_source_image_filename(Path(relative_path).name)
+                    relative_path = f"{IMAGES_GENERATED_SUBDIR}/{filename}"
 
                 # backend 루트 디렉토리
                 base_dir = Path(__file__).resolve().parent.parent.parent.parent
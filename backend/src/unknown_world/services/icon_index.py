@@ -0,0 +1,286 @@
+"""Unknown World - 아이템 아이콘 캐시 인덱스 (manifest).
+
+IconCache 조회가 인벤토리 렌더링마다 발생하므로, 캐시 상태를 시작 시 한 번 읽어 들인
+메모리 인덱스로 관리하고 조회 경로(hot path)에서는 파일 시스템을 건드리지 않습니다.
+
+구성:
+    - manifest.json: cache_key → {url, size, created_at, last_used_at, canonical}
+    - 메모리 인덱스: LRU 순서를 유지하는 OrderedDict (엔트리 수 상한)
+    - 디스크 쿼터: 총 아이콘 바이트 상한 초과 시 LRU 순으로 축출
+    - 저장: 임시 파일 작성 후 os.replace로 원자적 교체
+
+스레드 안전:
+    IconCache.set은 CPU 오프로드 풀에서 실행되므로 인덱스 변경은 락으로 보호하고,
+    manifest 직렬화/쓰기는 락 밖에서 스냅샷으로 수행합니다.
+
+환경변수:
+    - UW_ICON_CACHE_MAX_ENTRIES: 최대 아이콘 수 (기본: 5000)
+    - UW_ICON_CACHE_MAX_BYTES: 아이콘 디스크 쿼터 (기본: 64MB)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+MANIFEST_FILENAME = "manifest.json"
+"""아이콘 캐시 manifest 파일명."""
+
+MANIFEST_VERSION = 1
+"""manifest 스키마 버전."""
+
+DEFAULT_ICON_CACHE_MAX_ENTRIES = 5000
+"""기본 최대 아이콘 수."""
+
+DEFAULT_ICON_CACHE_MAX_BYTES = 64 * 1024 * 1024
+"""기본 아이콘 디스크 쿼터 (64MB)."""
+
+
+def _get_max_entries() -> int:
+    """환경변수에서 최대 아이콘 수를 읽습니다."""
+    return max(
+        1,
+        int(os.environ.get("UW_ICON_CACHE_MAX_ENTRIES", str(DEFAULT_ICON_CACHE_MAX_ENTRIES))),
+    )
+
+
+def _get_max_bytes() -> int:
+    """환경변수에서 아이콘 디스크 쿼터를 읽습니다."""
+    return max(
+        1,
+        int(os.environ.get("UW_ICON_CACHE_MAX_BYTES", str(DEFAULT_ICON_CACHE_MAX_BYTES))),
+    )
+
+
+# =============================================================================
+# 인덱스 엔트리
+# =============================================================================
+
+
+@dataclass
+class IconIndexEntry:
+    """캐시된 아이콘 한 개의 메타데이터.
+
+    Attributes:
+        url: 아이콘 서빙 URL
+        size: 파일 크기 (bytes)
+        created_at: 생성 시각 (epoch seconds)
+        last_used_at: 마지막 조회 시각 (epoch seconds)
+        canonical: 유사도 인덱스용 표준 키 (설명 원문은 저장하지 않음)
+    """
+
+    url: str
+    size: int
+    created_at: float
+    last_used_at: float
+    canonical: str = ""
+
+
+# =============================================================================
+# 아이콘 인덱스
+# =============================================================================
+
+
+class IconIndex:
+    """manifest 기반의 bounded LRU 아이콘 인덱스."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """IconIndex를 초기화합니다 (load() 호출 전까지 비어 있음).
+
+        Args:
+            cache_dir: 아이콘 캐시 디렉토리 (manifest.json 위치)
+            max_entries: 최대 아이콘 수 (기본: 환경변수 UW_ICON_CACHE_MAX_ENTRIES)
+            max_bytes: 디스크 쿼터 (기본: 환경변수 UW_ICON_CACHE_MAX_BYTES)
+        """
+        self._cache_dir = cache_dir
+        self._manifest_path = cache_dir / MANIFEST_FILENAME
+        self._max_entries = max_entries or _get_max_entries()
+        self._max_bytes = max_bytes or _get_max_bytes()
+        self._entries: OrderedDict[str, IconIndexEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """인덱스에 기록된 아이콘 총 바이트."""
+        return self._total_bytes
+
+    # -------------------------------------------------------------------------
+    # 로드 / 저장 (블로킹)
+    # -------------------------------------------------------------------------
+
+    def load(self, *, url_for_key: Callable[[str], str]) -> list[IconIndexEntry]:
+        """manifest를 읽어 인덱스를 채웁니다 (시작 시 1회, 블로킹).
+
+        manifest가 없거나 손상된 경우 디렉토리를 한 번 스캔하여 재구성합니다.
+        쿼터를 초과하는 엔트리는 즉시 축출합니다.
+
+        Args:
+            url_for_key: cache_key → URL 변환 함수 (스캔 재구성용)
+
+        Returns:
+            list[IconIndexEntry]: 로드 후 축출된 엔트리 목록 (파일 삭제 완료)
+        """
+        entries = self._read_manifest()
+        if entries is None:
+            entries = self._scan_directory(url_for_key)
+            logger.info(
+                "[IconIndex] Manifest rebuilt from directory scan",
+                extra={"entries": len(entries)},
+            )
+
+        with self._lock:
+            self._entries = OrderedDict(
+                sorted(entries.items(), key=lambda item: item[1].last_used_at)
+            )
+            self._total_bytes = sum(entry.size for entry in self._entries.values())
+            evicted = self._evict_locked()
+
+        self._delete_files(evicted)
+        self.save()
+        return [entry for _, entry in evicted]
+
+    def _read_manifest(self) -> dict[str, IconIndexEntry] | None:
+        try:
+            raw = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+            if raw.get("version") != MANIFEST_VERSION:
+                return None
+            return {key: IconIndexEntry(**value) for key, value in raw["entries"].items()}
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):
+            logger.warning("[IconIndex] Manifest unreadable, rebuilding")
+            return None
+
+    def _scan_directory(self, url_for_key: Callable[[str], str]) -> dict[str, IconIndexEntry]:
+        entries: dict[str, IconIndexEntry] = {}
+        for path in self._cache_dir.glob("*.png"):
+            stat_result = path.stat()
+            entries[path.stem] = IconIndexEntry(
+                url=url_for_key(path.stem),
+                size=stat_result.st_size,
+                created_at=stat_result.st_mtime,
+                last_used_at=stat_result.st_mtime,
+            )
+        return entries
+
+    def save(self) -> None:
+        """현재 인덱스를 manifest에 원자적으로 저장합니다 (블로킹)."""
+        # 쓰기 락 안에서 스냅샷을 떠야 늦게 뜬 스냅샷이 먼저 쓰이는 역전이 없음
+        with self._write_lock:
+            with self._lock:
+                snapshot = {key: asdict(entry) for key, entry in self._entries.items()}
+            payload = json.dumps(
+                {"version": MANIFEST_VERSION, "entries": snapshot},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            tmp_path = self._manifest_path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self._manifest_path)
+
+    # -------------------------------------------------------------------------
+    # 조회 / 갱신
+    # -------------------------------------------------------------------------
+
+    def items(self) -> list[tuple[str, IconIndexEntry]]:
+        """엔트리 스냅샷을 LRU 순서(오래된 것부터)로 반환합니다."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def get(self, cache_key: str) -> IconIndexEntry | None:
+        """엔트리를 조회하고 LRU 순서를 갱신합니다 (메모리만 사용)."""
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                entry.last_used_at = time.time()
+                self._entries.move_to_end(cache_key)
+            return entry
+
+    def put(
+        self, cache_key: str, *, url: str, size: int, canonical: str = ""
+    ) -> list[IconIndexEntry]:
+        """엔트리를 추가/갱신하고 쿼터를 적용한 뒤 manifest를 저장합니다 (블로킹).
+
+        Args:
+            cache_key: 캐시 키
+            url: 아이콘 URL
+            size: 파일 크기 (bytes)
+            canonical: 유사도 인덱스용 표준 키
+
+        Returns:
+            list[IconIndexEntry]: 축출된 엔트리 목록 (파일 삭제 완료)
+        """
+        now = time.time()
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            self._entries[cache_key] = IconIndexEntry(
+                url=url,
+                size=size,
+                created_at=previous.created_at if previous else now,
+                last_used_at=now,
+                canonical=canonical,
+            )
+            self._total_bytes += size
+            evicted = self._evict_locked(protect=cache_key)
+
+        self._delete_files(evicted)
+        self.save()
+        return [entry for _, entry in evicted]
+
+    def _evict_locked(self, *, protect: str | None = None) -> list[tuple[str, IconIndexEntry]]:
+        """엔트리 수/디스크 쿼터 초과분을 LRU 순으로 인덱스에서 제거합니다 (락 보유 상태)."""
+        evicted: list[tuple[str, IconIndexEntry]] = []
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._total_bytes > self._max_bytes
+        ):
+            cache_key = next(iter(self._entries))
+            if cache_key == protect:
+                break
+            entry = self._entries.pop(cache_key)
+            self._total_bytes -= entry.size
+            evicted.append((cache_key, entry))
+        return evicted
+
+    def _delete_files(self, evicted: list[tuple[str, IconIndexEntry]]) -> None:
+        for cache_key, _ in evicted:
+            (self._cache_dir / f"{cache_key}.png").unlink(missing_ok=True)
+        if evicted:
+            logger.info(
+                "[IconIndex] Icons evicted",
+                extra={"count": len(evicted), "total_bytes": self._total_bytes},
+            )
+
+    def get_stats(self) -> dict[str, int]:
+        """인덱스 지표를 반환합니다."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "total_bytes": self._total_bytes,
+            "max_bytes": self._max_bytes,
+        }
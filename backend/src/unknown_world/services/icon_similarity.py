@@ -0,0 +1,317 @@
+"""Unknown World - 아이템 아이콘 유사도 인덱스.
+
+IconCache의 정확 키(MD5)는 "rusty iron key"와 "a rusty iron key"를 다른 아이템으로 취급해
+같은 아이콘을 두 번 생성합니다. 이 모듈은 설명을 정규화한 표준 키(canonical key)와
+문자 trigram 유사도 인덱스로 거의 같은 설명을 기존 아이콘에 매핑합니다.
+
+매칭 순서:
+    1. 표준 키 일치 (대소문자/구두점/관사/조사/복수형/어순 무시)
+    2. 짧은 이름형 설명이 번들 아이콘 아키타입 별칭을 포함 (예: "녹슨 열쇠" → key-64.png)
+    3. 표준 키 문자 trigram Dice 유사도 ≥ 임계값
+
+설계 원칙:
+    - 외부 모델/임베딩 없이 로컬에서 결정적으로 동작 (언어 무관: ko/en 공통 규칙)
+    - RULE-007: 설명 원문은 로깅하지 않음
+
+환경변수:
+    - UW_ICON_SIMILARITY_THRESHOLD: trigram 유사도 임계값 (기본: 0.82, 1 이상이면 비활성화)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.82
+"""기본 trigram Dice 유사도 임계값."""
+
+DEFAULT_MAX_INDEX_ENTRIES = 10_000
+"""인덱스 최대 엔트리 수 (초과 시 가장 오래 사용되지 않은 엔트리 제거)."""
+
+SEED_MATCH_MAX_TOKENS = 3
+"""아키타입 별칭 포함 매칭을 허용하는 최대 토큰 수 (이름형 설명만 대상)."""
+
+SEED_ICON_URL_PREFIX = "/ui/items"
+"""번들 아이콘 URL 경로 (frontend/public/ui/items)."""
+
+SEED_ICON_ARCHETYPES: dict[str, tuple[str, ...]] = {
+    # 초기 아이템 (scripts/process_item_icons.py ICON_MAP과 동일한 슬러그)
+    "ancient-tome": ("ancient tome", "tome", "book", "고서", "책", "서적"),
+    "quill-pen": ("quill pen", "quill", "깃펜", "펜"),
+    "memory-fragment": ("memory fragment", "기억 파편", "기억 조각"),
+    "compass": ("compass", "나침반"),
+    "rope": ("rope", "밧줄", "로프"),
+    "lantern": ("lantern", "lamp", "랜턴", "등불"),
+    "map-fragment": ("map fragment", "map", "지도 조각", "지도"),
+    "data-core": ("data core", "데이터 코어"),
+    "circuit-board": ("circuit board", "회로 기판", "회로"),
+    "energy-cell": ("energy cell", "battery", "에너지 셀", "배터리"),
+    "scanner-device": ("scanner device", "scanner", "스캐너"),
+    # 공통 아이템
+    "sword": ("sword", "blade", "장검", "칼"),
+    "shield": ("shield", "방패"),
+    "potion": ("potion", "물약", "포션"),
+    "key": ("key", "열쇠"),
+    "gem": ("gem", "gemstone", "jewel", "보석"),
+    "scroll": ("scroll", "두루마리", "스크롤"),
+    "torch": ("torch", "횃불"),
+    "herb": ("herb", "약초"),
+    "coin": ("coin", "동전", "금화", "코인"),
+    "ring": ("ring", "반지"),
+    "amulet": ("amulet", "pendant", "necklace", "부적", "목걸이", "펜던트"),
+    "dagger": ("dagger", "knife", "단검"),
+    "flask": ("flask", "vial", "플라스크", "약병"),
+    "crystal": ("crystal", "수정", "크리스탈"),
+    "lockpick": ("lockpick", "lock pick", "락픽"),
+}
+"""번들 아이콘 슬러그 → 별칭 (en/ko). 에셋 SSOT: frontend/src/data/itemIconPresets.ts."""
+
+_STOPWORDS = frozenset(
+    {
+        # en: 관사/전치사/수량사
+        "a",
+        "an",
+        "the",
+        "of",
+        "with",
+        "and",
+        "some",
+        "this",
+        "that",
+        "for",
+        "to",
+        "in",
+        "on",
+        "piece",
+        # ko: 관형사/단위
+        "한",
+        "그",
+        "이",
+        "저",
+        "개",
+        "어떤",
+    }
+)
+
+_KO_PARTICLES = ("으로", "에서", "은", "는", "을", "를", "의", "와", "과", "이", "가", "로", "에")
+"""한국어 명사 뒤 조사 (3자 이상 토큰에서만 제거)."""
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def get_similarity_threshold() -> float:
+    """환경변수에서 trigram 유사도 임계값을 읽습니다."""
+    return float(os.environ.get("UW_ICON_SIMILARITY_THRESHOLD", str(DEFAULT_SIMILARITY_THRESHOLD)))
+
+
+def build_seed_icon_url(slug: str) -> str:
+    """번들 아이콘 URL을 생성합니다 (예: /ui/items/key-64.png)."""
+    return f"{SEED_ICON_URL_PREFIX}/{slug}-64.png"
+
+
+# =============================================================================
+# 정규화
+# =============================================================================
+
+
+def _normalize_token(token: str) -> str:
+    """토큰 단위 정규화 (한국어 조사 제거, 영어 복수형 단순 제거)."""
+    if token.isascii():
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            return token[:-1]
+        return token
+    if len(token) >= 3:
+        for particle in _KO_PARTICLES:
+            if token.endswith(particle) and len(token) - len(particle) >= 2:
+                return token[: -len(particle)]
+    return token
+
+
+def tokenize_item_description(description: str) -> list[str]:
+    """아이템 설명을 정규화된 토큰 목록으로 변환합니다 (불용어 제거, 순서 유지)."""
+    text = unicodedata.normalize("NFKC", description).casefold()
+    tokens = (_normalize_token(token) for token in _TOKEN_PATTERN.findall(text))
+    return [token for token in tokens if token and token not in _STOPWORDS]
+
+
+def canonicalize_item_description(description: str) -> str:
+    """언어 무관 표준 키를 생성합니다 (정규화 토큰의 정렬된 집합).
+
+    Example:
+        >>> canonicalize_item_description("A Rusty, Iron KEY!")
+        'iron key rusty'
+    """
+    return " ".join(sorted(set(tokenize_item_description(description))))
+
+
+def _trigrams(canonical: str) -> frozenset[str]:
+    """표준 키의 문자 trigram 집합 (경계 패딩 포함)."""
+    padded = f"  {canonical} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+# =============================================================================
+# 유사도 인덱스
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class IconMatch:
+    """유사도 조회 결과.
+
+    Attributes:
+        icon_url: 재사용할 아이콘 URL
+        score: 유사도 (1.0 = 표준 키 일치)
+        kind: 매칭 종류 (canonical/seed/fuzzy)
+    """
+
+    icon_url: str
+    score: float
+    kind: str
+
+
+class IconSimilarityIndex:
+    """표준 키 + 문자 trigram 역색인 기반 아이콘 유사도 인덱스."""
+
+    def __init__(
+        self,
+        *,
+        threshold: float | None = None,
+        max_entries: int = DEFAULT_MAX_INDEX_ENTRIES,
+        include_seeds: bool = True,
+    ) -> None:
+        """IconSimilarityIndex를 초기화합니다.
+
+        Args:
+            threshold: trigram 유사도 임계값 (기본: 환경변수)
+            max_entries: 최대 엔트리 수 (시드 제외)
+            include_seeds: 번들 아이콘 아키타입을 시드로 색인할지 여부
+        """
+        self._threshold = threshold if threshold is not None else get_similarity_threshold()
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()  # canonical → icon_url
+        self._trigrams: dict[str, frozenset[str]] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._seed_aliases: list[tuple[frozenset[str], str]] = []
+        # IconCache.set은 CPU 오프로드 풀에서 실행되므로 변경/조회를 직렬화
+        self._lock = threading.Lock()
+
+        if include_seeds:
+            for slug, aliases in SEED_ICON_ARCHETYPES.items():
+                url = build_seed_icon_url(slug)
+                for alias in aliases:
+                    tokens = frozenset(tokenize_item_description(alias))
+                    if tokens:
+                        self._seed_aliases.append((tokens, url))
+            # 다중 토큰 별칭("map fragment")이 단일 토큰("map")보다 우선
+            self._seed_aliases.sort(key=lambda entry: -len(entry[0]))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, description: str, icon_url: str) -> None:
+        """아이콘을 인덱스에 추가합니다."""
+        self.add_canonical(canonicalize_item_description(description), icon_url)
+
+    def add_canonical(self, canonical: str, icon_url: str) -> None:
+        """이미 정규화된 표준 키로 아이콘을 추가합니다 (manifest 복원용)."""
+        if not canonical:
+            return
+        with self._lock:
+            if canonical in self._entries:
+                self._entries[canonical] = icon_url
+                self._entries.move_to_end(canonical)
+                return
+
+            self._entries[canonical] = icon_url
+            grams = _trigrams(canonical)
+            self._trigrams[canonical] = grams
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(canonical)
+
+            while len(self._entries) > self._max_entries:
+                oldest = next(iter(self._entries))
+                self._remove_canonical(oldest)
+
+    def remove_url(self, icon_url: str) -> None:
+        """해당 URL을 가리키는 엔트리를 제거합니다 (캐시 축출 연동용)."""
+        with self._lock:
+            for canonical in [c for c, url in self._entries.items() if url == icon_url]:
+                self._remove_canonical(canonical)
+
+    def remove_canonical(self, canonical: str, *, icon_url: str | None = None) -> None:
+        """표준 키 엔트리를 제거합니다.
+
+        Args:
+            canonical: 표준 키
+            icon_url: 지정 시 엔트리가 이 URL을 가리킬 때만 제거 (다른 아이콘으로 갱신된 경우 유지)
+        """
+        with self._lock:
+            if icon_url is not None and self._entries.get(canonical) != icon_url:
+                return
+            self._remove_canonical(canonical)
+
+    def _remove_canonical(self, canonical: str) -> None:
+        self._entries.pop(canonical, None)
+        for gram in self._trigrams.pop(canonical, frozenset()):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(canonical)
+                if not posting:
+                    del self._postings[gram]
+
+    def lookup(self, description: str) -> IconMatch | None:
+        """설명과 충분히 유사한 기존 아이콘을 찾습니다.
+
+        Args:
+            description: 아이템 설명
+
+        Returns:
+            IconMatch 또는 None (임계값 미만)
+        """
+        tokens = tokenize_item_description(description)
+        canonical = " ".join(sorted(set(tokens)))
+        if not canonical:
+            return None
+
+        with self._lock:
+            return self._lookup_locked(canonical, set(tokens))
+
+    def _lookup_locked(self, canonical: str, token_set: set[str]) -> IconMatch | None:
+        exact = self._entries.get(canonical)
+        if exact is not None:
+            self._entries.move_to_end(canonical)
+            return IconMatch(icon_url=exact, score=1.0, kind="canonical")
+
+        if len(token_set) <= SEED_MATCH_MAX_TOKENS:
+            for alias_tokens, url in self._seed_aliases:
+                if alias_tokens <= token_set:
+                    return IconMatch(icon_url=url, score=1.0, kind="seed")
+
+        if self._threshold >= 1.0:
+            return None
+
+        grams = _trigrams(canonical)
+        overlap: dict[str, int] = {}
+        for gram in grams:
+            for candidate in self._postings.get(gram, ()):
+                overlap[candidate] = overlap.get(candidate, 0) + 1
+
+        best: tuple[float, str] | None = None
+        for candidate, shared in overlap.items():
+            score = 2 * shared / (len(grams) + len(self._trigrams[candidate]))
+            if score >= self._threshold and (best is None or score > best[0]):
+                best = (score, candidate)
+
+        if best is None:
+            return None
+        self._entries.move_to_end(best[1])
+        return IconMatch(icon_url=self._entries[best[1]], score=round(best[0], 3), kind="fuzzy")
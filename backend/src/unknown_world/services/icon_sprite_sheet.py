@@ -0,0 +1,131 @@
+"""Unknown World - 아이템 아이콘 스프라이트 시트 배치 생성.
+
+아이템이 많은 턴(스캐너 결과 3개 등)에서 아이콘마다 이미지 모델을 한 번씩 호출하지 않고,
+짧은 윈도우 동안 들어온 백그라운드 아이콘 요청을 모아 N칸 그리드 시트 1장으로 생성한 뒤
+Pillow로 ICON_SIZE 타일로 잘라 IconCache에 채웁니다.
+요청 수집/배치 실행은 IconWorkQueue(icon_work_queue)가 담당합니다.
+
+설계 원칙:
+    - RULE-004: 시트 생성/슬라이스 실패 시 개별 생성으로 폴백
+    - RULE-007: 아이템 설명 원문은 로깅하지 않음
+    - 슬라이스/인코딩은 CPU 오프로드 풀에서 실행
+
+환경변수:
+    - UW_ICON_BATCH_MAX_SIZE: 시트 1장당 최대 아이콘 수 (기본: 4, 1 이하면 배치 비활성화)
+    - UW_ICON_BATCH_WINDOW_MS: 요청 수집 윈도우 (기본: 250ms)
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import math
+import os
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from unknown_world.services.item_icon_generator import (
+        IconGenerationRequest,
+        IconGenerationResponse,
+    )
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_ICON_BATCH_MAX_SIZE = 4
+"""시트 1장당 기본 최대 아이콘 수 (2x2 그리드)."""
+
+MAX_ICON_BATCH_SIZE = 9
+"""시트 1장당 최대 아이콘 수 상한 (3x3 그리드, 타일 해상도 보장)."""
+
+DEFAULT_ICON_BATCH_WINDOW_MS = 250
+"""기본 요청 수집 윈도우 (ms)."""
+
+ICON_SHEET_CELL_INSET_RATIO = 0.04
+"""타일 경계 번짐 방지를 위해 셀 가장자리에서 잘라낼 비율."""
+
+
+def get_icon_batch_max_size() -> int:
+    """환경변수에서 시트 1장당 최대 아이콘 수를 읽습니다."""
+    value = int(os.environ.get("UW_ICON_BATCH_MAX_SIZE", str(DEFAULT_ICON_BATCH_MAX_SIZE)))
+    return max(1, min(MAX_ICON_BATCH_SIZE, value))
+
+
+def get_icon_batch_window_seconds() -> float:
+    """환경변수에서 요청 수집 윈도우(초)를 읽습니다."""
+    value = int(os.environ.get("UW_ICON_BATCH_WINDOW_MS", str(DEFAULT_ICON_BATCH_WINDOW_MS)))
+    return max(0, value) / 1000
+
+
+# =============================================================================
+# 그리드 레이아웃 / 슬라이스
+# =============================================================================
+
+
+def get_sheet_grid(count: int) -> tuple[int, int]:
+    """아이콘 수에 맞는 (열, 행) 그리드를 계산합니다.
+
+    셀이 정사각형이 되도록 항상 N x N 그리드를 사용합니다 (시트는 1:1 비율).
+    """
+    side = math.ceil(math.sqrt(count))
+    return side, side
+
+
+def slice_icon_sheet(image_data: bytes, count: int, tile_size: int) -> list[bytes]:
+    """스프라이트 시트를 읽기 순서로 잘라 tile_size PNG 타일 목록을 반환합니다.
+
+    블로킹 함수이므로 OffloadExecutor.run_cpu()를 통해 호출합니다.
+
+    Args:
+        image_data: 시트 이미지 바이트
+        count: 잘라낼 아이콘 수 (빈 셀은 무시)
+        tile_size: 타일 크기 (px)
+
+    Returns:
+        list[bytes]: PNG 타일 바이트 목록 (길이 == count)
+
+    Raises:
+        ValueError: 시트가 그리드로 나누기에 너무 작은 경우
+    """
+    from PIL import Image
+
+    columns, rows = get_sheet_grid(count)
+    tiles: list[bytes] = []
+
+    with Image.open(io.BytesIO(image_data)) as sheet:
+        sheet.load()
+        width, height = sheet.size
+        cell_w, cell_h = width // columns, height // rows
+        if cell_w < tile_size or cell_h < tile_size:
+            raise ValueError(f"sheet too small for {columns}x{rows} grid: {width}x{height}")
+
+        inset_x = int(cell_w * ICON_SHEET_CELL_INSET_RATIO)
+        inset_y = int(cell_h * ICON_SHEET_CELL_INSET_RATIO)
+
+        for index in range(count):
+            col, row = index % columns, index // columns
+            left, top = col * cell_w + inset_x, row * cell_h + inset_y
+            box = (left, top, left + cell_w - 2 * inset_x, top + cell_h - 2 * inset_y)
+            tile = sheet.crop(box).resize(  # type: ignore[reportUnknownMemberType]
+                (tile_size, tile_size), Image.Resampling.LANCZOS
+            )
+
+            output = io.BytesIO()
+            tile.save(output, format="PNG")
+            tiles.append(output.getvalue())
+
+    return tiles
+
+
+# =============================================================================
+# 배치 핸들러
+# =============================================================================
+
+type IconBatchHandler = Callable[
+    [list[IconGenerationRequest]], Awaitable[list[IconGenerationResponse]]
+]
+"""배치 요청 목록을 받아 같은 순서의 응답 목록을 반환하는 핸들러."""
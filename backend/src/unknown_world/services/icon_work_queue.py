@@ -0,0 +1,328 @@
+"""Unknown World - 백그라운드 아이콘 생성 작업 큐.
+
+스캐너 결과 등으로 아이콘 요청이 몰릴 때 아이템마다 태스크를 무제한 생성하면
+씬 이미지 생성과 이미지 모델을 두고 경쟁해 인터랙티브 지연이 커집니다.
+이 모듈은 백그라운드 아이콘 요청을 bounded 워커 슬롯으로 실행하는 우선순위 큐를 제공합니다.
+
+구성:
+    - 우선순위: visible(현재 인벤토리에 보이는 아이템) > normal > prefetch(예측 선생성)
+    - 공정성: 같은 우선순위 안에서는 세션 단위 라운드로빈
+    - 동시성 상한: 동시에 실행되는 배치 수 제한 (UW_ICON_MAX_CONCURRENCY)
+    - 큐 길이 상한/셰딩: 가득 차면 가장 낮은 우선순위의 최신 작업을 버리거나 새 요청을 거부
+    - 배치: 슬롯 1개는 최대 batch_size개 요청을 스프라이트 시트 1장으로 처리
+      (수집 윈도우는 UW_ICON_BATCH_WINDOW_MS)
+
+설계 원칙:
+    - RULE-004: 셰딩된 요청은 실패로 기록하지 않음 (다음 요청에서 재시도 가능)
+    - RULE-007: 아이템 설명 원문은 로깅하지 않음
+
+환경변수:
+    - UW_ICON_MAX_CONCURRENCY: 동시 실행 배치 수 (기본: 2)
+    - UW_ICON_QUEUE_MAX: 대기 큐 최대 길이 (기본: 64)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from unknown_world.services.icon_sprite_sheet import (
+    IconBatchHandler,
+    get_icon_batch_max_size,
+    get_icon_batch_window_seconds,
+)
+
+if TYPE_CHECKING:
+    from unknown_world.services.item_icon_generator import (
+        IconGenerationRequest,
+        IconGenerationResponse,
+    )
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_ICON_MAX_CONCURRENCY = 2
+"""기본 동시 실행 배치 수."""
+
+DEFAULT_ICON_QUEUE_MAX = 64
+"""기본 대기 큐 최대 길이."""
+
+DEFAULT_SESSION_KEY = "default"
+"""session_id가 없는 요청의 공정성 버킷."""
+
+
+class IconPriority(StrEnum):
+    """백그라운드 아이콘 생성 우선순위."""
+
+    VISIBLE = "visible"
+    """현재 인벤토리에 보이는 아이템"""
+
+    NORMAL = "normal"
+    """일반 요청"""
+
+    PREFETCH = "prefetch"
+    """예측 선생성 (가장 먼저 셰딩됨)"""
+
+
+_PRIORITY_ORDER: tuple[IconPriority, ...] = (
+    IconPriority.VISIBLE,
+    IconPriority.NORMAL,
+    IconPriority.PREFETCH,
+)
+"""높은 우선순위부터의 순서."""
+
+
+def get_icon_max_concurrency() -> int:
+    """환경변수에서 동시 실행 배치 수를 읽습니다."""
+    return max(1, int(os.environ.get("UW_ICON_MAX_CONCURRENCY", str(DEFAULT_ICON_MAX_CONCURRENCY))))
+
+
+def get_icon_queue_max() -> int:
+    """환경변수에서 대기 큐 최대 길이를 읽습니다."""
+    return max(1, int(os.environ.get("UW_ICON_QUEUE_MAX", str(DEFAULT_ICON_QUEUE_MAX))))
+
+
+class IconQueueFullError(Exception):
+    """대기 큐가 가득 차 요청이 셰딩되었음을 나타내는 예외."""
+
+
+# =============================================================================
+# 작업 큐
+# =============================================================================
+
+
+@dataclass
+class _IconJob:
+    request: IconGenerationRequest
+    priority: IconPriority
+    session: str
+    future: asyncio.Future[IconGenerationResponse] = field(repr=False)
+
+
+class IconWorkQueue:
+    """우선순위/세션 공정성/셰딩을 지원하는 bounded 아이콘 작업 큐.
+
+    요청은 (우선순위 → 세션 라운드로빈 → 도착 순)으로 꺼내며, 실행 중인 배치가
+    max_concurrency 미만일 때만 새 배치를 시작합니다. 첫 요청 도착 후 window_seconds가
+    지나거나 batch_size만큼 쌓이면 배치를 시작합니다.
+    """
+
+    def __init__(
+        self,
+        handler: IconBatchHandler,
+        *,
+        max_concurrency: int | None = None,
+        max_queue: int | None = None,
+        batch_size: int | None = None,
+        window_seconds: float | None = None,
+    ) -> None:
+        """IconWorkQueue를 초기화합니다.
+
+        Args:
+            handler: 배치 핸들러 (예: ItemIconGenerator._generate_icon_batch)
+            max_concurrency: 동시 실행 배치 수 (기본: 환경변수 UW_ICON_MAX_CONCURRENCY)
+            max_queue: 대기 큐 최대 길이 (기본: 환경변수 UW_ICON_QUEUE_MAX)
+            batch_size: 배치 최대 크기 (기본: 환경변수 UW_ICON_BATCH_MAX_SIZE)
+            window_seconds: 수집 윈도우 (기본: 환경변수 UW_ICON_BATCH_WINDOW_MS)
+        """
+        self._handler = handler
+        self._max_concurrency = max_concurrency or get_icon_max_concurrency()
+        self._max_queue = max_queue or get_icon_queue_max()
+        self._batch_size = batch_size or get_icon_batch_max_size()
+        self._window_seconds = (
+            window_seconds if window_seconds is not None else get_icon_batch_window_seconds()
+        )
+        # 우선순위 → (세션 → 작업 deque), 세션 순서가 라운드로빈 순서
+        self._levels: dict[IconPriority, OrderedDict[str, deque[_IconJob]]] = {
+            priority: OrderedDict() for priority in _PRIORITY_ORDER
+        }
+        self._jobs: dict[str, _IconJob] = {}  # item_id → 대기 중 작업
+        self._timer: asyncio.TimerHandle | None = None
+        self._running: set[asyncio.Task[None]] = set()
+        self._batches_total = 0
+        self._items_total = 0
+        self._shed_total = 0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    # -------------------------------------------------------------------------
+    # 제출 / 우선순위 조정
+    # -------------------------------------------------------------------------
+
+    async def submit(
+        self,
+        request: IconGenerationRequest,
+        *,
+        priority: IconPriority = IconPriority.NORMAL,
+        session_id: str | None = None,
+    ) -> IconGenerationResponse:
+        """요청을 큐에 넣고 결과를 기다립니다.
+
+        Raises:
+            IconQueueFullError: 큐가 가득 차 이 요청이 셰딩된 경우
+        """
+        if len(self._jobs) >= self._max_queue and not self._shed_below(priority):
+            self._shed_total += 1
+            logger.info(
+                "[IconWorkQueue] Request shed (queue full)",
+                extra={"item_id": request.item_id, "priority": priority.value},
+            )
+            raise IconQueueFullError("icon queue full")
+
+        future: asyncio.Future[IconGenerationResponse] = asyncio.get_running_loop().create_future()
+        job = _IconJob(
+            request=request,
+            priority=priority,
+            session=session_id or DEFAULT_SESSION_KEY,
+            future=future,
+        )
+        self._jobs[request.item_id] = job
+        self._levels[priority].setdefault(job.session, deque()).append(job)
+
+        self._schedule()
+        return await future
+
+    def promote(self, item_id: str, priority: IconPriority) -> bool:
+        """대기 중인 작업의 우선순위를 올립니다 (예: prefetch 아이템이 화면에 나타남).
+
+        Returns:
+            bool: 우선순위가 변경되었는지 여부
+        """
+        job = self._jobs.get(item_id)
+        if job is None or _PRIORITY_ORDER.index(priority) >= _PRIORITY_ORDER.index(job.priority):
+            return False
+
+        self._unlink(job)
+        job.priority = priority
+        self._levels[priority].setdefault(job.session, deque()).append(job)
+        return True
+
+    def _unlink(self, job: _IconJob) -> None:
+        sessions = self._levels[job.priority]
+        queue = sessions[job.session]
+        queue.remove(job)
+        if not queue:
+            del sessions[job.session]
+
+    def _shed_below(self, priority: IconPriority) -> bool:
+        """priority보다 낮은 우선순위의 최신 작업 하나를 셰딩합니다.
+
+        가장 낮은 우선순위 레벨에서 대기 작업이 가장 많은 세션의 최신 작업을 버립니다.
+        """
+        rank = _PRIORITY_ORDER.index(priority)
+        for level in reversed(_PRIORITY_ORDER[rank + 1 :]):
+            sessions = self._levels[level]
+            if not sessions:
+                continue
+            session = max(sessions, key=lambda key: len(sessions[key]))
+            victim = sessions[session][-1]
+            self._unlink(victim)
+            del self._jobs[victim.request.item_id]
+            self._shed_total += 1
+            if not victim.future.done():
+                victim.future.set_exception(IconQueueFullError("shed by higher priority"))
+            logger.info(
+                "[IconWorkQueue] Queued request shed",
+                extra={"item_id": victim.request.item_id, "priority": level.value},
+            )
+            return True
+        return False
+
+    # -------------------------------------------------------------------------
+    # 디스패치
+    # -------------------------------------------------------------------------
+
+    def _schedule(self) -> None:
+        """배치가 찼으면 즉시, 아니면 수집 윈도우 후 디스패치합니다."""
+        if len(self._jobs) >= self._batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._window_seconds, self._dispatch
+            )
+
+    def _take(self) -> _IconJob | None:
+        """(우선순위 → 세션 라운드로빈) 순서로 다음 작업을 꺼냅니다."""
+        for priority in _PRIORITY_ORDER:
+            sessions = self._levels[priority]
+            if not sessions:
+                continue
+            session, queue = next(iter(sessions.items()))
+            job = queue.popleft()
+            del sessions[session]
+            if queue:
+                sessions[session] = queue  # 다음 차례는 다른 세션
+            del self._jobs[job.request.item_id]
+            return job
+        return None
+
+    def _dispatch(self) -> None:
+        """빈 워커 슬롯마다 배치를 꺼내 실행합니다."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._jobs and len(self._running) < self._max_concurrency:
+            batch: list[_IconJob] = []
+            while len(batch) < self._batch_size and (job := self._take()) is not None:
+                if not job.future.done():
+                    batch.append(job)
+            if not batch:
+                continue
+
+            self._batches_total += 1
+            self._items_total += len(batch)
+            task = asyncio.create_task(self._run_batch(batch), name="icon_work_batch")
+            self._running.add(task)
+            task.add_done_callback(self._on_batch_done)
+
+    def _on_batch_done(self, task: asyncio.Task[None]) -> None:
+        self._running.discard(task)
+        if self._jobs:
+            # 슬롯이 비었으므로 윈도우 대기 없이 다음 배치 시작
+            self._dispatch()
+
+    async def _run_batch(self, batch: list[_IconJob]) -> None:
+        """핸들러를 실행하고 각 작업의 future에 결과를 전달합니다."""
+        try:
+            responses = await self._handler([job.request for job in batch])
+        except Exception as exc:
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_exception(exc)
+            return
+
+        for job, response in zip(batch, responses, strict=True):
+            if not job.future.done():
+                job.future.set_result(response)
+
+    def get_stats(self) -> dict[str, float | int]:
+        """큐 지표를 반환합니다."""
+        stats: dict[str, float | int] = {
+            "max_concurrency": self._max_concurrency,
+            "max_queue": self._max_queue,
+            "batch_size": self._batch_size,
+            "window_ms": int(self._window_seconds * 1000),
+            "running": len(self._running),
+            "queued": len(self._jobs),
+            "batches_total": self._batches_total,
+            "items_total": self._items_total,
+            "shed_total": self._shed_total,
+            "avg_batch_size": (
+                round(self._items_total / self._batches_total, 2) if self._batches_total else 0.0
+            ),
+        }
+        for priority in _PRIORITY_ORDER:
+            stats[f"queued_{priority.value}"] = sum(
+                len(queue) for queue in self._levels[priority].values()
+            )
+        return stats
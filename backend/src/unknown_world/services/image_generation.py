@@ -45,10 +45,12 @@ from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel, ConfigDict, Field
 
 from unknown_world.config.models import MODEL_IMAGE, ModelLabel, get_model_id
+from unknown_world.storage.offload import get_offload_executor, read_bytes_if_exists
 from unknown_world.storage.paths import (
     LEGACY_OUTPUT_DIR,
     build_image_url,
     get_generated_images_dir,
+    get_source_image_filename,
 )
 from unknown_world.storage.validation import (
     DEFAULT_ASPECT_RATIO,
@@ -107,6 +109,9 @@ class ImageGenerationStatus(StrEnum):
     SKIPPED = "skipped"
     """생성 건너뜀 (잔액 부족 등)"""
 
+    CANCELLED = "cancelled"
+    """생성 취소됨 (같은 세션의 더 새로운 요청으로 대체)"""
+
 
 # =============================================================================
 # 요청/응답 Pydantic 모델
@@ -270,7 +275,7 @@ class MockImageGenerator:
         # 파일 저장
         file_name = f"{image_id}.png"
         file_path = self._output_dir / file_name
-        file_path.write_bytes(placeholder_png)
+        await get_offload_executor().run_io(file_path.write_bytes, placeholder_png)
 
         # U-091: rembg 런타임 제거 - 배경 제거 후처리 없이 바로 저장
 
@@ -412,8 +417,8 @@ class ImageGenerator:
                 # URL에서 이미지 ID 추출
                 image_id = url.split("/")[-1]
                 file_path = self._output_dir / f"{image_id}.png"
-                if file_path.exists():
-                    image_bytes = file_path.read_bytes()
+                image_bytes = await get_offload_executor().run_io(read_bytes_if_exists, file_path)
+                if image_bytes is not None:
                     self._reference_image_cache[url] = image_bytes
                     logger.debug(
                         "[ImageGen] Local reference image loaded",
@@ -429,11 +434,12 @@ class ImageGenerator:
 
             # 정적 서빙 URL 경로 처리 (/static/images/generated/img_xxx.png)
             if url.startswith("/static/images/"):
-                filename = url.split("/")[-1]
+                # 변형(webp/avif) URL이어도 원본 PNG를 참조로 사용
+                filename = get_source_image_filename(url.split("/")[-1])
                 # generated/ 하위 파일 → _output_dir에서 탐색
                 file_path = self._output_dir / filename
-                if file_path.exists():
-                    image_bytes = file_path.read_bytes()
+                image_bytes = await get_offload_executor().run_io(read_bytes_if_exists, file_path)
+                if image_bytes is not None:
                     self._reference_image_cache[url] = image_bytes
                     logger.debug(
                         "[ImageGen] Static URL reference image loaded",
@@ -625,7 +631,7 @@ class ImageGenerator:
 
             file_name = f"{image_id}.png"
             file_path = self._output_dir / file_name
-            file_path.write_bytes(image_bytes)
+            await get_offload_executor().run_io(file_path.write_bytes, image_bytes)
 
             # U-091: rembg 런타임 제거 - 배경 제거 후처리 없이 바로 저장
 
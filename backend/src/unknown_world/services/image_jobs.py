@@ -0,0 +1,271 @@
+"""Unknown World - 이미지 생성 작업 레지스트리.
+
+/api/image/generate 호출을 세션/턴 단위 작업(job)으로 추적합니다.
+같은 세션에서 더 새로운 턴의 이미지 생성이 시작되면 이전 작업을 취소하여
+아무도 보지 않을 이미지를 위해 Gemini 호출과 동시 실행 슬롯을 낭비하지 않습니다.
+
+설계 원칙:
+    - RULE-004: 취소된 작업도 안전한 응답(status=cancelled)으로 종료
+    - RULE-007: 프롬프트 원문 노출 금지 (세션/턴 메타만 로깅)
+    - RULE-008: 텍스트 우선 + Lazy 이미지 원칙 (이미지는 최신 턴만 의미 있음)
+
+동작 규칙:
+    - session_id가 없는 작업은 추적만 하고 supersede 대상에서 제외
+    - 새 작업의 turn_id가 기존 작업보다 같거나 크면 기존 작업을 취소
+    - 새 작업의 turn_id가 기존 작업보다 작으면(늦게 도착한 과거 요청) 새 작업을 즉시 취소
+    - 동시 실행 수는 세마포어로 제한하며, 취소 시 슬롯이 즉시 반환됨
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from unknown_world.services.image_generation import (
+    ImageGenerationResponse,
+    ImageGenerationStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_MAX_CONCURRENT_IMAGE_JOBS = 4
+"""기본 이미지 생성 동시 실행 수."""
+
+CANCELLED_MESSAGE = "더 새로운 이미지 요청으로 대체되어 취소되었습니다."
+"""취소된 작업의 응답 메시지."""
+
+
+def _get_max_concurrent_jobs() -> int:
+    """환경변수에서 이미지 생성 동시 실행 수를 읽습니다."""
+    return max(
+        1,
+        int(os.environ.get("UW_IMAGE_MAX_CONCURRENT_JOBS", str(DEFAULT_MAX_CONCURRENT_IMAGE_JOBS))),
+    )
+
+
+# =============================================================================
+# 작업 엔트리
+# =============================================================================
+
+
+@dataclass
+class ImageJob:
+    """추적 중인 이미지 생성 작업.
+
+    Attributes:
+        job_id: 작업 고유 ID (레지스트리 내 단조 증가)
+        session_id: 세션 ID (None이면 supersede 대상 아님)
+        turn_id: 요청 턴 ID
+        task: 실제 생성 코루틴을 실행하는 태스크
+        created_at: 작업 등록 시각
+    """
+
+    job_id: int
+    session_id: str | None
+    turn_id: int | None
+    task: asyncio.Task[ImageGenerationResponse]
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def is_superseded_by(self, turn_id: int | None) -> bool:
+        """주어진 턴의 요청이 이 작업을 대체하는지 판정합니다.
+
+        turn_id가 어느 한쪽이라도 없으면 "마지막 요청 우선"으로 대체합니다.
+        """
+        if self.turn_id is None or turn_id is None:
+            return True
+        return turn_id >= self.turn_id
+
+
+# =============================================================================
+# 작업 레지스트리
+# =============================================================================
+
+
+class ImageJobRegistry:
+    """세션별 최신 이미지 생성 작업을 추적하고 이전 작업을 취소합니다."""
+
+    def __init__(self, max_concurrent_jobs: int | None = None) -> None:
+        """ImageJobRegistry를 초기화합니다.
+
+        Args:
+            max_concurrent_jobs: 동시 실행 수 (기본: 환경변수 UW_IMAGE_MAX_CONCURRENT_JOBS)
+        """
+        self._max_concurrent_jobs = max_concurrent_jobs or _get_max_concurrent_jobs()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._active_by_session: dict[str, ImageJob] = {}
+        self._running_jobs = 0
+        self._next_job_id = 1
+        self._cancelled_total = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """동시 실행 세마포어를 lazy 생성합니다 (이벤트 루프 바인딩 지연)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_jobs)
+        return self._semaphore
+
+    async def _run_with_slot(
+        self, factory: Callable[[], Awaitable[ImageGenerationResponse]]
+    ) -> ImageGenerationResponse:
+        """동시 실행 슬롯을 확보한 뒤 생성 코루틴을 실행합니다."""
+        async with self._get_semaphore():
+            self._running_jobs += 1
+            try:
+                return await factory()
+            finally:
+                self._running_jobs -= 1
+
+    async def run(
+        self,
+        factory: Callable[[], Awaitable[ImageGenerationResponse]],
+        *,
+        session_id: str | None = None,
+        turn_id: int | None = None,
+    ) -> ImageGenerationResponse:
+        """이미지 생성 작업을 등록하고 결과를 기다립니다.
+
+        같은 세션의 이전 작업은 취소됩니다. 이 작업 자체가 대체되면
+        status=cancelled 응답을 반환합니다.
+
+        Args:
+            factory: 생성 코루틴 팩토리 (예: lambda: generator.generate(req))
+            session_id: 세션 ID
+            turn_id: 요청 턴 ID
+
+        Returns:
+            ImageGenerationResponse: 생성 결과 또는 취소 응답
+        """
+        previous = self._active_by_session.get(session_id) if session_id else None
+        if previous is not None and not previous.is_superseded_by(turn_id):
+            # 늦게 도착한 과거 턴 요청: 실행하지 않음
+            self._cancelled_total += 1
+            logger.info(
+                "[ImageJobs] Stale image request skipped",
+                extra={
+                    "session_id": session_id,
+                    "turn_id": turn_id,
+                    "active_turn_id": previous.turn_id,
+                },
+            )
+            return create_cancelled_response()
+
+        job = ImageJob(
+            job_id=self._next_job_id,
+            session_id=session_id,
+            turn_id=turn_id,
+            task=asyncio.create_task(
+                self._run_with_slot(factory),
+                name=f"image_job_{self._next_job_id}",
+            ),
+        )
+        self._next_job_id += 1
+
+        if session_id:
+            self._active_by_session[session_id] = job
+            job.task.add_done_callback(lambda _t: self._release(job))
+            if previous is not None:
+                self._cancel_job(previous, reason="superseded")
+
+        try:
+            return await job.task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if job.task.cancelled() and (current is None or current.cancelling() == 0):
+                # supersede/cancel API에 의한 취소 → 안전한 응답 (RULE-004)
+                return create_cancelled_response()
+            # 요청 핸들러 자체가 취소됨 (클라이언트 연결 종료 등)
+            raise
+
+    def _release(self, job: ImageJob) -> None:
+        """완료/취소된 작업을 세션 추적에서 제거합니다."""
+        if job.session_id and self._active_by_session.get(job.session_id) is job:
+            del self._active_by_session[job.session_id]
+
+    def cancel(self, session_id: str, *, turn_id: int | None = None) -> bool:
+        """세션의 진행 중인 작업을 취소합니다.
+
+        Args:
+            session_id: 세션 ID
+            turn_id: 지정 시 이 턴 이하의 작업만 취소 (더 새로운 작업은 보존)
+
+        Returns:
+            bool: 취소된 작업이 있으면 True
+        """
+        job = self._active_by_session.get(session_id)
+        if job is None or job.task.done():
+            return False
+        if turn_id is not None and job.turn_id is not None and job.turn_id > turn_id:
+            return False
+        del self._active_by_session[session_id]
+        self._cancel_job(job, reason="cancel_request")
+        return True
+
+    def _cancel_job(self, job: ImageJob, *, reason: str) -> None:
+        """작업 태스크를 취소합니다 (진행 중인 Gemini 호출 포함)."""
+        if job.task.done():
+            return
+        job.task.cancel()
+        self._cancelled_total += 1
+        logger.info(
+            "[ImageJobs] Image job cancelled",
+            extra={
+                "job_id": job.job_id,
+                "session_id": job.session_id,
+                "turn_id": job.turn_id,
+                "reason": reason,
+            },
+        )
+
+    def get_active_job(self, session_id: str) -> ImageJob | None:
+        """세션의 진행 중인 작업을 반환합니다."""
+        return self._active_by_session.get(session_id)
+
+    def get_stats(self) -> dict[str, int]:
+        """레지스트리 상태 지표를 반환합니다."""
+        return {
+            "max_concurrent_jobs": self._max_concurrent_jobs,
+            "running_jobs": self._running_jobs,
+            "tracked_sessions": len(self._active_by_session),
+            "cancelled_total": self._cancelled_total,
+        }
+
+
+# =============================================================================
+# 헬퍼 함수
+# =============================================================================
+
+
+def create_cancelled_response() -> ImageGenerationResponse:
+    """취소된 작업의 응답을 생성합니다."""
+    return ImageGenerationResponse(
+        status=ImageGenerationStatus.CANCELLED,
+        message=CANCELLED_MESSAGE,
+    )
+
+
+# =============================================================================
+# 싱글톤 인스턴스
+# =============================================================================
+
+_registry_instance: ImageJobRegistry | None = None
+
+
+def get_image_job_registry() -> ImageJobRegistry:
+    """ImageJobRegistry 싱글톤 인스턴스를 반환합니다."""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = ImageJobRegistry()
+    return _registry_instance
+
+
+def reset_image_job_registry() -> None:
+    """테스트용 싱글톤 리셋."""
+    global _registry_instance
+    _registry_instance = None
@@ -0,0 +1,197 @@
+"""Unknown World - Scanner 업로드 이미지 전처리.
+
+휴대폰 사진(5~10MB, 4000px 이상)을 그대로 비전 모델에 보내면 업로드 시간과 입력 토큰이
+불필요하게 커집니다. 이 모듈은 비전 모델 호출 전에 이미지를 한 번 디코딩하여
+다음을 수행합니다.
+
+    1. EXIF 방향 적용 (auto-orient: 클라이언트 미리보기와 bbox 좌표계 일치)
+    2. 비전 모델 유효 해상도로 축소 (긴 변 기준, 비율 유지)
+    3. 메타데이터 제거 (EXIF/GPS 등) 후 재인코딩 (불투명: JPEG, 투명: WebP)
+
+설계 원칙:
+    - 디코딩/인코딩은 CPU 오프로드 풀에서 실행 (이벤트 루프 블로킹 금지)
+    - RULE-004: 전처리 실패 시 원본 바이트로 분석 계속
+    - RULE-007: 이미지 내용은 로깅하지 않음 (크기/해상도 메타만 기록)
+    - RULE-009: bbox는 0~1000 정규화 좌표이므로 축소와 무관 (방향만 정규화)
+
+환경변수:
+    - UW_SCAN_PREPROCESS: 전처리 활성화 (기본: "1")
+    - UW_SCAN_MAX_DIMENSION: 긴 변 최대 픽셀 (기본: 1536)
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+from dataclasses import dataclass
+
+from unknown_world.storage.offload import get_offload_executor
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_SCAN_MAX_DIMENSION = 1536
+"""비전 모델 유효 해상도 (긴 변, px). 768px 타일 2x2에 맞춤."""
+
+SCAN_JPEG_QUALITY = 85
+"""불투명 이미지 JPEG 인코딩 품질."""
+
+SCAN_WEBP_QUALITY = 85
+"""투명 이미지 WebP 인코딩 품질."""
+
+
+def is_scan_preprocess_enabled() -> bool:
+    """환경변수에서 전처리 활성화 여부를 읽습니다."""
+    return os.environ.get("UW_SCAN_PREPROCESS", "1").lower() not in ("0", "false", "no")
+
+
+def get_scan_max_dimension() -> int:
+    """환경변수에서 긴 변 최대 픽셀을 읽습니다."""
+    return max(256, int(os.environ.get("UW_SCAN_MAX_DIMENSION", str(DEFAULT_SCAN_MAX_DIMENSION))))
+
+
+# =============================================================================
+# 전처리
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class PreprocessedImage:
+    """전처리 결과.
+
+    Attributes:
+        data: 비전 모델에 보낼 이미지 바이트
+        content_type: data의 MIME 타입
+        width: 결과 이미지 너비 (px)
+        height: 결과 이미지 높이 (px)
+        original_bytes: 업로드 원본 크기 (bytes)
+        transformed: 재인코딩 여부 (False면 원본 바이트 그대로)
+    """
+
+    data: bytes
+    content_type: str
+    width: int
+    height: int
+    original_bytes: int
+    transformed: bool
+
+
+def preprocess_scan_image(
+    content: bytes,
+    content_type: str,
+    *,
+    max_dimension: int | None = None,
+) -> PreprocessedImage:
+    """업로드 이미지를 비전 모델 입력용으로 정규화합니다.
+
+    블로킹 함수이므로 OffloadExecutor.run_cpu()를 통해 호출합니다.
+    방향 보정/축소/메타데이터 제거가 모두 필요 없고 재인코딩 결과가 원본보다 크면
+    원본 바이트를 그대로 사용합니다.
+
+    Args:
+        content: 업로드 이미지 바이트
+        content_type: 업로드 MIME 타입
+        max_dimension: 긴 변 최대 픽셀 (기본: 환경변수 UW_SCAN_MAX_DIMENSION)
+
+    Returns:
+        PreprocessedImage: 전처리 결과
+
+    Raises:
+        OSError/ValueError: 디코딩 실패 시 (호출자에서 원본으로 폴백)
+    """
+    from PIL import Image, ImageOps
+
+    limit = max_dimension or get_scan_max_dimension()
+
+    with Image.open(io.BytesIO(content)) as img:
+        img.seek(0)  # 애니메이션 GIF/WebP는 첫 프레임만 분석
+        has_metadata = bool(img.getexif()) or "icc_profile" in img.info
+        oriented = ImageOps.exif_transpose(img)
+        needs_resize = max(oriented.size) > limit
+
+        if needs_resize:
+            oriented.thumbnail((limit, limit), Image.Resampling.LANCZOS)
+
+        has_alpha = oriented.mode in ("RGBA", "LA") or (
+            oriented.mode == "P" and "transparency" in oriented.info
+        )
+        output = io.BytesIO()
+        if has_alpha:
+            oriented.convert("RGBA").save(output, format="WEBP", quality=SCAN_WEBP_QUALITY)
+            out_type = "image/webp"
+        else:
+            oriented.convert("RGB").save(
+                output, format="JPEG", quality=SCAN_JPEG_QUALITY, optimize=True
+            )
+            out_type = "image/jpeg"
+        width, height = oriented.size
+
+    encoded = output.getvalue()
+    # EXIF 방향 정보는 메타데이터에 포함되므로 has_metadata가 방향 보정 여부도 포괄
+    if not (needs_resize or has_metadata) and len(encoded) >= len(content):
+        return PreprocessedImage(
+            data=content,
+            content_type=content_type,
+            width=width,
+            height=height,
+            original_bytes=len(content),
+            transformed=False,
+        )
+
+    return PreprocessedImage(
+        data=encoded,
+        content_type=out_type,
+        width=width,
+        height=height,
+        original_bytes=len(content),
+        transformed=True,
+    )
+
+
+async def preprocess_scan_image_async(content: bytes, content_type: str) -> PreprocessedImage:
+    """업로드 이미지를 CPU 오프로드 풀에서 전처리합니다.
+
+    비활성화되었거나 실패하면 원본 바이트를 그대로 반환합니다 (RULE-004).
+
+    Args:
+        content: 업로드 이미지 바이트
+        content_type: 업로드 MIME 타입
+
+    Returns:
+        PreprocessedImage: 전처리 결과 (폴백 시 transformed=False)
+    """
+    fallback = PreprocessedImage(
+        data=content,
+        content_type=content_type,
+        width=0,
+        height=0,
+        original_bytes=len(content),
+        transformed=False,
+    )
+    if not is_scan_preprocess_enabled():
+        return fallback
+
+    try:
+        result = await get_offload_executor().run_cpu(preprocess_scan_image, content, content_type)
+    except Exception as e:
+        logger.warning(
+            "[ImagePreprocess] Preprocessing failed, using original upload",
+            extra={"error_type": type(e).__name__},
+        )
+        return fallback
+
+    logger.info(
+        "[ImagePreprocess] Scan image preprocessed",
+        extra={
+            "transformed": result.transformed,
+            "original_kb": result.original_bytes // 1024,
+            "output_kb": len(result.data) // 1024,
+            "size": f"{result.width}x{result.height}",
+            "content_type": result.content_type,
+        },
+    )
+    return result
@@ -7,6 +7,8 @@
     - RULE-004: 실패 시 안전한 폴백 (텍스트-only 캡션)
     - RULE-007: 프롬프트 원문/비밀정보 노출 금지
     - RULE-009: bbox는 0~1000 정규화 + [ymin, xmin, ymax, xmax]
+    - 비전 모델 호출 전 업로드 전처리 (방향 보정/축소/EXIF 제거, image_preprocess)
+    - 같은/거의 같은 이미지 재스캔은 perceptual hash 결과 캐시로 응답 (vision_cache)
 
 페어링 질문 결정:
     - Q1: Option A (multipart 업로드로 처리)
@@ -38,6 +40,11 @@ from unknown_world.models.scanner import (
 from unknown_world.models.turn import Box2D, Language
 from unknown_world.orchestrator.prompt_loader import load_prompt
 from unknown_world.services.genai_client import ENV_UW_MODE, GenAIMode
+from unknown_world.services.image_preprocess import preprocess_scan_image_async
+from unknown_world.services.vision_cache import (
+    compute_perceptual_hash_async,
+    get_scan_result_cache,
+)
 from unknown_world.storage.validation import (
     ALLOWED_IMAGE_MIME_TYPES,
     BBOX_MAX,
@@ -665,14 +672,38 @@ class ImageUnderstandingService:
             result.original_image_url = original_image_url
             return result
 
-        # 실제 비전 모델 호출
+        # 결과 캐시 조회 (언어/아이템 수가 같은 동일·유사 이미지)
+        cache = get_scan_result_cache()
+        image_hash = (
+            await compute_perceptual_hash_async(image_content) if cache is not None else None
+        )
+        cache_variant = f"{language.value}:{item_count}"
+        if cache is not None and image_hash is not None:
+            cached = cache.get(image_hash, cache_variant)
+            if cached is not None:
+                # 아이템 후보 ID는 인벤토리 키이므로 스캔마다 새로 발급
+                for candidate in cached.item_candidates:
+                    candidate.id = f"item_{uuid.uuid4().hex[:8]}"
+                cached.analysis_time_ms = int((time.time() - start_time) * 1000)
+                cached.original_image_key = original_image_key
+                cached.original_image_url = original_image_url
+                return cached
+
+        # 실제 비전 모델 호출 (전처리: 1회 디코딩 → 방향 보정/축소/재인코딩, CPU 오프로드)
         try:
+            prepared = await preprocess_scan_image_async(image_content, content_type)
             result = await self._call_vision_model(
-                image_content,
-                content_type,
+                prepared.data,
+                prepared.content_type,
                 language,
                 item_count=item_count,
             )
+            if (
+                cache is not None
+                and image_hash is not None
+                and result.status == ScanStatus.COMPLETED
+            ):
+                cache.put(image_hash, result, cache_variant)
             result.analysis_time_ms = int((time.time() - start_time) * 1000)
             result.original_image_key = original_image_key
             result.original_image_url = original_image_url
@@ -0,0 +1,232 @@
+"""Unknown World - 생성 이미지 포맷/크기 변형 파이프라인.
+
+생성된 장면 이미지(PNG 원본)를 서빙용 WebP(선택적으로 AVIF)로 재인코딩하고
+thumb/medium/full 크기 변형을 함께 만듭니다. 1K~4K PNG를 그대로 내려보내는 대신
+클라이언트 뷰포트에 맞는 변형을 서빙하여 로딩 시간과 egress 비용을 줄입니다.
+
+설계 원칙:
+    - 원본 PNG는 그대로 유지 (Gemini 참조 이미지/비전 분석 입력)
+    - 인코딩은 CPU 오프로드 풀에서 실행 (이벤트 루프 블로킹 금지)
+    - 변형 URL이 필요 없는 요청(client 미전송)은 응답 후 백그라운드에서 인코딩
+    - RULE-004: 인코딩 실패 시 원본 PNG URL로 폴백 (이미지 생성 자체는 성공 처리)
+
+환경변수:
+    - UW_IMAGE_VARIANTS: 변형 생성 활성화 (기본: "1")
+    - UW_IMAGE_AVIF: AVIF 변형 추가 생성 (기본: "0", Pillow AVIF 지원 필요)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from unknown_world.storage.offload import get_offload_executor
+from unknown_world.storage.paths import (
+    DEFAULT_IMAGE_EXTENSION,
+    IMAGE_VARIANT_FULL,
+    IMAGE_VARIANT_MAX_WIDTHS,
+    IMAGE_VARIANT_ORDER,
+    VARIANT_IMAGE_EXTENSION,
+    build_variant_filename,
+    get_generated_images_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+WEBP_QUALITY = 82
+"""WebP 인코딩 품질 (0-100)."""
+
+AVIF_QUALITY = 60
+"""AVIF 인코딩 품질 (0-100)."""
+
+AVIF_EXTENSION = "avif"
+"""AVIF 변형 파일 확장자."""
+
+_PIL_FORMATS: dict[str, str] = {
+    VARIANT_IMAGE_EXTENSION: "WEBP",
+    AVIF_EXTENSION: "AVIF",
+}
+
+
+def is_variants_enabled() -> bool:
+    """환경변수에서 변형 생성 활성화 여부를 읽습니다."""
+    return os.environ.get("UW_IMAGE_VARIANTS", "1").lower() not in ("0", "false", "no")
+
+
+def is_avif_enabled() -> bool:
+    """AVIF 변형 생성 여부를 확인합니다 (환경변수 + Pillow 지원)."""
+    if os.environ.get("UW_IMAGE_AVIF", "0").lower() not in ("1", "true", "yes"):
+        return False
+    from PIL import features
+
+    return bool(features.check("avif"))
+
+
+# =============================================================================
+# 결과 데이터 클래스
+# =============================================================================
+
+
+@dataclass
+class ImageVariantSet:
+    """생성된 변형 목록.
+
+    Attributes:
+        image_id: 이미지 ID
+        source_width: 원본 너비 (px)
+        source_height: 원본 높이 (px)
+        variants: 변형 이름 → 생성된 확장자 목록 (예: {"medium": ["webp", "avif"]})
+    """
+
+    image_id: str
+    source_width: int
+    source_height: int
+    variants: dict[str, list[str]] = field(default_factory=lambda: {})
+
+    @property
+    def available(self) -> list[str]:
+        """기본 확장자(WebP)로 생성된 변형 이름 목록."""
+        return [v for v, exts in self.variants.items() if VARIANT_IMAGE_EXTENSION in exts]
+
+
+# =============================================================================
+# 인코딩 (블로킹 - run_cpu 대상)
+# =============================================================================
+
+
+def encode_image_variants(
+    image_id: str,
+    *,
+    output_dir: Path | None = None,
+    extensions: tuple[str, ...] = (VARIANT_IMAGE_EXTENSION,),
+) -> ImageVariantSet:
+    """원본 PNG에서 크기/포맷 변형을 인코딩합니다.
+
+    원본 너비 이하의 축소 티어는 건너뛰며(full이 대신함), full 변형은 항상 생성합니다.
+
+    Args:
+        image_id: 이미지 ID ({image_id}.png가 output_dir에 있어야 함)
+        output_dir: 이미지 디렉토리 (기본: .data/images/generated)
+        extensions: 생성할 확장자 목록 (webp/avif)
+
+    Returns:
+        ImageVariantSet: 생성된 변형 목록
+
+    Raises:
+        FileNotFoundError: 원본 PNG가 없는 경우
+    """
+    from PIL import Image
+
+    base_dir = output_dir or get_generated_images_dir()
+    source_path = base_dir / f"{image_id}.{DEFAULT_IMAGE_EXTENSION}"
+
+    with Image.open(source_path) as source:
+        source.load()
+        image = source if source.mode in ("RGB", "RGBA") else source.convert("RGBA")
+        width, height = image.size
+        result = ImageVariantSet(image_id=image_id, source_width=width, source_height=height)
+
+        for variant in IMAGE_VARIANT_ORDER:
+            max_width = IMAGE_VARIANT_MAX_WIDTHS.get(variant)
+            if variant != IMAGE_VARIANT_FULL and (max_width is None or width <= max_width):
+                continue
+
+            if max_width is not None and variant != IMAGE_VARIANT_FULL:
+                target = (max_width, max(1, round(height * max_width / width)))
+                resized = image.resize(target, Image.Resampling.LANCZOS)  # type: ignore[reportUnknownMemberType]
+            else:
+                resized = image
+
+            for extension in extensions:
+                filename = build_variant_filename(image_id, variant, extension=extension)
+                quality = AVIF_QUALITY if extension == AVIF_EXTENSION else WEBP_QUALITY
+                resized.save(base_dir / filename, format=_PIL_FORMATS[extension], quality=quality)
+                result.variants.setdefault(variant, []).append(extension)
+
+    return result
+
+
+# =============================================================================
+# 비동기 진입점
+# =============================================================================
+
+
+async def create_image_variants(
+    image_id: str,
+    *,
+    output_dir: Path | None = None,
+) -> ImageVariantSet | None:
+    """생성 완료된 이미지의 서빙용 변형을 만듭니다 (CPU 오프로드).
+
+    Args:
+        image_id: 이미지 ID
+        output_dir: 이미지 디렉토리 (기본: .data/images/generated)
+
+    Returns:
+        ImageVariantSet 또는 None (비활성화/실패 시, 원본 PNG로 폴백)
+    """
+    if not is_variants_enabled():
+        return None
+
+    extensions: tuple[str, ...] = (VARIANT_IMAGE_EXTENSION,)
+    if is_avif_enabled():
+        extensions = (*extensions, AVIF_EXTENSION)
+
+    try:
+        result = await get_offload_executor().run_cpu(
+            encode_image_variants,
+            image_id,
+            output_dir=output_dir,
+            extensions=extensions,
+        )
+    except Exception as e:
+        logger.warning(
+            "[ImageVariants] Variant encoding failed, serving source PNG",
+            extra={"image_id": image_id, "error_type": type(e).__name__},
+        )
+        return None
+
+    logger.debug(
+        "[ImageVariants] Variants encoded",
+        extra={
+            "image_id": image_id,
+            "source_width": result.source_width,
+            "variants": ",".join(sorted(result.variants)),
+        },
+    )
+    return result
+
+
+_background_tasks: set[asyncio.Task[ImageVariantSet | None]] = set()
+"""진행 중인 백그라운드 인코딩 태스크 (GC로 인한 조기 소멸 방지)."""
+
+
+def schedule_image_variants(image_id: str, *, output_dir: Path | None = None) -> bool:
+    """서빙용 변형 인코딩을 백그라운드로 시작합니다 (응답을 기다리게 하지 않음).
+
+    Accept 협상(/api/image/file, /static)은 변형이 생긴 뒤부터 WebP/AVIF를 서빙하고,
+    그 전에는 원본 PNG로 폴백합니다.
+
+    Args:
+        image_id: 이미지 ID
+        output_dir: 이미지 디렉토리 (기본: .data/images/generated)
+
+    Returns:
+        bool: 작업을 시작했는지 여부 (비활성화 시 False)
+    """
+    if not is_variants_enabled():
+        return False
+
+    task = asyncio.create_task(
+        create_image_variants(image_id, output_dir=output_dir), name="image_variants"
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return True
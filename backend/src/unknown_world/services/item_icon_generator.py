@@ -5,6 +5,7 @@
 
 U-091: 런타임 rembg 제거 - 배경 제거 없이 프롬프트로 어두운 배경 유도.
 U-093: 타임아웃 90초 상향, 최대 1회 재시도(총 2회), 지수 백오프, 폴백 보강.
+백그라운드 요청은 짧은 윈도우 동안 모아 스프라이트 시트 1장으로 배치 생성합니다.
 
 설계 원칙:
     - RULE-004: 실패 시 안전한 폴백 제공 (placeholder 아이콘)
@@ -31,6 +32,8 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import os
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from enum import StrEnum
 from pathlib import Path
@@ -38,6 +41,18 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from unknown_world.services.icon_index import IconIndex
+from unknown_world.services.icon_similarity import (
+    IconSimilarityIndex,
+    canonicalize_item_description,
+)
+from unknown_world.services.icon_sprite_sheet import get_sheet_grid, slice_icon_sheet
+from unknown_world.services.icon_work_queue import (
+    IconPriority,
+    IconQueueFullError,
+    IconWorkQueue,
+)
+from unknown_world.storage.offload import get_offload_executor, read_bytes_if_exists
 from unknown_world.storage.paths import build_image_url, get_generated_images_dir
 
 if TYPE_CHECKING:
@@ -134,6 +149,8 @@ class IconGenerationRequest(BaseModel):
         item_id: 아이템 고유 ID
         item_description: 아이템 설명 (아이콘 생성용)
         language: 현재 세션 언어 (ko-KR/en-US)
+        priority: 백그라운드 생성 우선순위 (visible > normal > prefetch)
+        session_id: 공정성 버킷 (세션 간 라운드로빈)
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -141,6 +158,8 @@ class IconGenerationRequest(BaseModel):
     item_id: str = Field(description="아이템 고유 ID")
     item_description: str = Field(description="아이템 설명 (아이콘 생성용)")
     language: str = Field(default="en-US", description="현재 세션 언어")
+    priority: IconPriority = Field(default=IconPriority.NORMAL, description="생성 우선순위")
+    session_id: str | None = Field(default=None, description="세션 식별자 (공정성)")
 
 
 class IconGenerationResponse(BaseModel):
@@ -173,25 +192,45 @@ class IconGenerationResponse(BaseModel):
 class IconCache:
     """아이템 아이콘 캐시.
 
-    메모리 캐시 + 파일 시스템 캐시를 사용하여 동일 아이템 재생성을 방지합니다.
-    캐시 키는 아이템 설명의 MD5 해시입니다.
+    manifest 기반 bounded LRU 인덱스(IconIndex)로 동일 아이템 재생성을 방지합니다.
+    인덱스는 생성 시 한 번 로드하며, 조회(get)는 파일 시스템을 건드리지 않습니다.
+    캐시 키는 아이템 설명의 MD5 해시이며, 정확히 일치하지 않으면 유사도 인덱스로
+    거의 같은 설명(관사/어순/복수형 차이 등)이나 번들 아이콘 아키타입을 재사용합니다.
     """
 
-    def __init__(self, cache_dir: Path | None = None) -> None:
-        """IconCache를 초기화합니다.
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        similarity_index: IconSimilarityIndex | None = None,
+        index: IconIndex | None = None,
+    ) -> None:
+        """IconCache를 초기화합니다 (manifest 로드 포함, 블로킹).
 
         Args:
             cache_dir: 캐시 디렉토리 (기본: .data/images/generated/icons)
+            similarity_index: 유사도 인덱스 (기본: 번들 아이콘 시드 포함 새 인스턴스)
+            index: 아이콘 인덱스 (기본: cache_dir의 manifest.json, 환경변수 쿼터)
         """
         self._cache_dir = cache_dir or get_generated_images_dir() / ICON_CACHE_SUBDIR
         self._cache_dir.mkdir(parents=True, exist_ok=True)
-        self._memory_cache: dict[str, str] = {}  # cache_key → icon_url
+        self._similarity = similarity_index or IconSimilarityIndex()
+        self._index = index or IconIndex(self._cache_dir)
+        self._index.load(url_for_key=self._build_icon_url)
+
+        # 유사도 인덱스 복원 (manifest에는 설명 원문 대신 표준 키만 저장)
+        for _, entry in self._index.items():
+            self._similarity.add_canonical(entry.canonical, entry.url)
 
         logger.info(
             "[IconCache] Initialized",
-            extra={"cache_dir": str(self._cache_dir)},
+            extra={"cache_dir": str(self._cache_dir), **self._index.get_stats()},
         )
 
+    @staticmethod
+    def _build_icon_url(cache_key: str) -> str:
+        """캐시 키의 아이콘 URL을 생성합니다."""
+        return build_image_url(f"{ICON_CACHE_SUBDIR}/{cache_key}.png", category="generated")
+
     def _make_cache_key(self, item_description: str) -> str:
         """캐시 키를 생성합니다 (MD5 해시).
 
@@ -214,30 +253,32 @@ class IconCache:
         """
         cache_key = self._make_cache_key(item_description)
 
-        # 메모리 캐시 확인
-        if cache_key in self._memory_cache:
+        # 인덱스 확인 (메모리만 사용, LRU 순서 갱신)
+        entry = self._index.get(cache_key)
+        if entry is not None:
             logger.debug(
-                "[IconCache] Memory cache hit",
+                "[IconCache] Cache hit",
                 extra={"cache_key": cache_key[:8]},
             )
-            return self._memory_cache[cache_key]
+            return entry.url
 
-        # 파일 캐시 확인
-        cache_path = self._cache_dir / f"{cache_key}.png"
-        if cache_path.exists():
-            icon_url = build_image_url(f"{ICON_CACHE_SUBDIR}/{cache_key}.png", category="generated")
-            self._memory_cache[cache_key] = icon_url
+        # 유사도 인덱스 확인 (표준 키/번들 아이콘/trigram 유사도)
+        match = self._similarity.lookup(item_description)
+        if match is not None:
             logger.debug(
-                "[IconCache] File cache hit",
-                extra={"cache_key": cache_key[:8]},
+                "[IconCache] Similar icon reused",
+                extra={"cache_key": cache_key[:8], "kind": match.kind, "score": match.score},
             )
-            return icon_url
+            return match.icon_url
 
         return None
 
     def set(self, item_description: str, image_data: bytes) -> str:
         """캐시에 아이콘을 저장합니다 (64x64 리사이징 포함).
 
+        Pillow 디코딩/리사이즈/인코딩과 파일 쓰기를 포함하는 블로킹 함수이므로
+        이벤트 루프에서는 OffloadExecutor.run_cpu()를 통해 호출합니다.
+
         Args:
             item_description: 아이템 설명
             image_data: 이미지 바이트 데이터
@@ -280,9 +321,15 @@ class IconCache:
             cache_path.write_bytes(image_data)
             processed_data = image_data
 
-        # URL 생성 및 메모리 캐시 저장
-        icon_url = build_image_url(f"{ICON_CACHE_SUBDIR}/{cache_key}.png", category="generated")
-        self._memory_cache[cache_key] = icon_url
+        # 인덱스/유사도 인덱스 갱신 (쿼터 초과분은 LRU 순으로 축출)
+        icon_url = self._build_icon_url(cache_key)
+        canonical = canonicalize_item_description(item_description)
+        evicted = self._index.put(
+            cache_key, url=icon_url, size=len(processed_data), canonical=canonical
+        )
+        self._similarity.add_canonical(canonical, icon_url)
+        for entry in evicted:
+            self._similarity.remove_canonical(entry.canonical, icon_url=entry.url)
 
         logger.info(
             "[IconCache] Icon cached",
@@ -306,6 +353,17 @@ class IconCache:
         cache_key = self._make_cache_key(item_description)
         return self._cache_dir / f"{cache_key}.png"
 
+    def flush(self) -> None:
+        """인덱스를 manifest에 저장합니다 (종료 시 호출, 블로킹).
+
+        get()의 LRU 갱신은 메모리에만 반영되므로 종료 시 한 번 저장합니다.
+        """
+        self._index.save()
+
+    def get_stats(self) -> dict[str, int]:
+        """캐시 지표를 반환합니다."""
+        return {**self._index.get_stats(), "similarity_entries": len(self._similarity)}
+
 
 # =============================================================================
 # 재시도 판별 헬퍼 (U-093)
@@ -359,12 +417,16 @@ class ItemIconGenerator:
         self,
         image_generator: ImageGeneratorType | None = None,
         cache: IconCache | None = None,
+        batch_max_size: int | None = None,
+        max_concurrency: int | None = None,
     ) -> None:
         """ItemIconGenerator를 초기화합니다.
 
         Args:
             image_generator: 이미지 생성기 (기본: get_image_generator())
             cache: 아이콘 캐시 (기본: 새 인스턴스)
+            batch_max_size: 시트 1장당 최대 아이콘 수 (기본: 환경변수, 1이면 배치 비활성화)
+            max_concurrency: 동시 실행 배치 수 (기본: 환경변수 UW_ICON_MAX_CONCURRENCY)
         """
         self._image_generator = image_generator
         self._cache = cache or IconCache()
@@ -372,6 +434,13 @@ class ItemIconGenerator:
         self._completed_urls: dict[str, str] = {}  # item_id -> icon_url (최근 완료된 항목)
         self._failed_generations: dict[str, str] = {}  # U-097: item_id -> error_message
 
+        # 백그라운드 생성은 우선순위 큐의 bounded 슬롯에서만 실행
+        self._work_queue = IconWorkQueue(
+            self._generate_icon_batch,
+            batch_size=batch_max_size,
+            max_concurrency=max_concurrency,
+        )
+
         logger.info("[ItemIconGenerator] Initialized")
 
     def _get_image_generator(self) -> ImageGeneratorType:
@@ -409,6 +478,43 @@ Use the item's natural colors accented with CRT phosphor tones.
 Background: solid dark #0d0d0d only. DO NOT use white or bright backgrounds.
 {ICON_SIZE}x{ICON_SIZE} pixels, single centered object."""
 
+    def _build_icon_sheet_prompt(
+        self, item_descriptions: list[str], language: str, columns: int, rows: int
+    ) -> str:
+        """스프라이트 시트(그리드) 아이콘 생성 프롬프트를 구성합니다.
+
+        Args:
+            item_descriptions: 아이템 설명 목록 (읽기 순서대로 셀에 배치)
+            language: 세션 언어
+            columns: 그리드 열 수
+            rows: 그리드 행 수
+
+        Returns:
+            str: 이미지 생성 프롬프트
+        """
+        lang_instruction = "한국어" if language == "ko-KR" else "English"
+        cells = "\n".join(
+            f'{index}. "{description}"' for index, description in enumerate(item_descriptions, 1)
+        )
+        empty_cells = columns * rows - len(item_descriptions)
+        empty_instruction = (
+            f"The last {empty_cells} cell(s) stay empty (solid dark #0d0d0d).\n"
+            if empty_cells
+            else ""
+        )
+        return f"""\
+A sprite sheet of {len(item_descriptions)} minimal icons ({lang_instruction}),
+arranged in a strict {columns}x{rows} grid of equal square cells,
+filled left-to-right, top-to-bottom in this order:
+{cells}
+{empty_instruction}
+{ICON_STYLE_PROMPT}
+
+Exactly one centered object per cell, never crossing cell boundaries.
+No grid lines, borders, labels or gaps between cells.
+Use each item's natural colors accented with CRT phosphor tones.
+Background: solid dark #0d0d0d only. DO NOT use white or bright backgrounds."""
+
     def get_placeholder_url(self, item_id: str) -> str:
         """placeholder 아이콘 URL을 반환합니다.
 
@@ -422,6 +528,10 @@ Background: solid dark #0d0d0d only. DO NOT use white or bright backgrounds.
         # 실제 구현에서는 정적 placeholder 이미지 경로를 반환할 수 있음
         return "/ui/icons/placeholder_item.png"
 
+    def flush(self) -> None:
+        """아이콘 캐시 인덱스를 저장합니다 (종료 시 호출, 블로킹)."""
+        self._cache.flush()
+
     async def generate_icon(
         self,
         request: IconGenerationRequest,
@@ -471,35 +581,11 @@ Background: solid dark #0d0d0d only. DO NOT use white or bright backgrounds.
 
         # Q1 Option B: 즉시 응답 모드 (placeholder 반환)
         if not wait_for_completion:
-            # 백그라운드 생성 태스크가 없으면 시작
-            if request.item_id not in self._pending_generations:
-                task = asyncio.create_task(
-                    self._generate_icon_internal(request),
-                    name=f"icon_gen_{request.item_id}",
-                )
-                self._pending_generations[request.item_id] = task
-
-                # U-097: 태스크 완료 시 결과 확인 및 상태 추적
-                def _on_task_done(
-                    t: asyncio.Task[IconGenerationResponse], item_id: str = request.item_id
-                ) -> None:
-                    self._pending_generations.pop(item_id, None)
-                    try:
-                        result = t.result()
-                        if result.status == IconGenerationStatus.FAILED:
-                            self._failed_generations[item_id] = result.message or "생성 실패"
-                            logger.warning(
-                                "[ItemIconGenerator] Background icon generation failed",
-                                extra={"item_id": item_id, "message": result.message},
-                            )
-                    except Exception as exc:
-                        self._failed_generations[item_id] = str(exc)
-                        logger.exception(
-                            "[ItemIconGenerator] Background task exception",
-                            extra={"item_id": item_id},
-                        )
-
-                task.add_done_callback(_on_task_done)
+            if request.item_id in self._pending_generations:
+                # 대기 중인 prefetch 아이템이 화면에 나타나면 우선순위 상향
+                self._work_queue.promote(request.item_id, request.priority)
+            else:
+                self._start_background_generation(request)
 
             elapsed_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
             return IconGenerationResponse(
@@ -514,6 +600,42 @@ Background: solid dark #0d0d0d only. DO NOT use white or bright backgrounds.
         # 동기 생성 모드 (완료까지 대기)
         return await self._generate_icon_internal(request)
 
+    def _start_background_generation(self, request: IconGenerationRequest) -> None:
+        """작업 큐에 요청을 제출하는 백그라운드 태스크를 시작하고 결과를 추적합니다."""
+        # 작업 큐에 제출 (같은 윈도우의 요청과 묶어 시트 1장으로 생성)
+        task = asyncio.create_task(
+            self._work_queue.submit(
+                request, priority=request.priority, session_id=request.session_id
+            ),
+            name=f"icon_gen_{request.item_id}",
+        )
+        self._pending_generations[request.item_id] = task
+
+        # U-097: 태스크 완료 시 결과 확인 및 상태 추적
+        def _on_task_done(
+            t: asyncio.Task[IconGenerationResponse], item_id: str = request.item_id
+        ) -> None:
+            self._pending_generations.pop(item_id, None)
+            try:
+                result = t.result()
+                if result.status == IconGenerationStatus.FAILED:
+                    self._failed_generations[item_id] = result.message or "생성 실패"
+                    logger.warning(
+                        "[ItemIconGenerator] Background icon generation failed",
+                        extra={"item_id": item_id, "message": result.message},
+                    )
+            except IconQueueFullError:
+                # 셰딩은 실패로 기록하지 않음 (다음 요청에서 재시도)
+                pass
+            except Exception as exc:
+                self._failed_generations[item_id] = str(exc)
+                logger.exception(
+                    "[ItemIconGenerator] Background task exception",
+                    extra={"item_id": item_id},
+                )
+
+        task.add_done_callback(_on_task_done)
+
     async def _generate_icon_internal(
         self, request: IconGenerationRequest
     ) -> IconGenerationResponse:
@@ -565,9 +687,12 @@ Background: solid dark #0d0d0d only. DO NOT use white or bright backgrounds.
                     # 성공: 캐시에 저장
                     if response.image_id:
                         src_path = get_generated_images_dir() / f"{response.image_id}.png"
-                        if src_path.exists():
-                            image_data = src_path.read_bytes()
-                            cached_url = self._cache.set(request.item_description, image_data)
+                        executor = get_offload_executor()
+                        image_data = await executor.run_io(read_bytes_if_exists, src_path)
+                        if image_data is not None:
+                            cached_url = await executor.run_cpu(
+                                self._cache.set, request.item_description, image_data
+                            )
                             self._completed_urls[request.item_id] = cached_url
                             logger.info(
                                 "[ItemIconGenerator] Icon generation complete",
@@ -689,6 +814,138 @@ Background: solid dark #0d0d0d only. DO NOT use white or bright backgrounds.
             message=f"아이콘 생성 실패 ({max_attempts}/{max_attempts} 시도): {last_error_message}",
         )
 
+    async def _generate_icon_batch(
+        self, requests: list[IconGenerationRequest]
+    ) -> list[IconGenerationResponse]:
+        """배치된 아이콘 요청을 스프라이트 시트 1장으로 생성합니다.
+
+        같은 설명은 한 칸만 생성하며, 시트 생성/슬라이스가 실패하면
+        설명별 개별 생성(_generate_icon_internal)으로 폴백합니다 (RULE-004).
+        폴백은 이 배치가 차지한 작업 큐 슬롯 하나 안에서 순차 실행하여
+        동시 이미지 모델 호출 상한(IconWorkQueue)을 넘지 않습니다.
+
+        Args:
+            requests: 배치된 아이콘 요청 목록
+
+        Returns:
+            list[IconGenerationResponse]: 요청 순서와 같은 응답 목록
+        """
+        # 캐시 URL은 시작 시 한 번 읽어 둠 (도중 축출되어도 큐 슬롯 안에서 재생성/대기하지 않음)
+        cached: dict[str, str] = {}
+        unique: dict[str, IconGenerationRequest] = {}
+        for request in requests:
+            description = request.item_description
+            if description in unique or description in cached:
+                continue
+            cached_url = self._cache.get(description)
+            if cached_url:
+                cached[description] = cached_url
+            else:
+                unique[description] = request
+
+        results: dict[str, IconGenerationResponse] = {}
+        if len(unique) > 1:
+            results = await self._generate_icon_sheet(list(unique.values()))
+        if unique and not results:
+            for description, request in unique.items():
+                results[description] = await self._generate_icon_internal(request)
+
+        batch_responses: list[IconGenerationResponse] = []
+        for request in requests:
+            result = results.get(request.item_description)
+            if result is None:
+                # 이전 배치에서 이미 캐시된 설명
+                batch_responses.append(
+                    IconGenerationResponse(
+                        status=IconGenerationStatus.CACHED,
+                        icon_url=cached[request.item_description],
+                        item_id=request.item_id,
+                        is_placeholder=False,
+                        message="캐시에서 아이콘을 반환했습니다.",
+                    )
+                )
+                continue
+            if result.status == IconGenerationStatus.COMPLETED:
+                self._completed_urls[request.item_id] = result.icon_url
+            batch_responses.append(result.model_copy(update={"item_id": request.item_id}))
+        return batch_responses
+
+    async def _generate_icon_sheet(
+        self, requests: list[IconGenerationRequest]
+    ) -> dict[str, IconGenerationResponse]:
+        """스프라이트 시트를 생성/슬라이스하여 IconCache를 채웁니다 (1회 시도).
+
+        Args:
+            requests: 설명이 서로 다른 아이콘 요청 목록
+
+        Returns:
+            dict[str, IconGenerationResponse]: 설명 → 응답 (실패 시 빈 dict)
+        """
+        start_time = datetime.now(UTC)
+        columns, rows = get_sheet_grid(len(requests))
+        descriptions = [request.item_description for request in requests]
+
+        from unknown_world.services.image_generation import (
+            ImageGenerationRequest,
+            ImageGenerationStatus,
+        )
+
+        gen_request = ImageGenerationRequest(
+            prompt=self._build_icon_sheet_prompt(descriptions, requests[0].language, columns, rows),
+            image_size="1024x1024",
+            aspect_ratio="1:1",
+            model_label="FAST",
+        )
+
+        try:
+            response = await asyncio.wait_for(
+                self._get_image_generator().generate(gen_request),
+                timeout=ICON_GENERATION_TIMEOUT_SECONDS,
+            )
+            if response.status != ImageGenerationStatus.COMPLETED or not response.image_id:
+                raise ValueError(response.message or "sprite sheet generation failed")
+
+            executor = get_offload_executor()
+            src_path = get_generated_images_dir() / f"{response.image_id}.png"
+            sheet_data = await executor.run_io(read_bytes_if_exists, src_path)
+            if sheet_data is None:
+                raise FileNotFoundError("sprite sheet file missing")
+
+            tiles = await executor.run_cpu(slice_icon_sheet, sheet_data, len(requests), ICON_SIZE)
+            icon_urls = [
+                await executor.run_cpu(self._cache.set, description, tile)
+                for description, tile in zip(descriptions, tiles, strict=True)
+            ]
+        except Exception as e:
+            logger.warning(
+                "[ItemIconGenerator] Sprite sheet failed, falling back to single icons",
+                extra={"batch_size": len(requests), "error_type": type(e).__name__},
+            )
+            return {}
+
+        elapsed_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
+        logger.info(
+            "[ItemIconGenerator] Sprite sheet icons generated",
+            extra={
+                "batch_size": len(requests),
+                "grid": f"{columns}x{rows}",
+                "elapsed_ms": elapsed_ms,
+            },
+        )
+        return {
+            description: IconGenerationResponse(
+                status=IconGenerationStatus.COMPLETED,
+                icon_url=icon_url,
+                item_id=request.item_id,
+                is_placeholder=False,
+                generation_time_ms=elapsed_ms,
+                message="아이콘이 성공적으로 생성되었습니다.",
+            )
+            for description, icon_url, request in zip(
+                descriptions, icon_urls, requests, strict=True
+            )
+        }
+
     async def get_icon_status(
         self, item_id: str, request: IconGenerationRequest | None = None
     ) -> IconGenerationStatus:
@@ -722,6 +979,133 @@ Background: solid dark #0d0d0d only. DO NOT use white or bright backgrounds.
 
         return IconGenerationStatus.PENDING
 
+    def prefetch_icons(
+        self,
+        items: Iterable[tuple[str, str]],
+        *,
+        language: str,
+        session_id: str | None = None,
+    ) -> int:
+        """아이템 아이콘을 낮은 우선순위(prefetch)로 미리 생성 큐에 넣습니다.
+
+        클라이언트가 /api/item/icon을 요청하기 전에 생성을 시작해, 내러티브를 읽는 동안
+        아이콘이 캐시되도록 합니다. 이미 캐시/진행 중인 아이템은 건너뜁니다.
+
+        Args:
+            items: (item_id, 아이콘 생성용 설명) 목록 (클라이언트와 같은 설명을 사용)
+            language: 세션 언어
+            session_id: 세션 식별자 (공정성)
+
+        Returns:
+            int: 새로 큐에 넣은 아이템 수
+        """
+        scheduled = 0
+        for item_id, description in items:
+            if (
+                not description
+                or item_id in self._pending_generations
+                or self._cache.get(description)
+            ):
+                continue
+            # 캐시 미스가 확인된 상태이므로 동기 경로 없이 바로 백그라운드 태스크 시작
+            self._start_background_generation(
+                IconGenerationRequest(
+                    item_id=item_id,
+                    item_description=description,
+                    language=language,
+                    priority=IconPriority.PREFETCH,
+                    session_id=session_id,
+                )
+            )
+            scheduled += 1
+
+        if scheduled:
+            logger.info(
+                "[ItemIconGenerator] Icon prefetch scheduled",
+                extra={"count": scheduled, "queued": len(self._work_queue)},
+            )
+        return scheduled
+
+    async def peek_icon(self, request: IconGenerationRequest) -> IconGenerationResponse:
+        """생성을 시작하지 않고 현재 아이콘 URL/상태를 조회합니다 (배치 상태 조회용).
+
+        Args:
+            request: 아이콘 생성 요청
+
+        Returns:
+            IconGenerationResponse: 캐시/완료 시 실제 URL, 그 외에는 placeholder
+        """
+        cached_url = self._cache.get(request.item_description)
+        if cached_url:
+            return IconGenerationResponse(
+                status=IconGenerationStatus.CACHED,
+                icon_url=cached_url,
+                item_id=request.item_id,
+            )
+
+        status = await self.get_icon_status(request.item_id)
+        completed_url = self._completed_urls.get(request.item_id)
+        if status == IconGenerationStatus.COMPLETED and completed_url:
+            return IconGenerationResponse(
+                status=status, icon_url=completed_url, item_id=request.item_id
+            )
+
+        return IconGenerationResponse(
+            status=status,
+            icon_url=self.get_placeholder_url(request.item_id),
+            item_id=request.item_id,
+            is_placeholder=True,
+            message=self._failed_generations.get(request.item_id),
+        )
+
+    async def wait_for_icon(self, item_id: str) -> IconGenerationResponse | None:
+        """진행 중인 백그라운드 생성이 끝날 때까지 기다려 결과를 반환합니다 (push 스트림용).
+
+        대기자가 취소되어도 생성 태스크는 취소되지 않습니다 (asyncio.shield).
+
+        Args:
+            item_id: 아이템 ID
+
+        Returns:
+            IconGenerationResponse 또는 None (진행/완료/실패 기록이 없는 경우)
+        """
+        task = self._pending_generations.get(item_id)
+        if task is not None:
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise
+            except IconQueueFullError:
+                return IconGenerationResponse(
+                    status=IconGenerationStatus.PENDING,
+                    icon_url=self.get_placeholder_url(item_id),
+                    item_id=item_id,
+                    is_placeholder=True,
+                    message="대기열이 가득 차 생성이 보류되었습니다.",
+                )
+            except Exception:
+                pass  # _on_task_done이 실패를 기록함
+
+        if item_id in self._completed_urls:
+            return IconGenerationResponse(
+                status=IconGenerationStatus.COMPLETED,
+                icon_url=self._completed_urls[item_id],
+                item_id=item_id,
+                is_placeholder=False,
+            )
+
+        if item_id in self._failed_generations or task is not None:
+            return IconGenerationResponse(
+                status=IconGenerationStatus.FAILED,
+                icon_url=self.get_placeholder_url(item_id),
+                item_id=item_id,
+                is_placeholder=True,
+                message=self._failed_generations.get(item_id, "생성 실패"),
+            )
+
+        return None
+
 
 # =============================================================================
 # 싱글톤 인스턴스
@@ -742,3 +1126,24 @@ def reset_item_icon_generator() -> None:
     """테스트용 싱글톤 리셋."""
     global _generator_instance
     _generator_instance = None
+
+
+def is_icon_prefetch_enabled(*, is_mock: bool | None = None) -> bool:
+    """아이콘 선생성(prefetch) 활성화 여부를 확인합니다.
+
+    환경변수 UW_ICON_PREFETCH(기본: 1)를 따르며, Mock 모드에서는 비활성화합니다.
+
+    Args:
+        is_mock: Mock 모드 여부 (None이면 환경변수 UW_MODE 기준)
+    """
+    if is_mock is None:
+        is_mock = os.environ.get("UW_MODE", "mock").lower() == "mock"
+    if is_mock:
+        return False
+    return os.environ.get("UW_ICON_PREFETCH", "1").lower() not in ("0", "false", "no")
+
+
+def flush_item_icon_cache() -> None:
+    """생성된 싱글톤이 있으면 아이콘 캐시 인덱스를 저장합니다 (종료 시, 블로킹)."""
+    if _generator_instance is not None:
+        _generator_instance.flush()
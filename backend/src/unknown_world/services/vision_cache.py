@@ -0,0 +1,322 @@
+"""Unknown World - 비전 분석 결과 캐시 (perceptual hash).
+
+같은 사진을 다시 스캔하거나, 바뀌지 않은 Scene 이미지에 "정밀분석"을 반복하면
+(resolve_stage는 턴마다 같은 이미지를 재분석) 매번 비전 모델을 다시 호출합니다.
+이 모듈은 이미지의 perceptual hash(dHash, 64bit)를 키로 ScanResult/VisionAnalysisResult를
+재사용하는 TTL/크기 제한 캐시를 제공합니다.
+
+매칭 순서:
+    1. 해시 정확 일치 (재업로드/재인코딩된 동일 이미지)
+    2. 해밍 거리 ≤ 임계값 (리사이즈/압축 차이가 있는 거의 같은 이미지)
+
+캐시 키에는 해시 외에 결과에 영향을 주는 파라미터(언어, 아이템 수 등)를 variant로 포함합니다.
+
+설계 원칙:
+    - 해시 계산(디코딩)은 CPU 오프로드 풀에서 실행 (이벤트 루프 블로킹 금지)
+    - RULE-004: 해시 계산 실패 시 캐시를 우회하고 정상 분석
+    - RULE-007: 이미지 내용은 로깅하지 않음 (해시 접두/거리만 기록)
+    - 성공 결과만 저장 (실패/폴백 결과는 재시도 가능해야 함)
+
+환경변수:
+    - UW_VISION_CACHE: 캐시 활성화 (기본: "1")
+    - UW_VISION_CACHE_TTL_S: 엔트리 유효 시간 (기본: 1800초)
+    - UW_VISION_CACHE_MAX_ENTRIES: 캐시별 최대 엔트리 수 (기본: 256)
+    - UW_VISION_CACHE_MAX_DISTANCE: 거의 같은 이미지로 볼 최대 해밍 거리 (기본: 4, 0이면 정확 일치만)
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from unknown_world.storage.offload import get_offload_executor
+
+if TYPE_CHECKING:
+    from unknown_world.models.scanner import ScanResult
+    from unknown_world.services.agentic_vision import VisionAnalysisResult
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DHASH_SIZE = 8
+"""dHash 한 변 크기 (8 → 64bit 해시)."""
+
+DEFAULT_VISION_CACHE_TTL_SECONDS = 1800.0
+"""기본 엔트리 유효 시간 (초)."""
+
+DEFAULT_VISION_CACHE_MAX_ENTRIES = 256
+"""기본 캐시별 최대 엔트리 수."""
+
+DEFAULT_VISION_CACHE_MAX_DISTANCE = 4
+"""기본 최대 해밍 거리 (64bit 중)."""
+
+
+def is_vision_cache_enabled() -> bool:
+    """환경변수에서 캐시 활성화 여부를 읽습니다."""
+    return os.environ.get("UW_VISION_CACHE", "1").lower() not in ("0", "false", "no")
+
+
+def get_vision_cache_ttl_seconds() -> float:
+    """환경변수에서 엔트리 유효 시간을 읽습니다."""
+    return float(os.environ.get("UW_VISION_CACHE_TTL_S", str(DEFAULT_VISION_CACHE_TTL_SECONDS)))
+
+
+def get_vision_cache_max_entries() -> int:
+    """환경변수에서 최대 엔트리 수를 읽습니다."""
+    return max(
+        1,
+        int(os.environ.get("UW_VISION_CACHE_MAX_ENTRIES", str(DEFAULT_VISION_CACHE_MAX_ENTRIES))),
+    )
+
+
+def get_vision_cache_max_distance() -> int:
+    """환경변수에서 최대 해밍 거리를 읽습니다."""
+    return max(
+        0,
+        int(os.environ.get("UW_VISION_CACHE_MAX_DISTANCE", str(DEFAULT_VISION_CACHE_MAX_DISTANCE))),
+    )
+
+
+# =============================================================================
+# Perceptual hash
+# =============================================================================
+
+
+def compute_perceptual_hash(content: bytes) -> int:
+    """이미지의 dHash(difference hash)를 계산합니다.
+
+    EXIF 방향을 적용한 흑백 9x8 축소본에서 가로로 인접한 픽셀의 밝기 증감을 비트로 기록합니다.
+    재인코딩/리사이즈/경미한 압축 차이에는 거의 변하지 않습니다.
+    블로킹 함수이므로 compute_perceptual_hash_async()를 통해 호출합니다.
+
+    Args:
+        content: 이미지 바이트
+
+    Returns:
+        int: 64bit 해시
+
+    Raises:
+        OSError/ValueError: 디코딩 실패 시
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(content)) as img:
+        # JPEG는 DCT 스케일링으로 축소 디코딩 (전체 해상도 디코딩 회피)
+        img.draft("L", (DHASH_SIZE * 8, DHASH_SIZE * 8))
+        small = (
+            ImageOps.exif_transpose(img)
+            .convert("L")
+            .resize((DHASH_SIZE + 1, DHASH_SIZE), Image.Resampling.BILINEAR)  # type: ignore[reportUnknownMemberType]
+        )
+
+    pixels = small.tobytes()
+    width = DHASH_SIZE + 1
+    bits = 0
+    for row in range(DHASH_SIZE):
+        offset = row * width
+        for col in range(DHASH_SIZE):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return bits
+
+
+async def compute_perceptual_hash_async(content: bytes) -> int | None:
+    """CPU 오프로드 풀에서 perceptual hash를 계산합니다.
+
+    Returns:
+        int | None: 64bit 해시 (디코딩 실패 시 None → 캐시 우회)
+    """
+    try:
+        return await get_offload_executor().run_cpu(compute_perceptual_hash, content)
+    except Exception as e:
+        logger.debug(
+            "[VisionCache] Perceptual hash failed, bypassing cache",
+            extra={"error_type": type(e).__name__},
+        )
+        return None
+
+
+# =============================================================================
+# 결과 캐시
+# =============================================================================
+
+
+@dataclass
+class _CacheEntry[T]:
+    image_hash: int
+    variant: str
+    value: T
+    expires_at: float
+
+
+class VisionResultCache[T]:
+    """perceptual hash 기반 TTL/LRU 결과 캐시.
+
+    값은 저장/반환 시 깊은 복사되므로 호출자가 반환값을 수정해도 캐시에 영향이 없습니다.
+    이벤트 루프 스레드에서만 사용합니다 (해시 계산만 오프로드).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        max_distance: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """VisionResultCache를 초기화합니다.
+
+        Args:
+            name: 로그/지표용 캐시 이름
+            ttl_seconds: 엔트리 유효 시간 (기본: 환경변수 UW_VISION_CACHE_TTL_S)
+            max_entries: 최대 엔트리 수 (기본: 환경변수 UW_VISION_CACHE_MAX_ENTRIES)
+            max_distance: 최대 해밍 거리 (기본: 환경변수 UW_VISION_CACHE_MAX_DISTANCE)
+            clock: 단조 시계 (테스트 주입용)
+        """
+        self._name = name
+        self._ttl = ttl_seconds if ttl_seconds is not None else get_vision_cache_ttl_seconds()
+        self._max_entries = max_entries or get_vision_cache_max_entries()
+        self._max_distance = (
+            max_distance if max_distance is not None else get_vision_cache_max_distance()
+        )
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, int], _CacheEntry[T]] = OrderedDict()
+        self._hits = 0
+        self._near_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, image_hash: int, variant: str = "") -> T | None:
+        """해시가 같거나 충분히 가까운 이미지의 결과를 반환합니다.
+
+        Args:
+            image_hash: 이미지 perceptual hash
+            variant: 결과에 영향을 주는 파라미터 (예: "ko-KR:2")
+
+        Returns:
+            캐시된 결과의 복사본 또는 None
+        """
+        now = self._clock()
+        self._purge_expired(now)
+
+        entry = self._entries.get((variant, image_hash))
+        distance = 0
+        if entry is None and self._max_distance > 0:
+            best: tuple[int, _CacheEntry[T]] | None = None
+            for candidate in self._entries.values():
+                if candidate.variant != variant:
+                    continue
+                d = (candidate.image_hash ^ image_hash).bit_count()
+                if d <= self._max_distance and (best is None or d < best[0]):
+                    best = (d, candidate)
+            if best is not None:
+                distance, entry = best
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end((entry.variant, entry.image_hash))
+        if distance:
+            self._near_hits += 1
+        else:
+            self._hits += 1
+        logger.info(
+            "[VisionCache] Cache hit",
+            extra={
+                "cache": self._name,
+                "hash_prefix": f"{image_hash:016x}"[:8],
+                "distance": distance,
+            },
+        )
+        return copy.deepcopy(entry.value)
+
+    def put(self, image_hash: int, value: T, variant: str = "") -> None:
+        """결과를 저장합니다 (가득 차면 가장 오래 사용되지 않은 엔트리 제거)."""
+        key = (variant, image_hash)
+        self._entries[key] = _CacheEntry(
+            image_hash=image_hash,
+            variant=variant,
+            value=copy.deepcopy(value),
+            expires_at=self._clock() + self._ttl,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """모든 엔트리를 제거합니다."""
+        self._entries.clear()
+
+    def _purge_expired(self, now: float) -> None:
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self._evictions += len(expired)
+
+    def get_stats(self) -> dict[str, float | int | str]:
+        """캐시 지표를 반환합니다."""
+        lookups = self._hits + self._near_hits + self._misses
+        return {
+            "name": self._name,
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl,
+            "max_distance": self._max_distance,
+            "hits": self._hits,
+            "near_hits": self._near_hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": (round((self._hits + self._near_hits) / lookups, 3) if lookups else 0.0),
+        }
+
+
+# =============================================================================
+# 싱글톤 인스턴스
+# =============================================================================
+
+_scan_cache: VisionResultCache[ScanResult] | None = None
+_scene_cache: VisionResultCache[VisionAnalysisResult] | None = None
+
+
+def get_scan_result_cache() -> VisionResultCache[ScanResult] | None:
+    """Scanner(ScanResult) 캐시를 반환합니다 (비활성화 시 None)."""
+    global _scan_cache
+
+    if not is_vision_cache_enabled():
+        return None
+    if _scan_cache is None:
+        _scan_cache = VisionResultCache("scan")
+    return _scan_cache
+
+
+def get_scene_analysis_cache() -> VisionResultCache[VisionAnalysisResult] | None:
+    """Agentic Vision(VisionAnalysisResult) 캐시를 반환합니다 (비활성화 시 None)."""
+    global _scene_cache
+
+    if not is_vision_cache_enabled():
+        return None
+    if _scene_cache is None:
+        _scene_cache = VisionResultCache("scene")
+    return _scene_cache
+
+
+def reset_vision_result_caches() -> None:
+    """비전 결과 캐시를 초기화합니다."""
+    global _scan_cache, _scene_cache
+    _scan_cache = None
+    _scene_cache = None
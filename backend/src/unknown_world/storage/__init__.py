@@ -9,20 +9,37 @@ MVP: LocalStorage, MMP: GCSStorage(예정)
 """
 
 from unknown_world.storage.local_storage import LocalStorage
+from unknown_world.storage.offload import (
+    OffloadExecutor,
+    OffloadKind,
+    get_offload_executor,
+    read_bytes_if_exists,
+    reset_offload_executor,
+)
 from unknown_world.storage.paths import (
     ARTIFACTS_SUBDIR,
     BASE_DATA_DIR,
     DEFAULT_IMAGE_EXTENSION,
+    IMAGE_VARIANT_FULL,
+    IMAGE_VARIANT_MAX_WIDTHS,
+    IMAGE_VARIANT_MEDIUM,
+    IMAGE_VARIANT_ORDER,
+    IMAGE_VARIANT_THUMB,
     IMAGES_GENERATED_SUBDIR,
     IMAGES_UPLOADED_SUBDIR,
     LEGACY_OUTPUT_DIR,
     STATIC_IMAGES_URL_PREFIX,
     STATIC_URL_PREFIX,
+    VARIANT_IMAGE_EXTENSION,
     build_image_url,
+    build_image_variant_url,
     build_legacy_image_url,
+    build_variant_filename,
     get_artifacts_dir,
     get_generated_images_dir,
+    get_source_image_filename,
     get_uploaded_images_dir,
+    select_image_variant,
 )
 from unknown_world.storage.storage import (
     PutResult,
@@ -55,6 +72,12 @@ __all__ = [
     "StorageMetadata",
     "get_storage",
     "reset_storage",
+    # Offload (이미지 코덱/파일 I/O 워커 풀)
+    "OffloadExecutor",
+    "OffloadKind",
+    "get_offload_executor",
+    "read_bytes_if_exists",
+    "reset_offload_executor",
     # Paths (RU-006-Q5)
     "ARTIFACTS_SUBDIR",
     "BASE_DATA_DIR",
@@ -69,6 +92,17 @@ __all__ = [
     "get_artifacts_dir",
     "get_generated_images_dir",
     "get_uploaded_images_dir",
+    # Image variants (WebP/AVIF 크기 티어)
+    "IMAGE_VARIANT_FULL",
+    "IMAGE_VARIANT_MAX_WIDTHS",
+    "IMAGE_VARIANT_MEDIUM",
+    "IMAGE_VARIANT_ORDER",
+    "IMAGE_VARIANT_THUMB",
+    "VARIANT_IMAGE_EXTENSION",
+    "build_image_variant_url",
+    "build_variant_filename",
+    "get_source_image_filename",
+    "select_image_variant",
     # Validation constants
     "ALLOWED_IMAGE_MIME_TYPES",
     "BBOX_MAX",
@@ -15,6 +15,7 @@ import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 
+from unknown_world.storage.offload import get_offload_executor, read_bytes_if_exists
 from unknown_world.storage.paths import (
     ARTIFACTS_SUBDIR,
     BASE_DATA_DIR,
@@ -39,6 +40,20 @@ CATEGORY_DIRS: dict[StorageCategory, str] = {
 }
 
 
+def _write_file(file_path: Path, data: bytes) -> None:
+    """상위 디렉토리를 보장하고 파일을 씁니다 (run_io 대상)."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(data)
+
+
+def _delete_file(file_path: Path) -> bool:
+    """파일이 존재하면 삭제합니다 (run_io 대상)."""
+    if not file_path.exists():
+        return False
+    file_path.unlink()
+    return True
+
+
 class LocalStorage(StorageInterface):
     """로컬 파일 시스템 스토리지.
 
@@ -105,10 +120,9 @@ class LocalStorage(StorageInterface):
             # 키 및 경로 생성
             key = self._generate_key(category, file_id, extension)
             file_path = self._base_dir / key
-            file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # 파일 저장
-            file_path.write_bytes(data)
+            # 파일 저장 (이벤트 루프 블로킹 방지: I/O 풀에서 실행)
+            await get_offload_executor().run_io(_write_file, file_path, data)
 
             # URL 생성
             url = self.get_url(key)
@@ -156,22 +170,17 @@ class LocalStorage(StorageInterface):
     async def get(self, key: str) -> bytes | None:
         """파일을 조회합니다."""
         file_path = self._base_dir / key
-        if not file_path.exists():
-            return None
-        return file_path.read_bytes()
+        return await get_offload_executor().run_io(read_bytes_if_exists, file_path)
 
     async def exists(self, key: str) -> bool:
         """파일 존재 여부를 확인합니다."""
         file_path = self._base_dir / key
-        return file_path.exists()
+        return await get_offload_executor().run_io(file_path.exists)
 
     async def delete(self, key: str) -> bool:
         """파일을 삭제합니다."""
         file_path = self._base_dir / key
-        if not file_path.exists():
-            return False
-        file_path.unlink()
-        return True
+        return await get_offload_executor().run_io(_delete_file, file_path)
 
     def get_url(self, key: str) -> str:
         """파일 접근 URL을 반환합니다."""
@@ -0,0 +1,245 @@
+"""Unknown World - 블로킹 작업 오프로드 실행기.
+
+Pillow 인코딩/디코딩(CPU)과 파일 읽기/쓰기(I/O)를 이벤트 루프 밖의
+워커 스레드 풀에서 실행합니다. 이벤트 루프가 수십 ms 블로킹되면
+같은 워커의 모든 NDJSON 스트림이 멈추므로, 이미지 경로의 블로킹 작업은
+반드시 이 실행기를 거칩니다.
+
+설계 원칙:
+    - CPU 풀: 코덱 작업 (Pillow는 대부분의 인코딩/리사이즈에서 GIL 해제)
+    - I/O 풀: 파일 시스템 작업 (디스크 지연이 코덱 작업을 막지 않도록 분리)
+    - 큐 지표: 대기/실행 중 작업 수, 대기 시간(ms)을 풀별로 집계
+    - RULE-007: 파일 내용/경로는 지표에 포함하지 않음
+
+환경변수:
+    - UW_OFFLOAD_CPU_WORKERS: CPU 풀 워커 수 (기본: min(4, CPU 코어 수))
+    - UW_OFFLOAD_IO_WORKERS: I/O 풀 워커 수 (기본: 8)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+DEFAULT_IO_WORKERS = 8
+"""기본 I/O 풀 워커 수."""
+
+DEFAULT_MAX_CPU_WORKERS = 4
+"""CPU 풀 워커 수 상한 (기본값 계산용)."""
+
+
+def _get_cpu_workers() -> int:
+    """환경변수에서 CPU 풀 워커 수를 읽습니다."""
+    default = min(DEFAULT_MAX_CPU_WORKERS, os.cpu_count() or 1)
+    return max(1, int(os.environ.get("UW_OFFLOAD_CPU_WORKERS", str(default))))
+
+
+def _get_io_workers() -> int:
+    """환경변수에서 I/O 풀 워커 수를 읽습니다."""
+    return max(1, int(os.environ.get("UW_OFFLOAD_IO_WORKERS", str(DEFAULT_IO_WORKERS))))
+
+
+class OffloadKind(StrEnum):
+    """오프로드 작업 종류."""
+
+    CPU = "cpu"
+    """코덱/이미지 처리 (Pillow)"""
+
+    IO = "io"
+    """파일 시스템 읽기/쓰기"""
+
+
+# =============================================================================
+# 풀별 지표
+# =============================================================================
+
+
+class _PoolMetrics:
+    """스레드 풀 하나의 큐 지표 (스레드 안전)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.running = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.total_run_ms = 0.0
+
+    def on_submit(self) -> None:
+        with self._lock:
+            self.submitted += 1
+
+    def on_start(self, wait_ms: float) -> None:
+        with self._lock:
+            self.running += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def on_finish(self, run_ms: float, *, failed: bool) -> None:
+        with self._lock:
+            self.running -= 1
+            self.total_run_ms += run_ms
+            if failed:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            started = self.completed + self.failed + self.running
+            return {
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "running": self.running,
+                "queued": self.submitted - started,
+                "avg_wait_ms": round(self.total_wait_ms / started, 2) if started else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 2),
+                "avg_run_ms": (
+                    round(self.total_run_ms / (started - self.running), 2)
+                    if started - self.running
+                    else 0.0
+                ),
+            }
+
+
+# =============================================================================
+# 오프로드 실행기
+# =============================================================================
+
+
+class OffloadExecutor:
+    """CPU/I-O 블로킹 작업을 워커 스레드 풀에서 실행합니다.
+
+    Example:
+        >>> executor = get_offload_executor()
+        >>> await executor.run_io(path.write_bytes, data)
+        >>> png = await executor.run_cpu(encode_png, image)
+    """
+
+    def __init__(self, *, cpu_workers: int | None = None, io_workers: int | None = None) -> None:
+        """OffloadExecutor를 초기화합니다.
+
+        Args:
+            cpu_workers: CPU 풀 워커 수 (기본: 환경변수 UW_OFFLOAD_CPU_WORKERS)
+            io_workers: I/O 풀 워커 수 (기본: 환경변수 UW_OFFLOAD_IO_WORKERS)
+        """
+        self._workers = {
+            OffloadKind.CPU: cpu_workers or _get_cpu_workers(),
+            OffloadKind.IO: io_workers or _get_io_workers(),
+        }
+        self._pools = {
+            kind: ThreadPoolExecutor(max_workers=count, thread_name_prefix=f"uw-{kind.value}")
+            for kind, count in self._workers.items()
+        }
+        self._metrics = {kind: _PoolMetrics() for kind in OffloadKind}
+
+        logger.info(
+            "[Offload] Executor initialized",
+            extra={
+                "cpu_workers": self._workers[OffloadKind.CPU],
+                "io_workers": self._workers[OffloadKind.IO],
+            },
+        )
+
+    async def run[**P, T](
+        self, kind: OffloadKind, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """블로킹 함수를 지정된 풀에서 실행하고 결과를 기다립니다.
+
+        Args:
+            kind: 작업 종류 (CPU/IO)
+            fn: 실행할 블로킹 함수
+            *args: 위치 인자
+            **kwargs: 키워드 인자
+
+        Returns:
+            fn의 반환값 (예외는 그대로 전파)
+        """
+        metrics = self._metrics[kind]
+        submitted_at = time.perf_counter()
+
+        def _instrumented() -> T:
+            started_at = time.perf_counter()
+            metrics.on_start((started_at - submitted_at) * 1000)
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                metrics.on_finish((time.perf_counter() - started_at) * 1000, failed=failed)
+
+        metrics.on_submit()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pools[kind], _instrumented)
+
+    async def run_cpu[**P, T](self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        """코덱/이미지 처리 작업을 CPU 풀에서 실행합니다."""
+        return await self.run(OffloadKind.CPU, fn, *args, **kwargs)
+
+    async def run_io[**P, T](self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        """파일 시스템 작업을 I/O 풀에서 실행합니다."""
+        return await self.run(OffloadKind.IO, fn, *args, **kwargs)
+
+    def get_stats(self) -> dict[str, dict[str, float | int]]:
+        """풀별 큐 지표를 반환합니다."""
+        return {
+            kind.value: {"workers": self._workers[kind], **self._metrics[kind].snapshot()}
+            for kind in OffloadKind
+        }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """워커 풀을 종료합니다."""
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
+
+
+# =============================================================================
+# 블로킹 파일 헬퍼 (run_io 대상)
+# =============================================================================
+
+
+def read_bytes_if_exists(path: Path) -> bytes | None:
+    """파일이 존재하면 바이트를 읽어 반환합니다 (존재 확인 + 읽기를 한 번에 오프로드)."""
+    if not path.exists():
+        return None
+    return path.read_bytes()
+
+
+# =============================================================================
+# 싱글톤 인스턴스
+# =============================================================================
+
+_executor_instance: OffloadExecutor | None = None
+
+
+def get_offload_executor() -> OffloadExecutor:
+    """OffloadExecutor 싱글톤 인스턴스를 반환합니다."""
+    global _executor_instance
+    if _executor_instance is None:
+        _executor_instance = OffloadExecutor()
+    return _executor_instance
+
+
+def reset_offload_executor() -> None:
+    """싱글톤을 종료/리셋합니다 (서버 종료 및 테스트용)."""
+    global _executor_instance
+    if _executor_instance is not None:
+        _executor_instance.shutdown(wait=False)
+    _executor_instance = None
@@ -12,8 +12,12 @@ MMP: GCS 버킷 경로로 확장 예정
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from pathlib import Path
-from typing import Final
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from unknown_world.models.turn import ClientInfo
 
 # =============================================================================
 # 기본 디렉토리 (MVP: 로컬)
@@ -57,7 +61,36 @@ STATIC_IMAGES_URL_PREFIX: Final[str] = f"{STATIC_URL_PREFIX}/images"
 # =============================================================================
 
 DEFAULT_IMAGE_EXTENSION: Final[str] = "png"
-"""기본 이미지 파일 확장자."""
+"""기본 이미지 파일 확장자 (원본, Gemini 참조 이미지 파이프라인용)."""
+
+VARIANT_IMAGE_EXTENSION: Final[str] = "webp"
+"""서빙용 변형(variant) 이미지 기본 확장자."""
+
+# =============================================================================
+# 이미지 변형(variant) 티어
+# =============================================================================
+
+IMAGE_VARIANT_THUMB: Final[str] = "thumb"
+"""썸네일 변형 (모바일/좁은 뷰포트)."""
+
+IMAGE_VARIANT_MEDIUM: Final[str] = "medium"
+"""중간 크기 변형 (노트북/일반 데스크톱)."""
+
+IMAGE_VARIANT_FULL: Final[str] = "full"
+"""원본 해상도 변형 (고해상도 뷰포트)."""
+
+IMAGE_VARIANT_MAX_WIDTHS: Final[dict[str, int]] = {
+    IMAGE_VARIANT_THUMB: 480,
+    IMAGE_VARIANT_MEDIUM: 1280,
+}
+"""축소 변형별 최대 너비 (px). full은 원본 너비를 유지합니다."""
+
+IMAGE_VARIANT_ORDER: Final[tuple[str, ...]] = (
+    IMAGE_VARIANT_THUMB,
+    IMAGE_VARIANT_MEDIUM,
+    IMAGE_VARIANT_FULL,
+)
+"""작은 것부터 큰 순서의 변형 목록."""
 
 # =============================================================================
 # 경로 헬퍼 함수
@@ -96,6 +129,103 @@ def build_image_url(
     return f"{STATIC_URL_PREFIX}/images/{category}/{filename}"
 
 
+def build_variant_filename(
+    image_id: str,
+    variant: str,
+    *,
+    extension: str = VARIANT_IMAGE_EXTENSION,
+) -> str:
+    """변형 이미지 파일명을 생성합니다.
+
+    Args:
+        image_id: 이미지 ID (예: img_abc123)
+        variant: 변형 이름 (thumb/medium/full)
+        extension: 파일 확장자 (webp/avif)
+
+    Returns:
+        파일명 (예: img_abc123.medium.webp, full은 img_abc123.webp)
+    """
+    if variant == IMAGE_VARIANT_FULL:
+        return f"{image_id}.{extension}"
+    return f"{image_id}.{variant}.{extension}"
+
+
+def get_source_image_filename(filename: str) -> str:
+    """변형 파일명에서 원본(PNG) 파일명을 복원합니다.
+
+    참조 이미지/비전 분석은 항상 원본을 사용해야 하므로,
+    클라이언트가 변형 URL을 되돌려 보내도 원본으로 매핑합니다.
+
+    Args:
+        filename: 파일명 (예: img_abc123.medium.webp)
+
+    Returns:
+        원본 파일명 (예: img_abc123.png)
+    """
+    image_id = filename.split(".", 1)[0]
+    return f"{image_id}.{DEFAULT_IMAGE_EXTENSION}"
+
+
+def select_image_variant(
+    client: ClientInfo | None,
+    available: Collection[str],
+) -> str | None:
+    """클라이언트 뷰포트에 맞는 변형을 선택합니다.
+
+    뷰포트 너비 이상인 가장 작은 변형을 고르고, 없으면 가장 큰 변형을 고릅니다.
+
+    Args:
+        client: 클라이언트 정보 (None이면 선택하지 않음)
+        available: 실제로 생성된 변형 이름 목록
+
+    Returns:
+        변형 이름 또는 None (클라이언트 정보/변형이 없는 경우)
+    """
+    if client is None:
+        return None
+
+    candidates = [v for v in IMAGE_VARIANT_ORDER if v in available]
+    if not candidates:
+        return None
+
+    for variant in candidates:
+        max_width = IMAGE_VARIANT_MAX_WIDTHS.get(variant)
+        if max_width is not None and max_width >= client.viewport_w:
+            return variant
+    return candidates[-1]
+
+
+def build_image_variant_url(
+    image_id: str,
+    *,
+    client: ClientInfo | None,
+    available: Collection[str],
+    extension: str = VARIANT_IMAGE_EXTENSION,
+    category: str = "generated",
+) -> str:
+    """클라이언트 뷰포트에 맞는 변형 이미지 URL을 생성합니다.
+
+    클라이언트 정보나 변형이 없으면 원본 PNG URL을 반환합니다 (하위 호환).
+
+    Args:
+        image_id: 이미지 ID
+        client: 클라이언트 정보 (TurnInput.client)
+        available: 실제로 생성된 변형 이름 목록
+        extension: 변형 파일 확장자 (webp/avif)
+        category: 이미지 카테고리
+
+    Returns:
+        서빙 URL (예: /static/images/generated/img_abc123.medium.webp)
+    """
+    variant = select_image_variant(client, available)
+    if variant is None:
+        return build_image_url(f"{image_id}.{DEFAULT_IMAGE_EXTENSION}", category=category)
+    return build_image_url(
+        build_variant_filename(image_id, variant, extension=extension),
+        category=category,
+    )
+
+
 def build_legacy_image_url(filename: str) -> str:
     """[Deprecated] 레거시 이미지 URL을 생성합니다.
 
@@ -17,6 +17,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from unknown_world.storage.offload import get_offload_executor
 from unknown_world.storage.paths import get_generated_images_dir
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,8 @@ def seed_scene_images() -> None:
     - 프론트엔드 WebP → 백엔드 PNG 변환 (Pillow 사용)
     - 이미 존재하고 원본보다 새로우면 건너뜀 (멱등)
     - 원본 미존재 또는 Pillow 오류 시 경고만 출력 (서버 시작 차단 금지)
+
+    블로킹 함수이므로 비동기 컨텍스트에서는 seed_scene_images_async()를 사용합니다.
     """
     dest_dir = get_generated_images_dir()
     dest_dir.mkdir(parents=True, exist_ok=True)
@@ -90,3 +93,11 @@ def seed_scene_images() -> None:
         "[Seed] Scene image seeding complete",
         extra={"converted": converted, "skipped": skipped, "total": len(_SCENE_IMAGE_IDS)},
     )
+
+
+async def seed_scene_images_async() -> None:
+    """seed_scene_images()를 CPU 오프로드 풀에서 실행합니다.
+
+    WebP 디코딩/PNG 인코딩이 이벤트 루프를 블로킹하지 않도록 lifespan에서 사용합니다.
+    """
+    await get_offload_executor().run_cpu(seed_scene_images)
@@ -0,0 +1,291 @@
+"""Unknown World - 스트리밍 이미지 업로드 리더.
+
+FastAPI의 UploadFile/Form 파라미터는 핸들러 실행 전에 multipart 본문 전체를 수신·스풀링하므로,
+크기 초과/비이미지 업로드도 전부 받은 뒤에야 거부됩니다. 이 모듈은 요청 본문을 청크 단위로
+파싱하면서 다음을 수행합니다.
+
+    1. Content-Length 선검사 (선언 크기가 상한을 넘으면 본문을 읽지 않고 거부)
+    2. 파일 파트 헤더 수신 직후 선언 MIME 검사 + 첫 바이트 매직 스니핑
+    3. 누적 크기 증분 검사 (상한 초과 시 즉시 중단)
+
+파일 데이터는 메모리 버퍼에 모읍니다. 후속 단계(검증/원본 저장/해시/전처리/비전 호출)가
+모두 bytes를 받으므로 스풀 파일은 최대 메모리를 줄이지 못하며, 이 모듈의 이점은
+상한(MAX_IMAGE_FILE_SIZE_BYTES) 위반/비이미지 업로드를 본문 수신 도중 거부하는 데 있습니다.
+
+MIME 판별 규칙:
+    - 매직 바이트로 지원 형식이 확인되면 그 타입을 사용 (잘못 선언된/octet-stream 업로드 보정)
+    - 확인되지 않으면 선언 MIME이 지원 형식일 때만 허용 (디코딩 실패는 분석 단계 폴백이 처리)
+
+설계 원칙:
+    - RULE-004: 거부 사유는 UploadRejectedError로 전달 (API 계층이 안전한 실패 응답으로 변환)
+    - RULE-007: 파일 내용은 로깅하지 않음
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING, Final
+
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from unknown_world.storage.validation import (
+    ALLOWED_IMAGE_MIME_TYPES,
+    IMAGE_SNIFF_BYTES,
+    MAX_IMAGE_FILE_SIZE_BYTES,
+    sniff_image_mime_type,
+)
+
+if TYPE_CHECKING:
+    from python_multipart.multipart import MultipartCallbacks
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# 상수 정의
+# =============================================================================
+
+MULTIPART_OVERHEAD_BYTES: Final[int] = 64 * 1024
+"""파일 외 multipart 본문(경계/헤더/텍스트 필드)에 허용하는 여유 크기."""
+
+MAX_FORM_FIELD_BYTES: Final[int] = 4 * 1024
+"""텍스트 필드 하나의 최대 크기."""
+
+
+class UploadRejection(StrEnum):
+    """업로드 거부 사유."""
+
+    UNSUPPORTED_TYPE = "unsupported_type"
+    """지원하지 않는 이미지 형식"""
+
+    TOO_LARGE = "too_large"
+    """크기 상한 초과"""
+
+    MISSING_FILE = "missing_file"
+    """파일 파트 없음"""
+
+    MALFORMED = "malformed"
+    """multipart 본문 파싱 실패"""
+
+
+class UploadRejectedError(Exception):
+    """업로드가 스트리밍 도중 거부되었음을 나타내는 예외.
+
+    Attributes:
+        reason: 거부 사유
+        content_type: 선언 MIME 타입 (형식 거부 시)
+        size_bytes: 선언/관측 크기 (크기 거부 시, 모르면 None)
+    """
+
+    def __init__(
+        self,
+        reason: UploadRejection,
+        *,
+        content_type: str | None = None,
+        size_bytes: int | None = None,
+    ) -> None:
+        super().__init__(reason.value)
+        self.reason = reason
+        self.content_type = content_type
+        self.size_bytes = size_bytes
+
+
+@dataclass
+class StreamedUpload:
+    """스트리밍으로 수신한 이미지 업로드.
+
+    Attributes:
+        content: 파일 바이트
+        content_type: 매직 바이트로 확인한 MIME (확인 불가 시 선언 MIME)
+        filename: 클라이언트 파일명
+        fields: 텍스트 폼 필드
+    """
+
+    content: bytes
+    content_type: str
+    filename: str | None
+    fields: dict[str, str] = field(default_factory=lambda: {})
+
+
+# =============================================================================
+# multipart 파서 상태
+# =============================================================================
+
+
+class _ImageUploadParser:
+    """python-multipart 콜백으로 파일/필드 파트를 수집합니다 (콜백은 동기 실행)."""
+
+    def __init__(self, file_field: str, max_bytes: int) -> None:
+        self._file_field = file_field
+        self._max_bytes = max_bytes
+        self.fields: dict[str, str] = {}
+        self.filename: str | None = None
+        self.declared_type = "application/octet-stream"
+        self.sniffed_type: str | None = None
+        self.file_seen = False
+        self.file_size = 0
+        self.content = bytearray()
+        self._head = b""
+        self._header_name = b""
+        self._header_value = b""
+        self._headers: dict[bytes, bytes] = {}
+        self._part: str | None = None  # "file" | "field" | "skip"
+        self._field_name = ""
+        self._field_data = bytearray()
+
+    def callbacks(self) -> MultipartCallbacks:
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._part = None
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        if b"filename" not in options:
+            self._part = "field"
+            self._field_name = name
+            self._field_data = bytearray()
+            return
+
+        if name != self._file_field or self.file_seen:
+            self._part = "skip"  # 대상 외 파일 파트는 버림 (본문 총량 상한은 유지)
+            return
+
+        self._part = "file"
+        self.file_seen = True
+        self.filename = options[b"filename"].decode("utf-8", "replace")
+        declared = self._headers.get(b"content-type", b"").decode("latin-1").strip()
+        self.declared_type = declared or "application/octet-stream"
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._part == "field":
+            if len(self._field_data) + (end - start) > MAX_FORM_FIELD_BYTES:
+                raise UploadRejectedError(UploadRejection.MALFORMED)
+            self._field_data += data[start:end]
+            return
+        if self._part != "file":
+            return
+
+        chunk = data[start:end]
+        self.file_size += len(chunk)
+        if self.file_size > self._max_bytes:
+            raise UploadRejectedError(UploadRejection.TOO_LARGE)
+
+        if self.sniffed_type is None and len(self._head) < IMAGE_SNIFF_BYTES:
+            self._head += chunk[: IMAGE_SNIFF_BYTES - len(self._head)]
+            if len(self._head) >= IMAGE_SNIFF_BYTES:
+                self._check_type()
+        self.content += chunk
+
+    def _on_part_end(self) -> None:
+        if self._part == "field":
+            self.fields[self._field_name] = self._field_data.decode("utf-8", "replace")
+        elif self._part == "file" and self.sniffed_type is None:
+            self._check_type()  # IMAGE_SNIFF_BYTES보다 짧은 파일
+        self._part = None
+
+    def _check_type(self) -> None:
+        """매직 바이트 + 선언 MIME으로 형식을 확정합니다 (지원 형식이 아니면 즉시 거부)."""
+        sniffed = sniff_image_mime_type(self._head)
+        if sniffed is None and self.declared_type.lower() not in ALLOWED_IMAGE_MIME_TYPES:
+            raise UploadRejectedError(
+                UploadRejection.UNSUPPORTED_TYPE, content_type=self.declared_type
+            )
+        self.sniffed_type = sniffed or self.declared_type
+
+
+# =============================================================================
+# 스트리밍 리더
+# =============================================================================
+
+
+async def read_image_upload(
+    headers: Mapping[str, str],
+    stream: AsyncIterator[bytes],
+    *,
+    file_field: str = "file",
+    max_bytes: int = MAX_IMAGE_FILE_SIZE_BYTES,
+) -> StreamedUpload:
+    """multipart 본문을 스트리밍으로 읽어 이미지 파일 하나와 텍스트 필드를 반환합니다.
+
+    Args:
+        headers: 요청 헤더 (content-type, content-length)
+        stream: 요청 본문 청크 스트림 (예: request.stream())
+        file_field: 이미지 파일 필드 이름
+        max_bytes: 파일 최대 크기
+
+    Returns:
+        StreamedUpload: 수신한 업로드
+
+    Raises:
+        UploadRejectedError: 형식/크기/본문 문제로 거부된 경우 (본문 나머지는 읽지 않음)
+    """
+    max_body = max_bytes + MULTIPART_OVERHEAD_BYTES
+    content_length = headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_body:
+        raise UploadRejectedError(UploadRejection.TOO_LARGE, size_bytes=int(content_length))
+
+    _, params = parse_options_header(headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if not boundary:
+        raise UploadRejectedError(UploadRejection.MALFORMED)
+
+    state = _ImageUploadParser(file_field, max_bytes)
+    parser = MultipartParser(boundary, state.callbacks())
+    body_size = 0
+
+    try:
+        async for chunk in stream:
+            body_size += len(chunk)
+            if body_size > max_body:
+                raise UploadRejectedError(UploadRejection.TOO_LARGE)
+            try:
+                parser.write(chunk)
+            except UploadRejectedError:
+                raise
+            except Exception as e:
+                raise UploadRejectedError(UploadRejection.MALFORMED) from e
+
+        try:
+            parser.finalize()
+        except Exception as e:
+            raise UploadRejectedError(UploadRejection.MALFORMED) from e
+
+        if not state.file_seen:
+            raise UploadRejectedError(UploadRejection.MISSING_FILE)
+    except UploadRejectedError as e:
+        logger.info(
+            "[UploadStream] Upload rejected",
+            extra={"reason": e.reason.value, "received_kb": body_size // 1024},
+        )
+        raise
+
+    return StreamedUpload(
+        content=bytes(state.content),
+        content_type=state.sniffed_type or state.declared_type,
+        filename=state.filename,
+        fields=state.fields,
+    )
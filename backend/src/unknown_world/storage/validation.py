@@ -38,6 +38,9 @@ MAX_IMAGE_FILE_SIZE_BYTES: Final[int] = 20 * 1024 * 1024  # 20MB
 MIN_IMAGE_FILE_SIZE_BYTES: Final[int] = 100
 """최소 이미지 파일 크기 (손상 파일 감지용)."""
 
+IMAGE_SNIFF_BYTES: Final[int] = 12
+"""MIME 판별(매직 바이트)에 필요한 헤더 길이."""
+
 # =============================================================================
 # 이미지 생성 제한
 # =============================================================================
@@ -96,6 +99,49 @@ BBOX_MAX: Final[int] = 1000
 # =============================================================================
 
 
+def sniff_image_mime_type(header: bytes) -> str | None:
+    """헤더 매직 바이트로 이미지 MIME 타입을 판별합니다.
+
+    Args:
+        header: 파일 앞부분 (IMAGE_SNIFF_BYTES 이상 권장)
+
+    Returns:
+        판별된 MIME 타입 (지원 형식이 아니면 None)
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def unsupported_image_format_message(content_type: str, language: Language) -> str:
+    """지원하지 않는 형식 에러 메시지."""
+    if language == Language.KO:
+        return f"지원하지 않는 이미지 형식입니다: {content_type}"
+    return f"Unsupported image format: {content_type}"
+
+
+def image_too_large_message(size_bytes: int | None, language: Language) -> str:
+    """크기 초과 에러 메시지 (스트리밍 중단 시 전체 크기를 모르면 size_bytes=None)."""
+    max_mb = MAX_IMAGE_FILE_SIZE_BYTES // (1024 * 1024)
+    is_ko = language == Language.KO
+    if size_bytes is None:
+        return (
+            f"파일이 너무 큽니다 (최대 {max_mb}MB)" if is_ko else f"File too large (max {max_mb}MB)"
+        )
+    size_mb = size_bytes / (1024 * 1024)
+    return (
+        f"파일이 너무 큽니다: {size_mb:.1f}MB (최대 {max_mb}MB)"
+        if is_ko
+        else f"File too large: {size_mb:.1f}MB (max {max_mb}MB)"
+    )
+
+
 def validate_image_upload(
     content: bytes,
     content_type: str,
@@ -116,20 +162,11 @@ def validate_image_upload(
 
     # MIME 타입 검증
     if content_type.lower() not in ALLOWED_IMAGE_MIME_TYPES:
-        return (
-            f"지원하지 않는 이미지 형식입니다: {content_type}"
-            if is_ko
-            else f"Unsupported image format: {content_type}"
-        )
+        return unsupported_image_format_message(content_type, language)
 
     # 파일 크기 검증 (최대)
     if len(content) > MAX_IMAGE_FILE_SIZE_BYTES:
-        size_mb = len(content) / (1024 * 1024)
-        return (
-            f"파일이 너무 큽니다: {size_mb:.1f}MB (최대 20MB)"
-            if is_ko
-            else f"File too large: {size_mb:.1f}MB (max 20MB)"
-        )
+        return image_too_large_message(len(content), language)
 
     # 파일 크기 검증 (최소 - 손상 파일 감지)
     if len(content) < MIN_IMAGE_FILE_SIZE_BYTES:
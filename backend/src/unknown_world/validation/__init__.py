@@ -4,8 +4,12 @@
 """
 
 from unknown_world.validation.business_rules import (
+    BusinessRuleEngine,
     BusinessRuleError,
     BusinessRuleValidationResult,
+    RuleContext,
+    create_default_engine,
+    get_business_rule_engine,
     validate_business_rules,
 )
 from unknown_world.validation.language_gate import (
@@ -17,12 +21,21 @@ from unknown_world.validation.language_gate import (
     measure_language_ratio,
     validate_language_consistency,
 )
+from unknown_world.validation.traversal import NodeKind, ValidationNode, iter_validation_nodes
 
 __all__ = [
     # Business Rules
+    "BusinessRuleEngine",
     "BusinessRuleError",
     "BusinessRuleValidationResult",
+    "RuleContext",
+    "create_default_engine",
+    "get_business_rule_engine",
     "validate_business_rules",
+    # Traversal
+    "NodeKind",
+    "ValidationNode",
+    "iter_validation_nodes",
     # Language Gate (U-043)
     "MIXED_THRESHOLD_RATIO",
     "LanguageGateResult",
@@ -6,6 +6,10 @@
 - Box2D: 0~1000 범위 + [ymin,xmin,ymax,xmax] 순서 검증
 - Safety: blocked 시 안전한 대체 결과 제공 확인
 
+검증 엔진:
+    - TurnOutput을 한 번만 순회(iter_validation_nodes)하며 노드 종류별 등록 규칙을 디스패치
+    - 모든 위반은 필드 경로와 함께 보고 (fail_fast 설정 시 첫 위반에서 중단)
+
 설계 원칙:
     - RULE-003: 구조화 출력(JSON Schema) 우선 + 이중 검증
     - RULE-004: 검증 실패 시 Repair loop + 안전한 폴백
@@ -21,9 +25,10 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from unknown_world.config.economy import (
     MAX_CREDIT,
@@ -34,11 +39,12 @@ from unknown_world.models.turn import Language
 from unknown_world.validation.language_gate import (
     LanguageGateResult,
     build_language_error_summary,
-    validate_language_consistency,
+    is_language_mixed,
 )
+from unknown_world.validation.traversal import NodeKind, ValidationNode, iter_validation_nodes
 
 if TYPE_CHECKING:
-    from unknown_world.models.turn import TurnInput, TurnOutput
+    from unknown_world.models.turn import SceneObject, TurnInput, TurnOutput
 
 # =============================================================================
 # 로거 설정
@@ -149,10 +155,12 @@ class BusinessRuleValidationResult:
     language: Language = Language.EN
     language_gate_result: LanguageGateResult | None = None
 
-    def add_error(self, error_type: BusinessRuleError, message: str) -> None:
-        """에러를 추가합니다."""
+    def add_error(
+        self, error_type: BusinessRuleError, message: str, *, field_path: str = ""
+    ) -> None:
+        """에러를 추가합니다 (field_path: 위반 필드 경로, 예: "ui.objects[0].box_2d")."""
         self.is_valid = False
-        self.errors.append({"type": error_type.value, "message": message})
+        self.errors.append({"type": error_type.value, "message": message, "field": field_path})
 
     def build_summary(self) -> str:
         """에러 요약을 생성합니다 (Repair 프롬프트용).
@@ -179,16 +187,48 @@ class BusinessRuleValidationResult:
 
 
 # =============================================================================
-# 개별 검증 함수
+# 규칙 실행 컨텍스트
 # =============================================================================
 
 
-def _validate_economy(
-    turn_input: TurnInput,
-    turn_output: TurnOutput,
-    result: BusinessRuleValidationResult,
-) -> None:
-    """Economy 규칙을 검증합니다 (RULE-005).
+@dataclass
+class RuleContext:
+    """규칙 함수가 공유하는 단일 순회 상태.
+
+    Attributes:
+        turn_input: 검증 기준 TurnInput
+        turn_output: 검증 대상 TurnOutput
+        result: 위반을 누적하는 검증 결과
+        language_gate: 텍스트 노드별 언어 혼합 위반 누적 (순회 종료 후 에러로 집계)
+    """
+
+    turn_input: TurnInput
+    turn_output: TurnOutput
+    result: BusinessRuleValidationResult
+    language_gate: LanguageGateResult
+
+    @property
+    def messages(self) -> dict[str, str]:
+        """결과 언어의 에러 메시지 템플릿."""
+        return BUSINESS_RULE_MESSAGES[self.result.language]
+
+    @property
+    def has_violation(self) -> bool:
+        """지금까지 위반이 하나라도 발견되었는지 여부."""
+        return not (self.result.is_valid and self.language_gate.is_valid)
+
+
+BusinessRule = Callable[[RuleContext, ValidationNode], None]
+"""노드 하나를 검사해 ctx.result/ctx.language_gate에 위반을 기록하는 규칙 함수."""
+
+
+# =============================================================================
+# 개별 규칙
+# =============================================================================
+
+
+def _check_economy(ctx: RuleContext, node: ValidationNode) -> None:
+    """Economy 규칙을 검증합니다 (RULE-005, TURN 노드).
 
     검증 항목:
     - 잔액 음수 금지
@@ -196,9 +236,10 @@ def _validate_economy(
     - cost와 balance_after 일관성 (U-136: gains 반영)
     - gains 상한 초과 금지 (U-136: 인플레이션 방지)
     """
-    economy = turn_output.economy
-    snapshot = turn_input.economy_snapshot
-    messages = BUSINESS_RULE_MESSAGES[result.language]
+    economy = ctx.turn_output.economy
+    snapshot = ctx.turn_input.economy_snapshot
+    messages = ctx.messages
+    result = ctx.result
 
     # 0. gains 상한 검증 (U-136: 인플레이션 방지)
     if economy.gains.signal > MAX_SINGLE_TURN_REWARD_SIGNAL:
@@ -207,6 +248,7 @@ def _validate_economy(
             messages["gains_signal_exceeded"].format(
                 value=economy.gains.signal, max=MAX_SINGLE_TURN_REWARD_SIGNAL
             ),
+            field_path="economy.gains.signal",
         )
 
     if economy.gains.memory_shard > MAX_SINGLE_TURN_REWARD_MEMORY_SHARD:
@@ -215,6 +257,7 @@ def _validate_economy(
             messages["gains_shard_exceeded"].format(
                 value=economy.gains.memory_shard, max=MAX_SINGLE_TURN_REWARD_MEMORY_SHARD
             ),
+            field_path="economy.gains.memory_shard",
         )
 
     # 1. 과도한 비용 청구 금지 (snapshot < cost)
@@ -226,6 +269,7 @@ def _validate_economy(
         result.add_error(
             BusinessRuleError.ECONOMY_NEGATIVE_BALANCE,
             messages["signal_insufficient"].format(have=snapshot.signal, need=economy.cost.signal),
+            field_path="economy.cost.signal",
         )
 
     if snapshot.memory_shard < economy.cost.memory_shard:
@@ -234,6 +278,7 @@ def _validate_economy(
             messages["memory_shard_insufficient"].format(
                 have=snapshot.memory_shard, need=economy.cost.memory_shard
             ),
+            field_path="economy.cost.memory_shard",
         )
 
     # 2. 잔액 음수 금지 (이미 필드 수준 ge=0 검증이 있지만, 비즈니스 룰에서도 명시)
@@ -241,12 +286,14 @@ def _validate_economy(
         result.add_error(
             BusinessRuleError.ECONOMY_NEGATIVE_BALANCE,
             messages["signal_negative"].format(value=economy.balance_after.signal),
+            field_path="economy.balance_after.signal",
         )
 
     if economy.balance_after.memory_shard < 0:
         result.add_error(
             BusinessRuleError.ECONOMY_NEGATIVE_BALANCE,
             messages["memory_shard_negative"].format(value=economy.balance_after.memory_shard),
+            field_path="economy.balance_after.memory_shard",
         )
 
     # 3. cost와 balance_after 일관성 검증 (U-136: gains 반영)
@@ -264,6 +311,7 @@ def _validate_economy(
             messages["signal_mismatch"].format(
                 expected=expected_signal, actual=economy.balance_after.signal
             ),
+            field_path="economy.balance_after.signal",
         )
 
     if economy.balance_after.memory_shard != expected_shard:
@@ -272,6 +320,7 @@ def _validate_economy(
             messages["memory_shard_mismatch"].format(
                 expected=expected_shard, actual=economy.balance_after.memory_shard
             ),
+            field_path="economy.balance_after.memory_shard",
         )
 
     # credit 일관성 검증
@@ -279,116 +328,219 @@ def _validate_economy(
         result.add_error(
             BusinessRuleError.ECONOMY_COST_MISMATCH,
             f"Credit mismatch: expected {expected_credit}, actual {economy.credit}",
+            field_path="economy.credit",
         )
 
 
-def _validate_language(
-    turn_input: TurnInput,
-    turn_output: TurnOutput,
-    result: BusinessRuleValidationResult,
-) -> None:
-    """Language 규칙을 검증합니다 (RULE-006).
+def _check_language(ctx: RuleContext, node: ValidationNode) -> None:
+    """Language 규칙을 검증합니다 (RULE-006, TURN 노드).
 
     검증 항목:
     - TurnInput.language와 TurnOutput.language 일치
     """
-    if turn_input.language != turn_output.language:
-        messages = BUSINESS_RULE_MESSAGES[result.language]
-        result.add_error(
+    if ctx.turn_input.language != ctx.turn_output.language:
+        ctx.result.add_error(
             BusinessRuleError.LANGUAGE_MISMATCH,
-            messages["language_mismatch"].format(
-                input_lang=turn_input.language.value,
-                output_lang=turn_output.language.value,
+            ctx.messages["language_mismatch"].format(
+                input_lang=ctx.turn_input.language.value,
+                output_lang=ctx.turn_output.language.value,
             ),
+            field_path="language",
         )
 
 
-def _validate_language_content(
-    turn_input: TurnInput,
-    turn_output: TurnOutput,
-    result: BusinessRuleValidationResult,
-) -> None:
-    """Language 콘텐츠 혼합을 검증합니다 (RULE-006, U-043).
+def _check_safety(ctx: RuleContext, node: ValidationNode) -> None:
+    """Safety 규칙을 검증합니다 (TURN 노드).
 
     검증 항목:
-    - 사용자 노출 텍스트가 TurnInput.language와 동일 언어인지 확인
-    - ko/en 혼합 시 LANGUAGE_CONTENT_MIXED 에러 추가
+    - blocked 시 안전한 대체 결과(narrative) 제공 확인
     """
-    # 언어 혼합 검증 (U-043)
-    lang_result = validate_language_consistency(turn_output, turn_input.language)
+    turn_output = ctx.turn_output
 
-    if not lang_result.is_valid:
-        messages = BUSINESS_RULE_MESSAGES[result.language]
-        result.add_error(
-            BusinessRuleError.LANGUAGE_CONTENT_MIXED,
-            messages["language_content_mixed"].format(violation_count=len(lang_result.violations)),
+    # 차단 시에도 narrative가 있어야 함 (안전한 대체 결과)
+    if turn_output.safety.blocked and (
+        not turn_output.narrative or len(turn_output.narrative.strip()) == 0
+    ):
+        ctx.result.add_error(
+            BusinessRuleError.SAFETY_BLOCKED_NO_FALLBACK,
+            ctx.messages["safety_blocked_no_fallback"],
+            field_path="narrative",
         )
-        # 상세 에러 요약 생성을 위해 결과 저장
-        result.language_gate_result = lang_result
 
 
-def _validate_box2d(
-    turn_output: TurnOutput,
-    result: BusinessRuleValidationResult,
-) -> None:
-    """Box2D 좌표 규칙을 검증합니다 (RULE-009).
+def _check_language_content(ctx: RuleContext, node: ValidationNode) -> None:
+    """사용자 노출 텍스트의 ko/en 혼합을 검사합니다 (RULE-006, U-043, TEXT 노드).
+
+    위반은 ctx.language_gate에 누적되고, 순회 종료 후 LANGUAGE_CONTENT_MIXED 에러 하나로
+    집계됩니다 (_finalize_language_content).
+    """
+    text = node.value
+    if isinstance(text, str) and is_language_mixed(text, ctx.turn_input.language):
+        ctx.language_gate.add_violation(node.path, text)
+
+
+def _check_box2d(ctx: RuleContext, node: ValidationNode) -> None:
+    """Box2D 좌표 규칙을 검증합니다 (RULE-009, OBJECT 노드).
 
     검증 항목:
     - 0~1000 범위
     - ymin < ymax, xmin < xmax 순서
     """
-    messages = BUSINESS_RULE_MESSAGES[result.language]
-
-    # UI 오브젝트의 box2d 검증
-    for obj in turn_output.ui.objects:
-        box = obj.box_2d
-
-        # 범위 검증 (0~1000)
-        coords = [box.ymin, box.xmin, box.ymax, box.xmax]
-        for coord in coords:
-            if coord < 0 or coord > 1000:
-                result.add_error(
-                    BusinessRuleError.BOX2D_OUT_OF_RANGE,
-                    messages["box2d_out_of_range"].format(obj_id=obj.id, coord=coord),
-                )
-                break  # 한 오브젝트에 대해 한 번만 보고
-
-        # 순서 검증 (ymin < ymax, xmin < xmax)
-        if box.ymin >= box.ymax:
+    obj = cast("SceneObject", node.value)
+    box = obj.box_2d
+    messages = ctx.messages
+    result = ctx.result
+    field_path = f"{node.path}.box_2d"
+
+    # 범위 검증 (0~1000)
+    for coord in (box.ymin, box.xmin, box.ymax, box.xmax):
+        if coord < 0 or coord > 1000:
             result.add_error(
-                BusinessRuleError.BOX2D_INVALID_ORDER,
-                messages["box2d_invalid_yorder"].format(
-                    obj_id=obj.id, ymin=box.ymin, ymax=box.ymax
-                ),
+                BusinessRuleError.BOX2D_OUT_OF_RANGE,
+                messages["box2d_out_of_range"].format(obj_id=obj.id, coord=coord),
+                field_path=field_path,
             )
+            break  # 한 오브젝트에 대해 한 번만 보고
 
-        if box.xmin >= box.xmax:
-            result.add_error(
-                BusinessRuleError.BOX2D_INVALID_ORDER,
-                messages["box2d_invalid_xorder"].format(
-                    obj_id=obj.id, xmin=box.xmin, xmax=box.xmax
-                ),
-            )
+    # 순서 검증 (ymin < ymax, xmin < xmax)
+    if box.ymin >= box.ymax:
+        result.add_error(
+            BusinessRuleError.BOX2D_INVALID_ORDER,
+            messages["box2d_invalid_yorder"].format(obj_id=obj.id, ymin=box.ymin, ymax=box.ymax),
+            field_path=field_path,
+        )
 
+    if box.xmin >= box.xmax:
+        result.add_error(
+            BusinessRuleError.BOX2D_INVALID_ORDER,
+            messages["box2d_invalid_xorder"].format(obj_id=obj.id, xmin=box.xmin, xmax=box.xmax),
+            field_path=field_path,
+        )
 
-def _validate_safety(
-    turn_output: TurnOutput,
-    result: BusinessRuleValidationResult,
-) -> None:
-    """Safety 규칙을 검증합니다.
 
-    검증 항목:
-    - blocked 시 안전한 대체 결과(narrative) 제공 확인
+def _finalize_language_content(ctx: RuleContext) -> None:
+    """누적된 언어 혼합 위반을 LANGUAGE_CONTENT_MIXED 에러로 집계합니다 (U-043)."""
+    gate = ctx.language_gate
+    if gate.is_valid:
+        return
+
+    logger.warning(
+        "[LanguageGate] Language mixing detected",
+        extra={
+            "expected_language": gate.expected_language.value,
+            "violation_count": len(gate.violations),
+        },
+    )
+    ctx.result.add_error(
+        BusinessRuleError.LANGUAGE_CONTENT_MIXED,
+        ctx.messages["language_content_mixed"].format(violation_count=len(gate.violations)),
+        field_path=", ".join(violation["field"] for violation in gate.violations),
+    )
+    # 상세 에러 요약 생성을 위해 결과 저장
+    ctx.result.language_gate_result = gate
+
+
+# =============================================================================
+# 검증 엔진
+# =============================================================================
+
+
+class BusinessRuleEngine:
+    """TurnOutput을 한 번 순회하며 노드 종류별 등록 규칙을 실행하는 검증 엔진.
+
+    규칙을 추가해도 순회 횟수는 늘지 않습니다 (노드마다 등록된 규칙만 디스패치).
+    fail_fast가 켜져 있으면 첫 위반 직후 순회를 중단합니다 (판정만 필요한 호출용).
     """
-    safety = turn_output.safety
-    messages = BUSINESS_RULE_MESSAGES[result.language]
 
-    # 차단 시에도 narrative가 있어야 함 (안전한 대체 결과)
-    if safety.blocked and (not turn_output.narrative or len(turn_output.narrative.strip()) == 0):
-        result.add_error(
-            BusinessRuleError.SAFETY_BLOCKED_NO_FALLBACK,
-            messages["safety_blocked_no_fallback"],
+    def __init__(self, *, fail_fast: bool = False) -> None:
+        """BusinessRuleEngine을 초기화합니다.
+
+        Args:
+            fail_fast: 기본 단락 평가 여부 (validate()에서 호출별로 재정의 가능)
+        """
+        self._fail_fast = fail_fast
+        self._rules: dict[NodeKind, list[BusinessRule]] = {kind: [] for kind in NodeKind}
+
+    def register(self, kind: NodeKind, rule: BusinessRule) -> None:
+        """노드 종류에 규칙을 등록합니다 (등록 순서대로 실행)."""
+        self._rules[kind].append(rule)
+
+    def validate(
+        self,
+        turn_input: TurnInput,
+        turn_output: TurnOutput,
+        *,
+        fail_fast: bool | None = None,
+    ) -> BusinessRuleValidationResult:
+        """등록된 규칙으로 TurnOutput을 검증합니다.
+
+        Args:
+            turn_input: 검증 기준 TurnInput
+            turn_output: 검증 대상 TurnOutput
+            fail_fast: 단락 평가 여부 (None이면 엔진 기본값)
+
+        Returns:
+            BusinessRuleValidationResult: 위반 목록(필드 경로 포함) + 요약
+        """
+        stop_early = self._fail_fast if fail_fast is None else fail_fast
+        # RU-005-S2: turn_input.language에 따라 에러 메시지 i18n 분기
+        ctx = RuleContext(
+            turn_input=turn_input,
+            turn_output=turn_output,
+            result=BusinessRuleValidationResult(language=turn_input.language),
+            language_gate=LanguageGateResult(expected_language=turn_input.language),
         )
+        rules = self._rules
+
+        for node in iter_validation_nodes(turn_output):
+            for rule in rules[node.kind]:
+                rule(ctx, node)
+                if stop_early and ctx.has_violation:
+                    break
+            else:
+                continue
+            break
+
+        _finalize_language_content(ctx)
+
+        result = ctx.result
+        if not result.is_valid:
+            result.build_summary()
+            logger.warning(
+                "[BusinessRules] Validation failed",
+                extra={"error_count": len(result.errors)},
+            )
+
+        return result
+
+
+def create_default_engine(*, fail_fast: bool = False) -> BusinessRuleEngine:
+    """기본 비즈니스 룰이 등록된 엔진을 생성합니다."""
+    engine = BusinessRuleEngine(fail_fast=fail_fast)
+    engine.register(NodeKind.TURN, _check_economy)  # RULE-005
+    engine.register(NodeKind.TURN, _check_language)  # RULE-006
+    engine.register(NodeKind.TURN, _check_safety)
+    engine.register(NodeKind.TEXT, _check_language_content)  # RULE-006, U-043
+    engine.register(NodeKind.OBJECT, _check_box2d)  # RULE-009
+    return engine
+
+
+_engine_instance: BusinessRuleEngine | None = None
+
+
+def get_business_rule_engine() -> BusinessRuleEngine:
+    """기본 BusinessRuleEngine 싱글톤 인스턴스를 반환합니다."""
+    global _engine_instance
+
+    if _engine_instance is None:
+        _engine_instance = create_default_engine()
+    return _engine_instance
+
+
+def reset_business_rule_engine() -> None:
+    """BusinessRuleEngine 싱글톤을 초기화합니다 (테스트용)."""
+    global _engine_instance
+    _engine_instance = None
 
 
 # =============================================================================
@@ -399,32 +551,17 @@ def _validate_safety(
 def validate_business_rules(
     turn_input: TurnInput,
     turn_output: TurnOutput,
+    *,
+    fail_fast: bool = False,
 ) -> BusinessRuleValidationResult:
-    """비즈니스 룰을 검증합니다."""
-    # RU-005-S2: turn_input.language에 따라 에러 메시지 i18n 분기
-    result = BusinessRuleValidationResult(language=turn_input.language)
-
-    # 1. Economy 검증 (RULE-005)
-    _validate_economy(turn_input, turn_output, result)
-
-    # 2. Language enum 검증 (RULE-006)
-    _validate_language(turn_input, turn_output, result)
-
-    # 3. Language 콘텐츠 혼합 검증 (RULE-006, U-043)
-    _validate_language_content(turn_input, turn_output, result)
+    """비즈니스 룰을 검증합니다 (TurnOutput 단일 순회).
 
-    # 4. Box2D 검증 (RULE-009)
-    _validate_box2d(turn_output, result)
+    Args:
+        turn_input: 검증 기준 TurnInput
+        turn_output: 검증 대상 TurnOutput
+        fail_fast: 첫 위반에서 중단 (Repair 요약이 필요 없는 판정 전용 호출)
 
-    # 5. Safety 검증
-    _validate_safety(turn_output, result)
-
-    # 에러 요약 생성
-    if not result.is_valid:
-        result.build_summary()
-        logger.warning(
-            "[BusinessRules] Validation failed",
-            extra={"error_count": len(result.errors)},
-        )
-
-    return result
+    Returns:
+        BusinessRuleValidationResult: 검증 결과
+    """
+    return get_business_rule_engine().validate(turn_input, turn_output, fail_fast=fail_fast)
@@ -9,6 +9,11 @@ TurnInput.language를 SSOT로 삼아 TurnOutput의 사용자 노출 텍스트가
     - RULE-004: 검증 실패 시 Repair loop로 복구
     - CP-MVP-05: 언어 혼합 금지 검증
 
+성능:
+    - 모든 턴/모든 필드/모든 Repair 시도마다 실행되므로 마이크로초 단위로 유지
+    - 화이트리스트는 모듈 로드 시 단일 정규식(긴 용어 우선 alternation)으로 컴파일
+    - 문자 분류는 문자 단위 Python 루프 대신 C 레벨 연산(정규식 subn/translate/isalpha)으로 집계
+
 페어링 결정:
     - Q1: Option A (보수적 - 오탐 최소, CP에서 튜닝)
     - Q2: Option A (고유명 최소치만 허용)
@@ -23,11 +28,12 @@ from __future__ import annotations
 
 import logging
 import re
-import unicodedata
+import string
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from unknown_world.models.turn import Language
+from unknown_world.validation.traversal import NodeKind, iter_validation_nodes
 
 if TYPE_CHECKING:
     from unknown_world.models.turn import TurnOutput
@@ -49,28 +55,30 @@ MIXED_THRESHOLD_RATIO = 0.15  # 15% 이상의 반대 언어 문자 → 혼합으
 # 페어링 결정 Q2: Option A (고유명 최소치만 허용)
 # 허용 화이트리스트 (영어 고유명 - 재화/모델 라벨 등)
 # 주의: 복합어는 개별 단어도 함께 등록해야 합니다 (한글 붙은 경우 단어 경계 매칭 문제)
-ALLOWED_ENGLISH_TERMS: set[str] = {
-    # 재화 이름 (RULE-005)
-    "signal",
-    "shard",
-    "memory",
-    "memory shard",
-    # 모델 라벨 (RULE-008)
-    "fast",
-    "quality",
-    "cheap",
-    "ref",
-    # 시스템 상수
-    "ok",
-    "fail",
-    "blocked",
-    # 기타 허용 약어
-    "ui",
-    "api",
-    "id",
-    "json",
-    "schema",
-}
+ALLOWED_ENGLISH_TERMS: Final[frozenset[str]] = frozenset(
+    {
+        # 재화 이름 (RULE-005)
+        "signal",
+        "shard",
+        "memory",
+        "memory shard",
+        # 모델 라벨 (RULE-008)
+        "fast",
+        "quality",
+        "cheap",
+        "ref",
+        # 시스템 상수
+        "ok",
+        "fail",
+        "blocked",
+        # 기타 허용 약어
+        "ui",
+        "api",
+        "id",
+        "json",
+        "schema",
+    }
+)
 
 # 한글 유니코드 범위
 HANGUL_JAMO_START = 0x1100
@@ -82,45 +90,63 @@ HANGUL_COMPAT_JAMO_END = 0x318F
 
 
 # =============================================================================
-# 언어 감지 휴리스틱
+# 컴파일된 검사 엔진 (모듈 로드 시 1회 생성)
 # =============================================================================
 
 
-def _is_hangul(char: str) -> bool:
-    """한글 문자인지 확인합니다."""
-    code = ord(char)
-    return (
-        (HANGUL_SYLLABLES_START <= code <= HANGUL_SYLLABLES_END)
-        or (HANGUL_JAMO_START <= code <= HANGUL_JAMO_END)
-        or (HANGUL_COMPAT_JAMO_START <= code <= HANGUL_COMPAT_JAMO_END)
-    )
+def _compile_whitelist(terms: frozenset[str]) -> re.Pattern[str]:
+    """화이트리스트 용어를 단일 alternation 정규식으로 컴파일합니다.
+
+    긴 용어를 먼저 두어 복합어("memory shard")가 부분 용어("memory")보다 우선합니다.
+    한글이 붙어있는 경우도 처리하기 위해 단어 경계 대신 알파벳이 아닌 문자 또는
+    문자열 경계로 매칭합니다 (예: "Signal가", "Memory Shard를").
+    매칭은 좌우가 알파벳이 아닌 위치에서만 일어나므로, 한 번의 치환 결과는 용어별로
+    순차 치환한 결과와 같습니다 (제거가 새 매칭을 만들지 않음).
+    선두 lookahead는 의미상 중복이지만 정규식 엔진이 알파벳 위치로 바로 건너뛰게 합니다.
+    """
+    ordered = sorted(terms, key=lambda term: (-len(term), term))
+    alternation = "|".join(re.escape(term) for term in ordered)
+    return re.compile(rf"(?=[a-zA-Z])(?<![a-zA-Z])(?:{alternation})(?![a-zA-Z])", re.IGNORECASE)
+
+
+_WHITELIST_PATTERN: Final[re.Pattern[str]] = _compile_whitelist(ALLOWED_ENGLISH_TERMS)
+"""화이트리스트 제거용 컴파일 정규식."""
 
+_HANGUL_PATTERN: Final[re.Pattern[str]] = re.compile(
+    f"[{chr(HANGUL_JAMO_START)}-{chr(HANGUL_JAMO_END)}"
+    f"{chr(HANGUL_COMPAT_JAMO_START)}-{chr(HANGUL_COMPAT_JAMO_END)}"
+    f"{chr(HANGUL_SYLLABLES_START)}-{chr(HANGUL_SYLLABLES_END)}]"
+)
+"""한글 코드포인트 범위 (자모/호환 자모/음절)."""
 
-def _is_latin(char: str) -> bool:
-    """라틴 알파벳인지 확인합니다 (a-z, A-Z)."""
-    return char.isalpha() and unicodedata.category(char).startswith("L") and not _is_hangul(char)
+_DELETE_ASCII_LETTERS: Final[dict[int, int | None]] = str.maketrans("", "", string.ascii_letters)
+"""ASCII 알파벳 삭제용 translate 테이블 (ASCII 텍스트 라틴 문자 집계)."""
 
 
 def _normalize_text_for_check(text: str) -> str:
     """검사용으로 텍스트를 정규화합니다.
 
     - 소문자 변환
-    - 화이트리스트 단어 제거
-    - 숫자/기호/공백/이모지 제거
+    - 화이트리스트 단어 제거 (컴파일된 단일 정규식 1회 치환)
     """
-    normalized = text.lower()
+    return _WHITELIST_PATTERN.sub("", text.lower())
 
-    # 화이트리스트 단어 제거 (대소문자 무시)
-    # 복합어를 먼저 처리 (긴 것부터)
-    sorted_terms = sorted(ALLOWED_ENGLISH_TERMS, key=len, reverse=True)
-    for term in sorted_terms:
-        # 한글이 붙어있는 경우도 처리하기 위해 단어 경계 대신
-        # 알파벳이 아닌 문자 또는 문자열 경계로 매칭
-        # 예: "Signal가", "Memory Shard를" 등
-        pattern = rf"(?<![a-zA-Z]){re.escape(term)}(?![a-zA-Z])"
-        normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
 
-    return normalized
+def _count_scripts(text: str) -> tuple[int, int]:
+    """한글/라틴(한글이 아닌 알파벳) 문자 수를 집계합니다.
+
+    한글은 코드포인트 범위 정규식 치환 1회로 세고, 나머지는 ASCII면 translate,
+    아니면 str.isalpha 매핑으로 셉니다 (모두 C 레벨 루프).
+
+    Returns:
+        (hangul_count, latin_count)
+    """
+    rest, hangul_count = _HANGUL_PATTERN.subn("", text)
+    if rest.isascii():
+        latin_count = len(rest) - len(rest.translate(_DELETE_ASCII_LETTERS))
+    else:
+        latin_count = sum(map(str.isalpha, rest))
+    return hangul_count, latin_count
 
 
 @dataclass
@@ -156,17 +182,8 @@ def measure_language_ratio(text: str) -> LanguageRatio:
     if not text:
         return LanguageRatio()
 
-    # 정규화 (화이트리스트 제거)
-    normalized = _normalize_text_for_check(text)
-
-    hangul_count = 0
-    latin_count = 0
-
-    for char in normalized:
-        if _is_hangul(char):
-            hangul_count += 1
-        elif _is_latin(char):
-            latin_count += 1
+    # 정규화 (화이트리스트 제거) 후 스크립트별 집계
+    hangul_count, latin_count = _count_scripts(_normalize_text_for_check(text))
 
     total = hangul_count + latin_count
 
@@ -245,52 +262,12 @@ def extract_user_facing_texts(turn_output: TurnOutput) -> list[ExtractedText]:
     Returns:
         list[ExtractedText]: 추출된 텍스트 목록
     """
-    texts: list[ExtractedText] = []
-
-    # 1. narrative (가장 중요)
-    if turn_output.narrative:
-        texts.append(ExtractedText(field_path="narrative", text=turn_output.narrative))
-
-    # 2. ui.action_deck.cards[]
-    # U-065: description, hint, reward_hint, disabled_reason 필드 제거됨
-    for i, card in enumerate(turn_output.ui.action_deck.cards):
-        texts.append(ExtractedText(field_path=f"ui.action_deck.cards[{i}].label", text=card.label))
-
-    # 3. ui.objects[]
-    for i, obj in enumerate(turn_output.ui.objects):
-        texts.append(ExtractedText(field_path=f"ui.objects[{i}].label", text=obj.label))
-        if obj.interaction_hint:
-            texts.append(
-                ExtractedText(
-                    field_path=f"ui.objects[{i}].interaction_hint",
-                    text=obj.interaction_hint,
-                )
-            )
-
-    # 4. world.quests_updated[]
-    for i, quest in enumerate(turn_output.world.quests_updated):
-        texts.append(ExtractedText(field_path=f"world.quests_updated[{i}].label", text=quest.label))
-
-    # 5. world.rules_changed[]
-    for i, rule in enumerate(turn_output.world.rules_changed):
-        texts.append(ExtractedText(field_path=f"world.rules_changed[{i}].label", text=rule.label))
-        if rule.description:
-            texts.append(
-                ExtractedText(
-                    field_path=f"world.rules_changed[{i}].description",
-                    text=rule.description,
-                )
-            )
-
-    # 6. world.memory_pins[]
-    for i, pin in enumerate(turn_output.world.memory_pins):
-        texts.append(ExtractedText(field_path=f"world.memory_pins[{i}].content", text=pin.content))
-
-    # 7. safety.message
-    if turn_output.safety.message:
-        texts.append(ExtractedText(field_path="safety.message", text=turn_output.safety.message))
-
-    return texts
+    # 단일 순회기(iter_validation_nodes)의 TEXT 노드와 같은 범위/순서
+    return [
+        ExtractedText(field_path=node.path, text=node.value)
+        for node in iter_validation_nodes(turn_output)
+        if node.kind is NodeKind.TEXT and isinstance(node.value, str)
+    ]
 
 
 # =============================================================================
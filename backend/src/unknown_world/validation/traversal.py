@@ -0,0 +1,106 @@
+"""Unknown World - TurnOutput 단일 순회기.
+
+비즈니스 룰/언어 게이트가 TurnOutput을 규칙마다 따로 훑지 않도록,
+검증 대상 노드를 한 번의 순회로 필드 경로와 함께 방출합니다.
+
+노드 종류:
+    - TURN: 루트 TurnOutput (economy/language/safety 같은 턴 단위 규칙)
+    - TEXT: 사용자 노출 텍스트 (언어 혼합 검사 대상, U-043)
+    - OBJECT: UI 오브젝트 (Box2D 규칙, RULE-009)
+
+방출 순서는 기존 extract_user_facing_texts()의 텍스트 순서를 그대로 유지합니다.
+
+설계 원칙:
+    - RULE-006: 사용자 노출 텍스트 범위는 언어 게이트와 동일
+    - 순회는 읽기 전용 (노드 값은 원본 모델 참조)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from unknown_world.models.turn import TurnOutput
+
+
+class NodeKind(StrEnum):
+    """검증 노드 종류."""
+
+    TURN = "turn"
+    """루트 TurnOutput"""
+
+    TEXT = "text"
+    """사용자 노출 텍스트 (value: str)"""
+
+    OBJECT = "object"
+    """UI 오브젝트 (value: SceneObject)"""
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationNode:
+    """순회 중 방출되는 검증 노드.
+
+    Attributes:
+        kind: 노드 종류
+        path: 필드 경로 (예: "ui.objects[0].label", 루트는 "")
+        value: 노드 값 (TurnOutput | str | SceneObject)
+    """
+
+    kind: NodeKind
+    path: str
+    value: object
+
+
+def iter_validation_nodes(turn_output: TurnOutput) -> Iterator[ValidationNode]:
+    """TurnOutput을 한 번 순회하며 검증 노드를 방출합니다.
+
+    텍스트 범위 (순서대로):
+        - narrative
+        - ui.action_deck.cards[].label
+        - ui.objects[].label, interaction_hint (+ OBJECT 노드)
+        - world.quests_updated[].label
+        - world.rules_changed[].label, description
+        - world.memory_pins[].content
+        - safety.message
+
+    Args:
+        turn_output: 순회할 TurnOutput
+
+    Yields:
+        ValidationNode: TURN 노드 1개 후 TEXT/OBJECT 노드
+    """
+    yield ValidationNode(NodeKind.TURN, "", turn_output)
+
+    if turn_output.narrative:
+        yield ValidationNode(NodeKind.TEXT, "narrative", turn_output.narrative)
+
+    # U-065: description, hint, reward_hint, disabled_reason 필드 제거됨
+    for i, card in enumerate(turn_output.ui.action_deck.cards):
+        yield ValidationNode(NodeKind.TEXT, f"ui.action_deck.cards[{i}].label", card.label)
+
+    for i, obj in enumerate(turn_output.ui.objects):
+        prefix = f"ui.objects[{i}]"
+        yield ValidationNode(NodeKind.OBJECT, prefix, obj)
+        yield ValidationNode(NodeKind.TEXT, f"{prefix}.label", obj.label)
+        if obj.interaction_hint:
+            yield ValidationNode(NodeKind.TEXT, f"{prefix}.interaction_hint", obj.interaction_hint)
+
+    world = turn_output.world
+    for i, quest in enumerate(world.quests_updated):
+        yield ValidationNode(NodeKind.TEXT, f"world.quests_updated[{i}].label", quest.label)
+
+    for i, rule in enumerate(world.rules_changed):
+        yield ValidationNode(NodeKind.TEXT, f"world.rules_changed[{i}].label", rule.label)
+        if rule.description:
+            yield ValidationNode(
+                NodeKind.TEXT, f"world.rules_changed[{i}].description", rule.description
+            )
+
+    for i, pin in enumerate(world.memory_pins):
+        yield ValidationNode(NodeKind.TEXT, f"world.memory_pins[{i}].content", pin.content)
+
+    if turn_output.safety.message:
+        yield ValidationNode(NodeKind.TEXT, "safety.message", turn_output.safety.message)
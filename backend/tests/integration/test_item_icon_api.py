@@ -1,3 +1,5 @@
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -79,3 +81,88 @@ async def test_api_get_icon_status():
         data = response.json()
         assert data["status"] == "completed"
         assert data["item_id"] == "item_123"
+
+
+@pytest.fixture
+def icon_generator(tmp_path):
+    """실제 ItemIconGenerator (배치 비활성화, 개별 생성만 모킹)."""
+    from unknown_world.services.item_icon_generator import (
+        IconCache,
+        IconGenerationRequest,
+        IconGenerationResponse,
+        IconGenerationStatus,
+        ItemIconGenerator,
+    )
+
+    generator = ItemIconGenerator(
+        image_generator=MagicMock(),
+        cache=IconCache(cache_dir=tmp_path / "icons"),
+        batch_max_size=1,
+    )
+
+    async def fake_generate(request: IconGenerationRequest) -> IconGenerationResponse:
+        await asyncio.sleep(0.01)
+        return IconGenerationResponse(
+            status=IconGenerationStatus.COMPLETED,
+            icon_url=f"/static/images/generated/icons/{request.item_id}.png",
+            item_id=request.item_id,
+        )
+
+    generator._generate_icon_internal = fake_generate  # type: ignore[method-assign]
+    generator._cache.set("Cached lantern", b"not an image")
+    with patch("unknown_world.api.item_icon.get_item_icon_generator", return_value=generator):
+        yield generator
+
+
+@pytest.mark.asyncio
+async def test_api_batch_icons_status_and_generate(icon_generator):
+    from unknown_world.main import app
+
+    items = [
+        {"item_id": "i1", "description": "Cached lantern"},
+        {"item_id": "i2", "description": "Glowing shard"},
+    ]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        peek = await ac.post("/api/item/icons", json={"items": items, "generate": False})
+        started = await ac.post("/api/item/icons", json={"items": items})
+
+    assert [icon["status"] for icon in peek.json()["icons"]] == ["cached", "pending"]
+    icons = started.json()["icons"]
+    assert [icon["item_id"] for icon in icons] == ["i1", "i2"]
+    assert icons[0]["is_placeholder"] is False
+    assert icons[1]["status"] == "generating"
+    assert icons[1]["is_placeholder"] is True
+
+
+@pytest.mark.asyncio
+async def test_api_icon_stream_pushes_completed_icons(icon_generator):
+    from unknown_world.main import app
+
+    items = [
+        {"item_id": "i1", "description": "Cached lantern"},
+        {"item_id": "i2", "description": "Glowing shard"},
+    ]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        ndjson = await ac.post("/api/item/icons/stream", json={"items": items})
+        sse = await ac.post(
+            "/api/item/icons/stream",
+            json={"items": items[:1]},
+            headers={"Accept": "text/event-stream"},
+        )
+
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [(e["type"], e.get("item_id"), e.get("status")) for e in events] == [
+        ("icon", "i1", "cached"),
+        ("icon", "i2", "generating"),
+        ("icon", "i2", "completed"),
+        ("done", None, None),
+    ]
+    assert events[2]["icon_url"].endswith("/i2.png")
+    assert events[3]["pending"] == []
+
+    assert sse.headers["content-type"].startswith("text/event-stream")
+    assert sse.text.startswith("event: icon\ndata: ")
+    assert sse.text.endswith('event: done\ndata: {"type":"done","pending":[]}\n\n')
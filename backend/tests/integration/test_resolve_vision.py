@@ -1,5 +1,6 @@
 """Unknown World - Resolve Stage 정밀분석 통합 테스트 (U-076[Mvp])."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -146,3 +147,40 @@ async def test_resolve_vision_failure_fallback(base_context, mock_emit):
         assert "자세히 봐도 특별한 것은 보이지 않습니다" in updated_ctx.output.narrative
         # 이미지 생성은 여전히 비활성화 (정밀분석 시도 자체로 인해)
         assert updated_ctx.output.render.image_job.should_generate is False
+
+
+@pytest.mark.asyncio
+async def test_resolve_vision_uses_precomputed_affordances(base_context, mock_emit, monkeypatch):
+    """이미지 생성 직후 선계산된 affordance가 있으면 비전 호출 없이 반영한다."""
+    from unknown_world.services.affordance_precompute import reset_affordance_precomputer
+
+    monkeypatch.setenv("UW_AFFORDANCE_PRECOMPUTE", "1")
+    reset_affordance_precomputer()
+    base_context.turn_input.action_id = "deep_analyze"
+    base_context.output.render.image_url = "/static/images/generated/img_pre.medium.webp"
+
+    precomputed = VisionAnalysisResult(
+        affordances=[
+            Affordance(label="낡은 레버", box_2d=Box2D(ymin=100, xmin=100, ymax=200, xmax=200))
+        ],
+    )
+    with patch(
+        "unknown_world.services.agentic_vision.AgenticVisionService.analyze_scene",
+        new_callable=AsyncMock,
+    ) as mock_analyze:
+        mock_analyze.return_value = precomputed
+        from unknown_world.services.affordance_precompute import get_affordance_precomputer
+
+        precomputer = get_affordance_precomputer()
+        assert precomputer is not None
+        precomputer.schedule("img_pre", Language.KO)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        mock_analyze.reset_mock()
+
+        updated_ctx = await resolve_stage(base_context, emit=mock_emit)
+
+        mock_analyze.assert_not_called()
+        assert updated_ctx.output.ui.objects[0].label == "낡은 레버"
+
+    reset_affordance_precomputer()
@@ -84,3 +84,25 @@ def test_scan_image_too_large():
     res_data = response.json()
     assert res_data["success"] is False
     assert "File too large" in res_data["message"]
+
+
+def test_scan_image_octet_stream_detected_by_magic_bytes():
+    """Content-Type 없이 올라온 PNG도 매직 바이트로 판별해 분석한다."""
+    file_content = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200
+    files = {"file": ("photo", file_content, "application/octet-stream")}
+    data = {"language": "en-US", "preserve_original": "false"}
+
+    response = client.post("/api/scan", files=files, data=data)
+
+    assert response.status_code == 200
+    res_data = response.json()
+    assert res_data["success"] is True
+    assert res_data["language"] == "en-US"
+
+
+def test_scan_openapi_documents_multipart_fields():
+    """본문을 직접 파싱해도 OpenAPI에 multipart 필드가 노출된다."""
+    schema = client.get("/openapi.json").json()
+    body = schema["paths"]["/api/scan"]["post"]["requestBody"]["content"]
+    fields = body["multipart/form-data"]["schema"]["properties"]
+    assert set(fields) == {"file", "language", "preserve_original", "session_id"}
@@ -0,0 +1,180 @@
+"""Unknown World - /api/session WebSocket/SSE 세션 전송 통합 테스트.
+
+하나의 연결에서 턴 이벤트가 /api/turn NDJSON과 같은 순서/구조로 다중화되는지 검증합니다.
+"""
+
+import asyncio
+import json
+import os
+
+# U-080 대응: 테스트 환경에서 Mock 모드 강제 (다른 임포트보다 먼저 실행)
+os.environ["UW_MODE"] = "mock"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from unknown_world.api.session import (
+    SessionChannel,
+    TurnSession,
+    _stream_session_sse,
+    get_session_registry,
+    reset_session_registry,
+)
+from unknown_world.main import app
+
+client = TestClient(app)
+
+TURN_PAYLOAD = {
+    "language": "ko-KR",
+    "text": "테스트 입력",
+    "client": {"viewport_w": 1920, "viewport_h": 1080, "theme": "dark"},
+    "economy_snapshot": {"signal": 100, "memory_shard": 5},
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry():
+    reset_session_registry()
+    yield
+    reset_session_registry()
+
+
+def _receive_until_final(ws, request_id: str) -> list[dict]:
+    events = []
+    while True:
+        envelope = json.loads(ws.receive_text())
+        assert envelope["channel"] == SessionChannel.TURN
+        assert envelope["request_id"] == request_id
+        events.append(envelope["event"])
+        if envelope["event"]["type"] == "final":
+            return events
+
+
+def test_websocket_multiple_turns_on_one_connection():
+    with client.websocket_connect("/api/session/ws") as ws:
+        ready = json.loads(ws.receive_text())
+        assert ready["channel"] == SessionChannel.SESSION
+        assert ready["event"]["type"] == "ready"
+        session_id = ready["event"]["session_id"]
+
+        for request_id in ("t1", "t2"):
+            ws.send_text(
+                json.dumps({"type": "turn", "request_id": request_id, "data": TURN_PAYLOAD})
+            )
+            events = _receive_until_final(ws, request_id)
+
+            assert events[0] == {"type": "stage", "name": "parse", "status": "start"}
+            stages = [e["name"] for e in events if e["type"] == "stage" and e["status"] == "start"]
+            assert stages == ["parse", "validate", "plan", "resolve", "render", "verify", "commit"]
+            assert events[-1]["data"]["language"] == "ko-KR"
+
+        ws.send_text(json.dumps({"type": "ping", "request_id": "p1"}))
+        pong = json.loads(ws.receive_text())
+        assert pong == {"channel": "session", "request_id": "p1", "event": {"type": "pong"}}
+
+    session = get_session_registry().get(session_id)
+    assert session is not None and session.turn_count == 2
+    assert not session.attached
+
+
+def test_websocket_invalid_messages_keep_connection_open():
+    with client.websocket_connect("/api/session/ws") as ws:
+        ws.receive_text()  # ready
+
+        ws.send_text("not json")
+        error = json.loads(ws.receive_text())
+        assert error["event"]["code"] == "INVALID_MESSAGE"
+
+        # 잘못된 턴 입력은 /api/turn과 같이 error + final(폴백)
+        ws.send_text(json.dumps({"type": "turn", "request_id": "bad", "data": {"text": "x"}}))
+        events = _receive_until_final(ws, "bad")
+        assert [e["type"] for e in events] == ["error", "final"]
+        assert events[0]["code"] == "VALIDATION_ERROR"
+
+
+def test_websocket_resume_existing_session():
+    session = get_session_registry().create()
+
+    with client.websocket_connect(f"/api/session/ws?session_id={session.session_id}") as ws:
+        ready = json.loads(ws.receive_text())
+
+    assert ready["event"]["session_id"] == session.session_id
+    assert len(get_session_registry()) == 1
+
+
+def test_sse_fallback_messages_endpoint():
+    session_id = client.post("/api/session").json()["session_id"]
+
+    response = client.post(
+        f"/api/session/{session_id}/messages",
+        json={"type": "turn", "request_id": "t1", "data": TURN_PAYLOAD},
+    )
+    assert response.status_code == 202
+    assert response.json()["active_requests"] == ["t1"]
+
+    assert client.post("/api/session/missing/messages", json={"type": "ping"}).status_code == 404
+    assert client.delete(f"/api/session/{session_id}").json() == {"closed": True}
+
+
+@pytest.mark.asyncio
+async def test_sse_stream_formats_channel_events():
+    session = TurnSession()
+    session.attach()
+    await session.handle_message({"type": "turn", "request_id": "t1", "data": TURN_PAYLOAD})
+
+    stream = _stream_session_sse(session)
+    messages = []
+    async for message in stream:
+        messages.append(message)
+        if '"type":"final"' in message:
+            break
+    await stream.aclose()
+
+    assert messages[0].startswith("event: session\ndata: ")
+    assert all(m.endswith("\n\n") for m in messages)
+    turn_messages = [m for m in messages[1:] if not m.startswith(":")]
+    assert all(m.startswith("event: turn\ndata: ") for m in turn_messages)
+    first = json.loads(turn_messages[0].split("data: ", 1)[1])
+    assert first["event"] == {"type": "stage", "name": "parse", "status": "start"}
+    assert not session.attached
+
+
+@pytest.mark.asyncio
+async def test_session_replies_do_not_block_on_full_outbox():
+    """소비자가 없어 outbox가 가득 차도 pong/error 응답은 대기하지 않고 버려진다."""
+    session = TurnSession(outbox_size=1)
+
+    await asyncio.wait_for(session.handle_message({"type": "ping", "request_id": "p1"}), 1)
+    await asyncio.wait_for(session.handle_message({"type": "ping", "request_id": "p2"}), 1)
+    await asyncio.wait_for(session.handle_message("not a dict"), 1)
+
+    assert session.dropped_replies == 2
+    _, envelope = await session.next_message()
+    assert json.loads(envelope)["request_id"] == "p1"
+
+
+@pytest.mark.asyncio
+async def test_turn_stops_when_no_transport_attaches_within_grace():
+    now = [0.0]
+    session = TurnSession(outbox_size=1, attach_grace_seconds=5.0, clock=lambda: now[0])
+    await session.handle_message({"type": "turn", "request_id": "t1", "data": TURN_PAYLOAD})
+    assert session.active_requests == ["t1"]
+
+    now[0] = 10.0  # 전송 없이 유예 시간 경과 → 진행 중인 턴 중단
+    for _ in range(100):
+        if not session.active_requests:
+            break
+        await asyncio.sleep(0.05)
+    assert session.active_requests == []
+
+    await session.handle_message({"type": "turn", "request_id": "t2", "data": TURN_PAYLOAD})
+    assert session.active_requests == []  # 새 요청 거부
+
+
+def test_sse_messages_rejected_after_attach_grace(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("UW_SESSION_ATTACH_GRACE_S", "0")
+    session_id = client.post("/api/session").json()["session_id"]
+
+    response = client.post(f"/api/session/{session_id}/messages", json={"type": "ping"})
+
+    assert response.status_code == 409
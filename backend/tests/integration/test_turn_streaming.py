@@ -182,3 +182,83 @@ def test_turn_streaming_repair_loop(monkeypatch):
     assert len(repair_events) >= 1
     assert "attempt" in repair_events[0]
     assert repair_events[0]["attempt"] == 1
+
+
+def test_turn_streaming_gzip_negotiated():
+    """Accept-Encoding: gzip이면 압축 스트림을 반환하고, 해제된 라인은 동일한 이벤트다."""
+    payload = {
+        "language": "ko-KR",
+        "text": "테스트 입력",
+        "client": {"viewport_w": 1920, "viewport_h": 1080, "theme": "dark"},
+        "economy_snapshot": {"signal": 100, "memory_shard": 5},
+    }
+
+    response = client.post("/api/turn", json=payload, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+
+    events = [json.loads(line) for line in response.iter_lines() if line]
+    assert events[0] == {"type": "stage", "name": "parse", "status": "start"}
+    assert [e["type"] for e in events].count("final") == 1
+
+    health = client.get("/api/turn/health").json()
+    assert health["compression"]["encodings"]["gzip"]["streams"] >= 1
+
+
+def test_turn_streaming_identity_uncompressed():
+    """Accept-Encoding: identity이면 압축하지 않는다."""
+    payload = {
+        "language": "en-US",
+        "text": "test",
+        "client": {"viewport_w": 1920, "viewport_h": 1080, "theme": "dark"},
+        "economy_snapshot": {"signal": 100, "memory_shard": 5},
+    }
+
+    response = client.post("/api/turn", json=payload, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert any(json.loads(line)["type"] == "final" for line in response.iter_lines() if line)
+
+
+def test_turn_streaming_idempotent_retry_replays_stored_turn():
+    """같은 Idempotency-Key 재시도는 저장된 이벤트를 재생하고, 다른 입력이면 409."""
+    from unknown_world.api.turn_replay import reset_turn_replay_store
+
+    reset_turn_replay_store()
+    payload = {
+        "language": "ko-KR",
+        "text": "테스트 입력",
+        "client": {"viewport_w": 1920, "viewport_h": 1080, "theme": "dark"},
+        "economy_snapshot": {"signal": 100, "memory_shard": 5},
+    }
+    headers = {"Idempotency-Key": "turn-retry-1", "Accept-Encoding": "identity"}
+
+    # 저장된 턴 실행 태스크가 요청 간 유지되도록 같은 이벤트 루프 사용
+    with TestClient(app) as loop_client:
+        first = loop_client.post("/api/turn", json=payload, headers=headers)
+        retry = loop_client.post("/api/turn", json=payload, headers=headers)
+        conflict = loop_client.post(
+            "/api/turn", json={**payload, "text": "다른 입력"}, headers=headers
+        )
+        health = loop_client.get("/api/turn/health").json()
+
+    assert first.headers["idempotency-replay"] == "new"
+    assert retry.headers["idempotency-replay"] == "replayed"
+    assert retry.content == first.content
+    assert conflict.status_code == 409
+    assert health["replay"]["replayed"] == 1
+    reset_turn_replay_store()
+
+
+def test_turn_streaming_malformed_body():
+    """JSON이 아닌 본문도 error(VALIDATION_ERROR) + final(폴백) 스트림으로 응답한다."""
+    response = client.post(
+        "/api/turn", content=b"{not json", headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 200
+
+    events = [json.loads(line) for line in response.iter_lines() if line]
+    assert [e["type"] for e in events] == ["error", "final"]
+    assert events[0]["message"] == "Failed to parse request body"
+    assert events[1]["data"]["language"] == "en-US"
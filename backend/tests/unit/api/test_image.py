@@ -1,7 +1,10 @@
 """Unknown World - 이미지 생성 API 엔드포인트 단위 테스트."""
 
+import uuid
+
 import pytest
 from fastapi.testclient import TestClient
+from PIL import Image
 
 from unknown_world.main import app
 from unknown_world.services.image_generation import (
@@ -9,6 +12,8 @@ from unknown_world.services.image_generation import (
     get_image_generator,
     reset_image_generator,
 )
+from unknown_world.services.image_variants import encode_image_variants
+from unknown_world.storage.paths import get_generated_images_dir
 
 
 @pytest.fixture
@@ -98,3 +103,93 @@ def test_get_image_file_not_found(client):
     """존재하지 않는 이미지 파일 요청 시 404 테스트."""
     response = client.get("/api/image/file/non_existent_id")
     assert response.status_code == 404
+
+
+def test_cancel_image_without_active_job(client):
+    """진행 중인 작업이 없는 세션 취소 요청은 cancelled=False를 반환한다."""
+    response = client.post("/api/image/cancel", json={"session_id": "no-such-session"})
+
+    assert response.status_code == 200
+    assert response.json() == {"session_id": "no-such-session", "cancelled": False}
+
+
+def test_generate_image_with_session_and_turn(client):
+    """세션/턴이 지정된 요청도 정상 완료되고 turn_id가 응답에 포함된다."""
+    payload = {"prompt": "A quiet corridor", "session_id": "sess-1", "turn_id": 3}
+
+    response = client.post("/api/image/generate", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == ImageGenerationStatus.COMPLETED
+    assert data["turn_id"] == 3
+
+
+def test_image_file_caching_headers_and_304(client):
+    """생성 이미지는 immutable 캐시 + 내용 해시 ETag를 가지며 재검증 시 304를 반환한다."""
+    gen_resp = client.post("/api/image/generate", json={"prompt": "Test cache headers"})
+    image_id = gen_resp.json()["image_id"]
+
+    response = client.get(f"/api/image/file/{image_id}")
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    cached = client.get(f"/api/image/file/{image_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    static = client.get(gen_resp.json()["image_url"], headers={"If-None-Match": etag})
+    assert static.status_code == 304
+
+
+def test_image_file_range_request(client):
+    """Range 요청은 206 부분 응답을 반환한다."""
+    gen_resp = client.post("/api/image/generate", json={"prompt": "Test range request"})
+    image_id = gen_resp.json()["image_id"]
+
+    response = client.get(f"/api/image/file/{image_id}", headers={"Range": "bytes=0-7"})
+    assert response.status_code == 206
+    assert response.content == b"\x89PNG\r\n\x1a\n"
+
+
+def test_image_file_negotiates_webp(client):
+    """Accept에 image/webp가 있으면 사전 인코딩된 WebP 변형을 반환한다."""
+    image_id = f"img_negotiate_{uuid.uuid4().hex[:8]}"
+    output_dir = get_generated_images_dir()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (64, 36), (10, 20, 30)).save(output_dir / f"{image_id}.png")
+    try:
+        encode_image_variants(image_id, output_dir=output_dir)
+
+        response = client.get(
+            f"/api/image/file/{image_id}", headers={"Accept": "image/webp,image/png,*/*"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["vary"] == "Accept"
+
+        png = client.get(f"/api/image/file/{image_id}")
+        assert png.headers["content-type"] == "image/png"
+        assert png.headers["etag"] != response.headers["etag"]
+    finally:
+        # 원본 PNG와 모든 변형 파일 정리 (image_id는 테스트마다 고유)
+        for path in output_dir.glob(f"{image_id}*"):
+            path.unlink(missing_ok=True)
+
+
+def test_static_icon_cache_is_revalidated(client):
+    """아이콘 캐시 파일은 같은 URL로 재생성되므로 immutable 대신 ETag 재검증을 사용한다."""
+    icon_name = f"icon_{uuid.uuid4().hex[:8]}.png"
+    icon_dir = get_generated_images_dir() / "icons"
+    icon_dir.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (8, 8), (1, 2, 3)).save(icon_dir / icon_name)
+    try:
+        response = client.get(f"/static/images/generated/icons/{icon_name}")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+        assert "etag" in response.headers
+    finally:
+        (icon_dir / icon_name).unlink(missing_ok=True)
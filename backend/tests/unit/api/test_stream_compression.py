@@ -0,0 +1,109 @@
+"""NDJSON 스트림 압축 (Accept-Encoding 협상 + 이벤트 단위 flush) 단위 테스트."""
+
+import json
+import zlib
+from collections.abc import AsyncIterator
+
+import pytest
+
+from unknown_world.api.stream_compression import (
+    DEFAULT_STREAM_COMPRESSION_LEVEL,
+    StreamEncoding,
+    compress_stream,
+    get_stream_compression_level,
+    get_stream_compression_stats,
+    negotiate_stream_encoding,
+    reset_stream_compression_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_stream_compression_stats()
+    yield
+    reset_stream_compression_stats()
+
+
+async def _lines(lines: list[bytes]) -> AsyncIterator[bytes]:
+    for line in lines:
+        yield line
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, StreamEncoding.IDENTITY),
+        ("", StreamEncoding.IDENTITY),
+        ("gzip", StreamEncoding.GZIP),
+        ("deflate, gzip;q=0.8", StreamEncoding.GZIP),
+        ("gzip;q=0", StreamEncoding.IDENTITY),
+        ("*", StreamEncoding.GZIP),
+        ("*, gzip;q=0", StreamEncoding.IDENTITY),
+        ("identity", StreamEncoding.IDENTITY),
+    ],
+)
+def test_negotiate_gzip(monkeypatch, header, expected):
+    monkeypatch.setattr("unknown_world.api.stream_compression.brotli", None)
+
+    assert negotiate_stream_encoding(header) == expected
+
+
+def test_negotiate_respects_disable_flag(monkeypatch):
+    monkeypatch.setenv("UW_STREAM_COMPRESSION", "0")
+
+    assert negotiate_stream_encoding("gzip, br") == StreamEncoding.IDENTITY
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("7", 7), ("42", 9), ("0", 1), ("fast", DEFAULT_STREAM_COMPRESSION_LEVEL)],
+)
+def test_compression_level_is_clamped_and_tolerates_bad_values(monkeypatch, raw, expected):
+    monkeypatch.setenv("UW_STREAM_COMPRESSION_LEVEL", raw)
+
+    assert get_stream_compression_level() == expected
+
+
+@pytest.mark.asyncio
+async def test_gzip_chunks_decode_per_event():
+    """각 압축 조각만으로 해당 이벤트까지 완전히 복원된다 (sync flush)."""
+    lines = [
+        json.dumps({"type": "stage", "name": "parse", "status": "start"}).encode() + b"\n",
+        json.dumps({"type": "narrative_delta", "text": "어두운 복도"}, ensure_ascii=False).encode()
+        + b"\n",
+        json.dumps({"type": "final", "data": {"narrative": "문이 열립니다. " * 50}}).encode()
+        + b"\n",
+    ]
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    decoded = b""
+    chunks = [chunk async for chunk in compress_stream(_lines(lines), StreamEncoding.GZIP)]
+
+    for i in range(len(lines)):
+        decoded += decoder.decompress(chunks[i])
+        assert decoded == b"".join(lines[: i + 1])
+
+    assert decoder.decompress(chunks[-1]) == b""
+    assert decoder.eof
+
+
+@pytest.mark.asyncio
+async def test_identity_passthrough_does_not_record_stats():
+    lines = [b'{"type":"stage"}\n']
+
+    chunks = [chunk async for chunk in compress_stream(_lines(lines), StreamEncoding.IDENTITY)]
+
+    assert chunks == lines
+    assert get_stream_compression_stats().get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_stats_report_compression_ratio():
+    lines = [json.dumps({"text": "반복되는 한국어 텍스트 " * 40}).encode() + b"\n"] * 3
+
+    async for _ in compress_stream(_lines(lines), StreamEncoding.GZIP):
+        pass
+
+    stats = get_stream_compression_stats().get_stats()["gzip"]
+    assert stats["streams"] == 1
+    assert stats["raw_bytes"] == sum(len(line) for line in lines)
+    assert 0 < stats["ratio"] < 0.5
@@ -0,0 +1,179 @@
+"""턴 스트림 이벤트 큐 (크기 제한/stage 병합/백프레셔/연결 끊김) 단위 테스트."""
+
+import asyncio
+
+import pytest
+
+from unknown_world.api import turn as turn_api
+from unknown_world.api.turn_event_queue import (
+    TurnEventQueue,
+    TurnStreamMetrics,
+    get_turn_stream_metrics,
+    reset_turn_stream_metrics,
+)
+from unknown_world.models.turn import AgentPhase, ClientInfo, EconomySnapshot, Language, TurnInput
+from unknown_world.orchestrator.stages.types import PipelineEvent, PipelineEventType
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    reset_turn_stream_metrics()
+    yield
+    reset_turn_stream_metrics()
+
+
+def _stage(event_type: PipelineEventType, phase: AgentPhase) -> PipelineEvent:
+    return PipelineEvent(event_type=event_type, phase=phase)
+
+
+def _badges() -> PipelineEvent:
+    return PipelineEvent(event_type=PipelineEventType.BADGES, badges=[])
+
+
+@pytest.mark.asyncio
+async def test_full_queue_coalesces_superseded_stage_events():
+    metrics = TurnStreamMetrics()
+    queue = TurnEventQueue(maxsize=2, metrics=metrics)
+
+    await queue.put(_stage(PipelineEventType.STAGE_START, AgentPhase.PARSE))
+    await queue.put(_stage(PipelineEventType.STAGE_COMPLETE, AgentPhase.PARSE))
+    await queue.put(_stage(PipelineEventType.STAGE_START, AgentPhase.VALIDATE))
+
+    drained = [await queue.get(timeout=1), await queue.get(timeout=1)]
+    assert [(e.event_type, e.phase) for e in drained if e is not None] == [
+        (PipelineEventType.STAGE_COMPLETE, AgentPhase.PARSE),
+        (PipelineEventType.STAGE_START, AgentPhase.VALIDATE),
+    ]
+    assert metrics.get_stats()["coalesced_events"] == 1
+
+
+@pytest.mark.asyncio
+async def test_coalescing_only_drops_start_superseded_by_same_phase():
+    """다른 단계의 complete는 버리지 않는다 (parse가 진행 중으로 남지 않음)."""
+    metrics = TurnStreamMetrics()
+    queue = TurnEventQueue(maxsize=2, metrics=metrics)
+
+    await queue.put(_stage(PipelineEventType.STAGE_COMPLETE, AgentPhase.PARSE))
+    await queue.put(_stage(PipelineEventType.STAGE_START, AgentPhase.VALIDATE))
+    await queue.put(_stage(PipelineEventType.STAGE_COMPLETE, AgentPhase.VALIDATE))
+
+    drained = [await queue.get(timeout=1), await queue.get(timeout=1)]
+    assert [(e.event_type, e.phase) for e in drained if e is not None] == [
+        (PipelineEventType.STAGE_COMPLETE, AgentPhase.PARSE),
+        (PipelineEventType.STAGE_COMPLETE, AgentPhase.VALIDATE),
+    ]
+    assert metrics.get_stats()["coalesced_events"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stage_without_same_phase_successor_applies_backpressure():
+    metrics = TurnStreamMetrics()
+    queue = TurnEventQueue(maxsize=2, metrics=metrics)
+    await queue.put(_stage(PipelineEventType.STAGE_START, AgentPhase.PARSE))
+    await queue.put(_stage(PipelineEventType.STAGE_COMPLETE, AgentPhase.VALIDATE))
+
+    producer = asyncio.create_task(
+        queue.put(_stage(PipelineEventType.STAGE_START, AgentPhase.RESOLVE))
+    )
+    await asyncio.sleep(0.01)
+    assert not producer.done()
+
+    first = await queue.get(timeout=1)
+    await asyncio.wait_for(producer, timeout=1)
+
+    assert first is not None and first.phase == AgentPhase.PARSE
+    assert [e.phase for e in [await queue.get(timeout=1), await queue.get(timeout=1)] if e] == [
+        AgentPhase.VALIDATE,
+        AgentPhase.RESOLVE,
+    ]
+    assert metrics.get_stats()["coalesced_events"] == 0
+
+
+@pytest.mark.asyncio
+async def test_non_stage_events_apply_backpressure():
+    """병합할 stage 이벤트가 없으면 생산자는 소비될 때까지 대기한다 (이벤트 유실 없음)."""
+    metrics = TurnStreamMetrics()
+    queue = TurnEventQueue(maxsize=2, metrics=metrics)
+    await queue.put(_stage(PipelineEventType.STAGE_START, AgentPhase.RESOLVE))
+    await queue.put(_badges())
+
+    producer = asyncio.create_task(queue.put(_badges()))
+    await asyncio.sleep(0.01)
+    assert not producer.done()  # 마지막 stage 상태는 병합 대상이 아님
+
+    first = await queue.get(timeout=1)
+    await asyncio.wait_for(producer, timeout=1)
+
+    assert first is not None and first.event_type == PipelineEventType.STAGE_START
+    assert len(queue) == 2
+    assert metrics.get_stats()["producer_waits"] == 1
+    assert metrics.get_stats()["coalesced_events"] == 0
+
+
+@pytest.mark.asyncio
+async def test_close_drains_then_returns_none_and_get_times_out():
+    queue = TurnEventQueue(maxsize=4, metrics=TurnStreamMetrics())
+
+    with pytest.raises(TimeoutError):
+        await queue.get(timeout=0.01)
+
+    await queue.put(_badges())
+    await queue.close()
+
+    assert await queue.get(timeout=1) is not None
+    assert await queue.get(timeout=1) is None
+
+
+@pytest.mark.asyncio
+async def test_dequeue_records_lag():
+    now = [100.0]
+    metrics = TurnStreamMetrics()
+    queue = TurnEventQueue(maxsize=4, metrics=metrics, clock=lambda: now[0])
+
+    await queue.put(_badges())
+    now[0] += 0.25
+    await queue.get(timeout=1)
+
+    stats = metrics.get_stats()
+    assert stats["events"] == 1
+    assert stats["max_lag_ms"] == 250.0
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_pipeline_task(monkeypatch):
+    """연결 끊김이 감지되면 final 없이 종료하고 파이프라인(모델 호출)을 취소한다."""
+    monkeypatch.setenv("UW_TURN_DISCONNECT_POLL_S", "0.01")
+    cancelled = asyncio.Event()
+
+    async def slow_pipeline(ctx, *, emit):
+        await emit(_stage(PipelineEventType.STAGE_START, AgentPhase.PARSE))
+        try:
+            await asyncio.sleep(30)  # 진행 중인 모델 호출
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return ctx
+
+    monkeypatch.setattr(turn_api, "run_pipeline", slow_pipeline)
+    disconnected = False
+
+    async def is_disconnected() -> bool:
+        return disconnected
+
+    turn_input = TurnInput(
+        language=Language.KO,
+        text="문을 연다",
+        client=ClientInfo(viewport_w=1920, viewport_h=1080),
+        economy_snapshot=EconomySnapshot(signal=100, memory_shard=5),
+    )
+    stream = turn_api._stream_turn_events(turn_input, is_disconnected=is_disconnected)
+
+    first = await anext(stream)
+    assert b'"status":"start"' in first
+
+    disconnected = True
+    remaining = [line async for line in stream]
+
+    assert remaining == []
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert get_turn_stream_metrics().get_stats()["disconnects"] == 1
@@ -0,0 +1,148 @@
+"""멱등 턴 제출 재생 저장소 (재생/합류/충돌/포기 취소/만료) 단위 테스트."""
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+import pytest
+
+from unknown_world.api.turn_replay import (
+    IdempotencyKeyConflictError,
+    TurnReplayMode,
+    TurnReplayStore,
+    is_valid_idempotency_key,
+    turn_fingerprint,
+)
+from unknown_world.models.turn import ClientInfo, EconomySnapshot, Language, TurnInput
+
+STAGE = b'{"type":"stage","name":"parse","status":"start"}\n'
+FINAL = b'{"type":"final","data":{}}\n'
+
+
+class FakeTurn:
+    """호출 횟수를 세고, release 전까지 final을 보내지 않는 턴 스트림."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.cancelled = asyncio.Event()
+
+    def __call__(self, is_abandoned: Callable[[], Awaitable[bool]]) -> AsyncGenerator[bytes]:
+        self.calls += 1
+        return self._stream(is_abandoned)
+
+    async def _stream(self, is_abandoned: Callable[[], Awaitable[bool]]) -> AsyncGenerator[bytes]:
+        yield STAGE
+        while not self.release.is_set():
+            if await is_abandoned():
+                self.cancelled.set()
+                return  # _stream_turn_events와 같이 final 없이 종료
+            await asyncio.sleep(0.005)
+        yield FINAL
+
+
+async def _collect(stream: AsyncGenerator[bytes]) -> list[bytes]:
+    return [line async for line in stream]
+
+
+@pytest.mark.asyncio
+async def test_completed_turn_is_replayed_without_regeneration():
+    store = TurnReplayStore(ttl_seconds=60, max_entries=8, attach_grace_seconds=5)
+    turn = FakeTurn()
+    turn.release.set()
+
+    mode, stream = store.open("k1", "fp", turn)
+    assert mode == TurnReplayMode.NEW
+    assert await _collect(stream) == [STAGE, FINAL]
+
+    mode, stream = store.open("k1", "fp", turn)
+    assert mode == TurnReplayMode.REPLAYED
+    assert await _collect(stream) == [STAGE, FINAL]
+    assert turn.calls == 1
+    assert store.get_stats()["replayed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_during_in_flight_turn_attaches_to_running_pipeline():
+    store = TurnReplayStore(ttl_seconds=60, max_entries=8, attach_grace_seconds=5)
+    turn = FakeTurn()
+
+    _, first = store.open("k1", "fp", turn)
+    assert await anext(first) == STAGE
+    await first.aclose()  # 연결 끊김
+
+    mode, retry = store.open("k1", "fp", turn)
+    assert mode == TurnReplayMode.ATTACHED
+    assert await anext(retry) == STAGE  # 지금까지의 이벤트 재생
+    turn.release.set()
+    assert await _collect(retry) == [FINAL]
+    assert turn.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_same_key_with_different_input_conflicts():
+    store = TurnReplayStore(ttl_seconds=60, max_entries=8, attach_grace_seconds=5)
+    turn = FakeTurn()
+    turn.release.set()
+    await _collect(store.open("k1", "fp-a", turn)[1])
+
+    with pytest.raises(IdempotencyKeyConflictError):
+        store.open("k1", "fp-b", turn)
+    assert store.get_stats()["conflicts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_abandoned_turn_is_cancelled_and_not_stored():
+    store = TurnReplayStore(ttl_seconds=60, max_entries=8, attach_grace_seconds=0.01)
+    turn = FakeTurn()
+
+    _, stream = store.open("k1", "fp", turn)
+    await anext(stream)
+    await stream.aclose()
+
+    await asyncio.wait_for(turn.cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert len(store) == 0  # final 없이 끝난 턴은 재시도 시 새로 생성
+    assert store.get_stats()["abandoned"] == 1
+
+    mode, _ = store.open("k1", "fp", turn)
+    assert mode == TurnReplayMode.NEW
+    await store.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_completed_turns_expire_and_are_bounded():
+    now = [0.0]
+    store = TurnReplayStore(
+        ttl_seconds=10, max_entries=2, attach_grace_seconds=5, clock=lambda: now[0]
+    )
+    turn = FakeTurn()
+    turn.release.set()
+
+    for key in ("a", "b", "c"):
+        await _collect(store.open(key, "fp", turn)[1])
+        now[0] += 1
+    assert len(store) == 2  # 가장 오래된 완료 턴 제거
+
+    now[0] += 10
+    store.open("d", "fp", turn)
+    assert len(store) == 1
+    await store.shutdown()
+
+
+def test_fingerprint_and_key_validation():
+    turn_input = TurnInput(
+        language=Language.KO,
+        text="문을 연다",
+        client=ClientInfo(viewport_w=1920, viewport_h=1080),
+        economy_snapshot=EconomySnapshot(signal=100, memory_shard=5),
+    )
+    other = turn_input.model_copy(update={"text": "창문을 연다"})
+
+    assert turn_fingerprint(turn_input) == turn_fingerprint(turn_input.model_copy())
+    assert turn_fingerprint(turn_input) != turn_fingerprint(other)
+    assert turn_fingerprint(turn_input, 1) != turn_fingerprint(turn_input, 2)
+
+    assert is_valid_idempotency_key("turn-3f2a")
+    assert not is_valid_idempotency_key("")
+    assert not is_valid_idempotency_key("x" * 201)
+    assert not is_valid_idempotency_key("키")
@@ -0,0 +1,113 @@
+"""NDJSON 스트림 이벤트 빠른 직렬화 경로 단위 테스트.
+
+빠른 경로(사전 렌더링/모델 생성 생략, final의 model_dump_json 삽입)가
+Pydantic 이벤트 모델 + 표준 json 인코딩 경로와 바이트 단위로 같은 라인을 만드는지 검증합니다.
+"""
+
+import json
+from typing import Any
+
+import pytest
+
+from unknown_world.api.turn import _convert_pipeline_event
+from unknown_world.api.turn_stream_events import (
+    BadgesEvent,
+    ErrorEvent,
+    FinalEvent,
+    NarrativeDeltaEvent,
+    RepairEvent,
+    StageEvent,
+    StageStatus,
+    badges_event_line,
+    error_event_line,
+    final_event_line,
+    narrative_delta_event_line,
+    repair_event_line,
+    stage_event_line,
+)
+from unknown_world.models.turn import (
+    AgentPhase,
+    ClientInfo,
+    EconomySnapshot,
+    Language,
+    TurnInput,
+    ValidationBadge,
+)
+from unknown_world.orchestrator.fallback import create_safe_fallback
+from unknown_world.orchestrator.mock import MockOrchestrator
+from unknown_world.orchestrator.stages.types import PipelineEvent, PipelineEventType
+
+
+def _legacy_line(event: dict[str, Any]) -> bytes:
+    """이벤트 모델 dict를 표준 json으로 직렬화한 NDJSON 라인 (비교 기준)."""
+    return (json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+@pytest.mark.parametrize("phase", list(AgentPhase))
+@pytest.mark.parametrize("status", [StageStatus.START, StageStatus.COMPLETE, StageStatus.FAIL])
+def test_stage_lines_are_prerendered_and_identical(phase: AgentPhase, status: str):
+    line = stage_event_line(phase.value, status)
+
+    assert line == _legacy_line(StageEvent(name=phase.value, status=status).model_dump())
+    assert stage_event_line(phase.value, status) is line  # 캐시된 bytes 재사용
+
+
+def test_dynamic_lines_match_event_models():
+    badges = [ValidationBadge.SCHEMA_OK.value, ValidationBadge.ECONOMY_OK.value]
+    text = '문을 연다 "따옴표"와 \\ 역슬래시\n줄바꿈'
+
+    assert badges_event_line(badges) == _legacy_line(BadgesEvent(badges=badges).model_dump())
+    assert repair_event_line(1, "재시도 중") == _legacy_line(
+        RepairEvent(attempt=1, message="재시도 중").model_dump()
+    )
+    assert repair_event_line(2) == _legacy_line(RepairEvent(attempt=2).model_dump())
+    assert narrative_delta_event_line(text) == _legacy_line(
+        NarrativeDeltaEvent(text=text).model_dump()
+    )
+    assert error_event_line("오류", "INTERNAL_ERROR") == _legacy_line(
+        ErrorEvent(message="오류", code="INTERNAL_ERROR").model_dump()
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("language", [Language.KO, Language.EN])
+def test_final_line_matches_double_dump_path(seed: int, language: Language):
+    """model_dump_json 1회 삽입 결과가 기존 model_dump → FinalEvent → json 경로와 같다."""
+    turn_input = TurnInput(
+        language=language,
+        text="문을 연다",
+        client=ClientInfo(viewport_w=1920, viewport_h=1080),
+        economy_snapshot=EconomySnapshot(signal=100, memory_shard=5),
+    )
+    output = MockOrchestrator(seed=seed).generate_turn_output(turn_input)
+
+    legacy = _legacy_line(FinalEvent(data=output.model_dump(mode="json")).model_dump(mode="json"))
+    assert final_event_line(output) == legacy
+
+
+def test_final_line_escapes_like_stdlib_json():
+    output = create_safe_fallback(language=Language.KO)
+    output = output.model_copy(
+        update={"narrative": '제어\x00\x1f\t\n\r\b\f 문자 "따옴표" \\ \u2028 \x7f 😀 é'}
+    )
+
+    legacy = _legacy_line(FinalEvent(data=output.model_dump(mode="json")).model_dump(mode="json"))
+    assert final_event_line(output) == legacy
+    assert json.loads(final_event_line(output))["data"]["narrative"] == output.narrative
+
+
+def test_convert_pipeline_event_returns_bytes():
+    start = _convert_pipeline_event(
+        PipelineEvent(event_type=PipelineEventType.STAGE_START, phase=AgentPhase.PARSE)
+    )
+    badges = _convert_pipeline_event(
+        PipelineEvent(event_type=PipelineEventType.BADGES, badges=[ValidationBadge.SCHEMA_OK])
+    )
+    missing_phase = _convert_pipeline_event(PipelineEvent(event_type=PipelineEventType.STAGE_START))
+
+    assert start == b'{"type":"stage","name":"parse","status":"start"}\n'
+    assert badges is not None and json.loads(badges) == {
+        "type": "badges",
+        "badges": [ValidationBadge.SCHEMA_OK.value],
+    }
+    assert missing_phase is None
@@ -0,0 +1,201 @@
+"""Unknown World - 리플레이 스위트 병렬 실행/샤딩/리포트 단위 테스트."""
+
+import asyncio
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from unknown_world.harness import suite_runner
+from unknown_world.harness.replay_runner import ReplayResult, run_replay, save_scenario
+from unknown_world.harness.reports import to_junit_xml
+from unknown_world.harness.scenario import (
+    GateResult,
+    GateStatus,
+    Scenario,
+    ScenarioStep,
+    StepResult,
+)
+from unknown_world.harness.suite_runner import (
+    merge_suite_results,
+    run_suite,
+    run_suite_files,
+    shard_items,
+)
+
+
+def _scenario(name: str, steps: int = 2) -> Scenario:
+    return Scenario(
+        name=name,
+        steps=[ScenarioStep(text=f"Look around {i}", action_id="explore") for i in range(steps)],
+    )
+
+
+def test_shard_items_round_robin_covers_all_items_once():
+    items = list(range(10))
+    shards = [shard_items(items, index, 3) for index in range(3)]
+
+    assert shards[0] == [0, 3, 6, 9]
+    assert sorted(x for shard in shards for x in shard) == items
+    with pytest.raises(ValueError):
+        shard_items(items, 3, 3)
+
+
+@pytest.mark.asyncio
+async def test_run_replay_skips_stage_delays_by_default():
+    result = await asyncio.wait_for(run_replay(_scenario("fast", steps=3)), timeout=1.0)
+
+    assert result.all_passed
+    assert result.duration_ms > 0
+    assert all(step.duration_ms > 0 for step in result.step_results)
+
+
+@pytest.mark.asyncio
+async def test_run_suite_bounds_concurrency_and_keeps_input_order(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    active = 0
+    peak = 0
+
+    async def fake_replay(scenario: Scenario, *, stage_delays: bool) -> ReplayResult:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        failed = 1 if scenario.name == "s3" else 0
+        return ReplayResult(
+            scenario_name=scenario.name,
+            total_steps=1,
+            passed_steps=1 - failed,
+            failed_steps=failed,
+        )
+
+    monkeypatch.setattr(suite_runner, "run_replay", fake_replay)
+    scenarios = [_scenario(f"s{i}") for i in range(8)]
+
+    suite = await run_suite(scenarios, concurrency=3)
+
+    assert peak == 3
+    assert [r.scenario_name for r in suite.results] == [s.name for s in scenarios]
+    assert (suite.passed_scenarios, suite.failed_scenarios) == (7, 1)
+    assert not suite.all_passed
+
+
+@pytest.mark.asyncio
+async def test_sharded_runs_merge_into_full_suite():
+    scenarios = [_scenario(f"s{i}", steps=1) for i in range(5)]
+
+    shards = [
+        await run_suite(scenarios, concurrency=2, shard_index=index, shard_count=2)
+        for index in range(2)
+    ]
+    merged = merge_suite_results(shards)
+
+    assert [shard.total_scenarios for shard in shards] == [3, 2]
+    assert shards[1].shard_index == 1
+    assert merged.total_scenarios == 5
+    assert merged.passed_steps == 5
+    assert merged.step_timing.count == 5
+    assert merged.shard_index is None
+
+
+@pytest.mark.asyncio
+async def test_run_suite_files_loads_only_shard_and_records_load_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    paths = [tmp_path / "a.json", tmp_path / "b.json", tmp_path / "c.json"]
+    save_scenario(_scenario("a", steps=1), paths[0])
+    save_scenario(_scenario("b", steps=1), paths[1])
+    paths[2].write_text("{not json", encoding="utf-8")
+    loaded: list[str] = []
+    real_load = suite_runner.load_scenario
+
+    def tracking_load(path: str | Path) -> Scenario:
+        loaded.append(Path(path).name)
+        return real_load(path)
+
+    monkeypatch.setattr(suite_runner, "load_scenario", tracking_load)
+
+    suite = await run_suite_files(paths, shard_index=0, shard_count=2)
+
+    assert loaded == ["a.json", "c.json"]
+    assert [r.scenario_name for r in suite.results] == ["a", str(paths[2])]
+    assert (suite.passed_scenarios, suite.failed_scenarios) == (1, 1)
+    assert "failed to load" in suite.results[1].summary
+
+
+def test_junit_report_marks_gate_failures_and_errors():
+    failed_step = StepResult(
+        step_index=0,
+        text="Open the door",
+        gates=[
+            GateResult(name="schema", status=GateStatus.PASS),
+            GateResult(name="economy", status=GateStatus.FAIL, detail="Negative balance: -5"),
+        ],
+        all_passed=False,
+        duration_ms=12.0,
+    )
+    error_step = StepResult(
+        step_index=1,
+        text="Pick up the key",
+        gates=[GateResult(name="schema", status=GateStatus.FAIL, detail="boom")],
+        all_passed=False,
+        error="boom",
+    )
+    scenario = ReplayResult(
+        scenario_name="broken",
+        total_steps=2,
+        passed_steps=0,
+        failed_steps=2,
+        step_results=[failed_step, error_step],
+    )
+    suite = suite_runner.SuiteResult(
+        total_scenarios=1, failed_scenarios=1, total_steps=2, failed_steps=2, results=[scenario]
+    )
+
+    root = ET.fromstring(to_junit_xml(suite))
+
+    assert (root.get("tests"), root.get("failures"), root.get("errors")) == ("2", "1", "1")
+    cases = root.findall("./testsuite/testcase")
+    failure = cases[0].find("failure")
+    assert failure is not None and failure.get("message") == "economy"
+    assert "Negative balance: -5" in (failure.text or "")
+    assert cases[0].get("time") == "0.012"
+    assert cases[1].find("error") is not None
+
+
+def test_junit_report_counts_crashed_scenario_as_one_error():
+    passed = ReplayResult(
+        scenario_name="ok",
+        total_steps=1,
+        passed_steps=1,
+        failed_steps=0,
+        step_results=[StepResult(step_index=0, text="Look", gates=[], all_passed=True)],
+    )
+    crashed = ReplayResult(
+        scenario_name="crashed",
+        total_steps=3,
+        passed_steps=0,
+        failed_steps=3,
+        summary="Replay 'crashed' crashed: boom",
+    )
+    suite = suite_runner.SuiteResult(
+        total_scenarios=2,
+        failed_scenarios=1,
+        total_steps=4,
+        failed_steps=3,
+        results=[passed, crashed],
+    )
+
+    root = ET.fromstring(to_junit_xml(suite))
+
+    assert (root.get("tests"), root.get("failures"), root.get("errors")) == ("2", "0", "1")
+    testsuite = root.findall("./testsuite")[1]
+    assert (testsuite.get("tests"), testsuite.get("failures"), testsuite.get("errors")) == (
+        "1",
+        "0",
+        "1",
+    )
+    error = testsuite.find("./testcase/error")
+    assert error is not None and error.get("type") == "ScenarioError"
@@ -0,0 +1,43 @@
+"""모델 핫패스 (빈 리스트 기본값 default_factory) 단위 테스트."""
+
+from unknown_world.models.turn import (
+    ActionDeck,
+    AgentConsole,
+    ImageJob,
+    TurnOutput,
+    UIOutput,
+    ValidationBadge,
+    WorldDelta,
+)
+
+_LIST_DEFAULT_FIELDS = [
+    (ActionDeck, "cards"),
+    (UIOutput, "objects"),
+    (WorldDelta, "rules_changed"),
+    (WorldDelta, "inventory_added"),
+    (WorldDelta, "inventory_removed"),
+    (WorldDelta, "quests_updated"),
+    (WorldDelta, "relationships_changed"),
+    (WorldDelta, "memory_pins"),
+    (ImageJob, "reference_image_ids"),
+    (AgentConsole, "badges"),
+]
+
+
+def test_list_defaults_are_fresh_per_instance():
+    first = AgentConsole()
+    first.badges.append(ValidationBadge.SCHEMA_OK)
+
+    assert AgentConsole().badges == []
+    assert WorldDelta().inventory_added is not WorldDelta().inventory_added
+
+
+def test_list_defaults_keep_schema_default():
+    """default_factory로 바꿔도 Gemini/프론트엔드 스키마의 "default": []는 유지된다."""
+    defs = TurnOutput.model_json_schema()["$defs"]
+
+    for model, field in _LIST_DEFAULT_FIELDS:
+        assert defs[model.__name__]["properties"][field]["default"] == []
+        field_info = model.model_fields[field]
+        assert field_info.default_factory is not None
+        assert field_info.get_default(call_default_factory=True) == []
@@ -234,3 +234,23 @@ async def test_validate_stage_mock_unexpected_exception(turn_input):
     assert ctx.is_fallback is True
     # _validate_mock 내부 try-except 루프가 MAX_REPAIR_ATTEMPTS만큼 돌고 결국 폴백
     assert ctx.repair_attempts > 0
+
+
+@pytest.mark.asyncio
+async def test_commit_stage_prefetches_inventory_icons(turn_input):
+    """검증된 출력의 inventory_added 아이콘을 commit 단계에서 prefetch로 큐잉한다."""
+    from unittest.mock import MagicMock
+
+    ctx = create_pipeline_context(turn_input, seed=2, is_mock=True)
+    assert ctx.icon_prefetcher is None  # Mock 모드 기본값
+
+    ctx.icon_prefetcher = MagicMock()
+    ctx.session_id = "session-1"
+    ctx = await run_pipeline(ctx, emit=AsyncMock())
+
+    added = ctx.output.world.inventory_added
+    assert added
+    ctx.icon_prefetcher.prefetch_icons.assert_called_once()
+    call = ctx.icon_prefetcher.prefetch_icons.call_args
+    assert list(call.args[0]) == [(item.id, item.description or item.label) for item in added]
+    assert call.kwargs == {"language": "ko-KR", "session_id": "session-1"}
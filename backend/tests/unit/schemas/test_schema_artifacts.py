@@ -0,0 +1,69 @@
+"""빌드 시 생성되는 TurnInput/TurnOutput JSON Schema 아티팩트 단위 테스트.
+
+생성물이 현재 Pydantic 모델과 일치하는지(drift) 검사합니다.
+실패 시: cd backend && uv run python -m unknown_world.schemas
+"""
+
+import json
+
+import pytest
+
+from unknown_world.models.turn import TurnOutput
+from unknown_world.orchestrator.generate_turn_output import TurnOutputGenerator
+from unknown_world.schemas.artifacts import (
+    MANIFEST_PATH,
+    SHARED_SCHEMA_DIR,
+    find_stale_artifacts,
+    get_turn_schema_artifacts,
+    load_turn_schema_artifacts,
+    reset_turn_schema_artifacts,
+    strip_additional_properties,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_artifacts():
+    reset_turn_schema_artifacts()
+    yield
+    reset_turn_schema_artifacts()
+
+
+def test_generated_artifacts_match_models():
+    assert find_stale_artifacts() == []
+
+
+def test_gemini_schema_has_no_additional_properties():
+    schema = get_turn_schema_artifacts().gemini_schema()
+
+    assert schema == strip_additional_properties(TurnOutput.model_json_schema())
+    assert "additionalProperties" not in json.dumps(schema)
+
+
+def test_loaded_artifacts_version_matches_manifest_and_shared_schemas():
+    artifacts = get_turn_schema_artifacts()
+    manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+    assert artifacts.source == "generated"
+    assert artifacts.version == manifest["version"]
+    for name in ("turn_input", "turn_output"):
+        shared = json.loads((SHARED_SCHEMA_DIR / f"{name}.schema.json").read_text("utf-8"))
+        assert shared["x-schema-version"] == artifacts.version
+
+
+def test_fallback_build_from_models_has_same_version(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("UW_SCHEMA_ARTIFACTS", "0")
+    built = load_turn_schema_artifacts()
+
+    assert built.source == "models"
+    assert built.version == get_turn_schema_artifacts().version
+    assert built.gemini_schema() == get_turn_schema_artifacts().gemini_schema()
+
+
+def test_generator_receives_fresh_schema_copy_per_request():
+    generator = TurnOutputGenerator(force_mock=True)
+    first = generator._get_json_schema()  # pyright: ignore[reportPrivateUsage]
+    first["properties"].clear()  # SDK의 제자리 변환 시뮬레이션
+
+    second = generator._get_json_schema()  # pyright: ignore[reportPrivateUsage]
+    assert second["properties"]
+    assert second is not first
@@ -0,0 +1,95 @@
+"""Unknown World - Scene affordance 백그라운드 선계산 테스트."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from unknown_world.models.turn import Box2D, Language
+from unknown_world.services.affordance_precompute import (
+    AffordancePrecomputer,
+    image_id_from_url,
+)
+from unknown_world.services.agentic_vision import Affordance, VisionAnalysisResult
+
+
+def _result(*labels: str) -> VisionAnalysisResult:
+    return VisionAnalysisResult(
+        affordances=[
+            Affordance(label=label, box_2d=Box2D(ymin=100, xmin=100, ymax=200, xmax=200))
+            for label in labels
+        ]
+    )
+
+
+def _precomputer(analyze: AsyncMock, **kwargs) -> AffordancePrecomputer:
+    service = MagicMock()
+    service.analyze_scene = analyze
+    return AffordancePrecomputer(lambda: service, **kwargs)
+
+
+def test_image_id_from_url_maps_variants():
+    assert image_id_from_url("/static/images/generated/img_abc.png") == "img_abc"
+    assert image_id_from_url("/static/images/generated/img_abc.medium.webp?v=1") == "img_abc"
+    assert image_id_from_url("/ui/scenes/intro.webp") is None
+
+
+@pytest.mark.asyncio
+async def test_precomputed_result_is_served_by_image_id():
+    analyze = AsyncMock(return_value=_result("상자"))
+    precomputer = _precomputer(analyze)
+
+    assert precomputer.schedule("img_abc", Language.KO) is True
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    result = await precomputer.get("/static/images/generated/img_abc.medium.webp", Language.KO)
+
+    assert result is not None
+    assert [a.label for a in result.affordances] == ["상자"]
+    analyze.assert_awaited_once_with("/static/images/generated/img_abc.png", Language.KO)
+    assert await precomputer.get("/static/images/generated/img_abc.png", Language.EN) is None
+    assert precomputer.schedule("img_abc", Language.KO) is False  # 이미 보관됨
+
+
+@pytest.mark.asyncio
+async def test_trigger_waits_for_running_precompute():
+    """트리거가 선계산 도중 도착하면 완료를 기다려 같은 결과를 사용한다."""
+    release = asyncio.Event()
+
+    async def slow_analyze(image_url: str, language: Language) -> VisionAnalysisResult:
+        await release.wait()
+        return _result("lever")
+
+    precomputer = _precomputer(AsyncMock(side_effect=slow_analyze), wait_seconds=5)
+    precomputer.schedule("img_run", Language.EN)
+
+    pending = asyncio.create_task(
+        precomputer.get("/static/images/generated/img_run.png", Language.EN)
+    )
+    await asyncio.sleep(0)
+    release.set()
+    result = await pending
+
+    assert result is not None
+    assert result.affordances[0].label == "lever"
+
+
+@pytest.mark.asyncio
+async def test_empty_or_timed_out_precompute_is_not_served():
+    empty = _precomputer(AsyncMock(return_value=VisionAnalysisResult(success=False)))
+    empty.schedule("img_empty", Language.EN)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert await empty.get("/static/images/generated/img_empty.png", Language.EN) is None
+
+    never = asyncio.Event()
+
+    async def hang(image_url: str, language: Language) -> VisionAnalysisResult:
+        await never.wait()
+        return _result("x")
+
+    slow = _precomputer(AsyncMock(side_effect=hang), wait_seconds=0.01)
+    slow.schedule("img_slow", Language.EN)
+    assert await slow.get("/static/images/generated/img_slow.png", Language.EN) is None
+    await slow.shutdown()
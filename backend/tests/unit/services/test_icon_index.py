@@ -0,0 +1,83 @@
+"""Unknown World - 아이콘 캐시 manifest 인덱스 테스트."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from unknown_world.services.icon_index import MANIFEST_FILENAME, IconIndex
+from unknown_world.services.item_icon_generator import IconCache
+
+
+def _url(cache_key: str) -> str:
+    return f"/static/images/generated/icons/{cache_key}.png"
+
+
+def _write_icon(cache_dir: Path, cache_key: str, size: int) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / f"{cache_key}.png").write_bytes(b"x" * size)
+
+
+def test_manifest_round_trip(tmp_path):
+    """put한 엔트리는 manifest에 저장되어 새 인덱스로 복원된다."""
+    index = IconIndex(tmp_path)
+    index.load(url_for_key=_url)
+    _write_icon(tmp_path, "k1", 10)
+    index.put("k1", url=_url("k1"), size=10, canonical="iron key")
+
+    raw = json.loads((tmp_path / MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    assert set(raw["entries"]) == {"k1"}
+
+    restored = IconIndex(tmp_path)
+    restored.load(url_for_key=_url)
+    entry = restored.get("k1")
+    assert entry is not None
+    assert entry.url == _url("k1")
+    assert entry.canonical == "iron key"
+
+
+def test_lru_eviction_by_entries_and_bytes(tmp_path):
+    """엔트리 수/바이트 쿼터를 넘으면 가장 오래 사용되지 않은 아이콘을 파일째 축출한다."""
+    index = IconIndex(tmp_path, max_entries=2, max_bytes=25)
+    index.load(url_for_key=_url)
+    for key in ("a", "b"):
+        _write_icon(tmp_path, key, 10)
+        index.put(key, url=_url(key), size=10)
+
+    index.get("a")  # b가 가장 오래됨
+    _write_icon(tmp_path, "c", 10)
+    evicted = index.put("c", url=_url("c"), size=10)
+    assert [entry.url for entry in evicted] == [_url("b")]
+    assert not (tmp_path / "b.png").exists()
+
+    _write_icon(tmp_path, "d", 20)
+    evicted = index.put("d", url=_url("d"), size=20)
+    assert {entry.url for entry in evicted} == {_url("a"), _url("c")}
+    assert index.get_stats()["total_bytes"] == 20
+    assert len(index) == 1
+
+
+def test_rebuild_from_directory_scan(tmp_path):
+    """manifest가 손상되면 디렉토리를 스캔하여 재구성한다."""
+    _write_icon(tmp_path, "k1", 5)
+    (tmp_path / MANIFEST_FILENAME).write_text("{not json", encoding="utf-8")
+
+    index = IconIndex(tmp_path)
+    index.load(url_for_key=_url)
+
+    assert index.get("k1") is not None
+    assert index.total_bytes == 5
+
+
+def test_icon_cache_get_does_not_touch_filesystem(tmp_path):
+    """시작 시 로드 이후 get()은 파일 시스템을 조회하지 않는다."""
+    cache = IconCache(cache_dir=tmp_path)
+    url = cache.set("Rusty iron key", b"not an image")
+
+    with patch.object(Path, "exists", side_effect=AssertionError("fs access")):
+        assert cache.get("Rusty iron key") == url
+        assert cache.get("Totally unknown artifact") is None
+
+    restored = IconCache(cache_dir=tmp_path)
+    assert restored.get("Rusty iron key") == url
+    # 유사도 인덱스도 manifest의 표준 키로 복원됨
+    assert restored.get("A rusty iron key") == url
@@ -0,0 +1,58 @@
+"""Unknown World - 아이템 아이콘 유사도 인덱스 테스트."""
+
+from unknown_world.services.icon_similarity import (
+    IconSimilarityIndex,
+    canonicalize_item_description,
+)
+from unknown_world.services.item_icon_generator import IconCache
+
+
+def test_canonical_key_ignores_articles_case_order_and_plurals():
+    assert canonicalize_item_description("A Rusty, Iron KEY!") == "iron key rusty"
+    assert canonicalize_item_description("the iron keys, rusty") == "iron key rusty"
+    assert canonicalize_item_description("녹슨 열쇠를") == canonicalize_item_description(
+        "녹슨 열쇠"
+    )
+
+
+def test_lookup_matches_canonical_and_fuzzy_entries():
+    index = IconSimilarityIndex(threshold=0.8, include_seeds=False)
+    index.add("glowing blue mushroom cap", "/icons/mushroom.png")
+
+    exact = index.lookup("A glowing blue mushroom cap")
+    assert exact is not None and exact.kind == "canonical"
+
+    fuzzy = index.lookup("glowing blue mushroom caps of the deep")
+    assert fuzzy is not None
+    assert fuzzy.kind == "fuzzy"
+    assert fuzzy.icon_url == "/icons/mushroom.png"
+
+    assert index.lookup("broken clockwork bird") is None
+
+
+def test_seed_archetypes_cover_short_names_in_both_languages():
+    index = IconSimilarityIndex()
+
+    assert index.lookup("rusty iron key").icon_url == "/ui/items/key-64.png"
+    assert index.lookup("녹슨 열쇠").icon_url == "/ui/items/key-64.png"
+    assert index.lookup("torn treasure map fragment") is None  # 4토큰: 이름형 아님
+    assert index.lookup("treasure map").icon_url == "/ui/items/map-fragment-64.png"
+    # 긴 문장형 설명은 아키타입 별칭만으로 매칭하지 않음
+    assert index.lookup("a key that opens the cellar door beneath the old inn") is None
+
+
+def test_remove_url_drops_entries():
+    index = IconSimilarityIndex(include_seeds=False)
+    index.add("ember stone", "/icons/ember.png")
+    index.remove_url("/icons/ember.png")
+
+    assert len(index) == 0
+    assert index.lookup("ember stone") is None
+
+
+def test_icon_cache_reuses_near_duplicate_description(tmp_path):
+    cache = IconCache(cache_dir=tmp_path / "icons")
+    url = cache.set("rusty iron lantern hook", b"not-an-image")
+
+    assert cache.get("A rusty iron lantern hook") == url
+    assert cache.get("Rusty iron lantern hooks") == url
@@ -0,0 +1,160 @@
+"""Unknown World - 아이콘 스프라이트 시트 배치 생성 테스트."""
+
+import asyncio
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from unknown_world.services.icon_sprite_sheet import get_sheet_grid, slice_icon_sheet
+from unknown_world.services.image_generation import (
+    ImageGenerationResponse,
+    ImageGenerationStatus,
+)
+from unknown_world.services.item_icon_generator import (
+    ICON_SIZE,
+    IconCache,
+    IconGenerationRequest,
+    IconGenerationStatus,
+    ItemIconGenerator,
+)
+
+_COLORS = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0)]
+
+
+def _sheet_png(size: int = 512) -> bytes:
+    """2x2 그리드 색상 시트 (읽기 순서: 빨강, 초록, 파랑, 노랑)."""
+    sheet = Image.new("RGB", (size, size))
+    half = size // 2
+    for index, color in enumerate(_COLORS):
+        col, row = index % 2, index // 2
+        sheet.paste(color, (col * half, row * half, (col + 1) * half, (row + 1) * half))
+    output = io.BytesIO()
+    sheet.save(output, format="PNG")
+    return output.getvalue()
+
+
+def _request(index: int) -> IconGenerationRequest:
+    return IconGenerationRequest(item_id=f"item_{index}", item_description=f"Item {index}")
+
+
+def test_sheet_grid_is_square():
+    assert get_sheet_grid(1) == (1, 1)
+    assert get_sheet_grid(3) == (2, 2)
+    assert get_sheet_grid(4) == (2, 2)
+    assert get_sheet_grid(5) == (3, 3)
+
+
+def test_slice_icon_sheet_reading_order():
+    """시트를 읽기 순서로 잘라 ICON_SIZE 타일을 만든다 (빈 셀 무시)."""
+    tiles = slice_icon_sheet(_sheet_png(), 3, ICON_SIZE)
+
+    assert len(tiles) == 3
+    for tile, color in zip(tiles, _COLORS, strict=False):
+        with Image.open(io.BytesIO(tile)) as img:
+            assert img.size == (ICON_SIZE, ICON_SIZE)
+            assert img.convert("RGB").getpixel((ICON_SIZE // 2, ICON_SIZE // 2)) == color
+
+
+@pytest.mark.asyncio
+async def test_generate_icon_batch_uses_single_sheet(tmp_path):
+    """여러 아이콘을 이미지 모델 1회 호출로 생성하고 캐시에 채운다."""
+    (tmp_path / "img_sheet.png").write_bytes(_sheet_png())
+    image_generator = MagicMock()
+    image_generator.generate = AsyncMock(
+        return_value=ImageGenerationResponse(
+            status=ImageGenerationStatus.COMPLETED,
+            image_id="img_sheet",
+            image_url="/static/images/generated/img_sheet.png",
+        )
+    )
+    cache = IconCache(cache_dir=tmp_path / "icons")
+    generator = ItemIconGenerator(image_generator=image_generator, cache=cache)
+
+    with patch(
+        "unknown_world.services.item_icon_generator.get_generated_images_dir",
+        return_value=tmp_path,
+    ):
+        responses = await generator._generate_icon_batch([_request(i) for i in range(3)])
+
+    assert image_generator.generate.await_count == 1
+    assert [r.status for r in responses] == [IconGenerationStatus.COMPLETED] * 3
+    assert [r.item_id for r in responses] == ["item_0", "item_1", "item_2"]
+    for index in range(3):
+        assert cache.get(f"Item {index}") is not None
+        assert await generator.get_icon_status(f"item_{index}") == IconGenerationStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_generate_icon_batch_falls_back_to_single_icons(tmp_path):
+    """시트 생성이 실패하면 아이콘별 개별 생성으로 폴백한다."""
+    image_generator = MagicMock()
+    image_generator.generate = AsyncMock(
+        return_value=ImageGenerationResponse(
+            status=ImageGenerationStatus.FAILED, message="invalid request"
+        )
+    )
+    generator = ItemIconGenerator(
+        image_generator=image_generator, cache=IconCache(cache_dir=tmp_path / "icons")
+    )
+
+    responses = await generator._generate_icon_batch([_request(0), _request(1)])
+
+    # 시트 1회 + 개별 2회 (invalid는 재시도 제외)
+    assert image_generator.generate.await_count == 3
+    assert all(r.status == IconGenerationStatus.FAILED for r in responses)
+    assert all(r.is_placeholder for r in responses)
+
+
+@pytest.mark.asyncio
+async def test_generate_icon_batch_fallback_runs_one_model_call_at_a_time(tmp_path):
+    """폴백 개별 생성은 큐 슬롯 하나 안에서 순차 실행된다 (동시 호출 상한 유지)."""
+    active = 0
+    peak = 0
+
+    async def generate(_request: object) -> ImageGenerationResponse:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return ImageGenerationResponse(
+            status=ImageGenerationStatus.FAILED, message="invalid request"
+        )
+
+    image_generator = MagicMock()
+    image_generator.generate = AsyncMock(side_effect=generate)
+    generator = ItemIconGenerator(
+        image_generator=image_generator, cache=IconCache(cache_dir=tmp_path / "icons")
+    )
+
+    await generator._generate_icon_batch([_request(i) for i in range(4)])
+
+    assert image_generator.generate.await_count == 5
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_icon_batch_returns_cached_descriptions_without_waiting(tmp_path):
+    """이미 캐시된 설명은 시작 시 읽은 URL로 응답한다 (도중 축출되어도 재생성하지 않음)."""
+    image_generator = MagicMock()
+    image_generator.generate = AsyncMock()
+    cache = IconCache(cache_dir=tmp_path / "icons")
+    cached_url = cache.set("Item 0", _sheet_png(64))
+    generator = ItemIconGenerator(image_generator=image_generator, cache=cache)
+    original_get = cache.get
+    calls = 0
+
+    def evicting_get(description: str) -> str | None:
+        nonlocal calls
+        calls += 1
+        return original_get(description) if calls == 1 else None
+
+    with patch.object(cache, "get", side_effect=evicting_get):
+        responses = await generator._generate_icon_batch([_request(0)])
+
+    assert image_generator.generate.await_count == 0
+    assert responses[0].status == IconGenerationStatus.CACHED
+    assert responses[0].icon_url == cached_url
+    assert responses[0].item_id == "item_0"
@@ -0,0 +1,121 @@
+"""Unknown World - 백그라운드 아이콘 작업 큐 테스트."""
+
+import asyncio
+
+import pytest
+
+from unknown_world.services.icon_work_queue import (
+    IconPriority,
+    IconQueueFullError,
+    IconWorkQueue,
+)
+from unknown_world.services.item_icon_generator import (
+    IconGenerationRequest,
+    IconGenerationResponse,
+    IconGenerationStatus,
+)
+
+
+def _request(item_id: str) -> IconGenerationRequest:
+    return IconGenerationRequest(item_id=item_id, item_description=f"Item {item_id}")
+
+
+class _RecordingHandler:
+    """배치를 기록하고 release 전까지 완료하지 않는 핸들러."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.running = 0
+        self.max_running = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, requests: list[IconGenerationRequest]) -> list[IconGenerationResponse]:
+        self.batches.append([r.item_id for r in requests])
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await self.release.wait()
+        self.running -= 1
+        return [
+            IconGenerationResponse(
+                status=IconGenerationStatus.COMPLETED, icon_url="/x.png", item_id=r.item_id
+            )
+            for r in requests
+        ]
+
+
+@pytest.mark.asyncio
+async def test_groups_requests_within_window():
+    """윈도우 내 요청은 하나의 배치로 핸들러에 전달된다."""
+    handler = _RecordingHandler()
+    handler.release.set()
+    queue = IconWorkQueue(handler, batch_size=4, window_seconds=0.01, max_concurrency=2)
+
+    results = await asyncio.gather(*(queue.submit(_request(f"i{i}")) for i in range(3)))
+
+    assert handler.batches == [["i0", "i1", "i2"]]
+    assert [r.item_id for r in results] == ["i0", "i1", "i2"]
+    assert queue.get_stats()["batches_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_priority_and_session_fairness():
+    """슬롯이 차면 대기하며, 비면 우선순위 → 세션 라운드로빈 순서로 실행한다."""
+    handler = _RecordingHandler()
+    queue = IconWorkQueue(handler, batch_size=1, window_seconds=0, max_concurrency=1)
+
+    submissions = [
+        ("busy", IconPriority.NORMAL, "s1"),
+        ("p1", IconPriority.PREFETCH, "s1"),
+        ("a1", IconPriority.NORMAL, "s1"),
+        ("a2", IconPriority.NORMAL, "s1"),
+        ("b1", IconPriority.NORMAL, "s2"),
+        ("v1", IconPriority.VISIBLE, "s2"),
+    ]
+    tasks = []
+    for item_id, priority, session in submissions:
+        tasks.append(
+            asyncio.create_task(
+                queue.submit(_request(item_id), priority=priority, session_id=session)
+            )
+        )
+        await asyncio.sleep(0)
+
+    assert handler.batches == [["busy"]]
+    assert queue.get_stats()["queued"] == 5
+
+    handler.release.set()
+    await asyncio.gather(*tasks)
+
+    assert [batch[0] for batch in handler.batches] == ["busy", "v1", "a1", "b1", "a2", "p1"]
+    assert handler.max_running == 1
+
+
+@pytest.mark.asyncio
+async def test_shedding_and_promotion():
+    """큐가 가득 차면 더 낮은 우선순위 작업을 버리고, 없으면 새 요청을 거부한다."""
+    handler = _RecordingHandler()
+    queue = IconWorkQueue(handler, batch_size=1, window_seconds=0, max_concurrency=1, max_queue=2)
+
+    busy = asyncio.create_task(queue.submit(_request("busy")))
+    await asyncio.sleep(0)
+    prefetch = asyncio.create_task(queue.submit(_request("p1"), priority=IconPriority.PREFETCH))
+    normal = asyncio.create_task(queue.submit(_request("n1")))
+    await asyncio.sleep(0)
+
+    # 가득 찬 큐: visible 요청은 prefetch를 밀어냄
+    visible = asyncio.create_task(queue.submit(_request("v1"), priority=IconPriority.VISIBLE))
+    await asyncio.sleep(0)
+    with pytest.raises(IconQueueFullError):
+        await prefetch
+
+    # 더 낮은 우선순위가 없으면 새 요청이 셰딩됨
+    with pytest.raises(IconQueueFullError):
+        await queue.submit(_request("p2"), priority=IconPriority.PREFETCH)
+
+    assert queue.promote("n1", IconPriority.VISIBLE) is True
+    assert queue.promote("n1", IconPriority.PREFETCH) is False
+
+    handler.release.set()
+    await asyncio.gather(busy, normal, visible)
+    assert [batch[0] for batch in handler.batches] == ["busy", "v1", "n1"]
+    assert queue.get_stats()["shed_total"] == 2
@@ -0,0 +1,130 @@
+"""Unknown World - 이미지 생성 작업 레지스트리(supersede/cancel) 테스트."""
+
+import asyncio
+
+import pytest
+
+from unknown_world.services.image_generation import (
+    ImageGenerationResponse,
+    ImageGenerationStatus,
+)
+from unknown_world.services.image_jobs import ImageJobRegistry
+
+
+def _completed(image_id: str) -> ImageGenerationResponse:
+    return ImageGenerationResponse(status=ImageGenerationStatus.COMPLETED, image_id=image_id)
+
+
+class _SlowGenerator:
+    """완료 신호 전까지 대기하는 생성기 (취소 여부 기록)."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def generate(self, image_id: str) -> ImageGenerationResponse:
+        self.started.set()
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return _completed(image_id)
+
+
+@pytest.mark.asyncio
+async def test_newer_turn_supersedes_older_job():
+    """같은 세션에서 새 턴 요청이 오면 이전 작업이 취소되어야 한다."""
+    registry = ImageJobRegistry(max_concurrent_jobs=2)
+    old_gen = _SlowGenerator()
+
+    old = asyncio.create_task(
+        registry.run(lambda: old_gen.generate("img_old"), session_id="s1", turn_id=1)
+    )
+    await old_gen.started.wait()
+
+    new = await registry.run(
+        lambda: asyncio.sleep(0, _completed("img_new")), session_id="s1", turn_id=2
+    )
+
+    old_result = await old
+    assert old_gen.cancelled is True
+    assert old_result.status == ImageGenerationStatus.CANCELLED
+    assert new.status == ImageGenerationStatus.COMPLETED
+    assert registry.get_stats()["cancelled_total"] == 1
+    assert registry.get_active_job("s1") is None
+
+
+@pytest.mark.asyncio
+async def test_stale_request_is_not_executed():
+    """늦게 도착한 과거 턴 요청은 실행하지 않고 취소 응답을 반환한다."""
+    registry = ImageJobRegistry(max_concurrent_jobs=2)
+    current_gen = _SlowGenerator()
+
+    current = asyncio.create_task(
+        registry.run(lambda: current_gen.generate("img_t5"), session_id="s1", turn_id=5)
+    )
+    await current_gen.started.wait()
+
+    calls: list[str] = []
+
+    async def stale() -> ImageGenerationResponse:
+        calls.append("stale")
+        return _completed("img_t4")
+
+    stale_result = await registry.run(stale, session_id="s1", turn_id=4)
+    assert stale_result.status == ImageGenerationStatus.CANCELLED
+    assert calls == []
+
+    current_gen.release.set()
+    assert (await current).status == ImageGenerationStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_different_sessions_do_not_interfere():
+    """세션이 다르면 서로의 작업을 취소하지 않는다."""
+    registry = ImageJobRegistry(max_concurrent_jobs=2)
+    gen_a = _SlowGenerator()
+
+    task_a = asyncio.create_task(
+        registry.run(lambda: gen_a.generate("img_a"), session_id="a", turn_id=1)
+    )
+    await gen_a.started.wait()
+
+    result_b = await registry.run(
+        lambda: asyncio.sleep(0, _completed("img_b")), session_id="b", turn_id=3
+    )
+    assert result_b.status == ImageGenerationStatus.COMPLETED
+
+    gen_a.release.set()
+    assert (await task_a).status == ImageGenerationStatus.COMPLETED
+    assert gen_a.cancelled is False
+
+
+@pytest.mark.asyncio
+async def test_cancel_frees_concurrency_slot():
+    """취소 API는 진행 중인 작업을 중단하고 동시 실행 슬롯을 반환한다."""
+    registry = ImageJobRegistry(max_concurrent_jobs=1)
+    blocking = _SlowGenerator()
+
+    task = asyncio.create_task(
+        registry.run(lambda: blocking.generate("img_x"), session_id="s1", turn_id=1)
+    )
+    await blocking.started.wait()
+    assert registry.get_stats()["running_jobs"] == 1
+
+    # 더 새로운 턴 기준으로는 취소되지 않음
+    assert registry.cancel("s1", turn_id=0) is False
+    assert registry.cancel("s1", turn_id=1) is True
+
+    assert (await task).status == ImageGenerationStatus.CANCELLED
+    assert registry.get_stats()["running_jobs"] == 0
+
+    # 슬롯이 반환되어 다른 세션 작업이 즉시 실행됨
+    result = await asyncio.wait_for(
+        registry.run(lambda: asyncio.sleep(0, _completed("img_y")), session_id="s2"),
+        timeout=1,
+    )
+    assert result.status == ImageGenerationStatus.COMPLETED
+    assert registry.cancel("s1") is False
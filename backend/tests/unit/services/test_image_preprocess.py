@@ -0,0 +1,78 @@
+"""Unknown World - Scanner 업로드 이미지 전처리 테스트."""
+
+import io
+
+import pytest
+from PIL import Image
+
+from unknown_world.services.image_preprocess import (
+    preprocess_scan_image,
+    preprocess_scan_image_async,
+)
+
+_EXIF_ORIENTATION = 0x0112
+
+
+def _jpeg(size: tuple[int, int], *, orientation: int | None = None) -> bytes:
+    img = Image.new("RGB", size, (200, 40, 40))
+    exif = Image.Exif()
+    if orientation is not None:
+        exif[_EXIF_ORIENTATION] = orientation
+    output = io.BytesIO()
+    img.save(output, format="JPEG", quality=95, exif=exif.tobytes())
+    return output.getvalue()
+
+
+def test_downsizes_orients_and_strips_exif():
+    """긴 변을 축소하고 EXIF 방향을 적용한 뒤 메타데이터 없이 JPEG로 재인코딩한다."""
+    # orientation=6: 90도 회전 (세로 사진)
+    content = _jpeg((3000, 2000), orientation=6)
+
+    result = preprocess_scan_image(content, "image/jpeg", max_dimension=1536)
+
+    assert result.transformed is True
+    assert result.content_type == "image/jpeg"
+    assert (result.width, result.height) == (1024, 1536)
+    with Image.open(io.BytesIO(result.data)) as img:
+        assert img.size == (1024, 1536)
+        assert _EXIF_ORIENTATION not in img.getexif()
+    assert len(result.data) < len(content)
+
+
+def test_small_clean_image_is_passed_through():
+    """축소/메타데이터 제거가 필요 없고 재인코딩 이득이 없으면 원본을 그대로 쓴다."""
+    img = Image.new("RGB", (64, 64), (10, 10, 10))
+    output = io.BytesIO()
+    img.save(output, format="PNG")
+    content = output.getvalue()
+
+    result = preprocess_scan_image(content, "image/png", max_dimension=1536)
+
+    assert result.transformed is False
+    assert result.data == content
+    assert result.content_type == "image/png"
+    assert (result.width, result.height) == (64, 64)
+
+
+def test_transparent_image_is_encoded_as_webp():
+    """투명도가 있는 이미지는 알파를 보존하도록 WebP로 재인코딩한다."""
+    img = Image.new("RGBA", (2000, 1000), (0, 0, 0, 0))
+    output = io.BytesIO()
+    img.save(output, format="PNG")
+
+    result = preprocess_scan_image(output.getvalue(), "image/png", max_dimension=1000)
+
+    assert result.content_type == "image/webp"
+    assert (result.width, result.height) == (1000, 500)
+
+
+@pytest.mark.asyncio
+async def test_async_falls_back_to_original_on_decode_error():
+    """디코딩 실패 시 원본 바이트로 분석을 계속한다 (RULE-004)."""
+    content = b"\xff\xd8\xff" + b"\x00" * 200
+
+    result = await preprocess_scan_image_async(content, "image/jpeg")
+
+    assert result.transformed is False
+    assert result.data == content
+    assert result.content_type == "image/jpeg"
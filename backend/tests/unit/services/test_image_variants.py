@@ -0,0 +1,109 @@
+"""Unknown World - 생성 이미지 WebP/AVIF 크기 변형 테스트."""
+
+import asyncio
+
+import pytest
+from PIL import Image
+
+from unknown_world.models.turn import ClientInfo
+from unknown_world.services.image_variants import (
+    create_image_variants,
+    encode_image_variants,
+    schedule_image_variants,
+)
+from unknown_world.storage.paths import (
+    build_image_variant_url,
+    get_source_image_filename,
+    select_image_variant,
+)
+
+
+def _write_source(tmp_path, image_id: str, width: int, height: int) -> None:
+    Image.new("RGB", (width, height), (40, 80, 120)).save(tmp_path / f"{image_id}.png")
+
+
+def test_encode_creates_tiers_below_source_width(tmp_path):
+    """원본보다 작은 티어만 축소 생성하고, full은 항상 생성한다."""
+    _write_source(tmp_path, "img_wide", 1600, 900)
+
+    result = encode_image_variants("img_wide", output_dir=tmp_path)
+
+    assert result.available == ["thumb", "medium", "full"]
+    with Image.open(tmp_path / "img_wide.thumb.webp") as thumb:
+        assert thumb.format == "WEBP"
+        assert thumb.size == (480, 270)
+    with Image.open(tmp_path / "img_wide.medium.webp") as medium:
+        assert medium.size == (1280, 720)
+    with Image.open(tmp_path / "img_wide.webp") as full:
+        assert full.size == (1600, 900)
+
+
+def test_encode_skips_tiers_not_smaller_than_source(tmp_path):
+    """원본 너비 이하의 티어는 건너뛴다."""
+    _write_source(tmp_path, "img_small", 400, 300)
+
+    result = encode_image_variants("img_small", output_dir=tmp_path)
+
+    assert result.available == ["full"]
+    assert not (tmp_path / "img_small.thumb.webp").exists()
+
+
+@pytest.mark.asyncio
+async def test_create_variants_falls_back_on_missing_source(tmp_path):
+    """원본이 없으면 None을 반환한다 (원본 PNG URL 유지)."""
+    assert await create_image_variants("img_missing", output_dir=tmp_path) is None
+
+
+@pytest.mark.asyncio
+async def test_create_variants_disabled_by_env(tmp_path, monkeypatch):
+    """UW_IMAGE_VARIANTS=0이면 변형을 생성하지 않는다."""
+    _write_source(tmp_path, "img_off", 1600, 900)
+    monkeypatch.setenv("UW_IMAGE_VARIANTS", "0")
+
+    assert await create_image_variants("img_off", output_dir=tmp_path) is None
+    assert not (tmp_path / "img_off.webp").exists()
+
+
+@pytest.mark.asyncio
+async def test_schedule_variants_encodes_in_background(tmp_path):
+    """client 없는 요청은 인코딩을 기다리지 않고 백그라운드에서 변형을 만든다."""
+    _write_source(tmp_path, "img_bg", 1600, 900)
+
+    assert schedule_image_variants("img_bg", output_dir=tmp_path)
+    assert not (tmp_path / "img_bg.webp").exists()
+
+    for _ in range(200):
+        if (tmp_path / "img_bg.webp").exists():
+            break
+        await asyncio.sleep(0.01)
+    assert (tmp_path / "img_bg.thumb.webp").exists()
+
+
+def test_select_variant_matches_viewport():
+    """뷰포트 너비 이상인 가장 작은 변형을 고른다."""
+    all_variants = ["thumb", "medium", "full"]
+
+    def client(width: int) -> ClientInfo:
+        return ClientInfo(viewport_w=width, viewport_h=800)
+
+    assert select_image_variant(client(390), all_variants) == "thumb"
+    assert select_image_variant(client(1280), all_variants) == "medium"
+    assert select_image_variant(client(2560), all_variants) == "full"
+    assert select_image_variant(client(390), ["full"]) == "full"
+    assert select_image_variant(None, all_variants) is None
+
+
+def test_variant_url_falls_back_to_png():
+    """클라이언트 정보가 없으면 원본 PNG URL을 반환한다."""
+    client = ClientInfo(viewport_w=1024, viewport_h=768)
+
+    assert (
+        build_image_variant_url("img_a", client=client, available=["thumb", "medium", "full"])
+        == "/static/images/generated/img_a.medium.webp"
+    )
+    assert (
+        build_image_variant_url("img_a", client=None, available=["medium"])
+        == "/static/images/generated/img_a.png"
+    )
+    assert get_source_image_filename("img_a.medium.webp") == "img_a.png"
+    assert get_source_image_filename("img_a.webp") == "img_a.png"
@@ -1,8 +1,10 @@
+import asyncio
 import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from unknown_world.services.icon_work_queue import IconPriority
 from unknown_world.services.item_icon_generator import (
     IconCache,
     IconGenerationRequest,
@@ -42,13 +44,18 @@ def test_cache_key_generation(icon_cache):
 
 
 @pytest.mark.asyncio
-async def test_generate_icon_cached(icon_generator, icon_cache, temp_cache_dir):
+async def test_generate_icon_cached(mock_image_generator, icon_cache, temp_cache_dir):
     description = "Cached item"
     cache_key = icon_cache._make_cache_key(description)
     cache_file = temp_cache_dir / f"{cache_key}.png"
     cache_file.parent.mkdir(parents=True, exist_ok=True)
     cache_file.write_bytes(b"fake_image_data")
+    (temp_cache_dir / "manifest.json").unlink()
 
+    # 재시작 시 manifest가 없으면 디렉토리 스캔으로 인덱스를 재구성
+    icon_generator = ItemIconGenerator(
+        image_generator=mock_image_generator, cache=IconCache(cache_dir=temp_cache_dir)
+    )
     request = IconGenerationRequest(
         item_id="item_1", item_description=description, language="ko-KR"
     )
@@ -146,3 +153,30 @@ async def test_generate_icon_failure(icon_generator, mock_image_generator):
     assert response.status == IconGenerationStatus.FAILED
     assert response.is_placeholder is True
     assert "placeholder" in response.icon_url
+
+
+@pytest.mark.asyncio
+async def test_prefetch_icons_queues_uncached_items_at_low_priority(icon_generator, icon_cache):
+    """캐시된 아이템은 건너뛰고 나머지는 prefetch 우선순위로 큐잉한다."""
+    icon_cache.set("Known relic", b"not an image")
+    submitted = []
+    release = asyncio.Event()
+
+    async def fake_submit(request, *, priority, session_id):
+        submitted.append((request.item_id, priority, session_id))
+        await release.wait()
+        return MagicMock()
+
+    icon_generator._work_queue.submit = fake_submit
+    scheduled = icon_generator.prefetch_icons(
+        [("a", "Known relic"), ("b", "Fresh relic"), ("c", "")],
+        language="en-US",
+        session_id="s1",
+    )
+    await asyncio.sleep(0)
+
+    assert scheduled == 1
+    assert submitted == [("b", IconPriority.PREFETCH, "s1")]
+    # 진행 중인 아이템은 중복 큐잉하지 않음
+    assert icon_generator.prefetch_icons([("b", "Fresh relic")], language="en-US") == 0
+    release.set()
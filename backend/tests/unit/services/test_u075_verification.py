@@ -73,7 +73,10 @@ async def test_item_icon_generator_generates_icon(icon_generator, mock_image_gen
     )
 
     request = IconGenerationRequest(
-        item_id="item_1", item_description="A shiny sword", language="ko-KR"
+        # 번들 아이콘 아키타입(sword 등)과 겹치지 않는 설명으로 실제 생성 경로를 검증
+        item_id="item_1",
+        item_description="A shiny starfruit",
+        language="ko-KR",
     )
 
     with patch.object(
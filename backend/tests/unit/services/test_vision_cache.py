@@ -0,0 +1,120 @@
+"""Unknown World - 비전 분석 결과 캐시 (perceptual hash) 테스트."""
+
+import io
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+from unknown_world.models.scanner import ItemCandidate, ScanResult, ScanStatus
+from unknown_world.models.turn import Language
+from unknown_world.services.image_understanding import ImageUnderstandingService
+from unknown_world.services.vision_cache import (
+    DEFAULT_VISION_CACHE_MAX_DISTANCE,
+    VisionResultCache,
+    compute_perceptual_hash,
+    reset_vision_result_caches,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    reset_vision_result_caches()
+    yield
+    reset_vision_result_caches()
+
+
+def _scene(size: tuple[int, int], *, fmt: str = "PNG", shift: int = 0) -> bytes:
+    img = Image.new("RGB", size, (30, 30, 60))
+    draw = ImageDraw.Draw(img)
+    w, h = size
+    draw.rectangle((w // 8 + shift, h // 4, w // 2, h * 3 // 4), fill=(220, 200, 40))
+    draw.ellipse((w * 5 // 8, h // 8, w * 7 // 8, h // 2), fill=(240, 240, 240))
+    output = io.BytesIO()
+    img.save(output, format=fmt)
+    return output.getvalue()
+
+
+def test_hash_is_stable_across_resize_and_reencode():
+    """같은 장면은 해상도/포맷이 달라도 해시가 (거의) 같다."""
+    original = compute_perceptual_hash(_scene((1200, 800)))
+    resized = compute_perceptual_hash(_scene((600, 400), fmt="JPEG"))
+    different = compute_perceptual_hash(_scene((1200, 800), shift=400))
+
+    assert (original ^ resized).bit_count() <= DEFAULT_VISION_CACHE_MAX_DISTANCE
+    assert (original ^ different).bit_count() > DEFAULT_VISION_CACHE_MAX_DISTANCE
+
+
+def test_cache_exact_near_and_variant_lookup():
+    cache: VisionResultCache[dict[str, int]] = VisionResultCache(
+        "test", ttl_seconds=60, max_entries=8, max_distance=2
+    )
+    cache.put(0b1010, {"n": 1}, "ko-KR")
+
+    assert cache.get(0b1010, "ko-KR") == {"n": 1}
+    assert cache.get(0b1011, "ko-KR") == {"n": 1}  # 해밍 거리 1
+    assert cache.get(0b0101, "ko-KR") is None  # 해밍 거리 4
+    assert cache.get(0b1010, "en-US") is None
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["near_hits"], stats["misses"]) == (1, 1, 2)
+
+
+def test_cache_returns_copies():
+    cache: VisionResultCache[dict[str, list[int]]] = VisionResultCache(
+        "test", ttl_seconds=60, max_entries=8, max_distance=0
+    )
+    cache.put(1, {"items": [1]})
+
+    first = cache.get(1)
+    assert first is not None
+    first["items"].append(2)
+
+    assert cache.get(1) == {"items": [1]}
+
+
+def test_cache_ttl_and_lru_bounds():
+    now = [0.0]
+    cache: VisionResultCache[str] = VisionResultCache(
+        "test", ttl_seconds=10, max_entries=2, max_distance=0, clock=lambda: now[0]
+    )
+    cache.put(1, "a")
+    cache.put(2, "b")
+    assert cache.get(1) == "a"  # 1을 최근 사용으로 갱신
+    cache.put(3, "c")  # 가장 오래 사용되지 않은 2 축출
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "a"
+
+    now[0] = 11.0
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_scanner_reuses_result_for_duplicate_image():
+    """같은 사진을 다시 스캔하면 비전 모델을 다시 호출하지 않고 새 아이템 ID를 발급한다."""
+    service = ImageUnderstandingService(force_mock=True)
+    service._is_mock = False
+    vision_result = ScanResult(
+        status=ScanStatus.COMPLETED,
+        caption="A lantern on a desk",
+        item_candidates=[
+            ItemCandidate(id="item_1", label="Lantern", description="Old lantern", item_type="tool")
+        ],
+    )
+    call_model = AsyncMock(side_effect=lambda *args, **kwargs: vision_result.model_copy(deep=True))
+
+    with (
+        patch.object(service, "_call_vision_model", call_model),
+        patch("unknown_world.services.image_understanding.determine_item_count", return_value=1),
+    ):
+        first = await service.analyze(_scene((800, 600)), "image/png", Language.EN)
+        second = await service.analyze(_scene((640, 480), fmt="JPEG"), "image/jpeg", Language.EN)
+        other_language = await service.analyze(_scene((800, 600)), "image/png", Language.KO)
+
+    assert call_model.await_count == 2
+    assert second.caption == first.caption
+    assert second.item_candidates[0].label == "Lantern"
+    assert second.item_candidates[0].id != first.item_candidates[0].id
+    assert other_language.status == ScanStatus.COMPLETED
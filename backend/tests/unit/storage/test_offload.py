@@ -0,0 +1,80 @@
+"""Unknown World - 블로킹 작업 오프로드 실행기 테스트."""
+
+import asyncio
+import threading
+
+import pytest
+
+from unknown_world.storage.local_storage import LocalStorage
+from unknown_world.storage.offload import OffloadExecutor, OffloadKind, read_bytes_if_exists
+from unknown_world.storage.storage import StorageCategory
+
+
+@pytest.mark.asyncio
+async def test_run_executes_off_event_loop_thread():
+    """오프로드된 함수는 이벤트 루프 스레드가 아닌 워커 스레드에서 실행된다."""
+    executor = OffloadExecutor(cpu_workers=1, io_workers=1)
+    try:
+        loop_thread = threading.get_ident()
+        worker_thread = await executor.run_cpu(threading.get_ident)
+        assert worker_thread != loop_thread
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queue_metrics_track_submitted_and_failed():
+    """풀별 지표가 제출/완료/실패/대기 수를 집계한다."""
+    executor = OffloadExecutor(cpu_workers=1, io_workers=1)
+    gate = threading.Event()
+    try:
+        blocker = asyncio.ensure_future(executor.run_io(gate.wait, 5))
+        queued = asyncio.ensure_future(executor.run_io(lambda: "done"))
+        await asyncio.sleep(0.05)
+
+        io_stats = executor.get_stats()[OffloadKind.IO.value]
+        assert io_stats["running"] == 1
+        assert io_stats["queued"] == 1
+
+        gate.set()
+        assert await blocker is True
+        assert await queued == "done"
+
+        def _boom() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await executor.run_cpu(_boom)
+
+        stats = executor.get_stats()
+        assert stats["io"]["completed"] == 2
+        assert stats["io"]["queued"] == 0
+        assert stats["io"]["max_wait_ms"] > 0
+        assert stats["cpu"]["failed"] == 1
+    finally:
+        gate.set()
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_local_storage_round_trip_uses_offload(tmp_path):
+    """LocalStorage의 put/get/exists/delete가 오프로드 경로로 동작한다."""
+    storage = LocalStorage(base_dir=tmp_path)
+
+    result = await storage.put(
+        b"payload", category=StorageCategory.ARTIFACT, content_type="application/json"
+    )
+    assert result.success is True
+    assert await storage.exists(result.key) is True
+    assert await storage.get(result.key) == b"payload"
+    assert await storage.delete(result.key) is True
+    assert await storage.get(result.key) is None
+    assert await storage.delete(result.key) is False
+
+
+def test_read_bytes_if_exists(tmp_path):
+    """존재하지 않는 파일은 None, 존재하면 바이트를 반환한다."""
+    path = tmp_path / "a.bin"
+    assert read_bytes_if_exists(path) is None
+    path.write_bytes(b"x")
+    assert read_bytes_if_exists(path) == b"x"
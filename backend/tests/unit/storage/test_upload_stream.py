@@ -0,0 +1,121 @@
+"""Unknown World - 스트리밍 이미지 업로드 리더 테스트."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from unknown_world.storage.upload_stream import (
+    UploadRejectedError,
+    UploadRejection,
+    read_image_upload,
+)
+
+BOUNDARY = "uwtestboundary"
+PNG_HEADER = b"\x89PNG\r\n\x1a\n" + b"\x00" * 8
+
+
+def _multipart(file_bytes: bytes, *, file_type: str, fields: dict[str, str]) -> bytes:
+    parts = [
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="photo"\r\n'
+        f"Content-Type: {file_type}\r\n\r\n".encode()
+        + file_bytes
+        + b"\r\n"
+    ]
+    for name, value in fields.items():
+        parts.append(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n".encode()
+        )
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+class _ChunkStream:
+    """청크 스트림 (소비된 청크 수 기록, Content-Length 없는 chunked 업로드 모사)."""
+
+    def __init__(self, body: bytes, chunk_size: int = 64 * 1024) -> None:
+        self._chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.consumed = 0
+
+    @property
+    def total(self) -> int:
+        return len(self._chunks)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            self.consumed += 1
+            yield chunk
+
+
+def _headers() -> dict[str, str]:
+    return {"content-type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+@pytest.mark.asyncio
+async def test_reads_file_and_fields_and_corrects_mime_by_magic_bytes():
+    """매직 바이트가 확인되면 선언 MIME(octet-stream) 대신 실제 형식을 사용한다."""
+    file_bytes = PNG_HEADER + b"\x01" * (3 * 1024 * 1024)  # 스풀이 디스크로 넘어가는 크기
+    body = _multipart(
+        file_bytes,
+        file_type="application/octet-stream",
+        fields={"language": "ko-KR", "session_id": "s1"},
+    )
+
+    upload = await read_image_upload(_headers(), aiter(_ChunkStream(body)))
+
+    assert upload.content == file_bytes
+    assert upload.content_type == "image/png"
+    assert upload.filename == "photo"
+    assert upload.fields == {"language": "ko-KR", "session_id": "s1"}
+
+
+@pytest.mark.asyncio
+async def test_rejects_non_image_after_first_chunk():
+    """선언 MIME도 매직 바이트도 이미지가 아니면 첫 청크에서 중단한다."""
+    body = _multipart(b"%PDF-1.7" + b"x" * (1024 * 1024), file_type="text/plain", fields={})
+    stream = _ChunkStream(body)
+
+    with pytest.raises(UploadRejectedError) as exc_info:
+        await read_image_upload(_headers(), aiter(stream))
+
+    assert exc_info.value.reason == UploadRejection.UNSUPPORTED_TYPE
+    assert exc_info.value.content_type == "text/plain"
+    assert stream.consumed == 1
+
+
+@pytest.mark.asyncio
+async def test_rejects_oversized_stream_incrementally():
+    """Content-Length가 없어도 누적 크기가 상한을 넘는 순간 중단한다."""
+    body = _multipart(PNG_HEADER + b"\x00" * (1024 * 1024), file_type="image/png", fields={})
+    stream = _ChunkStream(body)
+
+    with pytest.raises(UploadRejectedError) as exc_info:
+        await read_image_upload(_headers(), aiter(stream), max_bytes=256 * 1024)
+
+    assert exc_info.value.reason == UploadRejection.TOO_LARGE
+    assert stream.consumed < stream.total
+
+
+@pytest.mark.asyncio
+async def test_rejects_declared_oversize_without_reading_body():
+    body = _multipart(PNG_HEADER, file_type="image/png", fields={})
+    stream = _ChunkStream(body)
+    headers = {**_headers(), "content-length": str(50 * 1024 * 1024)}
+
+    with pytest.raises(UploadRejectedError) as exc_info:
+        await read_image_upload(headers, aiter(stream))
+
+    assert exc_info.value.reason == UploadRejection.TOO_LARGE
+    assert exc_info.value.size_bytes == 50 * 1024 * 1024
+    assert stream.consumed == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_file_part_is_rejected():
+    body = f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="language"\r\n\r\nen-US\r\n'
+    body += f"--{BOUNDARY}--\r\n"
+
+    with pytest.raises(UploadRejectedError) as exc_info:
+        await read_image_upload(_headers(), aiter(_ChunkStream(body.encode())))
+
+    assert exc_info.value.reason == UploadRejection.MISSING_FILE
@@ -0,0 +1,157 @@
+"""비즈니스 룰 단일 순회 검증 엔진 단위 테스트."""
+
+import pytest
+
+from unknown_world.models.turn import (
+    ActionCard,
+    ActionDeck,
+    AgentConsole,
+    Box2D,
+    ClientInfo,
+    CurrencyAmount,
+    EconomyOutput,
+    EconomySnapshot,
+    Language,
+    RenderOutput,
+    SafetyOutput,
+    SceneObject,
+    TurnInput,
+    TurnOutput,
+    UIOutput,
+    WorldDelta,
+)
+from unknown_world.validation import business_rules
+from unknown_world.validation.business_rules import (
+    BusinessRuleError,
+    RuleContext,
+    create_default_engine,
+    validate_business_rules,
+)
+from unknown_world.validation.language_gate import extract_user_facing_texts
+from unknown_world.validation.traversal import NodeKind, ValidationNode, iter_validation_nodes
+
+
+@pytest.fixture
+def turn_input() -> TurnInput:
+    return TurnInput(
+        language=Language.KO,
+        text="테스트 입력",
+        client=ClientInfo(viewport_w=1920, viewport_h=1080),
+        economy_snapshot=EconomySnapshot(signal=100, memory_shard=5),
+    )
+
+
+@pytest.fixture
+def turn_output() -> TurnOutput:
+    return TurnOutput(
+        language=Language.KO,
+        narrative="정상적인 한국어 내러티브입니다.",
+        ui=UIOutput(
+            action_deck=ActionDeck(
+                cards=[
+                    ActionCard(
+                        id="card",
+                        label="테스트 카드",
+                        cost=CurrencyAmount(signal=10, memory_shard=0),
+                    )
+                ]
+            ),
+            objects=[
+                SceneObject(
+                    id="door",
+                    label="낡은 문",
+                    box_2d=Box2D(ymin=100, xmin=100, ymax=400, xmax=300),
+                    interaction_hint="조심스럽게 열어보세요",
+                )
+            ],
+        ),
+        world=WorldDelta(),
+        render=RenderOutput(image_job=None),
+        economy=EconomyOutput(
+            cost=CurrencyAmount(signal=10, memory_shard=0),
+            balance_after=CurrencyAmount(signal=90, memory_shard=5),
+        ),
+        safety=SafetyOutput(blocked=False),
+        agent_console=AgentConsole(repair_count=0),
+    )
+
+
+def _break_output(turn_output: TurnOutput) -> TurnOutput:
+    """economy/box2d/언어 혼합 위반을 동시에 가진 출력을 만듭니다."""
+    bad_box = turn_output.ui.objects[0].box_2d.model_copy(update={"ymin": 500})
+    bad_object = turn_output.ui.objects[0].model_copy(update={"box_2d": bad_box})
+    return turn_output.model_copy(
+        update={
+            "narrative": "This narrative is written entirely in English text.",
+            "ui": turn_output.ui.model_copy(update={"objects": [bad_object]}),
+            "economy": turn_output.economy.model_copy(
+                update={"balance_after": CurrencyAmount(signal=80, memory_shard=5)}
+            ),
+        }
+    )
+
+
+def test_valid_output_passes(turn_input, turn_output):
+    result = validate_business_rules(turn_input, turn_output)
+
+    assert result.is_valid
+    assert result.errors == []
+
+
+def test_reports_all_violations_with_field_paths(turn_input, turn_output):
+    result = validate_business_rules(turn_input, _break_output(turn_output))
+
+    assert not result.is_valid
+    fields = {err["type"]: err["field"] for err in result.errors}
+    assert fields[BusinessRuleError.ECONOMY_COST_MISMATCH.value] == "economy.balance_after.signal"
+    assert fields[BusinessRuleError.BOX2D_INVALID_ORDER.value] == "ui.objects[0].box_2d"
+    assert fields[BusinessRuleError.LANGUAGE_CONTENT_MIXED.value] == "narrative"
+    assert result.language_gate_result is not None
+    assert result.error_summary
+
+
+def test_fail_fast_stops_at_first_violation(turn_input, turn_output):
+    result = validate_business_rules(turn_input, _break_output(turn_output), fail_fast=True)
+
+    assert not result.is_valid
+    assert [err["type"] for err in result.errors] == [BusinessRuleError.ECONOMY_COST_MISMATCH.value]
+
+
+def test_single_traversal_with_extra_rules(turn_input, turn_output, monkeypatch):
+    """규칙을 추가해도 TurnOutput 순회는 한 번뿐이고, 각 규칙은 해당 노드에만 디스패치된다."""
+    traversals = 0
+
+    def counting_iter(output: TurnOutput):
+        nonlocal traversals
+        traversals += 1
+        yield from iter_validation_nodes(output)
+
+    monkeypatch.setattr(business_rules, "iter_validation_nodes", counting_iter)
+
+    seen: list[str] = []
+
+    def record(ctx: RuleContext, node: ValidationNode) -> None:
+        seen.append(node.path)
+
+    engine = create_default_engine()
+    engine.register(NodeKind.OBJECT, record)
+    engine.register(NodeKind.OBJECT, record)
+
+    result = engine.validate(turn_input, turn_output)
+
+    assert result.is_valid
+    assert traversals == 1
+    assert seen == ["ui.objects[0]", "ui.objects[0]"]
+
+
+def test_text_nodes_match_extracted_texts(turn_output):
+    texts = extract_user_facing_texts(turn_output)
+    nodes = [node for node in iter_validation_nodes(turn_output) if node.kind is NodeKind.TEXT]
+
+    assert [t.field_path for t in texts] == [node.path for node in nodes]
+    assert [t.field_path for t in texts] == [
+        "narrative",
+        "ui.action_deck.cards[0].label",
+        "ui.objects[0].label",
+        "ui.objects[0].interaction_hint",
+    ]
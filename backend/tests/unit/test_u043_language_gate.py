@@ -191,3 +191,56 @@ async def test_repair_loop_fixes_language_mixing(sample_turn_input, base_turn_ou
         assert result.output.narrative == "수정된 한국어 내러티브"
         assert ValidationBadge.CONSISTENCY_OK in result.badges
         assert ValidationBadge.CONSISTENCY_FAIL not in result.badges  # 최종 배지는 OK여야 함
+
+
+def _reference_ratio(text: str) -> tuple[int, int]:
+    """컴파일 엔진 도입 전의 용어별 순차 치환 + 문자 단위 분류 (동등성 기준)."""
+    import re
+    import unicodedata
+
+    from unknown_world.validation.language_gate import ALLOWED_ENGLISH_TERMS
+
+    normalized = text.lower()
+    for term in sorted(ALLOWED_ENGLISH_TERMS, key=len, reverse=True):
+        pattern = rf"(?<![a-zA-Z]){re.escape(term)}(?![a-zA-Z])"
+        normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
+
+    def is_hangul(char: str) -> bool:
+        code = ord(char)
+        return 0xAC00 <= code <= 0xD7AF or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F
+
+    hangul = sum(1 for c in normalized if is_hangul(c))
+    latin = sum(
+        1
+        for c in normalized
+        if not is_hangul(c) and c.isalpha() and unicodedata.category(c).startswith("L")
+    )
+    return hangul, latin
+
+
+def test_compiled_language_gate_matches_reference():
+    """컴파일된 엔진은 기존 용어별 순차 치환/문자 단위 분류와 같은 집계를 낸다."""
+    import random
+
+    alphabet = list(
+        "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ 0123456789.,!?-'\n"
+        "가나다라한글시그널을를의ㄱㅎᄀ힤éſK²½漢Ж🙂"
+    )
+    words = ["Signal", "memory shard", "MEMORY", "shards", "ok", "Ref", "ui", "json", "API"]
+    rng = random.Random(40)
+    samples = [
+        "Signal가 부족합니다",
+        "Memory Shard를 얻었다",
+        "memory shards and OKAY",
+        "ſignal Key ok",
+    ]
+    for _ in range(500):
+        parts = [
+            rng.choice(words) if rng.random() < 0.3 else rng.choice(alphabet)
+            for _ in range(rng.randint(0, 40))
+        ]
+        samples.append("".join(parts))
+
+    for text in samples:
+        ratio = measure_language_ratio(text)
+        assert (ratio.hangul_count, ratio.latin_count) == _reference_ratio(text), text
@@ -32,7 +32,13 @@ const IMAGE_GENERATE_ENDPOINT = `${API_BASE_URL}/api/image/generate`;
 // =============================================================================
 
 /** 이미지 생성 상태 */
-export type ImageGenerationStatus = 'pending' | 'generating' | 'completed' | 'failed' | 'skipped';
+export type ImageGenerationStatus =
+  | 'pending'
+  | 'generating'
+  | 'completed'
+  | 'failed'
+  | 'skipped'
+  | 'cancelled';
 
 /** 모델 티어링 라벨 (U-066) */
 export type ImageModelLabel = 'FAST' | 'QUALITY';
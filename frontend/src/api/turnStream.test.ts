@@ -178,4 +178,113 @@ describe('executeTurnStream', () => {
       }),
     );
   });
+
+  it('should retry a failed connection with the same idempotency key', async () => {
+    const fetchMock = global.fetch as unknown as ReturnType<typeof vi.fn>;
+    fetchMock.mockRejectedValueOnce(new Error('Network failure'));
+    fetchMock.mockResolvedValueOnce({
+      ok: true,
+      body: new ReadableStream({
+        start(controller) {
+          controller.enqueue(
+            new TextEncoder().encode(
+              JSON.stringify({ type: 'stage', name: 'parse', status: 'start' }) + '\n',
+            ),
+          );
+          controller.close();
+        },
+      }),
+    });
+
+    const { executeTurnStream } = await import('./turnStream');
+    await executeTurnStream(mockInput, mockCallbacks, { idempotencyKey: 'turn-1', retries: 1 });
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    for (const [, init] of fetchMock.mock.calls) {
+      expect((init as RequestInit).headers).toEqual(
+        expect.objectContaining({ 'Idempotency-Key': 'turn-1' }),
+      );
+    }
+    expect(mockCallbacks.onError).not.toHaveBeenCalled();
+    expect(mockCallbacks.onStage).toHaveBeenCalledWith(expect.objectContaining({ name: 'parse' }));
+  });
+
+  it('should replay the turn with the same key after a mid-stream drop', async () => {
+    const encoder = new TextEncoder();
+    const line = (event: unknown) => encoder.encode(JSON.stringify(event) + '\n');
+    const stage = { type: 'stage', name: 'parse', status: 'start' };
+    const delta = { type: 'narrative_delta', text: 'Hello' };
+    const final = {
+      type: 'final',
+      data: {
+        language: 'ko-KR',
+        narrative: 'Hello',
+        economy: {
+          cost: { signal: 0, memory_shard: 0 },
+          balance_after: { signal: 100, memory_shard: 0 },
+        },
+        safety: { blocked: false },
+      },
+    };
+    const fetchMock = global.fetch as unknown as ReturnType<typeof vi.fn>;
+    // 1차: 이벤트 2개 전달 후 네트워크 끊김 (error()는 큐를 비우므로 소비된 뒤 호출)
+    let pulls = 0;
+    fetchMock.mockResolvedValueOnce({
+      ok: true,
+      body: new ReadableStream({
+        pull(controller) {
+          if (pulls++ === 0) {
+            controller.enqueue(line(stage));
+            controller.enqueue(line(delta));
+          } else {
+            controller.error(new TypeError('network error'));
+          }
+        },
+      }),
+    });
+    // 2차: 서버가 같은 키의 턴을 처음부터 재생
+    fetchMock.mockResolvedValueOnce({
+      ok: true,
+      body: new ReadableStream({
+        start(controller) {
+          controller.enqueue(line(stage));
+          controller.enqueue(line(delta));
+          controller.enqueue(line(final));
+          controller.close();
+        },
+      }),
+    });
+    const callbacks = { ...mockCallbacks, onRestart: vi.fn() };
+
+    const { executeTurnStream } = await import('./turnStream');
+    await executeTurnStream(mockInput, callbacks, { idempotencyKey: 'turn-1', retries: 1 });
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    for (const [, init] of fetchMock.mock.calls) {
+      expect((init as RequestInit).headers).toEqual(
+        expect.objectContaining({ 'Idempotency-Key': 'turn-1' }),
+      );
+    }
+    expect(callbacks.onRestart).toHaveBeenCalledTimes(1);
+    expect(callbacks.onError).not.toHaveBeenCalled();
+    expect(callbacks.onFinal).toHaveBeenCalledTimes(1);
+    expect(callbacks.onFinal).toHaveBeenCalledWith(
+      expect.objectContaining({ data: expect.objectContaining({ narrative: 'Hello' }) }),
+    );
+    expect(callbacks.onComplete).toHaveBeenCalledTimes(1);
+  });
+
+  it('should not retry client errors or requests without an idempotency key', async () => {
+    const fetchMock = global.fetch as unknown as ReturnType<typeof vi.fn>;
+    fetchMock.mockResolvedValue({ ok: false, status: 409, statusText: 'Conflict' });
+
+    const { executeTurnStream } = await import('./turnStream');
+    await executeTurnStream(mockInput, mockCallbacks, { idempotencyKey: 'turn-1', retries: 2 });
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    fetchMock.mockClear();
+    fetchMock.mockRejectedValue(new Error('Network failure'));
+    await executeTurnStream(mockInput, mockCallbacks, { retries: 2 });
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
 });
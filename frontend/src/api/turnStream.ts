@@ -372,11 +372,73 @@ export interface TurnStreamOptions {
   timeout?: number;
   /** AbortSignal */
   signal?: AbortSignal;
+  /**
+   * 멱등 키 (재시도 시 같은 값을 보내면 서버가 저장된 결과를 재생하거나 진행 중인 턴에 합류)
+   */
+  idempotencyKey?: string;
+  /**
+   * 연결 실패 시 재시도 횟수 (기본: 0).
+   * 멱등 키가 있을 때만 네트워크/5xx 실패(스트림 도중 끊김 포함)에 적용합니다.
+   * 같은 키로 재요청하면 서버가 턴 이벤트를 처음부터 재생(진행 중이면 합류)하므로,
+   * 이벤트를 받은 뒤의 재시도는 callbacks.onRestart로 누적 상태를 초기화한 뒤 진행합니다.
+   * final을 받은 뒤에는 재시도하지 않습니다 (턴 결과 중복 적용 방지).
+   */
+  retries?: number;
+}
+
+/** 재시도 간 기본 대기 시간 (ms, 시도마다 선형 증가) */
+const TURN_STREAM_RETRY_DELAY_MS = 500;
+
+/** 턴 스트림 HTTP 에러 (재시도 여부 판단용 status 보존) */
+class TurnStreamHttpError extends Error {
+  readonly status: number;
+
+  constructor(status: number, statusText: string) {
+    super(`HTTP ${status}: ${statusText}`);
+    this.status = status;
+  }
+}
+
+/** final 이벤트인지 판단합니다 (파싱 전 원시 이벤트). */
+function isFinalEvent(event: unknown): boolean {
+  return (
+    typeof event === 'object' &&
+    event !== null &&
+    (event as { type?: unknown }).type === StreamEventType.FINAL
+  );
+}
+
+/** 재시도 가능한 실패인지 판단합니다 (4xx는 같은 요청을 다시 보내도 실패). */
+function isRetryableStreamError(error: unknown): boolean {
+  return !(error instanceof TurnStreamHttpError) || error.status >= 500;
+}
+
+/** 재시도 대기 (Abort 시 즉시 AbortError로 종료) */
+function waitForRetry(ms: number, signal: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    if (signal.aborted) {
+      reject(new DOMException('Aborted', 'AbortError'));
+      return;
+    }
+    const timer = setTimeout(() => {
+      signal.removeEventListener('abort', onAbort);
+      resolve();
+    }, ms);
+    const onAbort = () => {
+      clearTimeout(timer);
+      reject(new DOMException('Aborted', 'AbortError'));
+    };
+    signal.addEventListener('abort', onAbort, { once: true });
+  });
 }
 
 /**
  * 턴 스트림 요청을 실행합니다.
  *
+ * 멱등 키와 retries가 주어지면 연결 실패(스트림 도중 끊김 포함)를 같은 키로 재시도합니다.
+ * 이미 이벤트를 전달한 뒤라면 재요청 전에 callbacks.onRestart를 호출합니다
+ * (서버가 턴 이벤트를 처음부터 재생하므로 단계/내러티브 상태를 초기화해야 함).
+ *
  * @param input - 턴 입력 데이터
  * @param callbacks - 이벤트 콜백
  * @param options - 요청 옵션
@@ -387,26 +449,38 @@ export async function executeTurnStream(
   callbacks: StreamCallbacks,
   options?: TurnStreamOptions,
 ): Promise<void> {
-  const parser = new NDJSONParser();
   const controller = new AbortController();
   const signal = options?.signal ?? controller.signal;
+  const maxRetries = options?.idempotencyKey ? (options.retries ?? 0) : 0;
 
   // RU-002-S1: AbortError 발생 시 onComplete 호출 여부 추적
   let aborted = false;
+  // 이번 시도에서 이벤트를 전달했는지 (재시도 전 onRestart 호출 여부)
+  let dispatched = false;
+  // final을 전달했으면 재시도하지 않음 (턴 결과 중복 적용 방지)
+  let finalDispatched = false;
+
+  const dispatch = (event: unknown): void => {
+    dispatched = true;
+    if (isFinalEvent(event)) finalDispatched = true;
+    dispatchEvent(event, callbacks, input.language, input.economy_snapshot);
+  };
 
-  try {
+  const streamOnce = async (): Promise<void> => {
+    const parser = new NDJSONParser();
     const response = await fetch(TURN_ENDPOINT, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
         Accept: 'application/x-ndjson',
+        ...(options?.idempotencyKey ? { 'Idempotency-Key': options.idempotencyKey } : {}),
       },
       body: JSON.stringify(input),
       signal,
     });
 
     if (!response.ok) {
-      throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+      throw new TurnStreamHttpError(response.status, response.statusText);
     }
 
     if (!response.body) {
@@ -427,14 +501,36 @@ export async function executeTurnStream(
       const events = parser.parse(chunk);
 
       for (const event of events) {
-        dispatchEvent(event, callbacks, input.language, input.economy_snapshot);
+        dispatch(event);
       }
     }
 
     // 남은 버퍼 플러시
     const remaining = parser.flush();
     if (remaining) {
-      dispatchEvent(remaining, callbacks, input.language, input.economy_snapshot);
+      dispatch(remaining);
+    }
+  };
+
+  try {
+    for (let attempt = 0; ; attempt++) {
+      try {
+        await streamOnce();
+        break;
+      } catch (error) {
+        const canRetry =
+          attempt < maxRetries &&
+          !finalDispatched &&
+          !(error instanceof DOMException && error.name === 'AbortError') &&
+          isRetryableStreamError(error);
+        if (!canRetry) throw error;
+        await waitForRetry(TURN_STREAM_RETRY_DELAY_MS * (attempt + 1), signal);
+        // 스트림 도중 끊김: 같은 키의 재요청은 턴 전체를 재생하므로 누적 상태 초기화
+        if (dispatched) {
+          dispatched = false;
+          callbacks.onRestart?.();
+        }
+      }
     }
   } catch (error) {
     if (error instanceof DOMException && error.name === 'AbortError') {
@@ -542,12 +638,17 @@ function createClientFallbackTurnOutput(
  *
  * @param input - 턴 입력 데이터
  * @param callbacks - 이벤트 콜백
+ * @param options - 요청 옵션 (멱등 키/재시도 횟수, signal은 내부에서 생성)
  * @returns 취소 함수
  */
-export function startTurnStream(input: TurnInput, callbacks: StreamCallbacks): () => void {
+export function startTurnStream(
+  input: TurnInput,
+  callbacks: StreamCallbacks,
+  options?: Omit<TurnStreamOptions, 'signal'>,
+): () => void {
   const controller = new AbortController();
 
-  executeTurnStream(input, callbacks, { signal: controller.signal });
+  executeTurnStream(input, callbacks, { ...options, signal: controller.signal });
 
   return () => controller.abort();
 }
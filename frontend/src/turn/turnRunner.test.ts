@@ -159,6 +159,7 @@ describe('turnRunner (U-124[Mvp]: toBackendReferenceUrl)', () => {
         previous_image_url: '/api/image/file/scene-narrator-start',
       }),
       expect.any(Object),
+      expect.objectContaining({ idempotencyKey: expect.any(String) }),
     );
   });
 
@@ -184,6 +185,7 @@ describe('turnRunner (U-124[Mvp]: toBackendReferenceUrl)', () => {
         previous_image_url: runtimeUrl,
       }),
       expect.any(Object),
+      expect.objectContaining({ idempotencyKey: expect.any(String) }),
     );
   });
 
@@ -209,6 +211,30 @@ describe('turnRunner (U-124[Mvp]: toBackendReferenceUrl)', () => {
         previous_image_url: externalUrl,
       }),
       expect.any(Object),
+      expect.objectContaining({ idempotencyKey: expect.any(String) }),
     );
   });
+
+  it('턴마다 새 멱등 키와 재시도 횟수를 startTurnStream에 전달해야 함', async () => {
+    const { createTurnRunner } = await import('./turnRunner');
+    const runner = createTurnRunner({
+      t: (key: string) => key,
+      theme: 'dark',
+      language: 'ko-KR',
+    });
+
+    const { startTurnStream } = (await import('../api/turnStream')) as unknown as {
+      startTurnStream: Mock;
+    };
+
+    runner.runTurn({ text: '첫 번째' });
+    runner.runTurn({ text: '두 번째' });
+
+    const [first, second] = startTurnStream.mock.calls.map(
+      (call) => call[2] as { idempotencyKey: string; retries: number },
+    );
+    expect(first.idempotencyKey).toBeTruthy();
+    expect(first.retries).toBeGreaterThan(0);
+    expect(second.idempotencyKey).not.toBe(first.idempotencyKey);
+  });
 });
@@ -53,6 +53,27 @@ const VISION_TRIGGER_KEYWORDS = [
 /** U-089: 정밀분석 오버레이 최소 표시 시간 (ms) - 깜빡임 방지 */
 const ANALYZING_MIN_DISPLAY_MS = 500;
 
+// =============================================================================
+// 턴 스트림 멱등 재시도
+// =============================================================================
+
+/** 첫 이벤트 전 연결 실패 시 같은 멱등 키로 재시도하는 횟수 */
+const TURN_STREAM_RETRIES = 2;
+
+/**
+ * 턴 하나에 대한 멱등 키를 생성합니다.
+ *
+ * 재시도는 같은 키를 재사용하므로 서버가 이미 처리 중/완료된 턴을 다시 실행하지 않고
+ * 진행 중인 턴에 합류하거나 저장된 결과를 재생합니다 (이중 과금 방지).
+ * crypto.randomUUID는 보안 컨텍스트(HTTPS/localhost)에서만 제공되므로 폴백을 둡니다.
+ */
+function createIdempotencyKey(): string {
+  if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+  return `turn-${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`;
+}
+
 // =============================================================================
 // U-124: 사전 생성 이미지 → 백엔드 참조 URL 변환
 // =============================================================================
@@ -335,6 +356,10 @@ export function createTurnRunner(deps: {
       onNarrativeDelta: (event) => {
         useAgentStore.getState().handleNarrativeDelta(event);
       },
+      // 스트림 도중 끊김 → 같은 멱등 키로 재요청 (서버가 턴 이벤트를 처음부터 재생)
+      onRestart: () => {
+        useAgentStore.getState().startStream();
+      },
       // Final → agentStore.handleFinal + worldStore.applyTurnOutput
       // U-097: onFinal에서는 텍스트/상태만 반영. 이미지 생성은 onComplete 이후에 시작.
       //   스트리밍 순서: narrative_delta × N → final → (스트림 종료) → onComplete
@@ -487,8 +512,11 @@ export function createTurnRunner(deps: {
       },
     };
 
-    // 스트림 시작
-    cancelFn = startTurnStream(turnInput, callbacks);
+    // 스트림 시작 (턴별 멱등 키: 재시도 시 같은 키 재사용)
+    cancelFn = startTurnStream(turnInput, callbacks, {
+      idempotencyKey: createIdempotencyKey(),
+      retries: TURN_STREAM_RETRIES,
+    });
   };
 
   /**
@@ -652,6 +680,10 @@ export function useTurnRunner(deps: {
         onNarrativeDelta: (event) => {
           useAgentStore.getState().handleNarrativeDelta(event);
         },
+        // 스트림 도중 끊김 → 같은 멱등 키로 재요청 (서버가 턴 이벤트를 처음부터 재생)
+        onRestart: () => {
+          useAgentStore.getState().startStream();
+        },
         // U-097: onFinal에서는 텍스트/상태만 반영. 이미지 생성은 onComplete에서 시작.
         onFinal: (event) => {
           pendingImageJobRef.current = event.data.render?.image_job ?? null;
@@ -782,8 +814,11 @@ export function useTurnRunner(deps: {
         },
       };
 
-      // 스트림 시작 및 취소 함수 저장
-      cancelFnRef.current = startTurnStream(turnInput, callbacks);
+      // 스트림 시작 및 취소 함수 저장 (턴별 멱등 키: 재시도 시 같은 키 재사용)
+      cancelFnRef.current = startTurnStream(turnInput, callbacks, {
+        idempotencyKey: createIdempotencyKey(),
+        retries: TURN_STREAM_RETRIES,
+      });
     },
     [t, theme, language],
   );
@@ -347,4 +347,9 @@ export interface StreamCallbacks {
   onError?: (event: ErrorEvent) => void;
   /** 스트림 완료 */
   onComplete?: () => void;
+  /**
+   * 스트림 도중 끊겨 같은 멱등 키로 재요청하기 직전 호출
+   * (서버가 턴 이벤트를 처음부터 재생하므로 누적된 단계/내러티브 상태를 초기화)
+   */
+  onRestart?: () => void;
 }